@@ -0,0 +1,104 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Capture a perf suite recording of a teleop task config inside Isaac Sim.
+
+Example:
+    # step the task with idle actions, or with the actions of a recorded demo
+    python -m ngine.benchmarks.perf.capture --task_config teleop_ci --headless --output recordings/
+    python -m ngine.benchmarks.perf.capture --task_config teleop_ci --headless --dataset_file datasets/dataset.hdf5
+
+    # then run the suite on the recordings
+    python -m ngine.benchmarks.perf.run --recordings recordings/
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+from pathlib import Path
+
+from isaaclab.app import AppLauncher
+
+from ngine.utils.config_loader import TELEOP_CONFIG_SCHEMA, config_loader
+
+parser = argparse.ArgumentParser(description="Capture a perf suite recording of a task.")
+parser.add_argument("--task_config", type=str, required=True, help="teleop task config")
+parser.add_argument("--steps", type=int, default=200, help="Number of recorded env steps.")
+parser.add_argument("--dataset_file", type=str, default=None, help="Replay the actions of the first demo in this file.")
+parser.add_argument("--output", type=str, default="recordings", help="Directory of the recording.")
+AppLauncher.add_app_launcher_args(parser)
+args_cli = parser.parse_args()
+
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import gymnasium as gym
+import h5py
+import torch
+
+from ngine.benchmarks.perf.recorded import TaskRecorder, env_cfg_kwargs
+from ngine.utils.env import parse_env_cfg, str_to_execute_mode
+from ngine.utils.place_utils.env_utils import set_seed
+
+
+def load_actions(dataset_file):
+    with h5py.File(dataset_file, "r") as f:
+        demo = sorted(f["data"].keys(), key=lambda name: int(name.split("_")[-1]))[0]
+        return torch.from_numpy(f["data"][demo]["actions"][()])
+
+
+def main():
+    yaml_args = config_loader.load(args_cli.task_config, schema=TELEOP_CONFIG_SCHEMA)
+    # stored in the recording, the parse_env_cfg case rebuilds the env config from them
+    parse_env_cfg_kwargs = env_cfg_kwargs(yaml_args, device=args_cli.device, headless=args_cli.headless)
+    env_cfg = parse_env_cfg(
+        **{**parse_env_cfg_kwargs, "execute_mode": str_to_execute_mode(parse_env_cfg_kwargs["execute_mode"])}
+    )
+    env_cfg.terminations.time_out = None
+    env_name = f"Robocasa-{yaml_args.task}-{yaml_args.robot}-v0"
+    gym.register(id=env_name, entry_point="isaaclab.envs:ManagerBasedRLEnv", kwargs={}, disable_env_checker=True)
+    env = gym.make(env_name, cfg=env_cfg).unwrapped
+    set_seed(env_cfg.seed, env)
+    env.reset(seed=env.cfg.seed)
+
+    if hasattr(env_cfg, "idle_action"):
+        idle_action = env_cfg.idle_action.repeat(env.num_envs, 1)
+    else:
+        idle_action = torch.zeros(env.action_space.shape)
+    actions = load_actions(args_cli.dataset_file) if args_cli.dataset_file else None
+
+    recorder = TaskRecorder(
+        env,
+        yaml_args.task,
+        config_names=[args_cli.task_config],
+        scene_usd=env_cfg.isaaclab_arena_env.orchestrator.get_ep_meta().get("usd_path"),
+        parse_env_cfg_kwargs=parse_env_cfg_kwargs,
+        seed=yaml_args.seed,
+    )
+    with torch.inference_mode():
+        for step in range(args_cli.steps):
+            action = actions[step][None] if actions is not None and step < len(actions) else idle_action
+            env.step(action.to(env.device))
+            recorder.add_frame()
+
+    path = recorder.save(Path(args_cli.output) / f"{args_cli.task_config}.pt")
+    print(f"Recording of {args_cli.steps} steps written to {path}")
+    env.close()
+
+
+if __name__ == "__main__":
+    main()
+    simulation_app.close()
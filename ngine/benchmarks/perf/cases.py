@@ -0,0 +1,346 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark cases of the perf suite.
+
+A case is a function ``case(recording, workdir) -> fn`` registered with :func:`perf_case`. It does its setup
+outside of the timed region and returns the zero-argument function timed by the runner. Cases raise
+:class:`SkipCase` when an input or an optional dependency is missing.
+"""
+
+import importlib
+import json
+import os
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from ngine.benchmarks.perf.recorded import ReplayEnv
+
+PERF_CASES: dict[str, Callable] = {}
+
+# checkers which only read the asset data captured in the recordings
+REPLAYABLE_CHECKERS = ["motion", "velocity_jump", "start_object_move", "obj_drop", "arm_joint_angle", "action_state_inconsistency"]
+
+
+class SkipCase(Exception):
+    pass
+
+
+def perf_case(name: str):
+    def decorator(fn):
+        PERF_CASES[name] = fn
+        return fn
+    return decorator
+
+
+def _require(module: str):
+    try:
+        return importlib.import_module(module)
+    except Exception as e:
+        raise SkipCase(f"{module} is not available ({type(e).__name__}: {e})")
+
+
+@perf_case("plugin_discovery")
+def plugin_discovery(recording, workdir):
+    """Enumerate the ngine plugins and collect the config files like ConfigLoader does at import."""
+    from ngine.utils.config_loader import ConfigLoader
+
+    def run():
+        ConfigLoader().yml_meta
+    return run
+
+
+@perf_case("config_resolution")
+def config_resolution(recording, workdir):
+    """Resolve the task configs, including their ``_base_`` chains, with a warm loader."""
+    from ngine.utils.config_loader import ConfigLoader
+
+    names = recording["meta"]["config_names"]
+    if not names:
+        raise SkipCase("the recording has no config names")
+    loader = ConfigLoader()
+
+    def run():
+        for name in names:
+            loader.load(name)
+    return run
+
+
+@perf_case("config_resolution_cold")
+def config_resolution_cold(recording, workdir):
+    """Resolve the task configs in a new loader without the on-disk cache, like a first run."""
+    from ngine.utils.config_loader import ConfigLoader
+
+    names = recording["meta"]["config_names"]
+    if not names:
+        raise SkipCase("the recording has no config names")
+    yml_meta = ConfigLoader().yml_meta
+
+    def run():
+        loader = ConfigLoader(use_disk_cache=False)
+        loader._yml_meta = dict(yml_meta)
+        for name in names:
+            loader.load(name)
+    return run
+
+
+@perf_case("config_resolution_disk")
+def config_resolution_disk(recording, workdir):
+    """Resolve the task configs in a new loader from the on-disk cache, like a later process."""
+    from ngine.utils.config_loader import ConfigLoader
+
+    names = recording["meta"]["config_names"]
+    if not names:
+        raise SkipCase("the recording has no config names")
+    yml_meta = ConfigLoader().yml_meta
+    warm = ConfigLoader()
+    for name in names:
+        warm.load(name)
+
+    def run():
+        loader = ConfigLoader()
+        loader._yml_meta = dict(yml_meta)
+        for name in names:
+            loader.load(name)
+    return run
+
+
+@perf_case("parse_env_cfg")
+def parse_env_cfg(recording, workdir):
+    """Full parse_env_cfg of the recorded task, needs the Isaac Lab / Arena packages."""
+    kwargs = recording["meta"]["parse_env_cfg_kwargs"]
+    if not kwargs:
+        raise SkipCase("the recording has no parse_env_cfg kwargs")
+    _require("isaaclab_arena")
+    env_module = _require("ngine.utils.env")
+    kwargs = dict(kwargs)
+    kwargs["execute_mode"] = env_module.str_to_execute_mode(kwargs.get("execute_mode"))
+
+    def run():
+        env_module.parse_env_cfg(**kwargs)
+    return run
+
+
+@perf_case("scene_parsing")
+def scene_parsing(recording, workdir):
+    """Parse the fixtures of the recorded scene usd, without the fixture metadata cache."""
+    scene_usd = recording["meta"]["scene_usd"]
+    if not scene_usd or not Path(scene_usd).exists():
+        raise SkipCase("the recording has no scene usd")
+    Usd = _require("pxr.Usd")
+    scene_parser = _require("ngine.engine.models.scenes.scene_parser")
+    seed = recording["meta"]["seed"]
+
+    def run():
+        stage = Usd.Stage.Open(scene_usd)
+        scene_parser.parse_fixtures(stage, 1, seed, "cpu")
+    return run
+
+
+def _kitchen_stage(Usd, num_fixtures=400, parts_per_fixture=25):
+    """Large in-memory stage shaped like a kitchen scene, fixtures of parts with a handle joint and visuals."""
+    stage = Usd.Stage.CreateInMemory()
+    stage.DefinePrim("/World", "Xform")
+    for f in range(num_fixtures):
+        root = f"/World/fixture_{f}_{'cab' if f % 3 else 'Drawer'}"
+        stage.DefinePrim(root, "Xform")
+        for p in range(parts_per_fixture):
+            part = stage.DefinePrim(f"{root}/part_{p}", "Xform" if p % 2 else "Mesh")
+            stage.DefinePrim(f"{part.GetPath()}/Handle_joint", "PhysicsRevoluteJoint" if p % 4 == 1 else "Xform")
+            stage.DefinePrim(f"{part.GetPath()}/visuals", "Scope")
+    return stage
+
+
+def _prim_lookups(recording):
+    """Fixture-style OpenUsd lookups on the recorded scene usd, or on a large synthetic stage without one."""
+    Usd = _require("pxr.Usd")
+    usd = _require("ngine.utils.usd_utils").OpenUsd
+
+    scene_usd = recording["meta"]["scene_usd"]
+    if scene_usd and Path(scene_usd).exists():
+        stage = Usd.Stage.Open(scene_usd)
+    else:
+        stage = _kitchen_stage(Usd)
+    root = stage.GetPseudoRoot()
+    # every tenth child of the top level prims, the fixtures of a scene usd
+    fixtures = [child for top in root.GetChildren() for child in top.GetChildren()]
+    fixtures = fixtures[::max(1, len(fixtures) // 10)]
+
+    def lookups():
+        # prims do not keep their stage alive
+        stage.GetPseudoRoot()
+        usd.get_prim_by_name(root, "handle_joint", only_xform=False)
+        usd.get_prim_by_prefix(root, "fixture_")
+        for fixture in fixtures:
+            usd.get_prim_by_suffix(fixture, "_joint", only_xform=False)
+            usd.get_prim_by_types(fixture, ["PhysicsRevoluteJoint"])
+    return lookups
+
+
+@perf_case("prim_lookup")
+def prim_lookup(recording, workdir):
+    """Fixture-style prim lookups through the prim index, built during setup."""
+    lookups = _prim_lookups(recording)
+    lookups()
+    return lookups
+
+
+@perf_case("prim_lookup_traversal")
+def prim_lookup_traversal(recording, workdir):
+    """The prim_lookup lookups with the prim index disabled, each one traversing the stage."""
+    lookups = _prim_lookups(recording)
+
+    def run():
+        previous = os.environ.get("NGINE_PRIM_INDEX")
+        os.environ["NGINE_PRIM_INDEX"] = "0"
+        try:
+            lookups()
+        finally:
+            if previous is None:
+                os.environ.pop("NGINE_PRIM_INDEX")
+            else:
+                os.environ["NGINE_PRIM_INDEX"] = previous
+    return run
+
+
+@perf_case("placement_sampling")
+def placement_sampling(recording, workdir, num_candidates=50, num_samples=100):
+    """Sample robot base candidates around the anchor and check them against the recorded obstacles."""
+    from ngine.utils.place_utils.spatial_index import SceneSpatialIndex
+
+    placement = recording["placement"]
+    index = SceneSpatialIndex(
+        placement["scene_min"], placement["scene_max"], placement["mins"], placement["maxs"], names=[]
+    )
+    robot_min, robot_max = placement["robot_min"], placement["robot_max"]
+    center = (robot_min + robot_max) / 2
+    anchor = np.asarray(placement["anchor_pos"], dtype=np.float64)
+    rng = np.random.default_rng(recording["meta"]["seed"])
+
+    def run():
+        for _ in range(num_samples):
+            dev_x, dev_y = 0.5, 0.25
+            # widen the range until a free candidate is found, like sample_robot_base_helper
+            while True:
+                positions = anchor + np.column_stack(
+                    [rng.uniform(-dev_x, dev_x, num_candidates), rng.uniform(-dev_y, dev_y, num_candidates), np.zeros(num_candidates)]
+                )
+                shift = np.zeros_like(positions)
+                shift[:, :2] = positions[:, :2] - center[:2]
+                qmins, qmaxs = robot_min + shift, robot_max + shift
+                valid = ~index.out_of_scene(qmins, qmaxs) & (index.tree.first_overlaps(qmins, qmaxs) < 0)
+                if valid.any() or dev_x > 10.0:
+                    break
+                dev_x += 0.10
+                dev_y += 0.05
+    return run
+
+
+@perf_case("checker_eval")
+def checker_eval(recording, workdir):
+    """Run the replayable checkers over all the recorded frames."""
+    checker_factory = _require("ngine.engine.checks.checker_factory")
+
+    env = ReplayEnv(recording)
+    checkers = []
+    for checker_type in REPLAYABLE_CHECKERS:
+        checker = checker_factory.get_checker(checker_type)()
+        try:
+            for frame in range(env.num_frames):
+                env.set_frame(frame)
+                checker.check(env)
+        except Exception:
+            # the checker needs env data which is not part of the recording
+            continue
+        checkers.append(checker)
+    if not checkers:
+        raise SkipCase("no checker can run on the recorded frames")
+
+    def run():
+        for checker in checkers:
+            checker.reset()
+        for frame in range(env.num_frames):
+            env.set_frame(frame)
+            for checker in checkers:
+                checker.check(env)
+    return run
+
+
+@perf_case("recorder_export")
+def recorder_export(recording, workdir):
+    """Collect the recorded frames into an episode and export it to hdf5, with the layout of the recorder manager."""
+    h5py = _require("h5py")
+    import torch
+
+    frames = recording["frames"]
+    num_frames = ReplayEnv(recording).num_frames
+    env_args = json.dumps({"env_name": recording["meta"]["task"], "type": 2})
+    output = Path(workdir) / "recorder_export"
+    output.mkdir(parents=True, exist_ok=True)
+    counter = [0]
+
+    def run():
+        # per-step appends like EpisodeData.add, concatenated once at export
+        episode = {}
+        for t in range(num_frames):
+            for group, prefix in (("articulations", "articulation"), ("rigid_objects", "rigid_object")):
+                for name, fields in frames[group].items():
+                    for field, values in fields.items():
+                        episode.setdefault(f"states/{prefix}/{name}/{field}", []).append(values[t])
+            if "latest_action" in frames:
+                episode.setdefault("actions", []).append(frames["latest_action"][t])
+        with h5py.File(output / f"dataset_{counter[0]}.hdf5", "w") as f:
+            data = f.create_group("data")
+            data.attrs["env_args"] = env_args
+            demo = data.create_group("demo_0")
+            demo.attrs["num_samples"] = num_frames
+            demo.attrs["seed"] = recording["meta"]["seed"]
+            demo.attrs["success"] = True
+            for key, values in episode.items():
+                demo.create_dataset(key, data=torch.stack(values).numpy(), compression="gzip")
+            data.attrs["total"] = num_frames
+        counter[0] += 1
+    return run
+
+
+def _span_loop(enabled: bool, iterations: int):
+    """Spans around an empty block, with the telemetry switched to ``enabled`` while timed."""
+    from ngine.utils.profile_utils import TELEMETRY, span
+
+    def run():
+        was_enabled = TELEMETRY.enabled
+        TELEMETRY.enabled = enabled
+        try:
+            for _ in range(iterations):
+                with span("perf/span"):
+                    pass
+        finally:
+            TELEMETRY.enabled = was_enabled
+            with TELEMETRY._lock:
+                TELEMETRY.stats.pop("perf/span", None)
+    return run
+
+
+@perf_case("telemetry_span")
+def telemetry_span(recording, workdir, iterations=100_000):
+    """Recorded spans, the cost telemetry adds to every traced call when enabled."""
+    return _span_loop(True, iterations)
+
+
+@perf_case("telemetry_span_disabled")
+def telemetry_span_disabled(recording, workdir, iterations=100_000):
+    """Spans with the telemetry disabled, the shared no-op context manager."""
+    return _span_loop(False, iterations)
@@ -0,0 +1,310 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Recorded inputs of the perf suite.
+
+A task recording holds everything the CPU-only benchmark cases need from a running Isaac Sim env:
+
+- ``meta``: task name, seed, config names, scene usd path and the ``parse_env_cfg`` kwargs.
+- ``placement``: scene bounds, obstacle boxes of the scene spatial index, robot footprint and base anchor.
+- ``frames``: per-step asset data read by the checkers (body poses, joint positions, object positions, actions).
+
+Recordings are captured inside a simulation session with :class:`TaskRecorder` (see ``capture.py``) and replayed
+with :class:`ReplayEnv`. :func:`synthetic_recording` generates a deterministic recording for machines without any.
+"""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import torch
+
+
+class TaskRecorder:
+    """Capture the inputs of the perf suite from a live env.
+
+    Example:
+        >>> recorder = TaskRecorder(env, "PnPCounterToSink", config_names=["PnPCounterToSink"], parse_env_cfg_kwargs=kwargs)
+        >>> for _ in range(200):
+        ...     env.step(actions)
+        ...     recorder.add_frame()
+        >>> recorder.save("recordings/PnPCounterToSink.pt")
+    """
+
+    def __init__(self, env, task: str, config_names: list[str] | None = None, scene_usd: str | None = None,
+                 parse_env_cfg_kwargs: dict | None = None, seed: int = 0):
+        self.env = env.unwrapped
+        self.meta = {
+            "task": task,
+            "seed": seed,
+            "config_names": list(config_names or []),
+            "scene_usd": scene_usd,
+            "parse_env_cfg_kwargs": dict(parse_env_cfg_kwargs or {}),
+            "step_dt": float(self.env.step_dt),
+        }
+        self.frames = []
+
+    def add_frame(self):
+        scene = self.env.scene
+        frame = {
+            "articulations": {
+                name: {
+                    "body_com_pose_w": asset.data.body_com_pose_w[:1].detach().cpu().clone(),
+                    "joint_pos": asset.data.joint_pos[:1].detach().cpu().clone(),
+                }
+                for name, asset in scene.articulations.items()
+            },
+            "rigid_objects": {
+                name: {"body_com_pos_w": asset.data.body_com_pos_w[:1].detach().cpu().clone()}
+                for name, asset in scene.rigid_objects.items()
+            },
+        }
+        latest_action = getattr(self.env, "latest_action", None)
+        if latest_action is not None:
+            frame["latest_action"] = latest_action[:1].detach().cpu().clone()
+        self.frames.append(frame)
+
+    def _placement(self):
+        from ngine.utils.place_utils.env_utils import calculate_robot_bbox
+        from ngine.utils.place_utils.spatial_index import get_scene_spatial_index
+
+        index = get_scene_spatial_index(self.env)
+        anchor_pos = self.env.scene.articulations["robot"].data.root_pos_w[0].cpu().numpy() - self.env.scene.env_origins[0].cpu().numpy()
+        robot_bbox = calculate_robot_bbox(self.env, anchor_pos)
+        return {
+            "scene_min": None if index.scene_min is None else np.asarray(index.scene_min),
+            "scene_max": None if index.scene_max is None else np.asarray(index.scene_max),
+            "mins": np.asarray(index.tree.mins),
+            "maxs": np.asarray(index.tree.maxs),
+            "robot_min": np.array(robot_bbox.GetMin()),
+            "robot_max": np.array(robot_bbox.GetMax()),
+            "anchor_pos": anchor_pos,
+        }
+
+    def save(self, path: str | Path) -> Path:
+        scene = self.env.scene
+        static = {
+            "articulations": {
+                name: {"body_names": list(asset.data.body_names), "joint_names": list(asset.data.joint_names)}
+                for name, asset in scene.articulations.items()
+            },
+        }
+        frames = {
+            group: {
+                name: {field: torch.cat([f[group][name][field] for f in self.frames]) for field in fields}
+                for name, fields in self.frames[0][group].items()
+            }
+            for group in ("articulations", "rigid_objects")
+        }
+        if "latest_action" in self.frames[0]:
+            frames["latest_action"] = torch.cat([f["latest_action"] for f in self.frames])
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        torch.save({"meta": self.meta, "placement": self._placement(), "static": static, "frames": frames}, path)
+        return path
+
+
+def load_recording(path: str | Path) -> dict:
+    return torch.load(path, weights_only=False)
+
+
+def env_cfg_kwargs(yaml_args, device: str | None = None, headless: bool = True) -> dict:
+    """The ``parse_env_cfg`` kwargs of a teleop config, as stored in the recordings.
+
+    ``execute_mode`` is kept as a string so that recordings load without Isaac Lab, the parse_env_cfg case
+    converts it with ``str_to_execute_mode``.
+    """
+    return {
+        "scene_backend": yaml_args.scene_backend,
+        "task_backend": yaml_args.task_backend,
+        "task_name": yaml_args.task,
+        "robot_name": yaml_args.robot,
+        "scene_name": yaml_args.layout,
+        "robot_scale": yaml_args.robot_scale,
+        "execute_mode": "teleop",
+        "device": yaml_args.device if device is None else device,
+        "num_envs": 1,
+        "use_fabric": not yaml_args.disable_fabric,
+        "usd_simplify": yaml_args.usd_simplify,
+        "seed": yaml_args.seed,
+        "sources": yaml_args.sources,
+        "object_projects": yaml_args.object_projects,
+        "headless_mode": headless,
+    }
+
+
+def write_synthetic_scene(path: str | Path, num_fixtures: int = 40, parts_per_fixture: int = 6,
+                          seed: int = 0) -> Path | None:
+    """Write a small kitchen-like scene usd, fixtures with a ``type`` / ``size``, bodies and a handle joint.
+
+    Returns None when pxr is not installed.
+    """
+    try:
+        from pxr import Gf, Sdf, Usd, UsdGeom
+    except ImportError:
+        return None
+    rng = np.random.default_rng(seed)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    stage = Usd.Stage.CreateNew(str(path))
+    world = UsdGeom.Xform.Define(stage, "/World").GetPrim()
+    stage.SetDefaultPrim(world)
+    fixture_types = ["counter", "cabinet", "drawer", "shelf"]
+    for f in range(num_fixtures):
+        fixture_type = fixture_types[f % len(fixture_types)]
+        size = rng.uniform(0.3, 1.2, 3)
+        xform = UsdGeom.Xform.Define(stage, f"/World/{fixture_type}_{f}")
+        xform.AddTranslateOp().Set(Gf.Vec3d(*rng.uniform(-5.0, 5.0, 2), 0.0))
+        xform.AddRotateXYZOp().Set(Gf.Vec3f(0.0, 0.0, float(rng.choice([0.0, 90.0, 180.0, 270.0]))))
+        xform.AddScaleOp().Set(Gf.Vec3f(1.0, 1.0, 1.0))
+        prim = xform.GetPrim()
+        prim.CreateAttribute("type", Sdf.ValueTypeNames.String).Set(fixture_type)
+        prim.CreateAttribute("size", Sdf.ValueTypeNames.String).Set(",".join(f"{v:.3f}" for v in size))
+        for p in range(parts_per_fixture):
+            body = UsdGeom.Xform.Define(stage, f"{prim.GetPath()}/body_{p}")
+            body.AddTranslateOp().Set(Gf.Vec3d(0.0, 0.0, float(size[2] * p / parts_per_fixture)))
+            cube = UsdGeom.Cube.Define(stage, f"{body.GetPath()}/visuals")
+            cube.CreateSizeAttr(float(size.min() / 2))
+            cube.CreateExtentAttr([Gf.Vec3f(-0.5), Gf.Vec3f(0.5)])
+            if p % 2 == 1:
+                joint = stage.DefinePrim(f"{body.GetPath()}/Handle_joint", "PhysicsRevoluteJoint")
+                joint.CreateAttribute("physics:lowerLimit", Sdf.ValueTypeNames.Float).Set(0.0)
+                joint.CreateAttribute("physics:upperLimit", Sdf.ValueTypeNames.Float).Set(90.0)
+    stage.GetRootLayer().Save()
+    return path
+
+
+def shipped_config_names() -> list[str]:
+    """Names of the configs shipped in ``configs/``, the config cases of synthetic recordings resolve all of them."""
+    from ngine import CONFIGS_PATH
+    from ngine.utils.config_loader import ConfigLoader
+
+    configs_path = CONFIGS_PATH.resolve()
+    return sorted(name for name, path in ConfigLoader().yml_meta.items() if configs_path in Path(path).parents)
+
+
+def synthetic_recording(task: str = "synthetic", seed: int = 0, num_frames: int = 200, num_bodies: int = 24,
+                        num_joints: int = 20, num_objects: int = 8, num_obstacles: int = 300,
+                        config_names: list[str] | None = None, task_config: str | None = "teleop_ci",
+                        workdir: str | Path | None = None) -> dict:
+    """A deterministic recording with the layout of a real one, for machines without recorded inputs.
+
+    ``config_names`` defaults to :func:`shipped_config_names`. The ``parse_env_cfg`` kwargs are the ones of the
+    ``task_config`` teleop config, and with a ``workdir`` the scene usd is a :func:`write_synthetic_scene` in it.
+    """
+    from ngine.utils.config_loader import TELEOP_CONFIG_SCHEMA, config_loader
+
+    rng = np.random.default_rng(seed)
+    generator = torch.Generator().manual_seed(seed)
+
+    def walk(*shape, scale=0.002):
+        steps = torch.randn((num_frames,) + shape, generator=generator) * scale
+        return torch.cumsum(steps, dim=0)
+
+    body_pos = walk(num_bodies, 3) + torch.tensor([0.0, 0.0, 0.8])
+    body_quat = torch.zeros(num_frames, num_bodies, 4)
+    body_quat[..., 0] = 1.0
+    body_names = [f"arm_link{i}" if i < num_bodies // 2 else f"gripper_link{i}" for i in range(num_bodies)]
+    # the elbow joints are the ones checked by the arm joint angle checker
+    joint_names = ["arm_right_elbow_pitch_joint", "arm_left_elbow_pitch_joint"]
+    joint_names += [f"arm_joint{i}" for i in range(num_joints - len(joint_names))]
+
+    centers = np.column_stack([rng.uniform(-5, 5, num_obstacles), rng.uniform(-5, 5, num_obstacles), rng.uniform(0, 2, num_obstacles)])
+    half_sizes = rng.uniform(0.05, 0.5, (num_obstacles, 3))
+    kwargs = {}
+    if task_config is not None:
+        kwargs = env_cfg_kwargs(config_loader.load(task_config, schema=TELEOP_CONFIG_SCHEMA), device="cpu")
+    scene_usd = None
+    if workdir is not None:
+        # one fixture per ten obstacles of the placement boxes
+        path = write_synthetic_scene(
+            Path(workdir) / "scenes" / f"{task}.usda", num_fixtures=max(1, num_obstacles // 10), seed=seed
+        )
+        scene_usd = None if path is None else str(path)
+    return {
+        "meta": {
+            "task": task,
+            "seed": seed,
+            "config_names": shipped_config_names() if config_names is None else list(config_names),
+            "scene_usd": scene_usd,
+            "parse_env_cfg_kwargs": kwargs,
+            "step_dt": 1.0 / 50.0,
+        },
+        "placement": {
+            "scene_min": np.array([-6.0, -6.0, 0.0]),
+            "scene_max": np.array([6.0, 6.0, 3.0]),
+            "mins": centers - half_sizes,
+            "maxs": centers + half_sizes,
+            "robot_min": np.array([-0.4, -0.4, 0.1]),
+            "robot_max": np.array([0.4, 0.4, 1.5]),
+            "anchor_pos": np.array([0.0, 0.0, 0.0]),
+        },
+        "static": {
+            "articulations": {"robot": {"body_names": body_names, "joint_names": joint_names}},
+        },
+        "frames": {
+            "articulations": {
+                "robot": {
+                    "body_com_pose_w": torch.cat([body_pos, body_quat], dim=-1),
+                    "joint_pos": walk(num_joints, scale=0.01),
+                },
+            },
+            "rigid_objects": {
+                f"obj_{i}": {"body_com_pos_w": walk(1, 3, scale=0.0005) + torch.tensor([0.1 * i, 0.0, 0.9])}
+                for i in range(num_objects)
+            },
+            "latest_action": walk(num_joints, scale=0.01),
+        },
+    }
+
+
+class ReplayEnv:
+    """Stand-in of the env exposing the recorded frames through the attributes read by the checkers.
+
+    Frames are recorded for env_0 only, so every tensor has a leading env dimension of 1.
+    """
+
+    def __init__(self, recording: dict):
+        self.recording = recording
+        self.step_dt = recording["meta"]["step_dt"]
+        self.num_frames = len(recording["frames"]["latest_action"]) if "latest_action" in recording["frames"] else \
+            len(next(iter(recording["frames"]["articulations"].values()))["joint_pos"])
+        task = SimpleNamespace(fixture_refs={}, objects={}, get_fixture=lambda *args, **kwargs: None)
+        self.cfg = SimpleNamespace(fixture_refs={}, isaaclab_arena_env=SimpleNamespace(task=task))
+        self.scene = SimpleNamespace(articulations={}, rigid_objects={}, deformable_objects={})
+        for name, static in recording["static"]["articulations"].items():
+            # body and joint names are read from both the articulation and its data
+            self.scene.articulations[name] = SimpleNamespace(data=SimpleNamespace(**static), **static)
+        for name in recording["frames"]["rigid_objects"]:
+            self.scene.rigid_objects[name] = SimpleNamespace(data=SimpleNamespace())
+        self.common_step_counter = 0
+        self.latest_action = None
+        self.set_frame(0)
+
+    @property
+    def unwrapped(self):
+        return self
+
+    def set_frame(self, index: int):
+        frames = self.recording["frames"]
+        for name, fields in frames["articulations"].items():
+            data = self.scene.articulations[name].data
+            data.body_com_pose_w = fields["body_com_pose_w"][index:index + 1]
+            data.body_com_pos_w = data.body_com_pose_w[..., :3]
+            data.joint_pos = fields["joint_pos"][index:index + 1]
+        for name, fields in frames["rigid_objects"].items():
+            self.scene.rigid_objects[name].data.body_com_pos_w = fields["body_com_pos_w"][index:index + 1]
+        if "latest_action" in frames:
+            self.latest_action = frames["latest_action"][index:index + 1]
+        self.common_step_counter = index + 1
@@ -0,0 +1,205 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Run the perf suite and compare the results against a stored baseline.
+
+Example:
+    # capture recordings in Isaac Sim (see capture.py), record a baseline on this machine, then check for regressions
+    python -m ngine.benchmarks.perf.capture --task_config teleop_ci --headless --output recordings/
+    python -m ngine.benchmarks.perf.run --recordings recordings/ --update_baseline
+    python -m ngine.benchmarks.perf.run --recordings recordings/ --output perf_results.json
+
+Without ``--recordings`` the suite runs on deterministic synthetic recordings. The process exits with code 1
+when a case is slower than its baseline by more than ``--threshold`` (relative) and ``--min_delta_ms``.
+
+Baselines are per-machine: the timings only compare against a baseline recorded on the same machine and software
+stack (see its ``meta``), so record one with ``--update_baseline`` before checking a machine for regressions.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import torch
+
+from ngine.benchmarks.perf.cases import PERF_CASES, SkipCase
+from ngine.benchmarks.perf.recorded import load_recording, synthetic_recording
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+
+
+def seed_everything(seed: int):
+    random.seed(seed)
+    np.random.seed(seed)
+    torch.manual_seed(seed)
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=Path(__file__).parent, capture_output=True, text=True, timeout=5
+        ).stdout.strip() or None
+    except Exception:
+        return None
+
+
+def load_recordings(recordings: str | None, seed: int, workdir: str | None = None) -> dict[str, dict]:
+    if recordings is None:
+        return {
+            "synthetic_small": synthetic_recording(
+                "synthetic_small", seed=seed, num_frames=100, num_obstacles=100, workdir=workdir
+            ),
+            "synthetic_large": synthetic_recording(
+                "synthetic_large", seed=seed, num_frames=400, num_obstacles=1000, workdir=workdir
+            ),
+        }
+    paths = sorted(Path(recordings).glob("*.pt")) if Path(recordings).is_dir() else [Path(recordings)]
+    if len(paths) == 0:
+        raise FileNotFoundError(f"No recordings (*.pt) found in {recordings}")
+    return {path.stem: load_recording(path) for path in paths}
+
+
+def time_case(fn, repeat: int, warmup: int) -> dict:
+    for _ in range(warmup):
+        fn()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(1000.0 * (time.perf_counter() - start))
+    times = np.asarray(times)
+    return {
+        "status": "ok",
+        "repeat": repeat,
+        "median_ms": float(np.median(times)),
+        "min_ms": float(times.min()),
+        "p90_ms": float(np.percentile(times, 90)),
+        "first_ms": float(times[0]),
+    }
+
+
+def run_suite(recordings: dict[str, dict], cases: list[str], repeat: int, warmup: int, seed: int, workdir: str) -> dict:
+    results = {}
+    for task, recording in recordings.items():
+        results[task] = {}
+        for case in cases:
+            seed_everything(seed)
+            try:
+                fn = PERF_CASES[case](recording, workdir)
+                results[task][case] = time_case(fn, repeat, warmup)
+            except SkipCase as e:
+                results[task][case] = {"status": "skipped", "reason": str(e)}
+            except Exception as e:
+                results[task][case] = {"status": "error", "reason": f"{type(e).__name__}: {e}"}
+            summary = results[task][case]
+            detail = f"{summary['median_ms']:.3f} ms" if summary["status"] == "ok" else summary["reason"]
+            print(f"[{task}] {case}: {summary['status']} ({detail})")
+    return results
+
+
+def compare_to_baseline(results: dict, baseline: dict, threshold: float, min_delta_ms: float) -> list[dict]:
+    regressions = []
+    for task, task_results in results.items():
+        for case, result in task_results.items():
+            reference = baseline.get("results", {}).get(task, {}).get(case)
+            if result["status"] != "ok" or reference is None or reference.get("status") != "ok":
+                continue
+            delta = result["median_ms"] - reference["median_ms"]
+            if delta > min_delta_ms and result["median_ms"] > reference["median_ms"] * (1.0 + threshold):
+                regressions.append({
+                    "task": task,
+                    "case": case,
+                    "baseline_ms": reference["median_ms"],
+                    "median_ms": result["median_ms"],
+                    "ratio": result["median_ms"] / reference["median_ms"],
+                })
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the ngine perf suite.")
+    parser.add_argument("--recordings", type=str, default=None, help="Recording file or directory of recordings (*.pt)")
+    parser.add_argument("--cases", type=str, default=",".join(PERF_CASES), help="Comma separated cases to run")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=str, default="perf_results.json")
+    parser.add_argument("--baseline", type=str, default=str(DEFAULT_BASELINE))
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed relative slowdown of the median")
+    parser.add_argument("--min_delta_ms", type=float, default=0.5, help="Ignore slowdowns below this absolute delta")
+    parser.add_argument("--update_baseline", action="store_true", help="Store the results as the new baseline")
+    args = parser.parse_args()
+
+    cases = [case for case in args.cases.split(",") if case]
+    unknown = set(cases) - set(PERF_CASES)
+    if unknown:
+        raise ValueError(f"Unknown perf cases: {sorted(unknown)}, available: {list(PERF_CASES)}")
+
+    with tempfile.TemporaryDirectory(prefix="ngine_perf_") as workdir:
+        # isolate the suite from the user caches, so that every run measures the same work
+        os.environ["NGINE_CACHE_DIR"] = os.path.join(workdir, "cache")
+        recordings = load_recordings(args.recordings, args.seed, workdir)
+        results = run_suite(recordings, cases, args.repeat, args.warmup, args.seed, workdir)
+
+    report = {
+        "meta": {
+            "git_commit": git_commit(),
+            "python": sys.version.split()[0],
+            "torch": torch.__version__,
+            "platform": platform.platform(),
+            "machine": platform.node(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "warmup": args.warmup,
+        },
+        "results": results,
+    }
+
+    baseline_path = Path(args.baseline)
+    if args.update_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(baseline_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline written to {baseline_path}")
+    elif baseline_path.exists():
+        with open(baseline_path, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        report["baseline"] = {"path": str(baseline_path), "git_commit": baseline.get("meta", {}).get("git_commit")}
+        report["regressions"] = compare_to_baseline(results, baseline, args.threshold, args.min_delta_ms)
+    else:
+        print(f"No baseline at {baseline_path}, run with --update_baseline to create it.")
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    for regression in report.get("regressions", []):
+        print(
+            f"REGRESSION [{regression['task']}] {regression['case']}: {regression['median_ms']:.3f} ms "
+            f"vs {regression['baseline_ms']:.3f} ms ({regression['ratio']:.2f}x)"
+        )
+    if report.get("regressions"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,5 @@
-from ngine.utils import monkey_patch
+import importlib.util
+
+# the patches target Isaac Lab, tools reading recorded data (checks/offline_eval.py) import ngine.engine without it
+if importlib.util.find_spec("isaaclab") is not None:
+    from ngine.utils import monkey_patch
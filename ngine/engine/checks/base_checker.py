@@ -12,14 +12,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from ngine.utils.profile_utils import TELEMETRY, span
+
+
 class BaseChecker:
     type = "base"
 
     def __init__(self, warning_on_screen=False):
         self.warning_on_screen = warning_on_screen
+        self._span_name = f"checker/{self.type}"
 
     def check(self, env):
-        result = self._check(env)
+        # checkers run every step, skip the span entirely while telemetry is disabled
+        if TELEMETRY.enabled:
+            with span(self._span_name):
+                result = self._check(env)
+        else:
+            result = self._check(env)
         if self.warning_on_screen:
             self.show_warning(result)
         return result
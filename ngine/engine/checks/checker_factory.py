@@ -12,33 +12,29 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from ngine.engine.checks.action_state_inconsistency_checker import ActionStateInconsistencyChecker
-from ngine.engine.checks.actuator_velocity_jump_checker import VelocityJumpChecker
-from ngine.engine.checks.arm_joint_pos_checker import ArmJointAngleChecker
-from ngine.engine.checks.clipping_checker import ClippingChecker
-from ngine.engine.checks.gripper_collision_checker import GripperCollisionChecker
-from ngine.engine.checks.kitchen_coffee_collision_checker import KitchenCoffeeCollisionChecker
-from ngine.engine.checks.motion_checker import MotionChecker
-from ngine.engine.checks.obj_drop_checker import ObjDropChecker
-from ngine.engine.checks.start_object_move_checker import StartObjectMoveChecker
+import importlib
 
+# checkers are imported on first use, the collision checkers need the fixtures and with them Isaac Lab and USD
 CHECKER_REGISTRY = {
-    "motion": MotionChecker,
-    "kitchen_coffee_collision": KitchenCoffeeCollisionChecker,
-    "gripper_collision": GripperCollisionChecker,
-    "clipping": ClippingChecker,
-    "velocity_jump": VelocityJumpChecker,
-    "start_object_move": StartObjectMoveChecker,
-    "obj_drop": ObjDropChecker,
-    "arm_joint_angle": ArmJointAngleChecker,
-    "action_state_inconsistency": ActionStateInconsistencyChecker,
+    "motion": "ngine.engine.checks.motion_checker.MotionChecker",
+    "kitchen_coffee_collision": "ngine.engine.checks.kitchen_coffee_collision_checker.KitchenCoffeeCollisionChecker",
+    "gripper_collision": "ngine.engine.checks.gripper_collision_checker.GripperCollisionChecker",
+    "clipping": "ngine.engine.checks.clipping_checker.ClippingChecker",
+    "velocity_jump": "ngine.engine.checks.actuator_velocity_jump_checker.VelocityJumpChecker",
+    "start_object_move": "ngine.engine.checks.start_object_move_checker.StartObjectMoveChecker",
+    "obj_drop": "ngine.engine.checks.obj_drop_checker.ObjDropChecker",
+    "arm_joint_angle": "ngine.engine.checks.arm_joint_pos_checker.ArmJointAngleChecker",
+    "action_state_inconsistency": (
+        "ngine.engine.checks.action_state_inconsistency_checker.ActionStateInconsistencyChecker"
+    ),
 }
 
 
 def get_checker(checker_type):
     if checker_type not in CHECKER_REGISTRY:
         raise ValueError(f"Checker type {checker_type} not found")
-    return CHECKER_REGISTRY[checker_type]
+    module_name, class_name = CHECKER_REGISTRY[checker_type].rsplit(".", 1)
+    return getattr(importlib.import_module(module_name), class_name)
 
 
 def get_checkers_from_cfg(checkers_cfg):
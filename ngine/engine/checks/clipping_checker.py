@@ -12,8 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+
 from ngine.engine.checks.base_checker import BaseChecker
-from ngine.utils.object_utils import calculate_contact_force
+from ngine.utils.contact_utils import calculate_contact_force
 
 
 class ClippingChecker(BaseChecker):
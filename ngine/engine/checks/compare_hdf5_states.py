@@ -18,26 +18,116 @@ HDF5 State Comparison Script
 This script compares state values between two HDF5 files and reports differences
 in state categories (articulation, rigid_object, deformable_object, etc.).
 
+Datasets are streamed in aligned blocks along the time axis, so memory stays bounded regardless of the
+episode length, and state categories can be compared in a pool of worker processes.
+
 Usage:
-    python compare_hdf5_states.py <file1.hdf5> <file2.hdf5> [--tolerance 1e-6] [--verbose]
+    python compare_hdf5_states.py <file1.hdf5> <file2.hdf5> [--tolerance 1e-6] [--verbose] [--workers 8]
 """
 
 import argparse
 import json
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 import h5py
 import numpy as np
 
+STATE_CATEGORIES = ['articulation', 'rigid_object', 'deformable_object']
+DEFAULT_BLOCK_BYTES = 32 << 20
 
-class HDF5StateComparator:
-    """Compare state values between two HDF5 files."""
 
-    def __init__(self, file1_path: str, file2_path: str, tolerance: float = 1e-6):
+def _compare_category_worker(file1_path: str, file2_path: str, episode: str, category: str, comparator_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Compare one state category of one episode, opening the files in the worker process."""
+    comparator = HDF5StateComparator(file1_path, file2_path, **comparator_kwargs)
+    with h5py.File(file1_path, 'r') as f1, h5py.File(file2_path, 'r') as f2:
+        path = f"data/{episode}/states/{category}"
+        return comparator._compare_category(f1[path], f2[path], category)
+
+
+class _StreamingDiff:
+    """Running statistics of the element-wise difference of two datasets, fed block by block."""
+
+    def __init__(self, tolerance: float, is_float: bool, max_reported_indices: int):
+        self.tolerance = tolerance
+        self.is_float = is_float
+        self.max_reported_indices = max_reported_indices
+        self.num_elements = 0
+        self.num_violations = 0
+        self.sum_diff = 0.0
+        self.max_diff = 0.0
+        self.max_diff_index = None
+        self.first_divergence = None
+        self.reported_indices = []
+        self.any_difference = False
+
+    def update(self, block1: np.ndarray, block2: np.ndarray, row_offset: int, shape: Tuple[int, ...]):
+        self.num_elements += block1.size
+        if self.is_float:
+            # matching values (infinities included) and matching NaNs are equal, any other NaN difference
+            # (a NaN against a number, or opposite infinities) is an infinite difference
+            equal = (block1 == block2) | (np.isnan(block1) & np.isnan(block2))
+            with np.errstate(invalid='ignore'):
+                diff = np.abs(block1.astype(np.float64) - block2.astype(np.float64))
+            diff[equal] = 0.0
+            diff[np.isnan(diff)] = np.inf
+            violations = diff > self.tolerance
+            if diff.size > 0:
+                self.any_difference |= bool(np.any(diff != 0))
+                self.sum_diff += float(diff.sum())
+                block_max_pos = int(np.argmax(diff))
+                if diff.flat[block_max_pos] > self.max_diff or self.max_diff_index is None:
+                    self.max_diff = float(diff.flat[block_max_pos])
+                    self.max_diff_index = self._global_index(block_max_pos, block1.shape, row_offset, shape)
+        else:
+            violations = block1 != block2
+            self.any_difference |= bool(np.any(violations))
+
+        num_block_violations = int(np.count_nonzero(violations))
+        if num_block_violations == 0:
+            return
+        self.num_violations += num_block_violations
+        flat_positions = np.flatnonzero(violations)
+        if self.first_divergence is None:
+            self.first_divergence = self._global_index(int(flat_positions[0]), block1.shape, row_offset, shape)
+        missing = self.max_reported_indices - len(self.reported_indices)
+        for pos in flat_positions[:max(missing, 0)]:
+            self.reported_indices.append(self._global_index(int(pos), block1.shape, row_offset, shape))
+
+    @staticmethod
+    def _global_index(flat_pos: int, block_shape: Tuple[int, ...], row_offset: int, shape: Tuple[int, ...]) -> List[int]:
+        if len(shape) == 0:
+            return []
+        index = list(np.unravel_index(flat_pos, block_shape))
+        index[0] += row_offset
+        return [int(i) for i in index]
+
+    @property
+    def mean_diff(self) -> float:
+        return self.sum_diff / self.num_elements if self.num_elements else 0.0
+
+
+class HDF5StateComparator:
+    """Compare state values between two HDF5 files.
+
+    Args:
+        file1_path: First HDF5 file.
+        file2_path: Second HDF5 file.
+        tolerance: Absolute tolerance of the floating point comparisons.
+        block_bytes: Maximum size of the block read from each dataset at once.
+        num_workers: Number of worker processes comparing state categories, compare serially if <= 1.
+        max_reported_indices: Maximum number of divergent indices listed per state.
+    """
+
+    def __init__(self, file1_path: str, file2_path: str, tolerance: float = 1e-6, block_bytes: int = DEFAULT_BLOCK_BYTES,
+                 num_workers: int = 1, max_reported_indices: int = 100):
         self.file1_path = file1_path
         self.file2_path = file2_path
         self.tolerance = tolerance
+        self.block_bytes = block_bytes
+        self.num_workers = num_workers
+        self.max_reported_indices = max_reported_indices
         self.differences = []
 
     def compare_files(self) -> Dict[str, Any]:
@@ -133,10 +223,20 @@ class HDF5StateComparator:
             print(f"  Episodes only in file 2: {len(only_in_file2_episodes)}")
         print(f"  Common episodes: {len(common_episodes)}")
 
-        # Compare state data for common episodes
-        for episode in common_episodes:
+        # Compare state data for common episodes, one task per (episode, category)
+        episode_diffs = {}
+        tasks = []
+        for episode in sorted(common_episodes):
             print(f"\n  Comparing episode: {episode}")
-            episode_diff = self._compare_episode_states(f1, f2, episode)
+            episode_diffs[episode], categories = self._prepare_episode_states(f1, f2, episode)
+            tasks.extend((episode, category) for category in categories)
+
+        for (episode, category), category_diff in zip(tasks, self._run_category_tasks(f1, f2, tasks)):
+            if category_diff['has_differences']:
+                episode_diffs[episode]['category_differences'][category] = category_diff
+                episode_diffs[episode]['has_differences'] = True
+
+        for episode, episode_diff in episode_diffs.items():
             if episode_diff['has_differences']:
                 state_differences['episode_differences'][episode] = episode_diff
 
@@ -151,8 +251,8 @@ class HDF5StateComparator:
             return []
         return [key for key in f['data'].keys() if key.startswith('demo_')]
 
-    def _compare_episode_states(self, f1: h5py.File, f2: h5py.File, episode: str) -> Dict[str, Any]:
-        """Compare state data for a specific episode."""
+    def _prepare_episode_states(self, f1: h5py.File, f2: h5py.File, episode: str) -> Tuple[Dict[str, Any], List[str]]:
+        """Check the state layout of an episode and list the categories present in both files."""
         episode_diff = {
             'has_differences': False,
             'category_differences': {},
@@ -161,26 +261,23 @@ class HDF5StateComparator:
         }
 
         # Check if states exist in both files
-        states_path1 = f"data/{episode}/states"
-        states_path2 = f"data/{episode}/states"
+        states_path = f"data/{episode}/states"
 
-        if states_path1 not in f1:
+        if states_path not in f1:
             episode_diff['missing_categories']['file1'].append('states')
-            return episode_diff
-        if states_path2 not in f2:
+            return episode_diff, []
+        if states_path not in f2:
             episode_diff['missing_categories']['file2'].append('states')
-            return episode_diff
+            return episode_diff, []
 
-        states1 = f1[states_path1]
-        states2 = f2[states_path2]
+        states1 = f1[states_path]
+        states2 = f2[states_path]
 
         # Compare each state category (articulation, rigid_object, deformable_object)
-        for category in ['articulation', 'rigid_object', 'deformable_object']:
+        categories = []
+        for category in STATE_CATEGORIES:
             if category in states1 and category in states2:
-                category_diff = self._compare_category(states1[category], states2[category], category)
-                if category_diff['has_differences']:
-                    episode_diff['category_differences'][category] = category_diff
-                    episode_diff['has_differences'] = True
+                categories.append(category)
             elif category in states1:
                 episode_diff['missing_categories']['file2'].append(f'states/{category}')
                 episode_diff['has_differences'] = True
@@ -188,8 +285,36 @@ class HDF5StateComparator:
                 episode_diff['missing_categories']['file1'].append(f'states/{category}')
                 episode_diff['has_differences'] = True
 
+        return episode_diff, categories
+
+    def _compare_episode_states(self, f1: h5py.File, f2: h5py.File, episode: str) -> Dict[str, Any]:
+        """Compare state data for a specific episode."""
+        episode_diff, categories = self._prepare_episode_states(f1, f2, episode)
+        for category, category_diff in zip(categories, self._run_category_tasks(f1, f2, [(episode, c) for c in categories])):
+            if category_diff['has_differences']:
+                episode_diff['category_differences'][category] = category_diff
+                episode_diff['has_differences'] = True
         return episode_diff
 
+    def _run_category_tasks(self, f1: h5py.File, f2: h5py.File, tasks: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """Compare the (episode, category) tasks, in a process pool if num_workers > 1."""
+        if self.num_workers <= 1 or len(tasks) <= 1:
+            return [
+                self._compare_category(f1[f"data/{episode}/states/{category}"], f2[f"data/{episode}/states/{category}"], category)
+                for episode, category in tasks
+            ]
+        comparator_kwargs = dict(
+            tolerance=self.tolerance,
+            block_bytes=self.block_bytes,
+            max_reported_indices=self.max_reported_indices,
+        )
+        with ProcessPoolExecutor(max_workers=min(self.num_workers, len(tasks))) as pool:
+            futures = [
+                pool.submit(_compare_category_worker, self.file1_path, self.file2_path, episode, category, comparator_kwargs)
+                for episode, category in tasks
+            ]
+            return [future.result() for future in futures]
+
     def _compare_category(self, cat1: h5py.Group, cat2: h5py.Group, category_name: str) -> Dict[str, Any]:
         """Compare a specific state category between two files."""
         category_diff = {
@@ -279,42 +404,40 @@ class HDF5StateComparator:
             state_diff['has_differences'] = True
             return state_diff
 
-        # Compare values
+        # Compare values block by block
         try:
-            data1 = state1[:]
-            data2 = state2[:]
+            is_float = np.issubdtype(state1.dtype, np.floating)
+            stats = _StreamingDiff(self.tolerance, is_float, self.max_reported_indices)
+            for row_offset, block1, block2 in self._iter_blocks(state1, state2):
+                stats.update(block1, block2, row_offset, state1.shape)
 
-            if np.array_equal(data1, data2):
+            if not stats.any_difference:
                 return state_diff
 
-            # Calculate differences
-            if np.issubdtype(data1.dtype, np.floating):
-                diff = np.abs(data1 - data2)
-                max_diff = np.max(diff)
-                mean_diff = np.mean(diff)
-
-                state_diff['max_difference'] = float(max_diff)
-                state_diff['mean_difference'] = float(mean_diff)
-
-                if max_diff > self.tolerance:
-                    state_diff['has_differences'] = True
-
-                    # Find locations with significant differences
-                    significant_diff_mask = diff > self.tolerance
-                    if np.any(significant_diff_mask):
-                        diff_indices = np.where(significant_diff_mask)
-                        state_diff['value_differences'] = {
-                            'indices_with_differences': [idx.tolist() for idx in diff_indices],
-                            'max_diff_value': float(np.max(diff[significant_diff_mask])),
-                            'num_different_elements': int(np.sum(significant_diff_mask))
-                        }
-            else:
-                # For non-numeric data, check for exact equality
-                if not np.array_equal(data1, data2):
-                    state_diff['has_differences'] = True
+            if is_float:
+                state_diff['max_difference'] = stats.max_diff
+                state_diff['mean_difference'] = stats.mean_diff
+
+            if stats.num_violations > 0:
+                state_diff['has_differences'] = True
+                if is_float:
+                    # Locations with significant differences, one index list per axis (capped at max_reported_indices)
+                    state_diff['value_differences'] = {
+                        'indices_with_differences': [list(axis) for axis in zip(*stats.reported_indices)],
+                        'first_divergence': stats.first_divergence,
+                        'first_divergence_step': stats.first_divergence[0] if stats.first_divergence else None,
+                        'max_diff_index': stats.max_diff_index,
+                        'max_diff_value': stats.max_diff,
+                        'num_different_elements': stats.num_violations,
+                    }
+                else:
+                    # For non-numeric data, check for exact equality
                     state_diff['value_differences'] = {
                         'type': 'non_numeric_difference',
-                        'description': 'Non-numeric data differs between files'
+                        'description': 'Non-numeric data differs between files',
+                        'first_divergence': stats.first_divergence,
+                        'first_divergence_step': stats.first_divergence[0] if stats.first_divergence else None,
+                        'num_different_elements': stats.num_violations,
                     }
 
         except Exception as e:
@@ -326,6 +449,40 @@ class HDF5StateComparator:
 
         return state_diff
 
+    def _iter_blocks(self, state1: h5py.Dataset, state2: h5py.Dataset):
+        """Yield (row_offset, block1, block2) along the first axis, reading at most block_bytes per dataset.
+
+        Blocks are aligned to the chunk layout of the first dataset and read into reused buffers.
+        """
+        if state1.ndim == 0:
+            yield 0, np.asarray(state1[()]), np.asarray(state2[()])
+            return
+        num_rows = state1.shape[0]
+        if num_rows == 0:
+            return
+        row_bytes = max(state1.dtype.itemsize * int(np.prod(state1.shape[1:])), 1)
+        rows = max(self.block_bytes // row_bytes, 1)
+        if state1.chunks is not None and rows >= state1.chunks[0]:
+            rows = rows // state1.chunks[0] * state1.chunks[0]
+        rows = min(rows, num_rows)
+
+        if state1.dtype.kind in 'OSUV':
+            # variable length / string data cannot be read into preallocated buffers
+            for start in range(0, num_rows, rows):
+                end = min(start + rows, num_rows)
+                yield start, np.asarray(state1[start:end]), np.asarray(state2[start:end])
+            return
+
+        buffer1 = np.empty((rows,) + state1.shape[1:], dtype=state1.dtype)
+        buffer2 = np.empty((rows,) + state2.shape[1:], dtype=state2.dtype)
+        for start in range(0, num_rows, rows):
+            end = min(start + rows, num_rows)
+            block1 = buffer1[:end - start]
+            block2 = buffer2[:end - start]
+            state1.read_direct(block1, source_sel=np.s_[start:end], dest_sel=np.s_[0:end - start])
+            state2.read_direct(block2, source_sel=np.s_[start:end], dest_sel=np.s_[0:end - start])
+            yield start, block1, block2
+
     def _update_category_summary(self, state_differences: Dict[str, Any]):
         """Update category-level summary of differences."""
         category_summary = {}
@@ -432,6 +589,17 @@ class HDF5StateComparator:
                             print(f"        {state}: max_diff={state_info['max_difference']:.2e}, mean_diff={state_info['mean_difference']:.2e}")
 
 
+def _json_safe(value: Any) -> Any:
+    """Replace the non-finite floats of a report, which strict JSON cannot represent, by their string form."""
+    if isinstance(value, dict):
+        return {key: _json_safe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(item) for item in value]
+    if isinstance(value, float) and not np.isfinite(value):
+        return str(value)
+    return value
+
+
 def main():
     parser = argparse.ArgumentParser(description='Compare state values between two HDF5 files')
     parser.add_argument('file1', help='First HDF5 file path')
@@ -439,6 +607,8 @@ def main():
     parser.add_argument('--tolerance', type=float, default=1e-6, help='Tolerance for numerical comparisons')
     parser.add_argument('--verbose', action='store_true', help='Print detailed information')
     parser.add_argument('--output', help='Output file for detailed report (JSON format)')
+    parser.add_argument('--workers', type=int, default=1, help='Number of worker processes comparing state categories')
+    parser.add_argument('--block_mb', type=float, default=DEFAULT_BLOCK_BYTES / (1 << 20), help='Maximum block size read per dataset (MB)')
 
     args = parser.parse_args()
 
@@ -453,7 +623,9 @@ def main():
 
     # Perform comparison
     try:
-        comparator = HDF5StateComparator(args.file1, args.file2, args.tolerance)
+        comparator = HDF5StateComparator(
+            args.file1, args.file2, args.tolerance, block_bytes=int(args.block_mb * (1 << 20)), num_workers=args.workers
+        )
         result = comparator.compare_files()
 
         # Print report
@@ -462,7 +634,7 @@ def main():
         # Save detailed report if requested
         if args.output:
             with open(args.output, 'w') as f:
-                json.dump(result, f, indent=2, default=str)
+                json.dump(_json_safe(result), f, indent=2, default=str, allow_nan=False)
             print(f"\nDetailed report saved to: {args.output}")
 
         # Return appropriate exit code
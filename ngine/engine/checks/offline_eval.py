@@ -0,0 +1,344 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Offline Checker Evaluation
+
+This script replays the recorded episodes of HDF5 datasets through the quality checkers, without a simulator,
+and writes one verdict per episode.
+
+Every frame of an episode is exposed through :class:`EpisodeReplayEnv`, a stand-in of the env with the
+attributes the checkers read, and the checkers are called once per frame as ``TaskBase.check_success_caller``
+does during the simulation. The inputs come from:
+
+- ``states``: robot joint positions, rigid object root poses and deformable object nodal positions.
+- ``actions``: the env actions, read as ``env.latest_action``.
+- ``checker_signals``: robot body poses and the net forces of the ``*_contact`` sensors, written by the
+  ``PostStepCheckerSignalsRecorder`` recorder term when the task config sets ``record_checker_signals``.
+
+A checker whose inputs are not in the episode is reported as skipped. Body and joint names are not stored
+in the datasets, pass them with --names (``{"body_names": [...], "joint_names": [...]}`` of the robot).
+The verdicts are also appended as one batch to the ``quality_report`` store next to them, see quality_report.py.
+
+Usage:
+    python offline_eval.py <dataset_dir_or_file> [--output verdicts.json] [--checkers obj_drop,clipping] [--workers 8]
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+import h5py
+import numpy as np
+import torch
+
+from ngine.engine.checks.checker_factory import get_checker
+from ngine.engine.checks.quality_report import REPORT_DIR, QualityReportStore, rows_from_verdicts
+
+# step_dt of the recorded tasks: physics at 100 Hz with a decimation of 2
+DEFAULT_STEP_DT = 1.0 / 50.0
+
+# episode inputs each checker needs, the other registered checkers need the live scene
+CHECKER_INPUTS = {
+    "obj_drop": ("objects",),
+    "clipping": ("contact_forces",),
+    "motion": ("body_poses",),
+    "velocity_jump": ("body_poses", "body_names"),
+    "arm_joint_angle": ("joint_pos", "joint_names"),
+    "action_state_inconsistency": ("joint_pos", "joint_names", "actions"),
+}
+
+CLIPPING_SENSORS = ("left_gripper", "right_gripper")
+
+VERDICTS_FILE = "quality_verdicts.json"
+
+# subgroups of a ``data/demo_*`` group read by the checkers, the camera observations and raw input are never loaded
+EPISODE_INPUTS = ("states", "actions", "checker_signals")
+
+
+def _read_tree(group, keys=None):
+    """Reads an HDF5 group, or only its ``keys`` children when given, into a nested dict of torch tensors."""
+    tree = {}
+    for name in group.keys() if keys is None else [key for key in keys if key in group]:
+        node = group[name]
+        if isinstance(node, h5py.Group):
+            tree[name] = _read_tree(node)
+        else:
+            tree[name] = torch.from_numpy(np.asarray(node[()]))
+    return tree
+
+
+class EpisodeReplayEnv:
+    """
+    Stand-in of the env exposing one recorded frame at a time through the attributes read by the checkers.
+
+    Args:
+        episode (dict): nested tensors of one ``data/demo_*`` group, see :func:`_read_tree`
+        names (dict): optional robot ``body_names`` / ``joint_names``
+        step_dt (float): env step duration of the recording
+    """
+
+    def __init__(self, episode, names=None, step_dt=DEFAULT_STEP_DT):
+        names = names or {}
+        states = episode.get("states", {})
+        signals = episode.get("checker_signals", {})
+        self.step_dt = step_dt
+        self.num_envs = 1
+        self.device = "cpu"
+        self.common_step_counter = 0
+        self.latest_action = None
+        self.cfg = SimpleNamespace(fixture_refs={}, isaaclab_arena_env=SimpleNamespace(task=None))
+        self.scene = SimpleNamespace(articulations={}, rigid_objects={}, deformable_objects={}, sensors={}, state={})
+
+        self._frames = {}
+        robot = states.get("articulation", {}).get("robot", {})
+        robot_data = SimpleNamespace()
+        if "joint_position" in robot:
+            self._frames[("robot", "joint_pos")] = robot["joint_position"]
+        if "robot_body_com_pose_w" in signals:
+            self._frames[("robot", "body_com_pose_w")] = signals["robot_body_com_pose_w"]
+        robot_data.body_names = list(names.get("body_names") or [])
+        robot_data.joint_names = list(names.get("joint_names") or [])
+        if not robot_data.body_names and "robot_body_com_pose_w" in signals:
+            robot_data.body_names = [f"body_{i}" for i in range(signals["robot_body_com_pose_w"].shape[1])]
+        self.scene.articulations["robot"] = SimpleNamespace(data=robot_data, joint_names=robot_data.joint_names)
+
+        for name, fields in states.get("rigid_object", {}).items():
+            if "root_pose" in fields:
+                self.scene.rigid_objects[name] = SimpleNamespace(data=SimpleNamespace())
+                self._frames[("rigid_object", name)] = fields["root_pose"][:, None, :3]
+        for name, fields in states.get("deformable_object", {}).items():
+            if "nodal_position" in fields:
+                self.scene.deformable_objects[name] = SimpleNamespace(data=SimpleNamespace())
+                self._frames[("deformable_object", name)] = fields["nodal_position"]
+        for name, forces in signals.get("contact_forces", {}).items():
+            self.scene.sensors[f"{name}_contact"] = SimpleNamespace(data=SimpleNamespace())
+            self._frames[("sensor", name)] = forces
+        if "actions" in episode:
+            self._frames[("actions", None)] = episode["actions"]
+
+        lengths = [len(values) for values in self._frames.values()]
+        self.num_frames = min(lengths) if lengths else 0
+        self.inputs = {
+            "objects": bool(self.scene.rigid_objects or self.scene.deformable_objects),
+            "contact_forces": all(f"{name}_contact" in self.scene.sensors for name in CLIPPING_SENSORS),
+            "body_poses": ("robot", "body_com_pose_w") in self._frames,
+            "body_names": bool(names.get("body_names")),
+            "joint_pos": ("robot", "joint_pos") in self._frames,
+            "joint_names": bool(robot_data.joint_names),
+            "actions": ("actions", None) in self._frames,
+        }
+
+    @property
+    def unwrapped(self):
+        return self
+
+    def set_frame(self, index):
+        frame = slice(index, index + 1)
+        robot = self.scene.articulations["robot"].data
+        for (kind, name), values in self._frames.items():
+            if kind == "robot":
+                setattr(robot, name, values[frame])
+            elif kind == "rigid_object":
+                self.scene.rigid_objects[name].data.body_com_pos_w = values[frame]
+            elif kind == "deformable_object":
+                self.scene.deformable_objects[name].data.nodal_pos_w = values[frame]
+            elif kind == "sensor":
+                self.scene.sensors[f"{name}_contact"].data.net_forces_w = values[frame]
+            else:
+                self.latest_action = values[frame]
+        if hasattr(robot, "body_com_pose_w"):
+            robot.body_com_pos_w = robot.body_com_pose_w[..., :3]
+        self.common_step_counter = index + 1
+
+
+def _jsonable(value):
+    if isinstance(value, torch.Tensor):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, dict):
+        return {str(k): _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    return value
+
+
+def evaluate_episode(episode, checker_types, names=None, step_dt=DEFAULT_STEP_DT):
+    """
+    Runs the checkers over every frame of one episode.
+
+    Returns:
+        dict: per checker ``status`` (passed / failed / skipped / error) and the final ``metrics``, and the episode ``passed``
+    """
+    env = EpisodeReplayEnv(episode, names, step_dt)
+    checkers, report = [], {}
+    for checker_type in checker_types:
+        missing = [key for key in CHECKER_INPUTS.get(checker_type, ("live_scene",)) if not env.inputs.get(key)]
+        if missing:
+            report[checker_type] = {"status": "skipped", "missing": missing}
+        else:
+            checkers.append(get_checker(checker_type)(warning_on_screen=False))
+
+    # a frame verdict only covers that frame for some checkers (motion), so any failing frame fails the episode
+    results = {checker.type: {} for checker in checkers}
+    first_failure = {}
+    with torch.no_grad():
+        for index in range(env.num_frames):
+            env.set_frame(index)
+            for checker in list(checkers):
+                try:
+                    result = checker.check(env) or {}
+                except Exception as e:
+                    report[checker.type] = {"status": "error", "error": f"{type(e).__name__}: {e}", "frame": index}
+                    checkers.remove(checker)
+                    continue
+                results[checker.type] = result
+                if not result.get("success", True) and checker.type not in first_failure:
+                    first_failure[checker.type] = index
+
+    for checker in checkers:
+        entry = {
+            "status": "failed" if checker.type in first_failure else "passed",
+            "metrics": _jsonable(checker.get_metrics(results[checker.type])),
+        }
+        if checker.type in first_failure:
+            entry["first_failure_frame"] = first_failure[checker.type]
+        report[checker.type] = entry
+    return {
+        "num_frames": env.num_frames,
+        "passed": all(entry["status"] not in ("failed", "error") for entry in report.values()),
+        "checkers": report,
+    }
+
+
+def evaluate_file(path, checker_types, names=None, step_dt=DEFAULT_STEP_DT):
+    """Evaluates every episode of one HDF5 file, returns {episode name: verdict}."""
+    verdicts = {}
+    with h5py.File(path, "r") as f:
+        data = f.get("data")
+        if data is None:
+            return verdicts
+        for name in sorted(data.keys(), key=lambda n: (len(n), n)):
+            group = data[name]
+            verdict = evaluate_episode(_read_tree(group, EPISODE_INPUTS), checker_types, names, step_dt)
+            if "success" in group.attrs:
+                verdict["recorded_success"] = bool(group.attrs["success"])
+            verdicts[name] = verdict
+    return verdicts
+
+
+def _evaluate_task(task):
+    path, checker_types, names, step_dt = task
+    t0 = time.perf_counter()
+    try:
+        return path, {"status": "ok", "episodes": evaluate_file(path, checker_types, names, step_dt), "seconds": time.perf_counter() - t0}
+    except Exception as e:
+        return path, {"status": "failed", "error": f"{type(e).__name__}: {e}", "seconds": time.perf_counter() - t0}
+
+
+def find_datasets(root):
+    root = Path(root)
+    if root.is_file():
+        return [root]
+    return sorted(p for p in root.rglob("*") if p.suffix in (".hdf5", ".h5") and p.is_file())
+
+
+def evaluate_datasets(input_path, output_path=None, checker_types=None, names=None, step_dt=DEFAULT_STEP_DT,
+                      workers=None, report_dir=None, batch=None, log=print):
+    """
+    Evaluates every episode of every HDF5 dataset below ``input_path`` in a process pool.
+
+    Args:
+        input_path: dataset file or directory searched recursively
+        output_path: verdicts json, ``<input dir>/quality_verdicts.json`` by default
+        checker_types: checkers to run, all the ones that can run offline by default
+        names: robot ``body_names`` / ``joint_names``
+        workers: process pool size, 0 to evaluate in this process
+        report_dir: quality report store the verdicts are appended to, ``<output dir>/quality_report`` by default
+        batch: batch name of the appended rows, the current time by default
+
+    Returns:
+        dict: the written verdicts
+    """
+    checker_types = list(checker_types or CHECKER_INPUTS)
+    paths = find_datasets(input_path)
+    root = Path(input_path) if Path(input_path).is_dir() else Path(input_path).parent
+    output_path = Path(output_path) if output_path else root / VERDICTS_FILE
+    tasks = [(str(path), checker_types, names, step_dt) for path in paths]
+
+    if workers is None:
+        workers = min(len(tasks), os.cpu_count() or 1)
+    if workers > 0 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_evaluate_task, tasks))
+    else:
+        results = [_evaluate_task(task) for task in tasks]
+
+    files = {}
+    num_episodes, num_failed = 0, 0
+    for path, result in results:
+        files[os.path.relpath(path, root)] = result
+        for verdict in result.get("episodes", {}).values():
+            num_episodes += 1
+            num_failed += not verdict["passed"]
+        if result["status"] == "failed":
+            log(f"{path}: {result['error']}")
+    verdicts = {"checkers": checker_types, "step_dt": step_dt, "files": files}
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_suffix(output_path.suffix + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(verdicts, f, indent=2)
+    os.replace(tmp_path, output_path)
+    report_dir = Path(report_dir) if report_dir else output_path.parent / REPORT_DIR
+    QualityReportStore(report_dir).append(rows_from_verdicts(verdicts), batch)
+    log(f"{num_episodes} episodes in {len(paths)} files, {num_failed} episodes failing a checker, verdicts written to {output_path}")
+    return verdicts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate the quality checkers on recorded HDF5 episodes, without a simulator.")
+    parser.add_argument("input", type=str, help="HDF5 dataset or directory of datasets")
+    parser.add_argument("--output", type=str, default=None, help=f"Verdicts json, <input dir>/{VERDICTS_FILE} by default")
+    parser.add_argument("--checkers", type=str, default=",".join(CHECKER_INPUTS), help="Comma separated checker types")
+    parser.add_argument("--names", type=str, default=None, help="Json file with the robot body_names and joint_names")
+    parser.add_argument("--step_dt", type=float, default=DEFAULT_STEP_DT)
+    parser.add_argument("--workers", type=int, default=None, help="Process pool size, 0 to evaluate in this process")
+    parser.add_argument("--report_dir", type=str, default=None, help=f"Quality report store, <output dir>/{REPORT_DIR} by default")
+    parser.add_argument("--batch", type=str, default=None, help="Batch name in the quality report, the current time by default")
+    args = parser.parse_args()
+
+    names = None
+    if args.names:
+        with open(args.names) as f:
+            names = json.load(f)
+    evaluate_datasets(
+        args.input,
+        args.output,
+        checker_types=[t for t in args.checkers.split(",") if t],
+        names=names,
+        step_dt=args.step_dt,
+        workers=args.workers,
+        report_dir=args.report_dir,
+        batch=args.batch,
+        log=lambda message: print(f"[offline_eval] {message}"),
+    )
+
+
+if __name__ == "__main__":
+    main()
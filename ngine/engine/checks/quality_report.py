@@ -0,0 +1,323 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Episode Quality Report
+
+Columnar store of the checker results, one Parquet part file per appended batch in a ``quality_report``
+directory next to the datasets. Every checker verdict of an episode is one row with ``metric`` unset, every
+flattened ``get_metrics`` entry of it one more row with the metric name and its ``value`` (numbers and booleans)
+or ``text`` (anything else, as json).
+
+Rows come from ``TaskBase.get_checker_results`` at the end of a teleop or replay session, or from the verdicts
+written by offline_eval.py. Appending never rewrites the existing parts, ``compact`` merges them.
+
+Usage:
+    python quality_report.py ingest quality_verdicts.json [--report_dir quality_report] [--batch night_01]
+    python quality_report.py query quality_report [--where checker=obj_drop] [--group_by batch,checker] [--metric robot.joint_1]
+    python quality_report.py query quality_report --where status=failed --rows
+    python quality_report.py compact quality_report
+"""
+
+import argparse
+import json
+import os
+import time
+import uuid
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+REPORT_DIR = "quality_report"
+
+SCHEMA = pa.schema(
+    [
+        ("batch", pa.string()),
+        ("recorded_at", pa.timestamp("ms")),
+        ("dataset", pa.string()),
+        ("episode", pa.string()),
+        ("checker", pa.string()),
+        ("status", pa.string()),
+        ("num_frames", pa.int64()),
+        ("first_failure_frame", pa.int64()),
+        ("metric", pa.string()),
+        ("value", pa.float64()),
+        ("text", pa.string()),
+    ]
+)
+
+WHERE_OPERATORS = ("!=", ">=", "<=", "=", ">", "<")
+
+
+def default_batch():
+    return time.strftime("%Y%m%d-%H%M%S")
+
+
+def flatten_metrics(metrics, prefix=""):
+    """Flattens nested metrics into {dotted name: leaf}."""
+    flat = {}
+    for key, value in (metrics or {}).items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten_metrics(value, f"{name}."))
+        else:
+            flat[name] = value
+    return flat
+
+
+def _metric_row(name, value):
+    if isinstance(value, (bool, np.bool_, int, float, np.integer, np.floating)):
+        return {"metric": name, "value": float(value), "text": None}
+    if isinstance(value, np.ndarray) and value.size == 1:
+        return {"metric": name, "value": float(value.item()), "text": None}
+    if isinstance(value, np.ndarray):
+        value = value.tolist()
+    return {"metric": name, "value": None, "text": value if isinstance(value, str) else json.dumps(value, default=str)}
+
+
+def checker_rows(dataset, episode, checker, status, metrics=None, num_frames=None, first_failure_frame=None, text=None):
+    """Rows of one checker verdict: the status row, then one row per flattened metric."""
+    base = {
+        "dataset": str(dataset),
+        "episode": str(episode),
+        "checker": checker,
+        "status": status,
+        "num_frames": num_frames,
+        "first_failure_frame": first_failure_frame,
+    }
+    rows = [{**base, "metric": None, "value": None, "text": text}]
+    for name, value in flatten_metrics(metrics).items():
+        rows.append({**base, **_metric_row(name, value)})
+    return rows
+
+
+def rows_from_checker_results(checker_results, dataset, episode):
+    """
+    Rows of the ``TaskBase.get_checker_results`` output, {checker type: metrics}.
+
+    The verdict is the ``success`` entry the checkers put into their metrics, ``unknown`` without it.
+    """
+    rows = []
+    for checker, metrics in checker_results.items():
+        metrics = dict(metrics or {})
+        success = metrics.pop("success", None)
+        status = "unknown" if success is None else ("passed" if bool(success) else "failed")
+        rows.extend(checker_rows(dataset, episode, checker, status, metrics))
+    return rows
+
+
+def rows_from_verdicts(verdicts):
+    """Rows of the verdicts written by offline_eval.py, a file that failed to load is one ``error`` row."""
+    rows = []
+    for dataset, result in verdicts.get("files", {}).items():
+        if result.get("status") == "failed":
+            rows.extend(checker_rows(dataset, "", "", "error", text=result.get("error")))
+            continue
+        for episode, verdict in result.get("episodes", {}).items():
+            for checker, entry in verdict["checkers"].items():
+                text = entry.get("error") or (",".join(entry["missing"]) if entry.get("missing") else None)
+                rows.extend(
+                    checker_rows(
+                        dataset,
+                        episode,
+                        checker,
+                        entry["status"],
+                        entry.get("metrics"),
+                        num_frames=verdict.get("num_frames"),
+                        first_failure_frame=entry.get("first_failure_frame"),
+                        text=text,
+                    )
+                )
+    return rows
+
+
+class QualityReportStore:
+    """
+    Append-only Parquet store of checker rows.
+
+    Args:
+        root: report directory, created on the first append
+    """
+
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def parts(self):
+        if not self.root.is_dir():
+            return []
+        return sorted(p for p in self.root.glob("part-*.parquet"))
+
+    def append(self, rows, batch=None):
+        """
+        Writes ``rows`` as a new part file, all rows get the same ``batch`` and ``recorded_at``.
+
+        Returns:
+            Path or None: the written part, None if there were no rows
+        """
+        if not rows:
+            return None
+        batch = batch or default_batch()
+        recorded_at = int(time.time() * 1000)
+        columns = {name: [row.get(name) for row in rows] for name in SCHEMA.names if name not in ("batch", "recorded_at")}
+        columns["batch"] = [batch] * len(rows)
+        columns["recorded_at"] = [recorded_at] * len(rows)
+        table = pa.Table.from_pydict(columns, schema=SCHEMA)
+        return self._write(table, f"part-{recorded_at}-{uuid.uuid4().hex[:8]}.parquet")
+
+    def _write(self, table, name):
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self.root / name
+        # hidden while written, the dataset reader skips dot files
+        tmp_path = self.root / f".{name}.tmp"
+        pq.write_table(table, tmp_path)
+        os.replace(tmp_path, path)
+        return path
+
+    def dataset(self):
+        return ds.dataset([str(p) for p in self.parts()], schema=SCHEMA, format="parquet")
+
+    def read(self, where=()):
+        """Reads the rows matching every ``where`` clause, see :func:`parse_where`."""
+        expression = None
+        for clause in where:
+            term = parse_where(clause)
+            expression = term if expression is None else expression & term
+        return self.dataset().to_table(filter=expression)
+
+    def compact(self):
+        """Merges the part files into one, returns the number of merged parts."""
+        parts = self.parts()
+        if len(parts) < 2:
+            return len(parts)
+        table = self.dataset().to_table().sort_by([("recorded_at", "ascending")])
+        last = parts[-1].name[len("part-"):-len(".parquet")]
+        self._write(table, f"part-{last}-compact.parquet")
+        for part in parts:
+            part.unlink()
+        return len(parts)
+
+
+def parse_where(clause):
+    """Parses ``column<op>value`` (op one of = != > >= < <=) into a dataset filter, ``column=`` matches unset."""
+    for op in WHERE_OPERATORS:
+        column, sep, value = clause.partition(op)
+        if sep:
+            break
+    else:
+        raise ValueError(f"Invalid where clause '{clause}', expected column<op>value with op in {WHERE_OPERATORS}")
+    column = column.strip()
+    if column not in SCHEMA.names:
+        raise ValueError(f"Unknown column '{column}', columns are {SCHEMA.names}")
+    field = ds.field(column)
+    if value == "" and op in ("=", "!="):
+        return field.is_null() if op == "=" else field.is_valid()
+    value_type = SCHEMA.field(column).type
+    if pa.types.is_timestamp(value_type):
+        value = pa.scalar(np.datetime64(value, "ms"), type=value_type)
+    else:
+        value = pa.scalar(value).cast(value_type)
+    return {
+        "=": field == value,
+        "!=": field != value,
+        ">": field > value,
+        ">=": field >= value,
+        "<": field < value,
+        "<=": field <= value,
+    }[op]
+
+
+def aggregate(table, group_by=("checker",), metric=None):
+    """
+    Aggregates report rows.
+
+    Without ``metric`` the verdict rows are counted per group (``verdicts``, ``failed``, ``errors``, ``fail_rate``),
+    with it the values of that metric are summarized (``count``, ``mean``, ``min``, ``max``, ``sum``).
+    """
+    group_by = list(group_by)
+    if metric is None:
+        table = table.filter(pc.is_null(table["metric"]))
+        status = table["status"]
+        table = table.append_column("failed", pc.cast(pc.equal(status, "failed"), pa.int64()))
+        table = table.append_column("errors", pc.cast(pc.equal(status, "error"), pa.int64()))
+        result = table.group_by(group_by).aggregate([("status", "count"), ("failed", "sum"), ("errors", "sum")])
+        result = result.rename_columns(group_by + ["verdicts", "failed", "errors"])
+        fail_rate = pc.divide(pc.cast(result["failed"], pa.float64()), pc.cast(result["verdicts"], pa.float64()))
+        result = result.append_column("fail_rate", fail_rate)
+    else:
+        table = table.filter(pc.and_(pc.equal(table["metric"], metric), pc.is_valid(table["value"])))
+        aggregations = [("value", name) for name in ("count", "mean", "min", "max", "sum")]
+        result = table.group_by(group_by).aggregate(aggregations)
+        result = result.rename_columns(group_by + ["count", "mean", "min", "max", "sum"])
+    return result.sort_by([(column, "ascending") for column in group_by])
+
+
+def format_table(table, max_rows=None):
+    rows = table.to_pylist()[:max_rows]
+    columns = table.column_names
+    cells = [[("" if row[c] is None else f"{row[c]:.4g}" if isinstance(row[c], float) else str(row[c])) for c in columns] for row in rows]
+    widths = [max([len(c)] + [len(r[i]) for r in cells]) for i, c in enumerate(columns)]
+    lines = ["  ".join(c.ljust(w) for c, w in zip(columns, widths))]
+    lines += ["  ".join(v.ljust(w) for v, w in zip(r, widths)) for r in cells]
+    if max_rows is not None and table.num_rows > max_rows:
+        lines.append(f"... {table.num_rows - max_rows} more rows")
+    return "\n".join(lines)
+
+
+def append_checker_results(output_dir, checker_results, dataset, episode, batch=None):
+    """Appends the ``get_checker_results`` output of a session to ``<output_dir>/quality_report``."""
+    return QualityReportStore(Path(output_dir) / REPORT_DIR).append(rows_from_checker_results(checker_results, dataset, episode), batch)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Store and query the per-episode checker results.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    ingest = subparsers.add_parser("ingest", help="Append the verdicts json of offline_eval.py")
+    ingest.add_argument("verdicts", type=str)
+    ingest.add_argument("--report_dir", type=str, default=None, help=f"<verdicts dir>/{REPORT_DIR} by default")
+    ingest.add_argument("--batch", type=str, default=None, help="Batch name, the current time by default")
+
+    query = subparsers.add_parser("query", help="Filter and aggregate the report")
+    query.add_argument("report_dir", type=str)
+    query.add_argument("--where", type=str, action="append", default=[], help="column<op>value, repeatable")
+    query.add_argument("--group_by", type=str, default="checker", help="Comma separated columns")
+    query.add_argument("--metric", type=str, default=None, help="Summarize this metric instead of the verdicts")
+    query.add_argument("--rows", action="store_true", help="Print the matching rows instead of aggregating")
+    query.add_argument("--max_rows", type=int, default=200)
+
+    compact = subparsers.add_parser("compact", help="Merge the part files")
+    compact.add_argument("report_dir", type=str)
+    args = parser.parse_args()
+
+    if args.command == "ingest":
+        with open(args.verdicts) as f:
+            verdicts = json.load(f)
+        report_dir = args.report_dir or Path(args.verdicts).parent / REPORT_DIR
+        path = QualityReportStore(report_dir).append(rows_from_verdicts(verdicts), args.batch)
+        print(f"[quality_report] appended {path}")
+    elif args.command == "query":
+        table = QualityReportStore(args.report_dir).read(args.where)
+        if not args.rows:
+            table = aggregate(table, [c for c in args.group_by.split(",") if c], args.metric)
+        print(format_table(table, args.max_rows))
+    else:
+        print(f"[quality_report] merged {QualityReportStore(args.report_dir).compact()} parts")
+
+
+if __name__ == "__main__":
+    main()
@@ -51,6 +51,7 @@ class Context:
     device: str | None = "cpu"
     use_fabric: bool | None = None
     add_camera_to_observation: bool = False
+    record_checker_signals: bool = False
     test_fixture_path: str | None = None
     test_fixture_type: str | None = None
     test_object_paths: list[str] | None = None
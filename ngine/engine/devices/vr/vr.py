@@ -14,6 +14,7 @@
 
 """VR controller for SE(3) control."""
 
+import os
 from collections.abc import Callable
 
 import numpy as np
@@ -27,8 +28,10 @@ from isaaclab.devices.device_base import DeviceBase
 import ngine.utils.math_utils.transform_utils.numpy_impl as T
 from ngine.utils.log_utils import get_vr_logger
 from ngine.utils.opentelevision import OpenTeleVision
+from ngine.utils.stereo_stream import StereoFrameBuffer
 
 from . import consts
+from ngine.utils.vr_frames import VR_FRAME_SIZE, VRFrameWriter, pack_vr_frame, unpack_vr_frame
 
 
 def mat_update(prev_mat, mat, name="UNK"):
@@ -174,6 +177,9 @@ class Device(DeviceBase):
                                 left_controller_state, right_controller_state) -> None:
         """Save raw input data to HDF5 for complete replay capability.
 
+        The raw input of the step is packed into a single fixed-layout frame (see ``ngine.utils.vr_frames``) which is
+        added to the episodes as ``obs/raw_input/frame`` and, when enabled, streamed to the VR frame file.
+
         Args:
             head_mat: Head transformation matrix
             abs_left_wrist_mat: Absolute left wrist transformation matrix
@@ -184,87 +190,38 @@ class Device(DeviceBase):
             right_controller_state: Right controller state dictionary
         """
         try:
-            # Save transformation matrices
-            self._save_matrix_to_hdf5("obs/raw_input/head_mat", head_mat)
-            self._save_matrix_to_hdf5("obs/raw_input/abs_left_wrist_mat", abs_left_wrist_mat)
-            self._save_matrix_to_hdf5("obs/raw_input/abs_right_wrist_mat", abs_right_wrist_mat)
-            self._save_matrix_to_hdf5("obs/raw_input/rel_left_wrist_mat", rel_left_wrist_mat)
-            self._save_matrix_to_hdf5("obs/raw_input/rel_right_wrist_mat", rel_right_wrist_mat)
-
-            # Save controller states
-            self._save_controller_state_to_hdf5("obs/raw_input/left_controller_state", left_controller_state)
-            self._save_controller_state_to_hdf5("obs/raw_input/right_controller_state", right_controller_state)
-
-            # Save internal state information
-            self._save_internal_state_to_hdf5()
+            frame_args = (head_mat, abs_left_wrist_mat, abs_right_wrist_mat, rel_left_wrist_mat, rel_right_wrist_mat,
+                          left_controller_state, right_controller_state, self._get_internal_state())
+            if getattr(self, "_raw_input_frame", None) is None:
+                self._raw_input_frame = np.zeros(VR_FRAME_SIZE, dtype=np.float32)
+            pack_vr_frame(self._raw_input_frame, *frame_args)
+            # one host to device copy, expand is a view and the recorder clones it into its own storage
+            frame = torch.from_numpy(self._raw_input_frame).to(self.env.device).unsqueeze(0)
+            self.env.recorder_manager.add_to_episodes("obs/raw_input/frame", frame.expand(self.env.num_envs, -1))
+
+            frame_writer = getattr(self, "frame_writer", None)
+            if frame_writer is not None:
+                frame_writer.write(int(getattr(self.env, "common_step_counter", 0)), *frame_args)
 
         except Exception as e:
             print(f"Error saving raw input to HDF5: {e}")
 
-    def _save_matrix_to_hdf5(self, key_prefix: str, matrix: np.ndarray) -> None:
-        """Save a transformation matrix to HDF5.
-
-        Args:
-            key_prefix: Key prefix for the matrix data
-            matrix: 4x4 transformation matrix
-        """
-        if matrix is not None:
-            tensor_matrix = torch.tensor(matrix, device=self.env.device, dtype=torch.float32).unsqueeze(0)
-            if self.env.num_envs > 1:
-                tensor_matrix = torch.repeat_interleave(tensor_matrix, self.env.num_envs, dim=0)
-            self.env.recorder_manager.add_to_episodes(key_prefix, tensor_matrix)
-
-    def _save_controller_state_to_hdf5(self, key_prefix: str, controller_state: dict) -> None:
-        """Save controller state dictionary to HDF5.
-
-        Args:
-            key_prefix: Key prefix for the controller state data
-            controller_state: Controller state dictionary
-        """
-        for key, value in controller_state.items():
-            if isinstance(value, (int, float, bool)):
-                tensor_value = torch.tensor([value], device=self.env.device, dtype=torch.float32).unsqueeze(0)
-                if self.env.num_envs > 1:
-                    tensor_value = torch.repeat_interleave(tensor_value, self.env.num_envs, dim=0)
-                self.env.recorder_manager.add_to_episodes(f"{key_prefix}/{key}", tensor_value)
-            elif isinstance(value, (list, tuple)):
-                tensor_value = torch.tensor(value, device=self.env.device, dtype=torch.float32).unsqueeze(0)
-                if self.env.num_envs > 1:
-                    tensor_value = torch.repeat_interleave(tensor_value, self.env.num_envs, dim=0)
-                self.env.recorder_manager.add_to_episodes(f"{key_prefix}/{key}", tensor_value)
-            else:
-                print(f"Warning: Skipping non-serializable controller state '{key}' of type {type(value)}")
-
-    def _save_internal_state_to_hdf5(self) -> None:
-        """Save internal VR device state to HDF5."""
-        try:
-            # Save important internal state variables
-            internal_state = {
-                "has_started": getattr(self, 'has_started', False),
-                "started": getattr(self, 'started', False),
-                "base_mode_flag": getattr(self, 'base_mode_flag', 1),
-                "last_thumbstick_state": getattr(self, 'last_thumbstick_state', 0),
-                "last_x_button_state": getattr(self, 'last_x_button_state', 0),
-                "last_y_button_state": getattr(self, 'last_y_button_state', 0),
-                "last_start_state": getattr(self, 'last_start_state', False),
-                "is_body_moving": getattr(self, 'is_body_moving', False),
-                "is_body_moving_last_frame": getattr(self, 'is_body_moving_last_frame', False),
-                "has_keep": getattr(self, 'has_keep', False),
-                "rollback_keep": getattr(self, 'rollback_keep', False),
-                "last_checkpoint_frame_idx": getattr(self, 'last_checkpoint_frame_idx', -1),
-            }
-
-            for key, value in internal_state.items():
-                if isinstance(value, (int, float, bool)):
-                    tensor_value = torch.tensor([value], device=self.env.device, dtype=torch.float32).unsqueeze(0)
-                else:
-                    tensor_value = torch.tensor(value, device=self.env.device, dtype=torch.float32).unsqueeze(0)
-                if self.env.num_envs > 1:
-                    tensor_value = torch.repeat_interleave(tensor_value, self.env.num_envs, dim=0)
-                self.env.recorder_manager.add_to_episodes(f"obs/raw_input/internal_state/{key}", tensor_value)
-
-        except Exception as e:
-            print(f"Error saving internal state to HDF5: {e}")
+    def _get_internal_state(self) -> dict:
+        """Internal VR device state saved along with the raw input."""
+        return {
+            "has_started": getattr(self, 'has_started', False),
+            "started": getattr(self, 'started', False),
+            "base_mode_flag": getattr(self, 'base_mode_flag', 1),
+            "last_thumbstick_state": getattr(self, 'last_thumbstick_state', 0),
+            "last_x_button_state": getattr(self, 'last_x_button_state', 0),
+            "last_y_button_state": getattr(self, 'last_y_button_state', 0),
+            "last_start_state": getattr(self, 'last_start_state', False),
+            "is_body_moving": getattr(self, 'is_body_moving', False),
+            "is_body_moving_last_frame": getattr(self, 'is_body_moving_last_frame', False),
+            "has_keep": getattr(self, 'has_keep', False),
+            "rollback_keep": getattr(self, 'rollback_keep', False),
+            "last_checkpoint_frame_idx": getattr(self, 'last_checkpoint_frame_idx', -1),
+        }
 
     @staticmethod
     def load_raw_input_from_hdf5(episode_data, step_index: int) -> dict | None:
@@ -287,6 +244,14 @@ class Device(DeviceBase):
 
             raw_input_data = episode_data._data["obs"]["raw_input"]
 
+            # Packed frames
+            if isinstance(raw_input_data.get("frame"), torch.Tensor):
+                frames = raw_input_data["frame"]
+                if step_index >= len(frames):
+                    print(f"Warning: Step index {step_index} out of range for raw input frames")
+                    return None
+                return unpack_vr_frame(frames[step_index].reshape(-1).cpu().numpy())
+
             # Load transformation matrices
             matrix_keys = ["head_mat", "abs_left_wrist_mat", "abs_right_wrist_mat",
                            "rel_left_wrist_mat", "rel_right_wrist_mat"]
@@ -366,6 +331,12 @@ class VRDevice(Device):
                         using this device.
         pos_sensitivity (float): Magnitude of input position command scaling
         rot_sensitivity (float): Magnitude of scale input rotation commands scaling
+        frame_file (str): Optional HDF5 file the packed VR frames are streamed to, in addition to the recorder.
+                          Defaults to the NGINE_VR_FRAME_FILE environment variable.
+        encoding (str): Optional codec ("jpeg") the headset stream is encoded with. The device then owns a
+                        :class:`StereoFrameBuffer` of ``img_shape`` that :meth:`publish_frame` writes into, and
+                        ``shm_name`` is ignored.
+        encoding_quality (int): Quality of the encoded stream.
     """
     tv_device_type: str
 
@@ -376,12 +347,27 @@ class VRDevice(Device):
         shm_name,
         relative_control=False,
         robot_mode="arm",
+        frame_file=None,
+        encoding=None,
+        encoding_quality=80,
     ):
         super().__init__(env)
+        frame_file = frame_file or os.environ.get("NGINE_VR_FRAME_FILE")
+        self.frame_writer = VRFrameWriter(frame_file) if frame_file else None
         self._additional_callbacks = {}
         self.robot_mode = robot_mode
         self.relative_control = relative_control
-        self.tv = OpenTeleVision(img_shape, shm_name, device_type=self.tv_device_type)
+        self.frame_buffer = None
+        if encoding is not None:
+            self.frame_buffer = StereoFrameBuffer.create((img_shape[0], img_shape[1], 3))
+            shm_name = self.frame_buffer.name
+        self.tv = OpenTeleVision(
+            img_shape,
+            shm_name,
+            device_type=self.tv_device_type,
+            encoding=encoding,
+            encoding_quality=encoding_quality,
+        )
         self._init_preprocessor()
         # 6-DOF variables
         self.x, self.y, self.z = 0, 0, 0
@@ -521,6 +507,8 @@ class VRDevice(Device):
         self.last_x_button_state = 0
         self.last_y_button_state = 0
         self.last_checkpoint_frame_idx = -1
+        if getattr(self, "frame_writer", None) is not None:
+            self.frame_writer.new_episode()
 
     # NOTE: Interface to robosuite
     def start_control(self):
@@ -735,6 +723,61 @@ class VRDevice(Device):
         self.listener.stop()
         self.listener.join()
         self.tv.close()
+        if self.frame_writer is not None:
+            self.frame_writer.close()
+        if self.frame_buffer is not None:
+            self.frame_buffer.close()
+
+    def publish_frame(self, image):
+        """
+        Publishes an image to the encoded headset stream.
+
+        Args:
+            image: (H, W, 3) uint8 image or tensor. A single view is shown to both eyes, the side by side image is
+                   resized to the stream shape when it differs.
+        """
+        if self.frame_buffer is None:
+            return
+        if isinstance(image, torch.Tensor):
+            image = image.detach().cpu().numpy()
+        image = np.asarray(image)
+        height, width, _ = self.frame_buffer.shape
+        if image.dtype != np.uint8:
+            image = np.clip(image * 255.0 if image.max() <= 1.0 else image, 0, 255).astype(np.uint8)
+        if image.shape[1] * 2 <= width:
+            image = np.concatenate([image, image], axis=1)
+        if image.shape[:2] != (height, width):
+            rows = np.arange(height) * image.shape[0] // height
+            cols = np.arange(width) * image.shape[1] // width
+            image = image[rows][:, cols]
+        self.frame_buffer.publish(image[..., :3])
+
+    def publish_observation(self, obs, camera_names=None, env_id=0):
+        """
+        Publishes camera images of ``obs["policy"]`` to the encoded headset stream.
+
+        One camera is shown to both eyes, two cameras are shown side by side as the left and right eye.
+
+        Args:
+            obs: observation dict returned by ``env.step``
+            camera_names: observation terms of the cameras, the first image term when None
+            env_id: environment whose images are streamed
+        """
+        if self.frame_buffer is None:
+            return
+        policy_obs = obs["policy"]
+        if camera_names is None:
+            camera_names = [
+                name
+                for name, value in policy_obs.items()
+                if getattr(value, "ndim", 0) == 4 and value.shape[-1] == 3
+            ][:1]
+        images = [policy_obs[name][env_id] for name in camera_names if name in policy_obs]
+        if not images:
+            return
+        if isinstance(images[0], torch.Tensor):
+            images = [image.detach().cpu().numpy() for image in images]
+        self.publish_frame(images[0] if len(images) == 1 else np.concatenate(images[:2], axis=1))
 
     def set_checkpoint_frame_idx(self, frame_index):
         self.last_checkpoint_frame_idx = frame_index
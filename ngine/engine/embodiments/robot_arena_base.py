@@ -124,9 +124,38 @@ class PrePhysicsStepJointTargetsRecorderCfg(RecorderTermCfg):
     class_type: type[RecorderTerm] = PrePhysicsStepJointTargetsRecorder
 
 
+class PostStepCheckerSignalsRecorder(RecorderTerm):
+    """Recorder term that records the post-step signals the checkers read and the recorded states lack.
+
+    The robot body poses and the net forces of the ``*_contact`` sensors are stored under ``checker_signals``,
+    so that the checkers can be evaluated offline on the dataset (see ngine/engine/checks/offline_eval.py).
+    Only recorded with ``record_checker_signals`` set in the task config.
+    """
+
+    def record_post_step(self):
+        scene = self._env.scene
+        signals = {"robot_body_com_pose_w": scene.articulations["robot"].data.body_com_pose_w.clone()}
+        contact_forces = {
+            name[:-len("_contact")]: sensor.data.net_forces_w.clone()
+            for name, sensor in scene.sensors.items()
+            if name.endswith("_contact") and sensor.data.net_forces_w is not None
+        }
+        if contact_forces:
+            signals["contact_forces"] = contact_forces
+        return "checker_signals", signals
+
+
+@configclass
+class PostStepCheckerSignalsRecorderCfg(RecorderTermCfg):
+    """Configuration for the checker signals recorder term."""
+
+    class_type: type[RecorderTerm] = PostStepCheckerSignalsRecorder
+
+
 @configclass
 class RecorderManagerCfg(ActionStateRecorderManagerCfg):
     record_pre_step_joint_targets = PrePhysicsStepJointTargetsRecorderCfg()
+    record_post_step_checker_signals = PostStepCheckerSignalsRecorderCfg()
 
 
 @configclass
@@ -217,7 +246,11 @@ class RobotBase(EmbodimentBase):
 
     def get_recorder_term_cfg(self):
         if self.context.execute_mode not in [ExecuteMode.TRAIN, ExecuteMode.EVAL, ExecuteMode.REPLAY_STATE]:
-            return RecorderManagerCfg()
+            recorder_cfg = RecorderManagerCfg()
+            if not self.context.record_checker_signals:
+                # only datasets meant for offline checker evaluation carry the checker signals
+                recorder_cfg.record_post_step_checker_signals = None
+            return recorder_cfg
 
     def get_observation_cfg(self):
         return self.observation_config
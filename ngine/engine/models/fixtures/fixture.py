@@ -80,6 +80,7 @@ class Fixture:
             placement=None,
             seed=None,
             device="cpu",
+            metadata=None,
     ):
         self.name = name
         self.prim = prim
@@ -92,13 +93,6 @@ class Fixture:
         if not hasattr(self, '_regions'):
             self._regions = dict()
 
-        geom_prim_list = usd.get_prim_by_type(self.prim, exclude_types=["Xform", "Scope"])
-        child_prim_infos = usd.get_all_child_xform_infos(self.prim)
-        self.body_bbox_map = {}
-        for child_prim in child_prim_infos:
-            prim_name = child_prim['prim'].GetName()
-            prim_size = usd.get_prim_size(child_prim['prim'])
-            self.body_bbox_map[prim_name] = prim_size
         self._pos = pos if pos is not None else np.array(list(prim.GetAttribute("xformOp:translate").Get()))
         self._scale = prim.GetAttribute("xformOp:scale").Get()
         self._scale = np.array(self._scale) if self._scale is not None else np.array([1, 1, 1])
@@ -107,6 +101,83 @@ class Fixture:
             euler_radians = np.radians(np.array(euler_angles))
             self.set_euler(euler_radians)
 
+        # cached metadata is parsed relative to the authored prim pose, so it is only valid without pose overrides
+        if metadata is None or pos is not None or rot is not None:
+            metadata = self._parse_geometry_metadata(prim)
+        self.metadata = metadata
+        self.body_bbox_map = {k: np.array(v) for k, v in metadata["body_bbox_map"].items()}
+        for reg_name, reg in metadata["regions"].items():
+            reg_dict = {k: np.array(v) for k, v in reg.items()}
+            reg_dict["per_env_offset"] = np.zeros((num_envs, 3))
+            self._regions[reg_name] = reg_dict
+
+        # if size is not None:
+        #     self.set_scale_from_size(size, max_size=max_size)
+
+        self.size = np.array([self.width, self.depth, self.height])
+
+        if self.width is not None:
+            try:
+                # calculate based on bounding points
+                reg_key = None
+                if "main" in self._regions:
+                    reg_key = "main"
+                elif "bbox" in self._regions:
+                    reg_key = "bbox"
+                else:
+                    raise ValueError
+                p0 = self._regions[reg_key]["p0"]
+                px = self._regions[reg_key]["px"]
+                py = self._regions[reg_key]["py"]
+                pz = self._regions[reg_key]["pz"]
+                self.origin_offset = np.array(
+                    [
+                        np.mean((p0[0], px[0])),
+                        np.mean((p0[1], py[1])),
+                        np.mean((p0[2], pz[2])),
+                    ]
+                ) - self._pos
+            except Exception as e:
+                raise RuntimeError(f"The counter self._regions is None.")
+        else:
+            self.origin_offset = np.array([0, 0, 0])
+
+        # placement config, for determining where to place fixture (most fixture will not use this)
+        self._placement = placement
+
+        # track information about all joints
+        self._joint_infos = dict()
+        for jnt_name, jnt in metadata["joints"].items():
+            jnt_range = {}
+            if jnt["lower"] is not None:
+                if jnt["type"] == "PhysicsRevoluteJoint":
+                    jnt_range = {"range": torch.tensor([jnt["lower"] * torch.pi / 180,
+                                                        jnt["upper"] * torch.pi / 180])}
+                else:
+                    jnt_range = {"range": torch.tensor([jnt["lower"],
+                                                        jnt["upper"]])}
+            self._joint_infos[jnt_name] = jnt_range
+
+    def _parse_geometry_metadata(self, prim):
+        """
+        Parse body bounding boxes, reg_* regions and joint limits of the fixture from its prim.
+        The result only holds plain python types so that it can be stored in the usd metadata cache.
+
+        Args:
+            prim (Usd.Prim): fixture prim
+
+        Returns:
+            dict: body_bbox_map, regions and joints of the fixture
+        """
+        geom_prim_list = usd.get_prim_by_type(prim, exclude_types=["Xform", "Scope"])
+        child_prim_infos = usd.get_all_child_xform_infos(prim)
+        body_bbox_map = {}
+        for child_prim in child_prim_infos:
+            prim_name = child_prim['prim'].GetName()
+            prim_size = usd.get_prim_size(child_prim['prim'])
+            body_bbox_map[prim_name] = [prim_size[0], prim_size[1], prim_size[2]]
+
+        regions = {}
         reg_geom_prims = []
         for geom_prim in geom_prim_list:
             g_name = geom_prim.GetName()
@@ -116,7 +187,6 @@ class Fixture:
         for geom_prim in reg_geom_prims:
             if "main" in geom_prim.GetName():
                 continue
-            reg_dict = {}
             g_name = geom_prim.GetName()
             reg_pos, reg_quat = usd.get_prim_pos_rot_in_world(geom_prim)[:2]
             if reg_pos is None or reg_quat is None:
@@ -134,17 +204,12 @@ class Fixture:
                     reg_size = usd.get_prim_size(geom_prim)
                     reg_halfsize = np.array(reg_size) / 2
                 reg_rel_pos = (T.quat2mat(T.convert_quat(reg_quat, to="xyzw")).T @ (np.array(reg_pos) - self.pos))
-            p0 = reg_rel_pos + [-reg_halfsize[0], -reg_halfsize[1], -reg_halfsize[2]]
-            px = reg_rel_pos + [reg_halfsize[0], -reg_halfsize[1], -reg_halfsize[2]]
-            py = reg_rel_pos + [-reg_halfsize[0], reg_halfsize[1], -reg_halfsize[2]]
-            pz = reg_rel_pos + [-reg_halfsize[0], -reg_halfsize[1], reg_halfsize[2]]
-            # reg_dict["prim"] = geom_prim
-            reg_dict["p0"] = p0
-            reg_dict["px"] = px
-            reg_dict["py"] = py
-            reg_dict["pz"] = pz
-            reg_dict["per_env_offset"] = np.zeros((num_envs, 3))
-            self._regions[g_name.replace("reg_", "")] = reg_dict
+            regions[g_name.replace("reg_", "")] = {
+                "p0": (reg_rel_pos + [-reg_halfsize[0], -reg_halfsize[1], -reg_halfsize[2]]).tolist(),
+                "px": (reg_rel_pos + [reg_halfsize[0], -reg_halfsize[1], -reg_halfsize[2]]).tolist(),
+                "py": (reg_rel_pos + [-reg_halfsize[0], reg_halfsize[1], -reg_halfsize[2]]).tolist(),
+                "pz": (reg_rel_pos + [-reg_halfsize[0], -reg_halfsize[1], reg_halfsize[2]]).tolist(),
+            }
 
         # add outer bounding box region(reg_main)
         reg_pos, reg_quat = usd.get_prim_pos_rot_in_world(prim)[:2]
@@ -160,61 +225,22 @@ class Fixture:
                 reg_halfsize = np.array([reg_halfsize_Vec3d[0], reg_halfsize_Vec3d[1], reg_halfsize_Vec3d[2]]) / 2
             if reg_halfsize.size:
                 reg_rel_pos = T.quat2mat(T.convert_quat(reg_quat, to="xyzw")).T @ (np.array(reg_pos) - self.pos)
-                reg_dict = {}
-                reg_dict["p0"] = reg_rel_pos + [-reg_halfsize[0], -reg_halfsize[1], -reg_halfsize[2]]
-                reg_dict["px"] = reg_rel_pos + [reg_halfsize[0], -reg_halfsize[1], -reg_halfsize[2]]
-                reg_dict["py"] = reg_rel_pos + [-reg_halfsize[0], reg_halfsize[1], -reg_halfsize[2]]
-                reg_dict["pz"] = reg_rel_pos + [-reg_halfsize[0], -reg_halfsize[1], reg_halfsize[2]]
-                reg_dict["per_env_offset"] = np.zeros((num_envs, 3))
-                self._regions["main"] = reg_dict
-
-        # if size is not None:
-        #     self.set_scale_from_size(size, max_size=max_size)
-
-        self.size = np.array([self.width, self.depth, self.height])
-
-        if self.width is not None:
-            try:
-                # calculate based on bounding points
-                reg_key = None
-                if "main" in self._regions:
-                    reg_key = "main"
-                elif "bbox" in self._regions:
-                    reg_key = "bbox"
-                else:
-                    raise ValueError
-                p0 = self._regions[reg_key]["p0"]
-                px = self._regions[reg_key]["px"]
-                py = self._regions[reg_key]["py"]
-                pz = self._regions[reg_key]["pz"]
-                self.origin_offset = np.array(
-                    [
-                        np.mean((p0[0], px[0])),
-                        np.mean((p0[1], py[1])),
-                        np.mean((p0[2], pz[2])),
-                    ]
-                ) - self._pos
-            except Exception as e:
-                raise RuntimeError(f"The counter self._regions is None.")
-        else:
-            self.origin_offset = np.array([0, 0, 0])
-
-        # placement config, for determining where to place fixture (most fixture will not use this)
-        self._placement = placement
+                regions["main"] = {
+                    "p0": (reg_rel_pos + [-reg_halfsize[0], -reg_halfsize[1], -reg_halfsize[2]]).tolist(),
+                    "px": (reg_rel_pos + [reg_halfsize[0], -reg_halfsize[1], -reg_halfsize[2]]).tolist(),
+                    "py": (reg_rel_pos + [-reg_halfsize[0], reg_halfsize[1], -reg_halfsize[2]]).tolist(),
+                    "pz": (reg_rel_pos + [-reg_halfsize[0], -reg_halfsize[1], reg_halfsize[2]]).tolist(),
+                }
+
+        joints = {}
+        for jnt in usd.get_all_joints_without_fixed(prim):
+            joints[jnt.GetName()] = {
+                "type": jnt.GetTypeName(),
+                "lower": jnt.GetAttribute("physics:lowerLimit").Get(),
+                "upper": jnt.GetAttribute("physics:upperLimit").Get(),
+            }
 
-        # track information about all joints
-        self._joint_infos = dict()
-        joint_prims = usd.get_all_joints_without_fixed(prim)
-        for jnt in joint_prims:
-            jnt_range = {}
-            if jnt.GetAttribute("physics:lowerLimit").Get() is not None:
-                if jnt.GetTypeName() == "PhysicsRevoluteJoint":
-                    jnt_range = {"range": torch.tensor([jnt.GetAttribute("physics:lowerLimit").Get() * torch.pi / 180,
-                                                        jnt.GetAttribute("physics:upperLimit").Get() * torch.pi / 180])}
-                else:
-                    jnt_range = {"range": torch.tensor([jnt.GetAttribute("physics:lowerLimit").Get(),
-                                                        jnt.GetAttribute("physics:upperLimit").Get()])}
-            self._joint_infos[jnt.GetName()] = jnt_range
+        return {"body_bbox_map": body_bbox_map, "regions": regions, "joints": joints}
 
     def get_reset_region_names(self):
         return ("int", )
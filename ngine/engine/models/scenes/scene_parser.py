@@ -18,19 +18,27 @@ import os
 import numpy as np
 
 from ngine.engine.models.fixtures.fixture import FIXTURES
+from ngine.utils.usd_metadata_cache import get_usd_metadata_cache
 from ngine.utils.usd_utils import OpenUsd as usd
 
 
-def parse_fixtures(stage, num_envs, seed, device):
+def parse_fixtures(stage, num_envs, seed, device, usd_path=None):
     """
     Parses fixtures from the given stage
 
     Args:
         stage (Usd.Stage): stage to parse fixtures from
 
+        usd_path (str): file the stage was loaded from. If set, per-fixture geometry metadata
+            (regions, body bounding boxes, joint limits) is read from / written to the usd metadata cache
+
     Returns:
         list: list of fixture infos{name: fixture object}
     """
+    metadata_cache = get_usd_metadata_cache()
+    cached = metadata_cache.get(usd_path, namespace="fixtures") if usd_path is not None else None
+    fixture_metadata = cached["fixtures"] if cached is not None else {}
+
     fixtures = {}
     root_prim = stage.GetPseudoRoot().GetChildren()[0]
     xform_infos = usd.get_child_xform_infos(root_prim)
@@ -41,7 +49,12 @@ def parse_fixtures(stage, num_envs, seed, device):
         if size_attr is None or np.fromstring(size_attr, sep=',').size == 0:
             continue
         fixture_type = info["type"] if info["type"] in FIXTURES else "Accessory"
-        fixtures[info["name"]] = FIXTURES[fixture_type](info["name"], info["prim"], num_envs, seed=seed, device=device)
+        fixtures[info["name"]] = FIXTURES[fixture_type](
+            info["name"], info["prim"], num_envs, seed=seed, device=device, metadata=fixture_metadata.get(info["name"])
+        )
+
+    if usd_path is not None and set(fixture_metadata) != set(fixtures):
+        metadata_cache.put(usd_path, {"fixtures": {name: fxtr.metadata for name, fxtr in fixtures.items()}}, namespace="fixtures")
 
     return fixtures
 
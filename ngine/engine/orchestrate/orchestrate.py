@@ -62,10 +62,10 @@ class Orchestrator(OrchestratorBase, NoDeepcopyMixin):
 
         # usd simplify
         if self.context.usd_simplify:
-            new_stage = usd.usd_simplify(self.scene.arena.stage, [ref.name for ref in self.fixture_refs.values()])
-            self.scene.scene_type
             self.scene.scene_usd_path = self.scene.scene_usd_path.replace(".usd", "_simplified.usd")
-            new_stage.GetRootLayer().Export(self.scene.scene_usd_path)
+            usd.usd_simplify_to_file(
+                self.scene.arena.stage, [ref.name for ref in self.fixture_refs.values()], self.scene.scene_usd_path
+            )
             # modify background
             self.scene.assets["Scene"].usd_path = self.scene.scene_usd_path
 
@@ -100,7 +100,7 @@ class Scene(Scene, NoDeepcopyMixin):
         self.scene_type = self.arena.scene_type
         self.fixture_cfgs = get_fixture_cfgs(self)
         self.floorplan_version = self.arena.version_id
-        self.fxtr_placements = usd.get_fixture_placements(self.arena.stage.GetPseudoRoot(), self.fixture_cfgs)
+        self.fxtr_placements = usd.get_fixture_placements(self.arena.stage.GetPseudoRoot(), self.fixture_cfgs, usd_path=self.scene_usd_path)
 
         if self.arena.layout_id in orchestrator.task.exclude_layouts:
             raise ValueError(f"Layout {self.arena.layout_id} is excluded in task {self.task_name}")
@@ -127,7 +127,7 @@ class Scene(Scene, NoDeepcopyMixin):
             local_scene_path=self.local_scene_path,
         )
         self.scene_usd_path = self.arena.usd_path
-        self.fixtures = parse_fixtures(self.arena.stage, self.context.num_envs, self.context.seed, self.context.device)
+        self.fixtures = parse_fixtures(self.arena.stage, self.context.num_envs, self.context.seed, self.context.device, usd_path=self.arena.usd_path)
 
     def set_ep_meta(self, meta):
         self._ep_meta = meta
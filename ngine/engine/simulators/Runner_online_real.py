@@ -13,10 +13,11 @@
 # limitations under the License.
 
 import threading
-import time
 
 import numpy as np
 
+from ngine.sim2real.realtime import RateScheduler
+
 
 class Runner_online_real:
     """Runner for real robot"""
@@ -41,6 +42,9 @@ class Runner_online_real:
         self.cmd = {}
         self.cmd_ready = False
 
+        # Timing statistics of the last run
+        self.stats = None
+
     def refresh_prop(self):
         """Update robot state
 
@@ -130,28 +134,36 @@ class Runner_online_real:
 
         return True
 
-    def run(self, freq=100):
+    def run(self, freq=100, overrun="warn", max_steps=None, stats_interval=None):
         """Run continuously
 
+        The loop is paced by a monotonic-clock :class:`RateScheduler` with a fixed phase, its jitter
+        statistics are kept in ``self.stats``.
+
         Args:
             freq: run frequency (Hz)
+            overrun: overrun policy, one of "warn", "skip", "catch_up" or "raise"
+            max_steps: stop after this number of steps, runs until the interface disconnects if None
+            stats_interval: print the jitter statistics every this number of steps, never if None
         """
-        period = 1.0 / freq
+        scheduler = RateScheduler(freq, overrun=overrun)
+        self.stats = scheduler.stats
+        scheduler.start()
+        step = 0
 
         while self.robotInterface.is_alive():
-            start_time = time.time()
-
             # Run one step
             if not self.run_step():
                 print("Run step failed")
                 break
+            step += 1
+            if stats_interval is not None and step % stats_interval == 0:
+                print(f"Runner timing: {self.stats}")
+            if max_steps is not None and step >= max_steps:
+                break
 
             # Control frequency
-            elapsed = time.time() - start_time
-            if elapsed < period:
-                time.sleep(period - elapsed)
-            else:
-                print(f"Warning: run period overtime ({elapsed:.4f}s > {period:.4f}s)")
+            scheduler.wait()
 
     def close(self):
         """Close the runner"""
@@ -0,0 +1,217 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import contextlib
+from typing import TYPE_CHECKING, Callable
+
+import torch
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedEnv
+
+_AUTOCAST_DTYPES = {
+    "fp16": torch.float16,
+    "bf16": torch.bfloat16,
+}
+
+
+class BatchedFeatureExtractor:
+    """Shared frozen-encoder inference for all camera feature terms of an environment.
+
+    Every :class:`overlaid_image_features` term using the same model registers its camera here.
+    The first registered camera acts as the leader: when its term is evaluated, the images of all
+    registered cameras are gathered and forwarded through the encoder in a single batch (grouped by
+    image resolution). The remaining terms then only pick up their slice of the result, which is tagged
+    with the observation step so a term evaluated before the leader never receives features of an older
+    step. Such a term computes its features on its own and is left out of the leader's batch.
+
+    Optionally the forward pass runs under autocast, through ``torch.compile``, and asynchronously on a
+    side CUDA stream. In asynchronous mode the features returned at step ``t`` are the ones launched at
+    step ``t - 1`` so the encoder overlaps with the next physics step; rows of environments that were
+    reset in between are recomputed synchronously.
+
+    Args:
+        model: The frozen encoder.
+        inference_fn: Callable ``(model, images) -> features``.
+        model_device: The device the encoder runs on.
+        mixed_precision: ``"fp16"``, ``"bf16"`` or None to run in full precision.
+        compile_model: Whether to wrap the inference function with ``torch.compile``.
+        async_inference: Whether to overlap inference with the simulation on a side CUDA stream.
+    """
+
+    def __init__(
+        self,
+        model: torch.nn.Module,
+        inference_fn: Callable,
+        model_device: str,
+        mixed_precision: str | None = None,
+        compile_model: bool = False,
+        async_inference: bool = False,
+    ):
+        if mixed_precision is not None and mixed_precision not in _AUTOCAST_DTYPES:
+            raise ValueError(f"Unknown mixed precision mode '{mixed_precision}'. Available: {list(_AUTOCAST_DTYPES)}.")
+        self.model = model
+        self.model_device = torch.device(model_device)
+        self.mixed_precision = mixed_precision
+        self.async_inference = async_inference and self.model_device.type == "cuda"
+
+        def _forward(images: torch.Tensor) -> torch.Tensor:
+            return inference_fn(model, images)
+
+        self._forward_fn = torch.compile(_forward) if compile_model else _forward
+
+        # camera name -> callable returning the current images of the camera
+        self._image_fns: dict[str, Callable[[], torch.Tensor]] = {}
+        # camera name -> (step, features) computed by the leader for the other cameras
+        self._pending: dict[str, tuple[int, torch.Tensor]] = {}
+        # camera name -> last step whose features the camera computed on its own
+        self._computed: dict[str, int] = {}
+
+        # asynchronous state
+        self._stream = torch.cuda.Stream(device=self.model_device) if self.async_inference else None
+        self._inflight: dict[str, torch.Tensor] | None = None
+        self._inflight_event = None
+        self._stale_env_ids: set[int] = set()
+        self._all_stale = True
+
+    @property
+    def leader(self) -> str | None:
+        return next(iter(self._image_fns), None)
+
+    def register(self, camera_name: str, image_fn: Callable[[], torch.Tensor]):
+        """Register a camera whose images are batched into the shared forward pass."""
+        self._image_fns[camera_name] = image_fn
+
+    def reset(self, env_ids: torch.Tensor | None = None):
+        """Mark the asynchronous results of the given environments as stale."""
+        self._pending.clear()
+        self._computed.clear()
+        if env_ids is None:
+            self._all_stale = True
+        else:
+            self._stale_env_ids.update(torch.as_tensor(env_ids).flatten().tolist())
+
+    def pending(self, camera_name: str, step: int) -> torch.Tensor | None:
+        """Get the features the leader computed for a camera at this step, None if there are none.
+
+        Terms check this before reading their images, so the images of a camera served from the
+        leader's batch are only read (and overlaid) once.
+        """
+        entry = self._pending.pop(camera_name, None)
+        if entry is None or entry[0] != step:
+            return None
+        return entry[1]
+
+    def __call__(self, camera_name: str, images: torch.Tensor, step: int) -> torch.Tensor:
+        """Get the features of a camera for the current observation step.
+
+        Args:
+            camera_name: The registered camera name.
+            images: The current images of this camera. Shape is (num_envs, height, width, channel).
+            step: The observation step the images belong to.
+
+        Returns:
+            The extracted features tensor, on the model device.
+        """
+        if camera_name != self.leader:
+            features = self.pending(camera_name, step)
+            if features is not None:
+                return features
+            # not computed by the leader in this pass (e.g. term evaluated on its own or before the leader)
+            self._computed[camera_name] = step
+            return self._infer({camera_name: images})[camera_name]
+
+        batch = {
+            name: (images if name == camera_name else fn())
+            for name, fn in self._image_fns.items()
+            if name == camera_name or self._computed.get(name) != step
+        }
+        if self.async_inference:
+            features = self._async_step(batch)
+        else:
+            features = self._infer(batch)
+        self._pending = {name: (step, feat) for name, feat in features.items() if name != camera_name}
+        return features[camera_name]
+
+    """
+    Helper functions.
+    """
+
+    def _autocast(self):
+        if self.mixed_precision is None:
+            return contextlib.nullcontext()
+        return torch.autocast(device_type=self.model_device.type, dtype=_AUTOCAST_DTYPES[self.mixed_precision])
+
+    @torch.no_grad()
+    def _infer(self, batch: dict[str, torch.Tensor]) -> dict[str, torch.Tensor]:
+        """Forward all cameras of the batch, one encoder call per image resolution."""
+        groups: dict[tuple, list[str]] = {}
+        for name, images in batch.items():
+            groups.setdefault(tuple(images.shape[1:]), []).append(name)
+
+        features = {}
+        for names in groups.values():
+            images = torch.cat([batch[name].to(self.model_device, non_blocking=True) for name in names], dim=0)
+            with self._autocast():
+                group_features = self._forward_fn(images)
+            group_features = group_features.float()
+            for name, feat in zip(names, group_features.split([batch[name].shape[0] for name in names], dim=0)):
+                features[name] = feat
+        return features
+
+    @torch.no_grad()
+    def _async_step(self, batch: dict[str, torch.Tensor]) -> dict[str, torch.Tensor]:
+        current_stream = torch.cuda.current_stream(self.model_device)
+
+        # collect the results launched at the previous step
+        if self._inflight is None or self._all_stale:
+            features = self._infer(batch)
+        else:
+            current_stream.wait_event(self._inflight_event)
+            # cameras that joined the batch at this step have no results in flight yet
+            features = {name: feat for name, feat in self._inflight.items() if name in batch}
+            missing = {name: images for name, images in batch.items() if name not in features}
+            if missing:
+                features.update(self._infer(missing))
+            if self._stale_env_ids:
+                env_ids = torch.tensor(sorted(self._stale_env_ids), device=self.model_device)
+                stale = {name: batch[name][env_ids.to(batch[name].device)] for name in features if name not in missing}
+                for name, feat in self._infer(stale).items():
+                    features[name][env_ids] = feat
+        self._all_stale = False
+        self._stale_env_ids.clear()
+
+        # stage the current images, since the camera buffers are overwritten by the next render
+        staged = {name: images.to(self.model_device, copy=True) for name, images in batch.items()}
+        self._stream.wait_stream(current_stream)
+        with torch.cuda.stream(self._stream):
+            self._inflight = self._infer(staged)
+            for tensor in staged.values():
+                tensor.record_stream(self._stream)
+            for tensor in self._inflight.values():
+                tensor.record_stream(current_stream)
+            self._inflight_event = torch.cuda.Event()
+            self._inflight_event.record(self._stream)
+        return features
+
+
+def get_feature_extractor(env: ManagerBasedEnv, key: tuple, factory: Callable[[], BatchedFeatureExtractor]) -> BatchedFeatureExtractor:
+    """Get the feature extractor shared by all terms of the environment with the same key, creating it if needed."""
+    if not hasattr(env, "_ngine_feature_extractors"):
+        env._ngine_feature_extractors = {}
+    if key not in env._ngine_feature_extractors:
+        env._ngine_feature_extractors[key] = factory()
+    return env._ngine_feature_extractors[key]
@@ -26,6 +26,8 @@ if TYPE_CHECKING:
 
 from isaaclab.envs.mdp.observations import image
 
+from .feature_extraction import BatchedFeatureExtractor, get_feature_extractor
+
 
 def object_position_in_robot_root_frame(
     env: ManagerBasedRLEnv,
@@ -86,6 +88,19 @@ def get_target_qpos(
         return env.scene['robot']._data.joint_pos_target
 
 
+_STATIC_BACKGROUND_CACHE: dict[int, tuple[torch.Tensor, torch.Tensor]] = {}
+
+
+def _get_static_background(back_image: torch.Tensor) -> torch.Tensor:
+    """Get the background image reordered from BGR to RGB, computed once per background tensor."""
+    cached = _STATIC_BACKGROUND_CACHE.get(id(back_image))
+    # keep a reference to the source tensor so that its id cannot be reused by another tensor
+    if cached is None or cached[0] is not back_image:
+        cached = (back_image, back_image[..., [2, 1, 0]].float().contiguous())
+        _STATIC_BACKGROUND_CACHE[id(back_image)] = cached
+    return cached[1]
+
+
 def overlay_image(
     env: ManagerBasedEnv,
     sensor_cfg: SceneEntityCfg = SceneEntityCfg("tiled_camera"),
@@ -133,7 +148,7 @@ def overlay_image(
         Returns:
             Overlapped image [num_env, H, W, C]
         """
-        back_image = back_image[..., [2, 1, 0]]
+        back_image = _get_static_background(back_image)
         if back_mask is None:
             back_mask = torch.ones_like(back_image[:, :, :, 0], dtype=torch.bool, device=back_image.device).unsqueeze(-1)
         if fore_mask is None:
@@ -148,14 +163,9 @@ def overlay_image(
         if env.cfg.isaaclab_arena_env.task.rgb_overlay_mode == 'background':
             semantic_mask = camera_output["semantic_segmentation"]
             overlay_mask = semantic_mask == semantic_id
-            sim_image = image_overlapping(
-                back_image=env.cfg.isaaclab_arena_env.task.rgb_overlay_images[sensor_cfg.name],
-                fore_image=sim_image,
-                back_mask=torch.logical_not(overlay_mask),
-                fore_mask=overlay_mask,
-                back_alpha=1.0,
-                fore_alpha=1.0,
-            )
+            # masks are complementary with full opacity, so the composite is a per-pixel select
+            background = _get_static_background(env.cfg.isaaclab_arena_env.task.rgb_overlay_images[sensor_cfg.name])
+            sim_image = torch.where(overlay_mask, sim_image, background).clamp(0.0, 255.0).to(torch.uint8)
         elif env.cfg.isaaclab_arena_env.task.rgb_overlay_mode == 'debug':
             sim_image = image_overlapping(
                 back_image=env.cfg.isaaclab_arena_env.task.rgb_overlay_images[sensor_cfg.name],
@@ -200,6 +210,13 @@ class overlaid_image_features(ManagerTermBase):
             from the environment simulation device. Defaults to the environment device.
         inference_kwargs: Additional keyword arguments to pass to the inference function. Defaults to None,
             which means no additional arguments are passed.
+        batch_cameras: Whether to share the model with the other terms using the same model and forward all
+            their cameras in one batch (see :class:`BatchedFeatureExtractor`). Defaults to True.
+        mixed_precision: Run the model under autocast with "fp16" or "bf16". Defaults to None (full precision).
+        compile_model: Whether to run the inference through ``torch.compile``. Defaults to False.
+        async_inference: Whether to overlap the inference with the next physics step on a side CUDA stream.
+            The returned features then lag one step behind, except for environments that were just reset.
+            Defaults to False.
 
     Returns:
         The extracted features tensor. Shape is (num_envs, feature_dim).
@@ -253,10 +270,45 @@ class overlaid_image_features(ManagerTermBase):
         else:
             model_config = self.model_zoo_cfg[self.model_name]
 
-        # Retrieve the model, preprocess and inference functions
-        self._model = model_config["model"]()
         self._reset_fn = model_config.get("reset")
         self._inference_fn = model_config["inference"]
+        self._batch_cameras: bool = cfg.params.get("batch_cameras", True)  # type: ignore
+        mixed_precision: str | None = cfg.params.get("mixed_precision")  # type: ignore
+        compile_model: bool = cfg.params.get("compile_model", False)  # type: ignore
+        async_inference: bool = cfg.params.get("async_inference", False)  # type: ignore
+        self._sensor_cfg: SceneEntityCfg = cfg.params.get("sensor_cfg", SceneEntityCfg("tiled_camera"))  # type: ignore
+
+        # stateless models can be shared by all cameras, models with a per-env state must stay per term
+        if self._batch_cameras and self._reset_fn is None:
+            extractor_key = (self.model_name, str(self.model_device), mixed_precision, compile_model, async_inference)
+            self._extractor = get_feature_extractor(
+                env,
+                extractor_key,
+                lambda: BatchedFeatureExtractor(
+                    model_config["model"](),
+                    self._inference_fn,
+                    self.model_device,
+                    mixed_precision=mixed_precision,
+                    compile_model=compile_model,
+                    async_inference=async_inference,
+                ),
+            )
+            self._model = self._extractor.model
+            self._extractor.register(self._sensor_cfg.name, self._read_images)
+        else:
+            # Retrieve the model, preprocess and inference functions
+            self._model = model_config["model"]()
+            self._extractor = None
+
+    def _read_images(self) -> torch.Tensor:
+        """Read the current (overlaid) images of this term's camera."""
+        return overlay_image(
+            env=self._env,
+            sensor_cfg=self._sensor_cfg,
+            data_type=self.cfg.params.get("data_type", "rgb"),
+            convert_perspective_to_orthogonal=self.cfg.params.get("convert_perspective_to_orthogonal", False),
+            normalize=False,  # we pre-process based on model
+        )
 
     def reset(self, env_ids: torch.Tensor | None = None):
         # reset the model if a reset function is provided
@@ -264,6 +316,8 @@ class overlaid_image_features(ManagerTermBase):
         # for example: video transformers
         if self._reset_fn is not None:
             self._reset_fn(self._model, env_ids)
+        if self._extractor is not None:
+            self._extractor.reset(env_ids)
 
     def __call__(
         self,
@@ -275,7 +329,19 @@ class overlaid_image_features(ManagerTermBase):
         model_name: str = "resnet18",
         model_device: str | None = None,
         inference_kwargs: dict | None = None,
+        batch_cameras: bool = True,
+        mixed_precision: str | None = None,
+        compile_model: bool = False,
+        async_inference: bool = False,
     ) -> torch.Tensor:
+        use_extractor = self._extractor is not None and not inference_kwargs
+        step = getattr(env, "common_step_counter", 0)
+        if use_extractor:
+            # cameras batched by the leader term were already read and overlaid by it
+            features = self._extractor.pending(sensor_cfg.name, step)
+            if features is not None:
+                return features.detach().to(env.device)
+
         # obtain the images from the sensor
         image_data = overlay_image(
             env=env,
@@ -289,7 +355,10 @@ class overlaid_image_features(ManagerTermBase):
         # store the device of the image
         image_device = image_data.device
         # forward the images through the model
-        features = self._inference_fn(self._model, image_data, **(inference_kwargs or {}))
+        if use_extractor:
+            features = self._extractor(sensor_cfg.name, image_data, step)
+        else:
+            features = self._inference_fn(self._model, image_data, **(inference_kwargs or {}))
 
         # move the features back to the image device
         return features.detach().to(image_device)
@@ -315,6 +384,10 @@ class overlaid_image_features(ManagerTermBase):
             model = AutoModel.from_pretrained(f"theaiinstitute/{model_name}", trust_remote_code=True).eval()
             return model.to(model_device)
 
+        # normalization constants, allocated once instead of at every inference
+        mean = torch.tensor([0.485, 0.456, 0.406], device=model_device).view(1, 3, 1, 1)
+        std = torch.tensor([0.229, 0.224, 0.225], device=model_device).view(1, 3, 1, 1)
+
         def _inference(model, images: torch.Tensor) -> torch.Tensor:
             """Inference the Theia transformer model.
 
@@ -330,8 +403,6 @@ class overlaid_image_features(ManagerTermBase):
             # permute the image to (num_envs, channel, height, width)
             image_proc = image_proc.permute(0, 3, 1, 2).float() / 255.0
             # Normalize the image
-            mean = torch.tensor([0.485, 0.456, 0.406], device=model_device).view(1, 3, 1, 1)
-            std = torch.tensor([0.229, 0.224, 0.225], device=model_device).view(1, 3, 1, 1)
             image_proc = (image_proc - mean) / std
 
             # Taken from Transformers; inference converted to be GPU only
@@ -367,6 +438,10 @@ class overlaid_image_features(ManagerTermBase):
             model = getattr(models, model_name)(weights=resnet_weights[model_name]).eval()
             return model.to(model_device)
 
+        # normalization constants, allocated once instead of at every inference
+        mean = torch.tensor([0.485, 0.456, 0.406], device=model_device).view(1, 3, 1, 1)
+        std = torch.tensor([0.229, 0.224, 0.225], device=model_device).view(1, 3, 1, 1)
+
         def _inference(model, images: torch.Tensor) -> torch.Tensor:
             """Inference the ResNet model.
 
@@ -382,8 +457,6 @@ class overlaid_image_features(ManagerTermBase):
             # permute the image to (num_envs, channel, height, width)
             image_proc = image_proc.permute(0, 3, 1, 2).float() / 255.0
             # normalize the image
-            mean = torch.tensor([0.485, 0.456, 0.406], device=model_device).view(1, 3, 1, 1)
-            std = torch.tensor([0.229, 0.224, 0.225], device=model_device).view(1, 3, 1, 1)
             image_proc = (image_proc - mean) / std
 
             # forward the image through the model
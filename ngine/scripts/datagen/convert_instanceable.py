@@ -0,0 +1,58 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Offline conversion of an asset tree to instanceable geometry, without Isaac Sim.
+
+    python ngine/scripts/datagen/convert_instanceable.py --input_dir assets/objects --workers 16
+
+Assets are converted in place unless --output_dir is given (relative asset paths of the converted
+layers then resolve against the output tree). Unchanged assets are skipped based on the manifest
+written to the output root.
+"""
+
+import argparse
+import sys
+
+from ngine.utils.usd_instanceable import GEOMETRY_TYPES, convert_tree
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Make the geometry of every USD asset below a directory instanceable.")
+    parser.add_argument("--input_dir", type=str, required=True)
+    parser.add_argument("--output_dir", type=str, default=None, help="Mirrored output tree, in place if not set")
+    parser.add_argument("--workers", type=int, default=None, help="Process pool size, 0 to convert in this process")
+    parser.add_argument("--no_xforms", action="store_true", help="Do not insert <name>_xform parents")
+    parser.add_argument("--geometry_types", type=str, default=",".join(GEOMETRY_TYPES), help="Comma separated prim types")
+    parser.add_argument("--manifest", type=str, default=None, help="Manifest path, <output root>/instanceable_manifest.json by default")
+    parser.add_argument("--force", action="store_true", help="Convert every asset, even the unchanged ones")
+    args = parser.parse_args()
+
+    manifest = convert_tree(
+        args.input_dir,
+        args.output_dir,
+        create_xforms=not args.no_xforms,
+        geometry_types=tuple(t for t in args.geometry_types.split(",") if t),
+        workers=args.workers,
+        force=args.force,
+        manifest_path=args.manifest,
+        log=lambda message: print(f"[convert_instanceable] {message}"),
+    )
+    failed = [path for path, entry in manifest["assets"].items() if entry["status"] == "failed"]
+    if failed:
+        print(f"[convert_instanceable] {len(failed)} assets failed, see the manifest")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,368 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Sharded data generation over a task x layout x seed grid.
+
+Every shard runs in its own worker process (its own Isaac Sim instance), launched from a command template with
+the ``{task}``, ``{layout}``, ``{seed}``, ``{output}`` and ``{shard_id}`` placeholders. The worker has to write
+its dataset to ``{output}`` and exit with code 0. Failed or timed out shards are retried up to
+``max_retries`` times, the state of every shard is checkpointed to ``<output_dir>/manifest.json`` so that an
+interrupted run resumes where it stopped. Finally the per-shard datasets are merged into
+``<output_dir>/merged.hdf5``.
+
+Example:
+    python -m ngine.scripts.datagen.orchestrator --config configs/data_collection/datagen/datagen_example.yml
+    # stub workers instead of Isaac Sim
+    python -m ngine.scripts.datagen.orchestrator --stub --tasks PnPCounterToSink,OpenDrawer \\
+        --layouts robocasakitchen-1-1,robocasakitchen-2-1 --seeds 0-3 --output_dir /tmp/datagen
+"""
+
+import argparse
+import os
+import re
+import shlex
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from itertools import product
+from pathlib import Path
+
+import yaml
+
+from ngine.utils.cache_utils import atomic_write_json, read_json
+
+MANIFEST_VERSION = 1
+
+STUB_COMMAND = (
+    f"{shlex.quote(sys.executable)} -m ngine.scripts.datagen.stub_worker --task {{task}} --layout {{layout}} --seed {{seed}} "
+    "--output {output}"
+)
+
+
+@dataclass
+class Shard:
+    shard_id: str
+    task: str
+    layout: str
+    seed: int
+    status: str = "pending"  # pending, running, done or failed
+    attempts: int = 0
+    output: str | None = None
+    error: str | None = None
+    duration_s: float | None = None
+
+
+def shard_id(task: str, layout: str, seed: int) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", f"{task}__{layout}__{seed}")
+
+
+def parse_seeds(seeds: str | list) -> list[int]:
+    """Seeds from a list or a comma separated string of seeds and ``start-end`` ranges (inclusive)."""
+    if isinstance(seeds, (list, tuple)):
+        return [int(seed) for seed in seeds]
+    result = []
+    for part in str(seeds).split(","):
+        part = part.strip()
+        if re.fullmatch(r"\d+-\d+", part):
+            start, end = map(int, part.split("-"))
+            result.extend(range(start, end + 1))
+        elif part:
+            result.append(int(part))
+    return result
+
+
+def expand_grid(tasks: list[str], layouts: list[str], seeds: list[int]) -> list[Shard]:
+    return [Shard(shard_id(task, layout, seed), task, layout, seed) for task, layout, seed in product(tasks, layouts, seeds)]
+
+
+class Manifest:
+    """Shard states of a run, persisted atomically after every change."""
+
+    def __init__(self, path: str | Path, shards: list[Shard], command: str):
+        self.path = Path(path)
+        self.command = command
+        self.shards = {shard.shard_id: shard for shard in shards}
+        previous = read_json(self.path)
+        if previous is not None and previous.get("version") == MANIFEST_VERSION:
+            for state in previous.get("shards", []):
+                shard = self.shards.get(state["shard_id"])
+                if shard is None:
+                    continue
+                shard.status, shard.attempts, shard.output = state["status"], state["attempts"], state["output"]
+                shard.error, shard.duration_s = state.get("error"), state.get("duration_s")
+                if shard.status == "running":
+                    # interrupted run
+                    shard.status = "pending"
+                elif shard.status == "done" and not (shard.output and Path(shard.output).exists()):
+                    shard.status = "pending"
+
+    def save(self):
+        atomic_write_json(self.path, {
+            "version": MANIFEST_VERSION,
+            "command": self.command,
+            "updated": time.time(),
+            "shards": [asdict(shard) for shard in self.shards.values()],
+        })
+
+    def counts(self) -> dict[str, int]:
+        counts = {"pending": 0, "running": 0, "done": 0, "failed": 0}
+        for shard in self.shards.values():
+            counts[shard.status] += 1
+        return counts
+
+
+@dataclass
+class _Running:
+    shard: Shard
+    process: subprocess.Popen
+    log_file: object
+    slot: int
+    start_time: float
+
+
+class DataGenOrchestrator:
+    """Run the shards of a manifest with a pool of worker processes.
+
+    Args:
+        manifest: The shards and their states.
+        command: Worker command template, see the module documentation.
+        output_dir: Directory of the shard datasets (``shards/``) and worker logs (``logs/``).
+        workers: Number of concurrent worker processes.
+        max_retries: Number of retries of a failed shard.
+        timeout_s: Wall time limit of a worker, None for no limit.
+        gpus: GPU ids assigned round-robin to the worker slots through CUDA_VISIBLE_DEVICES.
+        retry_failed: Also retry the shards which failed in a previous run.
+    """
+
+    def __init__(self, manifest: Manifest, command: str, output_dir: str | Path, workers: int = 1, max_retries: int = 2,
+                 timeout_s: float | None = None, gpus: list[str] | None = None, retry_failed: bool = False):
+        self.manifest = manifest
+        self.command = command
+        self.output_dir = Path(output_dir)
+        self.workers = workers
+        self.max_retries = max_retries
+        self.timeout_s = timeout_s
+        self.gpus = gpus or []
+        (self.output_dir / "shards").mkdir(parents=True, exist_ok=True)
+        (self.output_dir / "logs").mkdir(parents=True, exist_ok=True)
+        if retry_failed:
+            for shard in self.manifest.shards.values():
+                if shard.status == "failed":
+                    shard.status, shard.attempts = "pending", 0
+
+    def run(self, poll_interval: float = 0.2) -> dict[str, int]:
+        pending = [shard for shard in self.manifest.shards.values() if shard.status == "pending"]
+        running: list[_Running] = []
+        self.manifest.save()
+        print(f"[datagen] {len(pending)} shards to run, {self.manifest.counts()['done']} already done")
+        try:
+            while pending or running:
+                free_slots = sorted(set(range(self.workers)) - {r.slot for r in running})
+                while pending and free_slots:
+                    running.append(self._launch(pending.pop(0), free_slots.pop(0)))
+                    self.manifest.save()
+                time.sleep(poll_interval)
+                for r in list(running):
+                    returncode = r.process.poll()
+                    elapsed = time.perf_counter() - r.start_time
+                    if returncode is None and self.timeout_s is not None and elapsed > self.timeout_s:
+                        self._kill(r.process)
+                        returncode = "timeout"
+                    if returncode is None:
+                        continue
+                    running.remove(r)
+                    r.log_file.close()
+                    if self._finish(r.shard, returncode, elapsed):
+                        pending.append(r.shard)
+                    self.manifest.save()
+        except KeyboardInterrupt:
+            print("[datagen] interrupted, stopping the workers")
+            for r in running:
+                self._kill(r.process)
+                r.log_file.close()
+                r.shard.status = "pending"
+            self.manifest.save()
+            raise
+        counts = self.manifest.counts()
+        print(f"[datagen] finished: {counts}")
+        return counts
+
+    """
+    Helper functions.
+    """
+
+    def _launch(self, shard: Shard, slot: int) -> _Running:
+        shard.attempts += 1
+        shard.status = "running"
+        shard.error = None
+        shard.output = str(self.output_dir / "shards" / f"{shard.shard_id}.hdf5")
+        if os.path.exists(shard.output):
+            os.remove(shard.output)
+        values = {"task": shard.task, "layout": shard.layout, "seed": shard.seed, "output": shard.output, "shard_id": shard.shard_id}
+        args = [token.format(**values) for token in shlex.split(self.command)]
+        env = dict(os.environ)
+        env.update({
+            "NGINE_SHARD_ID": shard.shard_id,
+            "NGINE_SHARD_ATTEMPT": str(shard.attempts),
+            "NGINE_SHARD_SLOT": str(slot),
+        })
+        if self.gpus:
+            env["CUDA_VISIBLE_DEVICES"] = str(self.gpus[slot % len(self.gpus)])
+        log_file = open(self.output_dir / "logs" / f"{shard.shard_id}.attempt{shard.attempts}.log", "w")
+        # own session, so that killing a worker also kills the simulator processes it spawned
+        process = subprocess.Popen(args, stdout=log_file, stderr=subprocess.STDOUT, env=env, start_new_session=True)
+        print(f"[datagen] slot {slot}: {shard.shard_id} (attempt {shard.attempts})")
+        return _Running(shard, process, log_file, slot, time.perf_counter())
+
+    def _finish(self, shard: Shard, returncode, elapsed: float) -> bool:
+        """Update the shard state after its worker exited, returns True if the shard has to be retried."""
+        shard.duration_s = elapsed
+        if returncode == 0 and Path(shard.output).exists():
+            shard.status = "done"
+            print(f"[datagen] done: {shard.shard_id} ({elapsed:.1f}s)")
+            return False
+        if returncode == 0:
+            shard.error = "the worker exited without writing its output"
+        elif returncode == "timeout":
+            shard.error = f"timeout after {elapsed:.0f}s"
+        else:
+            shard.error = f"exit code {returncode}"
+        retry = shard.attempts <= self.max_retries
+        shard.status = "pending" if retry else "failed"
+        print(f"[datagen] {'retrying' if retry else 'failed'}: {shard.shard_id} ({shard.error})")
+        return retry
+
+    @staticmethod
+    def _kill(process: subprocess.Popen):
+        try:
+            os.killpg(process.pid, 15)
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            os.killpg(process.pid, 9)
+            process.wait()
+        except ProcessLookupError:
+            pass
+
+
+def _demo_index(name: str) -> int:
+    match = re.search(r"(\d+)$", name)
+    return int(match.group(1)) if match else -1
+
+
+def merge_hdf5(shards: list[Shard], output: str | Path) -> dict[str, int]:
+    """Merge the datasets of the done shards, renumbering the episodes.
+
+    Every merged episode keeps the ``shard_id``, ``task``, ``layout``, ``shard_seed`` and ``env_args`` of its shard as
+    attributes. The top-level ``env_args`` read by the replay scripts are the ones of the first merged episode. The
+    merged file is written next to ``output`` and renamed once complete.
+    """
+    import h5py
+
+    output = Path(output)
+    tmp_output = output.with_name(f".{output.name}.tmp")
+    num_episodes, total = 0, 0
+    with h5py.File(tmp_output, "w") as dst:
+        data = dst.create_group("data")
+        for shard in shards:
+            with h5py.File(shard.output, "r") as src:
+                if "data" not in src:
+                    continue
+                env_args = src["data"].attrs.get("env_args")
+                for name in sorted(src["data"], key=_demo_index):
+                    episode_name = f"demo_{num_episodes}"
+                    src.copy(src["data"][name], data, name=episode_name)
+                    episode = data[episode_name]
+                    episode.attrs["shard_id"] = shard.shard_id
+                    episode.attrs["task"] = shard.task
+                    episode.attrs["layout"] = shard.layout
+                    episode.attrs["shard_seed"] = shard.seed
+                    if env_args is not None:
+                        episode.attrs["env_args"] = env_args
+                        if "env_args" not in data.attrs:
+                            data.attrs["env_args"] = env_args
+                    total += int(episode.attrs.get("num_samples", 0))
+                    num_episodes += 1
+        data.attrs["total"] = total
+    os.replace(tmp_output, output)
+    return {"episodes": num_episodes, "samples": total, "shards": len(shards)}
+
+
+def load_settings(args) -> dict:
+    settings = {}
+    if args.config:
+        with open(args.config, "r") as f:
+            settings = yaml.safe_load(f) or {}
+    for key in ("tasks", "layouts", "seeds", "command", "output_dir", "workers", "max_retries", "timeout_s", "gpus"):
+        value = getattr(args, key)
+        if value is not None:
+            settings[key] = value
+    for key in ("tasks", "layouts", "gpus"):
+        if isinstance(settings.get(key), str):
+            settings[key] = [item.strip() for item in settings[key].split(",") if item.strip()]
+    if args.stub:
+        settings["command"] = STUB_COMMAND + " " + args.stub_args
+    for key in ("tasks", "layouts", "seeds", "command", "output_dir"):
+        if not settings.get(key):
+            raise ValueError(f"'{key}' is required, pass --{key} or set it in the config")
+    settings["seeds"] = parse_seeds(settings["seeds"])
+    return settings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sharded multi-process data generation.")
+    parser.add_argument("--config", type=str, default=None, help="yaml file with the settings below")
+    parser.add_argument("--tasks", type=str, default=None, help="Comma separated tasks")
+    parser.add_argument("--layouts", type=str, default=None, help="Comma separated layouts")
+    parser.add_argument("--seeds", type=str, default=None, help="Comma separated seeds or ranges, e.g. 0-9,20")
+    parser.add_argument("--command", type=str, default=None, help="Worker command template")
+    parser.add_argument("--output_dir", type=str, default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max_retries", type=int, default=None)
+    parser.add_argument("--timeout_s", type=float, default=None)
+    parser.add_argument("--gpus", type=str, default=None, help="Comma separated GPU ids assigned to the worker slots")
+    parser.add_argument("--retry_failed", action="store_true", help="Retry the shards which failed in a previous run")
+    parser.add_argument("--no_merge", action="store_true", help="Do not merge the shard datasets")
+    parser.add_argument("--stub", action="store_true", help="Use the stub worker instead of the command")
+    parser.add_argument("--stub_args", type=str, default="", help="Extra arguments of the stub worker")
+    args = parser.parse_args()
+
+    settings = load_settings(args)
+    output_dir = Path(settings["output_dir"])
+    manifest = Manifest(
+        output_dir / "manifest.json", expand_grid(settings["tasks"], settings["layouts"], settings["seeds"]), settings["command"]
+    )
+    orchestrator = DataGenOrchestrator(
+        manifest,
+        settings["command"],
+        output_dir,
+        workers=settings.get("workers", 1),
+        max_retries=settings.get("max_retries", 2),
+        timeout_s=settings.get("timeout_s"),
+        gpus=[str(gpu) for gpu in settings.get("gpus", [])],
+        retry_failed=args.retry_failed,
+    )
+    counts = orchestrator.run()
+
+    if not args.no_merge:
+        done = [shard for shard in manifest.shards.values() if shard.status == "done"]
+        if done:
+            summary = merge_hdf5(done, output_dir / "merged.hdf5")
+            print(f"[datagen] merged {summary['episodes']} episodes of {summary['shards']} shards into {output_dir / 'merged.hdf5'}")
+    if counts["failed"] > 0:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Stand-in of a data generation worker which does not need Isaac Sim.
+
+Writes a dataset with the layout of the Isaac Lab recorder (``data/demo_<i>`` groups with ``num_samples`` /
+``seed`` / ``success`` attributes) filled with deterministic random data. With ``--fail_rate`` the worker
+exits with an error for a deterministic subset of the (shard, attempt) pairs, to exercise the retries of the
+orchestrator.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import zlib
+
+import h5py
+import numpy as np
+
+
+def write_stub_dataset(output: str, task: str, layout: str, seed: int, episodes: int, steps: int):
+    rng = np.random.default_rng(seed)
+    tmp_output = f"{output}.tmp"
+    with h5py.File(tmp_output, "w") as f:
+        data = f.create_group("data")
+        data.attrs["env_args"] = json.dumps({"env_name": task, "type": 2, "layout": layout})
+        total = 0
+        for i in range(episodes):
+            demo = data.create_group(f"demo_{i}")
+            demo.attrs["num_samples"] = steps
+            demo.attrs["seed"] = seed
+            demo.attrs["success"] = bool(rng.random() < 0.8)
+            demo.create_dataset("actions", data=rng.standard_normal((steps, 12)).astype(np.float32))
+            joint_pos = np.cumsum(rng.standard_normal((steps, 14)) * 0.01, axis=0).astype(np.float32)
+            demo.create_dataset("states/articulation/robot/joint_position", data=joint_pos)
+            demo.create_dataset("obs/joint_pos", data=joint_pos)
+            total += steps
+        data.attrs["total"] = total
+    os.replace(tmp_output, output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stub data generation worker.")
+    parser.add_argument("--task", type=str, required=True)
+    parser.add_argument("--layout", type=str, required=True)
+    parser.add_argument("--seed", type=int, required=True)
+    parser.add_argument("--output", type=str, required=True)
+    parser.add_argument("--episodes", type=int, default=2)
+    parser.add_argument("--steps", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=0.0, help="Seconds to sleep, emulating the simulation")
+    parser.add_argument("--fail_rate", type=float, default=0.0, help="Fraction of the attempts which fail")
+    args = parser.parse_args()
+
+    attempt = int(os.environ.get("NGINE_SHARD_ATTEMPT", "1"))
+    draw = zlib.crc32(f"{args.task}/{args.layout}/{args.seed}/{attempt}".encode()) / 2**32
+    if args.duration > 0:
+        time.sleep(args.duration)
+    if draw < args.fail_rate:
+        print(f"stub worker: simulated failure of attempt {attempt}", file=sys.stderr)
+        sys.exit(3)
+    write_stub_dataset(args.output, args.task, args.layout, args.seed, args.episodes, args.steps)
+    print(f"stub worker: wrote {args.episodes} episodes to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -16,6 +16,7 @@ import time
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
+from types import SimpleNamespace
 from typing import Optional
 
 import gymnasium as gym
@@ -93,6 +94,10 @@ class PPOArgs:
     save_train_video_freq: Optional[int] = None
     """frequency to save training videos in terms of iterations"""
     finite_horizon_gae: bool = False
+    compile: bool = False
+    """whether to compile the policy forward and the PPO minibatch loss with torch.compile"""
+    cudagraphs: bool = False
+    """whether to additionally capture the compiled functions into CUDA graphs (torch.compile mode="reduce-overhead")"""
 
     # to be filled in runtime
     batch_size: int = 0
@@ -213,7 +218,51 @@ class NatureCNN(nn.Module):
         return torch.cat(encoded_tensor_list, dim=1)
 
 
+REWARD_LOG_TERMS = ("reaching_reward", "grasp_reward", "place_reward", "touching_table")
+
+
+class RolloutBuffer:
+    """
+    Preallocated rollout storage.
+
+    Every field is a single flat (num_steps * num_envs, ...) tensor allocated once, with a
+    (num_steps, num_envs, ...) view used while collecting. Steps are written in place, and the PPO
+    update gathers minibatches straight from the flat tensors without reshaping or copying the rollout.
+    """
+
+    def __init__(self, num_steps, num_envs, sample_obs, action_dim, device):
+        self.num_steps = num_steps
+        self.num_envs = num_envs
+        self.batch_size = num_steps * num_envs
+        self.flat_obs = {}
+        self.obs = {}
+        for k, v in sample_obs.items():
+            dtype = torch.uint8 if k == "rgb" else torch.float32
+            self.flat_obs[k] = torch.zeros((self.batch_size,) + tuple(v.shape[1:]), dtype=dtype, device=device)
+            self.obs[k] = self.flat_obs[k].view((num_steps, num_envs) + tuple(v.shape[1:]))
+
+        self.flat_actions = torch.zeros((self.batch_size, action_dim), device=device)
+        self.actions = self.flat_actions.view(num_steps, num_envs, action_dim)
+        for name in ("logprobs", "rewards", "dones", "values", "final_values"):
+            flat = torch.zeros(self.batch_size, device=device)
+            setattr(self, f"flat_{name}", flat)
+            setattr(self, name, flat.view(num_steps, num_envs))
+
+    def reset(self):
+        self.flat_final_values.zero_()
+
+    def insert_obs(self, step, obs, done):
+        for k, v in obs.items():
+            self.obs[k][step].copy_(v)
+        self.dones[step].copy_(done)
+
+    def minibatch_obs(self, inds):
+        return {k: v[inds] for k, v in self.flat_obs.items()}
+
+
 class DictArray(object):
+    """Nested rollout storage of :class:`LegacyPPO`."""
+
     def __init__(self, buffer_shape, element_space, data_dict=None, device=None):
         self.buffer_shape = buffer_shape
         if data_dict:
@@ -332,20 +381,20 @@ class PPO():
             self.obs_count = 0
 
             self.optimizer = optim.Adam(self.agent.parameters(), lr=args.learning_rate, eps=1e-5)
-            state_dim = sample_obs["state"].shape[-1]
             self.logger = get_logger(args)
-            obs_space = gym.spaces.Dict({'state': gym.spaces.Box(-np.inf, np.inf, (state_dim,), dtype=np.float32)})
-            if "rgb" in sample_obs:
-                rgb_shape = sample_obs["rgb"].shape[1:]
-                obs_space['rgb'] = gym.spaces.Box(0, 255, rgb_shape, dtype=np.uint8)
-
-            self.obs = DictArray((self.num_steps, self.num_envs), obs_space, device=device)
-            self.actions = torch.zeros((self.num_steps, self.num_envs) + (self.action_dim,)).to(device)
-            self.logprobs = torch.zeros((self.num_steps, self.num_envs)).to(device)
-            self.rewards = torch.zeros((self.num_steps, self.num_envs)).to(device)
-            self.dones = torch.zeros((self.num_steps, self.num_envs)).to(device)
-            self.values = torch.zeros((self.num_steps, self.num_envs)).to(device)
-            self.final_values = torch.zeros((self.num_steps, self.num_envs), device=device)
+
+            self.rollout = RolloutBuffer(self.num_steps, self.num_envs, sample_obs, self.action_dim, device)
+            # per-iteration metrics are accumulated on device and only synchronized when logged
+            self.reward_log_sums = {k: torch.zeros((), device=device) for k in REWARD_LOG_TERMS}
+            self.reward_log_counts = {k: 0 for k in REWARD_LOG_TERMS}
+            self.nonfinite_obs = torch.zeros((), dtype=torch.bool, device=device)
+
+            self.policy_step = self._policy_step
+            self.minibatch_loss = self._minibatch_loss
+            if args.compile or args.cudagraphs:
+                mode = "reduce-overhead" if args.cudagraphs else None
+                self.policy_step = torch.compile(self._policy_step, mode=mode)
+                self.minibatch_loss = torch.compile(self._minibatch_loss, mode=mode)
 
     def load_model(self, pt_path):
         self.agent.load_state_dict(torch.load(pt_path))
@@ -362,47 +411,57 @@ class PPO():
         action[:, :-1] = action[:, :-1] * 0.05
         return action
 
+    def _policy_step(self, obs):
+        with torch.no_grad():
+            action, logprob, _, value = self.agent.get_action_and_value(obs)
+        return action, logprob, value.flatten()
+
     def collect_data(self, next_obs, next_done):
-        self.final_values = torch.zeros((self.args.num_steps, self.args.num_envs), device=self.device)
+        rollout = self.rollout
+        rollout.reset()
         self.rollout_time = time.perf_counter()
         for step in range(0, self.num_steps):
             self.global_step += self.num_envs
-            self.obs[step] = next_obs
-            self.dones[step] = next_done
+            rollout.insert_obs(step, next_obs, next_done)
 
             # ALGO LOGIC: action logic
-            with torch.no_grad():
-                action, logprob, _, value = self.agent.get_action_and_value(next_obs)
-                self.values[step] = value.flatten()
-            self.actions[step] = action
-            self.logprobs[step] = logprob
+            action, logprob, value = self.policy_step(next_obs)
+            # outputs of a CUDA graph are overwritten by the next replay, the rollout buffer keeps its own copy
+            rollout.values[step].copy_(value)
+            rollout.actions[step].copy_(action)
+            rollout.logprobs[step].copy_(logprob)
 
             # TRY NOT TO MODIFY: execute the game and log data.
-            next_obs, reward, terminations, truncations, infos = self.envs.step(action)
+            next_obs, reward, terminations, truncations, infos = self.envs.step(rollout.actions[step])
             next_obs = observation(next_obs['policy'])
-            if (next_obs['state'] == torch.inf).sum() > 0:
-                breakpoint()
-
-            # if hasattr(self, 'obs_rms'):
-            #     next_obs["state"] = (next_obs["state"] - self.obs_rms) / torch.sqrt(self.obs_var + 1e-8)
-            # else:
-            #     next_obs = next_obs
+            # NaN and +-inf, accumulated on device and checked once at the end of the rollout
+            self.nonfinite_obs |= (~torch.isfinite(next_obs['state'])).any()
 
             next_done = torch.logical_or(terminations, truncations).to(torch.float32)
-            self.rewards[step] = reward.view(-1) * self.args.reward_scale
-            self.logger.add_scalar("Reward/reaching_reward", infos['log']['Episode_Reward/reaching_reward'].cpu().numpy(), self.global_step)
-            self.logger.add_scalar("Reward/grasp_reward", infos['log']['Episode_Reward/grasp_reward'].cpu().numpy(), self.global_step)
-            self.logger.add_scalar("Reward/place_reward", infos['log']['Episode_Reward/place_reward'].cpu().numpy(), self.global_step)
-            self.logger.add_scalar("Reward/touching_table", infos['log']['Episode_Reward/touching_table'].cpu().numpy(), self.global_step)
+            rollout.rewards[step].copy_(reward.view(-1) * self.args.reward_scale)
+            for k in REWARD_LOG_TERMS:
+                term = infos['log'].get(f'Episode_Reward/{k}')
+                if term is not None:
+                    self.reward_log_sums[k] += torch.as_tensor(term, device=self.device, dtype=torch.float32).mean()
+                    self.reward_log_counts[k] += 1
             if next_done.any():
                 final_obs = observation(common.torch_clone_dict(infos['final_obs'])['policy'])
-                done_mask = next_done.clone().bool()
-                for k in final_obs:
-                    final_obs[k] = final_obs[k][done_mask]
                 with torch.no_grad():
-                    self.final_values[step, torch.arange(self.args.num_envs, device=self.device)[done_mask]] = self.agent.get_value(final_obs).view(-1)
+                    final_value = self.agent.get_value(final_obs).view(-1)
+                rollout.final_values[step] = torch.where(next_done.bool(), final_value, 0.0)
         self.rollout_time = time.perf_counter() - self.rollout_time
         self.cumulative_times["rollout_time"] += self.rollout_time
+
+        if self.nonfinite_obs.item():
+            self.nonfinite_obs.zero_()
+            raise FloatingPointError(
+                "non-finite state observation in the rollout, checked once after all its steps ran"
+            )
+        for k in REWARD_LOG_TERMS:
+            if self.reward_log_counts[k] > 0:
+                self.logger.add_scalar(f"Reward/{k}", (self.reward_log_sums[k] / self.reward_log_counts[k]).item(), self.global_step)
+            self.reward_log_sums[k].zero_()
+            self.reward_log_counts[k] = 0
         return next_obs, next_done
 
     def anneal_lr(self, iteration):
@@ -411,18 +470,19 @@ class PPO():
         self.optimizer.param_groups[0]["lr"] = lrnow
 
     def get_value(self, next_obs, next_done):
+        rollout = self.rollout
         with torch.no_grad():
             next_value = self.agent.get_value(next_obs).reshape(1, -1)
-            advantages = torch.zeros_like(self.rewards).to(self.device)
+            advantages = torch.zeros_like(rollout.rewards)
             lastgaelam = 0
             for t in reversed(range(self.num_steps)):
                 if t == self.num_steps - 1:
                     next_not_done = 1.0 - next_done
                     nextvalues = next_value
                 else:
-                    next_not_done = 1.0 - self.dones[t + 1]
-                    nextvalues = self.values[t + 1]
-                real_next_values = next_not_done * nextvalues + self.final_values[t]  # t instead of t+1
+                    next_not_done = 1.0 - rollout.dones[t + 1]
+                    nextvalues = rollout.values[t + 1]
+                real_next_values = next_not_done * nextvalues + rollout.final_values[t]  # t instead of t+1
                 # next_not_done means nextvalues is computed from the correct next_obs
                 # if next_not_done is 1, final_values is always 0
                 # if next_not_done is 0, then use final_values, which is computed according to bootstrap_at_done
@@ -444,90 +504,236 @@ class PPO():
                     value_term_sum = value_term_sum * next_not_done
 
                     lam_coef_sum = 1 + self.args.gae_lambda * lam_coef_sum
-                    reward_term_sum = self.args.gae_lambda * self.args.gamma * reward_term_sum + lam_coef_sum * self.rewards[t]
+                    reward_term_sum = self.args.gae_lambda * self.args.gamma * reward_term_sum + lam_coef_sum * rollout.rewards[t]
                     value_term_sum = self.args.gae_lambda * self.args.gamma * value_term_sum + self.args.gamma * real_next_values
 
-                    advantages[t] = (reward_term_sum + value_term_sum) / lam_coef_sum - self.values[t]
+                    advantages[t] = (reward_term_sum + value_term_sum) / lam_coef_sum - rollout.values[t]
                 else:
-                    delta = self.rewards[t] + self.args.gamma * real_next_values - self.values[t]
+                    delta = rollout.rewards[t] + self.args.gamma * real_next_values - rollout.values[t]
                     advantages[t] = lastgaelam = delta + self.args.gamma * self.args.gae_lambda * next_not_done * lastgaelam  # Here actually we should use next_not_terminated, but we don't have lastgamlam if terminated
-            returns = advantages + self.values
+            returns = advantages + rollout.values
             return advantages, returns
 
+    def _minibatch_loss(self, mb_obs, mb_actions, mb_logprobs, mb_advantages, mb_returns, mb_values):
+        _, newlogprob, entropy, newvalue = self.agent.get_action_and_value(mb_obs, mb_actions)
+        logratio = newlogprob - mb_logprobs
+        ratio = logratio.exp()
+
+        with torch.no_grad():
+            # calculate approx_kl http://joschu.net/blog/kl-approx.html
+            old_approx_kl = (-logratio).mean()
+            approx_kl = ((ratio - 1) - logratio).mean()
+            clipfrac = ((ratio - 1.0).abs() > self.args.clip_coef).float().mean()
+
+        if self.args.norm_adv:
+            mb_advantages = (mb_advantages - mb_advantages.mean()) / (mb_advantages.std() + 1e-8)
+
+        # Policy loss
+        pg_loss1 = -mb_advantages * ratio
+        pg_loss2 = -mb_advantages * torch.clamp(ratio, 1 - self.args.clip_coef, 1 + self.args.clip_coef)
+        pg_loss = torch.max(pg_loss1, pg_loss2).mean()
+
+        # Value loss
+        newvalue = newvalue.view(-1)
+        if self.args.clip_vloss:
+            v_loss_unclipped = (newvalue - mb_returns) ** 2
+            v_clipped = mb_values + torch.clamp(
+                newvalue - mb_values,
+                -self.args.clip_coef,
+                self.args.clip_coef,
+            )
+            v_loss_clipped = (v_clipped - mb_returns) ** 2
+            v_loss_max = torch.max(v_loss_unclipped, v_loss_clipped)
+            v_loss = 0.5 * v_loss_max.mean()
+        else:
+            v_loss = 0.5 * ((newvalue - mb_returns) ** 2).mean()
+
+        entropy_loss = entropy.mean()
+        loss = pg_loss - self.args.ent_coef * entropy_loss + v_loss * self.args.vf_coef
+        stats = torch.stack([v_loss, pg_loss, entropy_loss, old_approx_kl, approx_kl, clipfrac]).detach()
+        return loss, stats
+
     def update(self, next_obs, next_done):
 
         advantages, returns = self.get_value(next_obs, next_done)
-        # flatten the batch
-        b_obs = self.obs.reshape((-1,))
-        b_logprobs = self.logprobs.reshape(-1)
-        b_actions = self.actions.reshape((-1,) + (self.action_dim,))
+        # the rollout buffer is already flat, no reshape or copy of the batch is needed
+        rollout = self.rollout
+        b_logprobs = rollout.flat_logprobs
+        b_actions = rollout.flat_actions
         b_advantages = advantages.reshape(-1)
         b_returns = returns.reshape(-1)
-        b_values = self.values.reshape(-1)
+        b_values = rollout.flat_values
         self.agent.train()
-        b_inds = np.arange(self.batch_size)
-        clipfracs = []
+        clipfrac_sum = torch.zeros((), device=self.device)
+        num_minibatches = 0
+        stats = None
+        early_stop = False
         update_time = time.perf_counter()
         for epoch in range(self.args.update_epochs):
-            np.random.shuffle(b_inds)
+            b_inds = torch.randperm(self.batch_size, device=self.device)
             for start in range(0, self.batch_size, self.minibatch_size):
                 end = start + self.minibatch_size
                 mb_inds = b_inds[start:end]
 
-                _, newlogprob, entropy, newvalue = self.agent.get_action_and_value(b_obs[mb_inds], b_actions[mb_inds])
-                logratio = newlogprob - b_logprobs[mb_inds]
-                ratio = logratio.exp()
+                loss, stats = self.minibatch_loss(
+                    rollout.minibatch_obs(mb_inds),
+                    b_actions[mb_inds],
+                    b_logprobs[mb_inds],
+                    b_advantages[mb_inds],
+                    b_returns[mb_inds],
+                    b_values[mb_inds],
+                )
+                # CUDA graph outputs are overwritten by the next replay
+                stats = stats.clone()
+                clipfrac_sum += stats[5]
+                num_minibatches += 1
+
+                # the early stopping check is the only host synchronization of the minibatch loop
+                if self.args.target_kl is not None and stats[4] > self.args.target_kl:
+                    early_stop = True
+                    break
+
+                self.optimizer.zero_grad(set_to_none=False)
+                loss.backward()
+                nn.utils.clip_grad_norm_(self.agent.parameters(), self.args.max_grad_norm)
+                self.optimizer.step()
+
+            if early_stop:
+                break
+        update_time = time.perf_counter() - update_time
+        self.cumulative_times["update_time"] += update_time
+        if not early_stop:
+            var_y = torch.var(b_returns, unbiased=False)
+            explained_var = 1 - torch.var(b_returns - b_values, unbiased=False) / var_y
+            # a single device to host copy for all the update metrics of the iteration
+            metrics = torch.cat([stats[:5], (clipfrac_sum / num_minibatches).view(1), var_y.view(1), explained_var.view(1)]).tolist()
+            v_loss, pg_loss, entropy_loss, old_approx_kl, approx_kl, clipfrac, var_y, explained_var = metrics
+            if var_y == 0:
+                explained_var = np.nan
+            self.logger.add_scalar("charts/learning_rate", self.optimizer.param_groups[0]["lr"], self.global_step)
+            self.logger.add_scalar("losses/value_loss", v_loss, self.global_step)
+            self.logger.add_scalar("losses/policy_loss", pg_loss, self.global_step)
+            self.logger.add_scalar("losses/entropy", entropy_loss, self.global_step)
+            self.logger.add_scalar("losses/old_approx_kl", old_approx_kl, self.global_step)
+            self.logger.add_scalar("losses/approx_kl", approx_kl, self.global_step)
+            self.logger.add_scalar("losses/clipfrac", clipfrac, self.global_step)
+            self.logger.add_scalar("losses/explained_variance", explained_var, self.global_step)
+            self.logger.add_scalar("time/step", self.global_step, self.global_step)
+            self.logger.add_scalar("time/update_time", update_time, self.global_step)
+            self.logger.add_scalar("time/rollout_time", self.rollout_time, self.global_step)
+            self.logger.add_scalar("time/rollout_fps", self.num_envs * self.num_steps / self.rollout_time, self.global_step)
+            for k, v in self.cumulative_times.items():
+                self.logger.add_scalar(f"time/total_{k}", v, self.global_step)
+            self.logger.add_scalar("time/total_rollout+update_time", self.cumulative_times["rollout_time"] + self.cumulative_times["update_time"], self.global_step)
+
+
+class LegacyPPO(PPO):
+    """
+    The PPO loop before :class:`RolloutBuffer`: nested DictArray storage, host synchronizations on every step and
+    minibatch, index copies from the host and reallocations. Kept as the baseline of ``benchmark_fps``, the losses
+    and the advantages are the ones of :class:`PPO`.
+    """
+
+    def __init__(self, envs, sample_obs, args, device="cuda"):
+        super().__init__(envs, sample_obs, args, device)
+        state_dim = sample_obs["state"].shape[-1]
+        obs_space = gym.spaces.Dict({'state': gym.spaces.Box(-np.inf, np.inf, (state_dim,), dtype=np.float32)})
+        if "rgb" in sample_obs:
+            rgb_shape = sample_obs["rgb"].shape[1:]
+            obs_space['rgb'] = gym.spaces.Box(0, 255, rgb_shape, dtype=np.uint8)
+
+        shape = (self.num_steps, self.num_envs)
+        self.rollout = SimpleNamespace(
+            obs=DictArray(shape, obs_space, device=device),
+            actions=torch.zeros(shape + (self.action_dim,)).to(device),
+            logprobs=torch.zeros(shape).to(device),
+            rewards=torch.zeros(shape).to(device),
+            dones=torch.zeros(shape).to(device),
+            values=torch.zeros(shape).to(device),
+            final_values=torch.zeros(shape, device=device),
+        )
+
+    def collect_data(self, next_obs, next_done):
+        rollout = self.rollout
+        rollout.final_values = torch.zeros((self.args.num_steps, self.args.num_envs), device=self.device)
+        self.rollout_time = time.perf_counter()
+        for step in range(0, self.num_steps):
+            self.global_step += self.num_envs
+            rollout.obs[step] = next_obs
+            rollout.dones[step] = next_done
+
+            # ALGO LOGIC: action logic
+            with torch.no_grad():
+                action, logprob, _, value = self.agent.get_action_and_value(next_obs)
+                rollout.values[step] = value.flatten()
+            rollout.actions[step] = action
+            rollout.logprobs[step] = logprob
+
+            # TRY NOT TO MODIFY: execute the game and log data.
+            next_obs, reward, terminations, truncations, infos = self.envs.step(action)
+            next_obs = observation(next_obs['policy'])
+            if (~torch.isfinite(next_obs['state'])).any():
+                raise FloatingPointError(f"non-finite state observation at rollout step {step}")
 
+            next_done = torch.logical_or(terminations, truncations).to(torch.float32)
+            rollout.rewards[step] = reward.view(-1) * self.args.reward_scale
+            for k in REWARD_LOG_TERMS:
+                self.logger.add_scalar(f"Reward/{k}", infos['log'][f'Episode_Reward/{k}'].cpu().numpy(), self.global_step)
+            if next_done.any():
+                final_obs = observation(common.torch_clone_dict(infos['final_obs'])['policy'])
+                done_mask = next_done.clone().bool()
+                for k in final_obs:
+                    final_obs[k] = final_obs[k][done_mask]
                 with torch.no_grad():
-                    # calculate approx_kl http://joschu.net/blog/kl-approx.html
-                    old_approx_kl = (-logratio).mean()
-                    approx_kl = ((ratio - 1) - logratio).mean()
-                    clipfracs += [((ratio - 1.0).abs() > self.args.clip_coef).float().mean().item()]
+                    rollout.final_values[step, torch.arange(self.args.num_envs, device=self.device)[done_mask]] = self.agent.get_value(final_obs).view(-1)
+        self.rollout_time = time.perf_counter() - self.rollout_time
+        self.cumulative_times["rollout_time"] += self.rollout_time
+        return next_obs, next_done
 
-                if self.args.target_kl is not None and approx_kl > self.args.target_kl:
-                    v_loss = None
-                    break
+    def update(self, next_obs, next_done):
 
-                mb_advantages = b_advantages[mb_inds]
-                if self.args.norm_adv:
-                    mb_advantages = (mb_advantages - mb_advantages.mean()) / (mb_advantages.std() + 1e-8)
-
-                # Policy loss
-                pg_loss1 = -mb_advantages * ratio
-                pg_loss2 = -mb_advantages * torch.clamp(ratio, 1 - self.args.clip_coef, 1 + self.args.clip_coef)
-                pg_loss = torch.max(pg_loss1, pg_loss2).mean()
-
-                # Value loss
-                newvalue = newvalue.view(-1)
-                if self.args.clip_vloss:
-                    v_loss_unclipped = (newvalue - b_returns[mb_inds]) ** 2
-                    v_clipped = b_values[mb_inds] + torch.clamp(
-                        newvalue - b_values[mb_inds],
-                        -self.args.clip_coef,
-                        self.args.clip_coef,
-                    )
-                    v_loss_clipped = (v_clipped - b_returns[mb_inds]) ** 2
-                    v_loss_max = torch.max(v_loss_unclipped, v_loss_clipped)
-                    v_loss = 0.5 * v_loss_max.mean()
-                else:
-                    v_loss = 0.5 * ((newvalue - b_returns[mb_inds]) ** 2).mean()
+        advantages, returns = self.get_value(next_obs, next_done)
+        # flatten the batch
+        rollout = self.rollout
+        b_obs = rollout.obs.reshape((-1,))
+        b_logprobs = rollout.logprobs.reshape(-1)
+        b_actions = rollout.actions.reshape((-1,) + (self.action_dim,))
+        b_advantages = advantages.reshape(-1)
+        b_returns = returns.reshape(-1)
+        b_values = rollout.values.reshape(-1)
+        self.agent.train()
+        b_inds = np.arange(self.batch_size)
+        clipfracs = []
+        stats = None
+        update_time = time.perf_counter()
+        for epoch in range(self.args.update_epochs):
+            np.random.shuffle(b_inds)
+            for start in range(0, self.batch_size, self.minibatch_size):
+                end = start + self.minibatch_size
+                mb_inds = b_inds[start:end]
 
-                entropy_loss = entropy.mean()
-                loss = pg_loss - self.args.ent_coef * entropy_loss + v_loss * self.args.vf_coef
+                loss, stats = self._minibatch_loss(
+                    b_obs[mb_inds], b_actions[mb_inds], b_logprobs[mb_inds], b_advantages[mb_inds], b_returns[mb_inds], b_values[mb_inds]
+                )
+                clipfracs += [stats[5].item()]
+                if self.args.target_kl is not None and stats[4] > self.args.target_kl:
+                    stats = None
+                    break
 
                 self.optimizer.zero_grad()
                 loss.backward()
                 nn.utils.clip_grad_norm_(self.agent.parameters(), self.args.max_grad_norm)
                 self.optimizer.step()
 
-            if self.args.target_kl is not None and approx_kl > self.args.target_kl:
+            if stats is None:
                 break
         update_time = time.perf_counter() - update_time
         self.cumulative_times["update_time"] += update_time
         y_pred, y_true = b_values.cpu().numpy(), b_returns.cpu().numpy()
         var_y = np.var(y_true)
         explained_var = np.nan if var_y == 0 else 1 - np.var(y_true - y_pred) / var_y
-        if v_loss is not None:
+        if stats is not None:
+            v_loss, pg_loss, entropy_loss, old_approx_kl, approx_kl = stats[:5]
             self.logger.add_scalar("charts/learning_rate", self.optimizer.param_groups[0]["lr"], self.global_step)
             self.logger.add_scalar("losses/value_loss", v_loss.item(), self.global_step)
             self.logger.add_scalar("losses/policy_loss", pg_loss.item(), self.global_step)
@@ -0,0 +1,143 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark the training throughput of the maniskill PPO agent.
+
+The simulator is replaced by a synthetic vectorized environment producing random observations on the
+device, so the numbers only reflect the cost of the agent (rollout storage, policy forward, PPO update
+and metric logging). The ``legacy`` mode runs :class:`LegacyPPO`, the previous loop with the per-step host
+synchronizations and allocations of the nested DictArray rollout storage, as a baseline.
+
+Example:
+    python -m ngine.scripts.maniskill_ppo.benchmark_fps --num_envs 512 --modes legacy,eager,compile,cudagraphs
+"""
+
+import argparse
+import time
+
+import gymnasium as gym
+import numpy as np
+import torch
+
+from ngine.scripts.maniskill_ppo.agent import PPO, LegacyPPO, PPOArgs, REWARD_LOG_TERMS, observation
+
+
+class SyntheticEnv:
+    """Minimal stand-in of the Isaac Lab env with the same observation / infos layout."""
+
+    def __init__(self, num_envs, state_dim, action_dim, device, episode_length=50, rgb_shape=None):
+        self.num_envs = num_envs
+        self.state_dim = state_dim
+        self.device = device
+        self.rgb_shape = rgb_shape
+        self.episode_length = episode_length
+        self.single_action_space = gym.spaces.Box(-1.0, 1.0, (action_dim,), dtype=np.float32)
+        self.episode_step = torch.zeros(num_envs, dtype=torch.long, device=device)
+
+    @property
+    def unwrapped(self):
+        return self
+
+    def _obs(self):
+        obs = {"state": torch.randn(self.num_envs, self.state_dim, device=self.device)}
+        if self.rgb_shape is not None:
+            obs["image"] = torch.randint(0, 256, (self.num_envs,) + self.rgb_shape, dtype=torch.uint8, device=self.device)
+        return {"policy": obs}
+
+    def reset(self):
+        self.episode_step.zero_()
+        return self._obs(), {}
+
+    def step(self, action):
+        self.episode_step += 1
+        terminations = self.episode_step >= self.episode_length
+        truncations = torch.zeros_like(terminations)
+        infos = {"log": {f"Episode_Reward/{k}": torch.rand((), device=self.device) for k in REWARD_LOG_TERMS}}
+        if terminations.any():
+            infos["final_obs"] = self._obs()
+            self.episode_step[terminations] = 0
+        reward = action.square().sum(-1)
+        return self._obs(), reward, terminations, truncations, infos
+
+
+def run(mode, cli):
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    rgb_shape = tuple(cli.rgb_shape) if cli.rgb_shape else None
+    args = PPOArgs(
+        exp_name=f"benchmark_fps_{mode}",
+        num_envs=cli.num_envs,
+        num_steps=cli.num_steps,
+        compile=mode in ("compile", "cudagraphs"),
+        cudagraphs=mode == "cudagraphs",
+        # keep every minibatch of the update so that all modes run the same amount of work
+        target_kl=None,
+        save_model=False,
+    )
+    env = SyntheticEnv(cli.num_envs, cli.state_dim, args.action_dim, device, rgb_shape=rgb_shape)
+    next_obs, _ = env.reset()
+    next_obs = observation(next_obs["policy"], device=device)
+    agent = (LegacyPPO if mode == "legacy" else PPO)(env, next_obs, args, device)
+    next_done = torch.zeros(cli.num_envs, device=device)
+
+    rollout_time = update_time = 0.0
+    for iteration in range(cli.warmup + cli.iterations):
+        if iteration == cli.warmup:
+            rollout_time = agent.cumulative_times["rollout_time"]
+            update_time = agent.cumulative_times["update_time"]
+            if device == "cuda":
+                torch.cuda.synchronize()
+            start = time.perf_counter()
+        next_obs, next_done = agent.collect_data(next_obs, next_done)
+        agent.update(next_obs, next_done)
+    if device == "cuda":
+        torch.cuda.synchronize()
+    total_time = time.perf_counter() - start
+    agent.logger.close()
+
+    num_samples = cli.iterations * cli.num_envs * cli.num_steps
+    rollout_time = agent.cumulative_times["rollout_time"] - rollout_time
+    update_time = agent.cumulative_times["update_time"] - update_time
+    return {
+        "rollout_fps": num_samples / rollout_time,
+        "update_ms": 1000.0 * update_time / cli.iterations,
+        "total_fps": num_samples / total_time,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the maniskill PPO training throughput.")
+    parser.add_argument("--num_envs", type=int, default=512)
+    parser.add_argument("--num_steps", type=int, default=16)
+    parser.add_argument("--state_dim", type=int, default=64)
+    parser.add_argument("--rgb_shape", type=int, nargs=3, default=None, help="H W C of a synthetic camera")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--modes", type=str, default="legacy,eager,compile,cudagraphs")
+    cli = parser.parse_args()
+
+    results = {}
+    for mode in cli.modes.split(","):
+        torch.manual_seed(0)
+        np.random.seed(0)
+        results[mode] = run(mode, cli)
+        print(f"{mode}: {results[mode]}")
+
+    print(f"\n{'mode':<12}{'rollout fps':>14}{'update ms':>12}{'total fps':>14}{'speedup':>10}")
+    baseline = next(iter(results.values()))["total_fps"]
+    for mode, r in results.items():
+        print(f"{mode:<12}{r['rollout_fps']:>14.0f}{r['update_ms']:>12.1f}{r['total_fps']:>14.0f}{r['total_fps'] / baseline:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -92,11 +92,9 @@ def parse_args_and_config():
     return config
 
 
-def main(usr_args):
-
-    from ngine.distributed.proxy import RemoteEnv
-    env = RemoteEnv.make(address=('127.0.0.1', 50000), authkey=b'ngine')
+def make_env_cfg(usr_args):
     from ngine.distributed.restful import DotDict
+    env_cfg = None
     if "env_cfg" in usr_args and usr_args["env_cfg"]:
         env_cfg = DotDict(usr_args["env_cfg"])
         defaults = {
@@ -122,13 +120,70 @@ def main(usr_args):
         for key, value in defaults.items():
             if key not in env_cfg:
                 env_cfg[key] = value
-    env.attach(env_cfg)
+    return env_cfg
+
 
+def make_policy(usr_args):
     policy_name = usr_args["policy_name"]
     policy_module = importlib.import_module("policy")
     policy_class = getattr(policy_module, policy_name)
-    policy = policy_class(usr_args)
+    return policy_class(usr_args)
+
+
+def main_vectorized(usr_args):
+    """Evaluate a batched policy on all the envs of one or several env servers.
+
+    Enabled by ``vectorized: true`` in the config. ``env_servers`` lists the ``[host, port]`` of the servers
+    (default: the local server), each server runs ``env_cfg.num_envs`` envs and can override the env config
+    (e.g. its task) with an optional third ``env_cfg`` element.
+
+    Policies without ``predict_batch`` run slot by slot through their ``predict`` / ``reset_model``, with one
+    policy instance per slot unless ``share_policy: true``.
+    """
+    from ngine.distributed.proxy import RemoteEnv
+    from ngine.scripts.policy.vector_eval import VectorEvalHarness, as_batched_policy
+
+    base_env_cfg = make_env_cfg(usr_args)
+    envs = []
+    for server in usr_args.get("env_servers", [["127.0.0.1", 50000]]):
+        env = RemoteEnv.make(address=(server[0], int(server[1])), authkey=b'ngine')
+        env_cfg = base_env_cfg
+        if len(server) > 2 and server[2]:
+            env_cfg = make_env_cfg({"env_cfg": {**(base_env_cfg or {}), **server[2]}})
+        env.attach(env_cfg)
+        envs.append((str((env_cfg or {}).get("task", "default")), env))
+
+    usr_args['actions_dim'] = envs[0][1].action_space.shape[1]
+    usr_args['decimation'] = envs[0][1].unwrapped.cfg.decimation
+    policy = as_batched_policy(
+        make_policy(usr_args),
+        make_policy=lambda: make_policy(usr_args),
+        shared=usr_args.get("share_policy", False),
+    )
+
+    harness = VectorEvalHarness(envs, policy, episodes_per_task=usr_args.get('test_num', 10))
+    results = harness.run()
+    for task, task_results in results["tasks"].items():
+        print(f"{task}: success rate {task_results['success_rate']:.2%} ({task_results['success_count']}/{task_results['episode_count']})")
+    print(f"Success rate: {results['success_rate']}")
+
+    Path("./eval_result").mkdir(parents=True, exist_ok=True)
+    with open("./eval_result/eval_results.json", "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=4, ensure_ascii=False)
+
+    for _, env in envs:
+        env.close()
+        env.close_connection()
+
+
+def main(usr_args):
+
+    from ngine.distributed.proxy import RemoteEnv
+    env = RemoteEnv.make(address=('127.0.0.1', 50000), authkey=b'ngine')
+    env_cfg = make_env_cfg(usr_args)
+    env.attach(env_cfg)
 
+    policy = make_policy(usr_args)
     usr_args['actions_dim'] = env.action_space.shape[1]
     usr_args['decimation'] = env.unwrapped.cfg.decimation
 
@@ -170,4 +225,7 @@ if __name__ == "__main__":
     #           --instruction  "Stack objects on counter from large to small" --test_num 10
     # run the main function
     usr_args = parse_args_and_config()
-    main(usr_args)
+    if usr_args.get("vectorized", False):
+        main_vectorized(usr_args)
+    else:
+        main(usr_args)
@@ -0,0 +1,403 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Vectorized policy evaluation over several envs / env servers.
+
+Every env (a local Isaac Lab env or a :class:`ngine.distributed.proxy.RemoteEnv`) exposes ``num_envs`` slots.
+Finished slots are reset independently by the env (Isaac Lab auto-resets terminated envs in ``step``) and
+immediately pick up the next pending episode of their task, so all slots stay busy until the episode budget is
+exhausted. The observations of all active slots are stacked into one batch per step and passed to the policy
+in a single call.
+
+The policy has to implement the batched interface:
+
+- ``predict_batch(obs, slots) -> actions``: ``obs`` is the observation tree of the active slots stacked along
+  the first axis, ``slots`` the matching list of :class:`SlotId`, ``actions`` a ``(len(slots), action_dim)``
+  tensor or array.
+- ``reset_slots(slots)`` (optional): called with the slots that start a new episode.
+
+Policies that only act on a single env (``predict(obs) -> action`` and ``reset_model()``) are wrapped in a
+:class:`SlotPolicyAdapter` by :func:`as_batched_policy`, which runs them slot by slot.
+
+Example:
+    >>> harness = VectorEvalHarness([("PnPCounterToSink", env)], policy, episodes_per_task=50)
+    >>> report = harness.run()
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Any, NamedTuple
+
+import numpy as np
+import torch
+
+
+class SlotId(NamedTuple):
+    env_idx: int
+    slot_idx: int
+
+
+@dataclass
+class EpisodeResult:
+    episode_id: int
+    task: str
+    slot: SlotId
+    success: bool
+    length: int
+    inference_ms: float = 0.0
+
+
+@dataclass
+class _SlotState:
+    episode_id: int | None = None
+    length: int = 0
+    inference_ms: float = 0.0
+
+
+@dataclass
+class _TaskQueue:
+    total: int
+    next_episode: int = 0
+    results: list[EpisodeResult] = field(default_factory=list)
+
+    def pop(self) -> int | None:
+        if self.next_episode >= self.total:
+            return None
+        self.next_episode += 1
+        return self.next_episode - 1
+
+
+def stack_tree(items: list[Any]) -> Any:
+    """Concatenate a list of observation trees (dicts of tensors / arrays) along the first axis."""
+    first = items[0]
+    if isinstance(first, dict):
+        return {k: stack_tree([item[k] for item in items]) for k in first}
+    if isinstance(first, torch.Tensor):
+        return torch.cat([item.to(first.device) for item in items], dim=0)
+    return np.concatenate([np.asarray(item) for item in items], axis=0)
+
+
+def index_tree(tree: Any, index: list[int]) -> Any:
+    """Select the rows ``index`` of every leaf of an observation tree."""
+    if isinstance(tree, dict):
+        return {k: index_tree(v, index) for k, v in tree.items()}
+    if isinstance(tree, torch.Tensor):
+        return tree[torch.as_tensor(index, device=tree.device, dtype=torch.long)]
+    return np.asarray(tree)[index]
+
+
+def _to_numpy(x: Any) -> np.ndarray:
+    if isinstance(x, torch.Tensor):
+        return x.detach().cpu().numpy()
+    return np.asarray(x)
+
+
+def _percentiles(values: list[float]) -> dict[str, float]:
+    if len(values) == 0:
+        return {}
+    values = np.asarray(values)
+    return {
+        "mean": float(values.mean()),
+        "p50": float(np.percentile(values, 50)),
+        "p99": float(np.percentile(values, 99)),
+        "max": float(values.max()),
+    }
+
+
+def _stack_actions(actions: list[Any]) -> Any:
+    if isinstance(actions[0], torch.Tensor):
+        return torch.cat([a.reshape(1, -1).to(actions[0].device) for a in actions], dim=0)
+    return np.concatenate([np.asarray(a).reshape(1, -1) for a in actions], axis=0)
+
+
+class SlotPolicyAdapter:
+    """Batched interface over a policy acting on a single env.
+
+    Every slot gets its own policy instance, so that policies keeping a per-episode state (action chunks,
+    observation history) evaluate each slot independently. Instances are created on first use by
+    ``make_policy``. A stateless policy can be shared by all slots with ``shared=True``.
+
+    Args:
+        make_policy: Callable returning a new policy with ``predict(obs) -> action`` and ``reset_model()``.
+        first: An already created policy, used for the first slot.
+        shared: Whether all slots use the same policy instance.
+        predict_fn: Name of the per-env inference method.
+        reset_fn: Name of the per-episode reset method, None if the policy has none.
+    """
+
+    def __init__(
+        self,
+        make_policy: Any,
+        first: Any = None,
+        shared: bool = False,
+        predict_fn: str = "predict",
+        reset_fn: str | None = "reset_model",
+    ):
+        self.make_policy = make_policy
+        self.shared = shared
+        self.predict_fn = predict_fn
+        self.reset_fn = reset_fn
+        self._first = first
+        self.policies: dict[SlotId, Any] = {}
+
+    def policy(self, slot: SlotId) -> Any:
+        """Get the policy of a slot, creating it if needed."""
+        if self.shared and self.policies:
+            return next(iter(self.policies.values()))
+        if slot not in self.policies:
+            if self._first is not None:
+                self.policies[slot], self._first = self._first, None
+            else:
+                self.policies[slot] = self.make_policy()
+        return self.policies[slot]
+
+    def reset_slots(self, slots: list[SlotId]):
+        if self.reset_fn is None:
+            return
+        for slot in slots:
+            getattr(self.policy(slot), self.reset_fn)()
+
+    def predict_batch(self, obs: Any, slots: list[SlotId]) -> Any:
+        actions = [getattr(self.policy(slot), self.predict_fn)(index_tree(obs, [i])) for i, slot in enumerate(slots)]
+        return _stack_actions(actions)
+
+
+def as_batched_policy(policy: Any, make_policy: Any = None, shared: bool = False) -> Any:
+    """Return the policy itself if it implements ``predict_batch``, else a :class:`SlotPolicyAdapter` over it.
+
+    Args:
+        policy: The policy to evaluate.
+        make_policy: Callable creating more instances of the policy for the other slots. Without it all slots
+            share ``policy``.
+        shared: Whether all slots share ``policy`` even when ``make_policy`` is given.
+    """
+    if hasattr(policy, "predict_batch"):
+        return policy
+    if not hasattr(policy, "predict"):
+        raise TypeError(
+            f"{type(policy).__name__} implements neither predict_batch(obs, slots) nor predict(obs), which the"
+            " vectorized evaluation requires."
+        )
+    return SlotPolicyAdapter(
+        make_policy,
+        first=policy,
+        shared=shared or make_policy is None,
+        reset_fn="reset_model" if hasattr(policy, "reset_model") else None,
+    )
+
+
+class VectorEvalHarness:
+    """Evaluate a batched policy on all the slots of several envs.
+
+    Args:
+        envs: ``(task_name, env)`` pairs. Several envs can serve the same task.
+        policy: The policy, see the module documentation. Policies without ``predict_batch`` are adapted
+            with :func:`as_batched_policy` and share one instance across the slots.
+        episodes_per_task: Number of episodes evaluated per task, or a dict of task name to number of episodes.
+        obs_key: Key of the policy observations in the env observations, None to use them as they are.
+        step_workers: Number of threads stepping the envs concurrently (useful with several env servers).
+    """
+
+    def __init__(
+        self,
+        envs: list[tuple[str, Any]],
+        policy: Any,
+        episodes_per_task: int | dict[str, int] = 10,
+        obs_key: str | None = "policy",
+        step_workers: int | None = None,
+    ):
+        if len(envs) == 0:
+            raise ValueError("At least one env is required.")
+        self.tasks = [task for task, _ in envs]
+        self.envs = [env for _, env in envs]
+        self.policy = as_batched_policy(policy)
+        self.obs_key = obs_key
+        self.num_slots = [int(env.unwrapped.num_envs) for env in self.envs]
+        if isinstance(episodes_per_task, int):
+            episodes_per_task = {task: episodes_per_task for task in self.tasks}
+        self.queues = {task: _TaskQueue(episodes_per_task.get(task, 0)) for task in dict.fromkeys(self.tasks)}
+        self.step_workers = step_workers if step_workers is not None else len(self.envs)
+        self.inference_ms = []
+        self.env_step_ms = []
+
+    def run(self) -> dict[str, Any]:
+        """Run the evaluation until every task exhausted its episodes and return the report."""
+        start_time = time.perf_counter()
+        pool = ThreadPoolExecutor(max_workers=self.step_workers) if self.step_workers > 1 and len(self.envs) > 1 else None
+        try:
+            obs = self._map(pool, lambda env: env.reset()[0])
+            slots = [[_SlotState() for _ in range(n)] for n in self.num_slots]
+            started = []
+            for env_idx, env_slots in enumerate(slots):
+                for slot_idx, slot in enumerate(env_slots):
+                    if self._assign(env_idx, slot):
+                        started.append(SlotId(env_idx, slot_idx))
+            self._reset_policy(started)
+            last_actions = [None] * len(self.envs)
+
+            while True:
+                active = [
+                    SlotId(env_idx, slot_idx)
+                    for env_idx, env_slots in enumerate(slots)
+                    for slot_idx, slot in enumerate(env_slots)
+                    if slot.episode_id is not None
+                ]
+                if len(active) == 0:
+                    break
+                actions = self._infer(obs, active, slots)
+                env_actions = self._scatter_actions(actions, active, last_actions)
+                last_actions = env_actions
+
+                step_start = time.perf_counter()
+                outputs = self._map(pool, lambda args: args[0].step(args[1]), list(zip(self.envs, env_actions)))
+                self.env_step_ms.append(1000.0 * (time.perf_counter() - step_start))
+
+                obs = [output[0] for output in outputs]
+                started = []
+                for env_idx, (_, _, terminated, truncated, extras) in enumerate(outputs):
+                    started += self._collect(env_idx, slots[env_idx], terminated, truncated, extras)
+                self._reset_policy(started)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        return self.report(time.perf_counter() - start_time)
+
+    def report(self, wall_time_s: float | None = None) -> dict[str, Any]:
+        """Aggregate the episode results per task.
+
+        The ``tasks`` and ``episodes`` sections only depend on the episode outcomes and are ordered by task
+        name and episode id, so that they are identical across runs of a deterministic env and policy.
+        Latencies are reported separately in ``timing``.
+        """
+        tasks = {}
+        episodes = []
+        for task in sorted(self.queues):
+            results = sorted(self.queues[task].results, key=lambda r: r.episode_id)
+            lengths = [r.length for r in results]
+            num_success = sum(r.success for r in results)
+            tasks[task] = {
+                "episode_count": len(results),
+                "success_count": num_success,
+                "success_rate": num_success / len(results) if results else 0.0,
+                "episode_length_mean": float(np.mean(lengths)) if lengths else 0.0,
+                "episode_length_max": int(max(lengths)) if lengths else 0,
+            }
+            for r in results:
+                episode = asdict(r)
+                episode.pop("inference_ms")
+                episode["slot"] = list(r.slot)
+                episodes.append(episode)
+        num_episodes = sum(t["episode_count"] for t in tasks.values())
+        num_success = sum(t["success_count"] for t in tasks.values())
+        report = {
+            "test_count": num_episodes,
+            "success_count": num_success,
+            "success_rate": num_success / num_episodes if num_episodes else 0.0,
+            "tasks": tasks,
+            "episodes": episodes,
+            "timing": {
+                "num_slots": sum(self.num_slots),
+                "inference_ms": _percentiles(self.inference_ms),
+                "env_step_ms": _percentiles(self.env_step_ms),
+                "episode_inference_ms": _percentiles([r.inference_ms for q in self.queues.values() for r in q.results]),
+            },
+        }
+        if wall_time_s is not None:
+            report["timing"]["wall_time_s"] = wall_time_s
+            report["timing"]["episodes_per_s"] = num_episodes / wall_time_s if wall_time_s > 0 else 0.0
+        return report
+
+    """
+    Helper functions.
+    """
+
+    def _map(self, pool, fn, items=None):
+        items = self.envs if items is None else items
+        if pool is None:
+            return [fn(item) for item in items]
+        return list(pool.map(fn, items))
+
+    def _assign(self, env_idx: int, slot: _SlotState) -> bool:
+        slot.episode_id = self.queues[self.tasks[env_idx]].pop()
+        slot.length = 0
+        slot.inference_ms = 0.0
+        return slot.episode_id is not None
+
+    def _reset_policy(self, slots: list[SlotId]):
+        if len(slots) > 0 and hasattr(self.policy, "reset_slots"):
+            self.policy.reset_slots(slots)
+
+    def _infer(self, obs: list[Any], active: list[SlotId], slots: list[list[_SlotState]]):
+        per_env = []
+        for env_idx, env_obs in enumerate(obs):
+            rows = [s.slot_idx for s in active if s.env_idx == env_idx]
+            if len(rows) > 0:
+                env_obs = env_obs[self.obs_key] if self.obs_key is not None else env_obs
+                per_env.append(env_obs if len(rows) == self.num_slots[env_idx] else index_tree(env_obs, rows))
+        batch = stack_tree(per_env)
+
+        start = time.perf_counter()
+        with torch.inference_mode():
+            actions = self.policy.predict_batch(batch, active)
+        elapsed_ms = 1000.0 * (time.perf_counter() - start)
+        self.inference_ms.append(elapsed_ms)
+        for s in active:
+            slots[s.env_idx][s.slot_idx].inference_ms += elapsed_ms
+        return actions
+
+    def _scatter_actions(self, actions, active: list[SlotId], last_actions: list[Any]) -> list[Any]:
+        """Build the full action batch of every env; idle slots repeat their last action."""
+        is_tensor = isinstance(actions, torch.Tensor)
+        env_actions = []
+        for env_idx, num_slots in enumerate(self.num_slots):
+            rows = [i for i, s in enumerate(active) if s.env_idx == env_idx]
+            if last_actions[env_idx] is not None:
+                env_action = last_actions[env_idx].clone() if is_tensor else np.array(last_actions[env_idx])
+            elif is_tensor:
+                env_action = actions.new_zeros((num_slots,) + tuple(actions.shape[1:]))
+            else:
+                env_action = np.zeros((num_slots,) + np.shape(actions)[1:], dtype=np.asarray(actions).dtype)
+            if len(rows) > 0:
+                slot_rows = [active[i].slot_idx for i in rows]
+                env_action[slot_rows] = actions[rows]
+            env_actions.append(env_action)
+        return env_actions
+
+    def _collect(self, env_idx: int, env_slots: list[_SlotState], terminated, truncated, extras) -> list[SlotId]:
+        """Record the finished episodes of an env and assign new episodes to its slots."""
+        done = _to_numpy(terminated).reshape(-1) | _to_numpy(truncated).reshape(-1)
+        success = extras.get("is_success") if extras else None
+        success = _to_numpy(success).reshape(-1) if success is not None else _to_numpy(terminated).reshape(-1)
+        queue = self.queues[self.tasks[env_idx]]
+        started = []
+        for slot_idx, slot in enumerate(env_slots):
+            if slot.episode_id is None:
+                continue
+            slot.length += 1
+            if not done[slot_idx]:
+                continue
+            queue.results.append(
+                EpisodeResult(
+                    episode_id=slot.episode_id,
+                    task=self.tasks[env_idx],
+                    slot=SlotId(env_idx, slot_idx),
+                    success=bool(success[slot_idx]),
+                    length=slot.length,
+                    inference_ms=slot.inference_ms,
+                )
+            )
+            if self._assign(env_idx, slot):
+                started.append(SlotId(env_idx, slot_idx))
+        return started
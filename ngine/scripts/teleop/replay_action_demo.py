@@ -102,6 +102,7 @@ if not args_cli.headless:
     from ngine.engine.devices.keyboard.se3_keyboard import Se3Keyboard
 from isaaclab.utils.datasets import EpisodeData, HDF5DatasetFileHandler
 from isaaclab_tasks.utils.parse_cfg import parse_env_cfg
+from ngine.engine.checks.quality_report import append_checker_results
 from ngine.utils.place_utils.env_utils import set_seed
 
 is_paused = False
@@ -654,6 +655,11 @@ def main():
                 print(f"Metrics saved to: {metrics_file_path}")
             except Exception as e:
                 print(f"Failed to save metrics: {e}")
+            try:
+                report_path = append_checker_results(save_dir, metrics_data, args_cli.dataset_file, replayed_episode_count)
+                print(f"Quality report appended: {report_path}")
+            except Exception as e:
+                print(f"Failed to append quality report: {e}")
 
     save_metrics()
     # Close environment after replay in complete
@@ -63,7 +63,7 @@ from termcolor import colored
 
 from isaaclab.app import AppLauncher
 
-from ngine.utils.config_loader import config_loader
+from ngine.utils.config_loader import TELEOP_CONFIG_SCHEMA, config_loader
 from ngine.utils.env import ExecuteMode
 from ngine.utils.log_utils import get_default_logger, handle_exception_and_log, log_scene_rigid_objects
 from ngine.utils.profile_utils import DEBUG_FRAME_ANALYZER, debug_print, trace_profile
@@ -113,7 +113,7 @@ parser.add_argument("--batch_name", type=str, default="default-batch", help="bat
 AppLauncher.add_app_launcher_args(parser)
 # parse the arguments
 args_cli = parser.parse_args()
-yaml_args = config_loader.load(args_cli.task_config)
+yaml_args = config_loader.load(args_cli.task_config, schema=TELEOP_CONFIG_SCHEMA)
 args_cli.__dict__.update(yaml_args.__dict__)
 
 app_launcher_args = vars(args_cli)
@@ -300,6 +300,11 @@ def main():
                 print(f"Metrics saved to: {metrics_file_path}")
             except Exception as e:
                 print(f"Failed to save metrics: {e}")
+            try:
+                report_path = append_checker_results(output_dir, metrics_data, args_cli.dataset_file, env.recorder_manager.exported_successful_episode_count)
+                print(f"Quality report appended: {report_path}")
+            except Exception as e:
+                print(f"Failed to append quality report: {e}")
 
     def create_teleop_interface(env):
         """Create teleoperation interface based on device type."""
@@ -317,7 +322,7 @@ def main():
             "M": call_save_checkpoint,
             "N": rollback_to_checkpoint,
             # Add new shortcut: quick rewind 10 frames
-            "B": lambda: quick_rewind(env, 10),
+            "B": lambda: quick_rewind(env, 10, teleop_interface),
         }
 
         if hasattr(env_cfg, "teleop_devices") and args_cli.teleop_device in env_cfg.teleop_devices.devices:
@@ -356,17 +361,21 @@ def main():
                 teleoperation_active = False
             elif args_cli.teleop_device.lower().startswith("vr"):
                 image_size = (720, 1280)
-                shm = shared_memory.SharedMemory(
-                    create=True,
-                    size=image_size[0] * image_size[1] * 3 * np.uint8().itemsize,
-                )
+                vr_encoding = getattr(args_cli, "vr_encoding", None)
+                shm = None
+                if vr_encoding is None:
+                    shm = shared_memory.SharedMemory(
+                        create=True,
+                        size=image_size[0] * image_size[1] * 3 * np.uint8().itemsize,
+                    )
                 vr_device_type = {
                     "vr-controller": VRController,
                     "vr-hand": VRHand,
                 }[args_cli.teleop_device.lower()]
                 teleop_interface = vr_device_type(env,
                                                   img_shape=image_size,
-                                                  shm_name=shm.name,)
+                                                  shm_name=shm.name if shm is not None else None,
+                                                  encoding=vr_encoding)
             else:
                 raise ValueError(
                     f"Invalid device interface '{args_cli.teleop_device}'. Supported: 'keyboard', 'spacemouse''handtracking'."
@@ -382,7 +391,7 @@ def main():
                     "SAVE": lambda: save_checkpoint(env, args_cli.checkpoint_path),
                     "LOAD": lambda: load_checkpoint(env, args_cli.checkpoint_path),
                     # Add new shortcut: quick rewind 10 frames
-                    "REWIND": lambda: quick_rewind(env, 10),
+                    "REWIND": lambda: quick_rewind(env, 10, teleop_interface),
                 }
             elif teleop_interface is not None:
                 teleoperation_active = True
@@ -706,6 +715,7 @@ def main():
                 if args_cli.enable_debug_log:
                     try:
                         env.step(actions)
+                        record_snapshot(env)
                         if initial_state is None:
                             initial_state = copy.deepcopy(env.recorder_manager.get_episode(0).data["initial_state"])
                         update_checkers_status(env, env_cfg.isaaclab_arena_env.task.get_warning_text())
@@ -733,6 +743,9 @@ def main():
                         if actions is None:
                             continue
                         obs, *_ = env.step(actions)
+                        record_snapshot(env)
+                        if getattr(teleop_interface, "frame_buffer", None) is not None:
+                            teleop_interface.publish_observation(obs, getattr(args_cli, "vr_stream_cameras", None))
                         carb.profiler.end(1)
                     if initial_state is None:
                         initial_state = copy.deepcopy(env.recorder_manager.get_episode(0).data["initial_state"])
@@ -855,7 +868,8 @@ def main():
     from isaaclab.devices.teleop_device_factory import create_teleop_device
     from multiprocessing import Process, shared_memory
     from ngine.utils.video_recorder import VideoRecorder, get_camera_images
-    from ngine.utils.teleop_utils import save_checkpoint, load_checkpoint, quick_rewind
+    from ngine.engine.checks.quality_report import append_checker_results
+    from ngine.utils.teleop_utils import save_checkpoint, load_checkpoint, quick_rewind, record_snapshot
     from ngine.utils.place_utils.env_utils import set_seed
     from ngine.utils.isaaclab_utils import update_sensors
     import carb
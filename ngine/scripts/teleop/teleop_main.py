@@ -65,7 +65,7 @@ from termcolor import colored
 
 from isaaclab.app import AppLauncher
 
-from ngine.utils.config_loader import config_loader
+from ngine.utils.config_loader import TELEOP_CONFIG_SCHEMA, config_loader
 from ngine.utils.env import ExecuteMode
 from ngine.utils.log_utils import get_default_logger, handle_exception_and_log, log_scene_rigid_objects
 from ngine.utils.profile_utils import DEBUG_FRAME_ANALYZER, debug_print, trace_profile
@@ -137,7 +137,7 @@ parser.add_argument("--batch_name", type=str, default="default-batch", help="bat
 AppLauncher.add_app_launcher_args(parser)
 # parse the arguments
 args_cli = parser.parse_args()
-yaml_args = config_loader.load(args_cli.task_config)
+yaml_args = config_loader.load(args_cli.task_config, schema=TELEOP_CONFIG_SCHEMA)
 args_cli.__dict__.update(yaml_args.__dict__)
 
 app_launcher_args = vars(args_cli)
@@ -430,6 +430,11 @@ def main():
                 print(f"Metrics saved to: {metrics_file_path}")
             except Exception as e:
                 print(f"Failed to save metrics: {e}")
+            try:
+                report_path = append_checker_results(output_dir, metrics_data, args_cli.dataset_file, env.recorder_manager.exported_successful_episode_count)
+                print(f"Quality report appended: {report_path}")
+            except Exception as e:
+                print(f"Failed to append quality report: {e}")
 
     # Global variable to track upload dialog state
     upload_dialog_state = {"shown": False, "result": None, "window": None}
@@ -453,7 +458,7 @@ def main():
             "B": start_teleoperation,
             # TODO not enable now
             # Add new shortcut: quick rewind 10 frames
-            "P": lambda: quick_rewind(teleop_interface.env, 10),
+            "P": lambda: quick_rewind(teleop_interface.env, 10, teleop_interface),
         }
 
         if hasattr(env_cfg.isaaclab_arena_env.embodiment, "teleop_devices") and args_cli.teleop_device in env_cfg.isaaclab_arena_env.embodiment.teleop_devices.devices:
@@ -497,18 +502,22 @@ def main():
             elif args_cli.teleop_device.lower().startswith("vr"):
                 teleoperation_active = True
                 image_size = (720, 1280)
-                shm = shared_memory.SharedMemory(
-                    create=True,
-                    size=image_size[0] * image_size[1] * 3 * np.uint8().itemsize,
-                )
+                vr_encoding = getattr(args_cli, "vr_encoding", None)
+                shm = None
+                if vr_encoding is None:
+                    shm = shared_memory.SharedMemory(
+                        create=True,
+                        size=image_size[0] * image_size[1] * 3 * np.uint8().itemsize,
+                    )
                 vr_device_type = {
                     "vr-controller": VRController,
                     "vr-hand": VRHand,
                 }[args_cli.teleop_device.lower()]
                 teleop_interface = vr_device_type(env,
                                                   img_shape=image_size,
-                                                  shm_name=shm.name,
-                                                  relative_control=args_cli.relative_control)
+                                                  shm_name=shm.name if shm is not None else None,
+                                                  relative_control=args_cli.relative_control,
+                                                  encoding=vr_encoding)
             else:
                 raise ValueError(
                     f"Invalid device interface '{args_cli.teleop_device}'. Supported: 'keyboard', 'spacemouse''handtracking'."
@@ -524,7 +533,7 @@ def main():
                     "SAVE": lambda: save_checkpoint(teleop_interface.env, args_cli.checkpoint_path),
                     "LOAD": lambda: load_checkpoint(teleop_interface.env, args_cli.checkpoint_path),
                     # Add new shortcut: quick rewind 10 frames
-                    "REWIND": lambda: quick_rewind(teleop_interface.env, 10),
+                    "REWIND": lambda: quick_rewind(teleop_interface.env, 10, teleop_interface),
                 }
             elif teleop_interface is not None:
                 if args_cli.teleop_device.lower().startswith("vr"):
@@ -624,7 +633,10 @@ def main():
                         pass
                 if scene_name is None:
                     scene_name = args_cli.layout
-                kwargs = {"debug_assets": args_cli.debug_assets}
+                kwargs = {
+                    "debug_assets": args_cli.debug_assets,
+                    "record_checker_signals": getattr(args_cli, "record_checker_signals", False),
+                }
                 if args_cli.debug_assets == "object":
                     execute_mode = ExecuteMode.TEST_OBJECT
                     kwargs["test_object_paths"] = args_cli.test_object_paths
@@ -978,6 +990,9 @@ def main():
                     if actions is None:
                         continue
                     obs, *_ = env.step(actions)
+                    record_snapshot(env)
+                    if getattr(teleop_interface, "frame_buffer", None) is not None:
+                        teleop_interface.publish_observation(obs, getattr(args_cli, "vr_stream_cameras", None))
                     if initial_state is None:
                         initial_state = copy.deepcopy(env.recorder_manager.get_episode(0).data.get("initial_state", None))
                     carb.profiler.end(1)
@@ -1137,7 +1152,8 @@ def main():
     from isaaclab.devices.teleop_device_factory import create_teleop_device
     from multiprocessing import Process, shared_memory
     from ngine.utils.video_recorder import VideoRecorder, get_camera_images
-    from ngine.utils.teleop_utils import save_checkpoint, load_checkpoint, quick_rewind
+    from ngine.engine.checks.quality_report import append_checker_results
+    from ngine.utils.teleop_utils import save_checkpoint, load_checkpoint, quick_rewind, record_snapshot
     from ngine.utils.place_utils.env_utils import reset_obj_cache, reset_physx, warmup_rendering, set_seed
     import carb
 
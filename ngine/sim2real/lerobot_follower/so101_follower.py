@@ -25,7 +25,8 @@ from ngine.utils.lerobot_common.cameras.opencv.configuration_opencv import OpenC
 from ngine.utils.lerobot_common.cameras.utils import make_cameras_from_configs
 from ngine.utils.lerobot_common.common import flatten_state_dict, to_cpu_tensor, to_tensor
 from ngine.utils.lerobot_common.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
-from ngine.utils.lerobot_common.motors import FeetechMotorsBus, Motor, MotorCalibration, MotorNormMode, OperatingMode
+from ngine.utils.lerobot_common.motors import FeetechMotorsBus, Motor, MotorCalibration, MotorNormMode, MotorsBus, OperatingMode
+from ngine.sim2real.lerobot_follower.threaded_io import FollowerIO
 
 
 class SO101Follower():
@@ -33,9 +34,11 @@ class SO101Follower():
     """
 
     def __init__(self, port: str = '/dev/ttyACM0', recalibrate: bool = False, calibration_file_name: str = 'so101_follower.json',
-                 camera_index=-1, use_degrees=False):
+                 camera_index=-1, use_degrees=False, bus_cls: type[MotorsBus] = FeetechMotorsBus):
         super().__init__()
         self.port = port
+        self._bus_cls = bus_cls
+        self._io: FollowerIO | None = None
         self.cameras = {}
         if camera_index > -1:
             self.cameras_cfg = {"global_camera": OpenCVCameraConfig(index_or_path=camera_index, fps=30, width=640, height=480)}
@@ -48,7 +51,7 @@ class SO101Follower():
             self.calibrate(norm_mode_body)
         calibration = self._load_calibration()
 
-        self._bus = FeetechMotorsBus(
+        self._bus = self._bus_cls(
             port=self.port,
             motors={
                 "shoulder_pan": Motor(1, "sts3215", norm_mode_body),
@@ -125,6 +128,7 @@ class SO101Follower():
     def disconnect(self):
         if not self.is_connected:
             raise DeviceNotConnectedError("SO101-Follower is not connected.")
+        self.stop_io()
         self._bus.disconnect()
         print("SO101-Follower disconnected.")
 
@@ -155,6 +159,36 @@ class SO101Follower():
         self._bus.write("P_Coefficient", "elbow_flex", 50)
         self._bus.write("P_Coefficient", "gripper", 50)
 
+    def start_io(
+        self, bus_freq: float = 100.0, camera_freq: float = 30.0, overrun: str = "skip", camera_sync_skew: float | None = None
+    ):
+        """Move bus reads/writes and camera capture to background threads.
+
+        Afterwards :meth:`get_qpos`, :meth:`send_action` and :meth:`capture_sensor_data` only exchange the latest
+        values with these threads and never block on the serial bus or on a camera frame. With
+        ``camera_sync_skew`` (seconds) the camera frames are captured as time-aligned bundles.
+        """
+        if self._io is not None:
+            return
+        self._io = FollowerIO(
+            self._bus,
+            self.cameras,
+            bus_freq=bus_freq,
+            camera_freq=camera_freq,
+            overrun=overrun,
+            camera_sync_skew=camera_sync_skew,
+        )
+        self._io.start()
+
+    def stop_io(self):
+        if self._io is None:
+            return
+        self._io.stop()
+        self._io = None
+
+    def io_stats(self) -> Dict[str, Dict[str, float]]:
+        return self._io.stats() if self._io is not None else {}
+
     @property
     def qpos(self):
         return self.get_qpos()
@@ -163,7 +197,7 @@ class SO101Follower():
         # NOTE (stao): the slowest part of inference is reading the qpos from the robot. Each time it takes about 5-6 milliseconds, meaning control frequency is capped at 200Hz.
         # and if you factor in other operations like policy inference etc. the max control frequency is typically more like 30-60 Hz.
         # Moreover on the rare occassions reading qpos can take 40 milliseconds which causes the control step to fall behind the desired control frequency.
-        qpos_deg = self._bus.sync_read("Present_Position")
+        qpos_deg = self._io.read_positions() if self._io is not None else self._bus.sync_read("Present_Position")
 
         # NOTE (stao): It seems the calibration from LeRobot has some offsets in some joints. We fix reading them here to match the expected behavior
         qpos_deg = flatten_state_dict(qpos_deg)
@@ -171,7 +205,7 @@ class SO101Follower():
         return qpos
 
     def calibrate(self, norm_mode_body):
-        self._bus = FeetechMotorsBus(
+        self._bus = self._bus_cls(
             port=self.port,
             motors={
                 "shoulder_pan": Motor(1, "sts3215", norm_mode_body),
@@ -239,7 +273,10 @@ class SO101Follower():
         goal_pos = {key.removesuffix(".pos"): val for key, val in action.items() if key.endswith(".pos")}
 
         # Send goal position to the arm
-        self._bus.sync_write("Goal_Position", goal_pos)
+        if self._io is not None:
+            self._io.send_goal(goal_pos)
+        else:
+            self._bus.sync_write("Goal_Position", goal_pos)
         return {f"{motor}.pos": val for motor, val in goal_pos.items()}
 
     def _save_calibration(self, calibration: Dict[str, MotorCalibration]):
@@ -285,8 +322,9 @@ class SO101Follower():
         cameras: dict[str, Camera] = self.cameras
         if sensor_names is None:
             sensor_names = list(cameras.keys())
+        frames = self._io.read_frames(sensor_names) if self._io is not None else None
         for name in sensor_names:
-            data = cameras[name].async_read()
+            data = frames[name] if frames is not None else cameras[name].async_read()
             # until https://github.com/huggingface/lerobot/issues/860 is resolved we temporarily assume this is RGB data only otherwise need to write a few extra if statements to check
             # if isinstance(cameras[name], IntelRealSenseCamera):
             sensor_obs[name] = dict(rgb=(to_tensor(data)).unsqueeze(0))
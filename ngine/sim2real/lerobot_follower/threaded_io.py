@@ -0,0 +1,143 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any
+
+from ngine.sim2real.realtime import LatestValue, OverrunPolicy, PeriodicThread
+from ngine.utils.lerobot_common.cameras.camera import Camera
+from ngine.utils.lerobot_common.cameras.capture_group import CaptureGroup
+from ngine.utils.lerobot_common.motors import MotorsBus
+
+
+class FollowerIO:
+    """Background I/O of a follower arm.
+
+    The serial bus is only accessed from one thread, which writes the most recent goal (if it changed since
+    the last tick) and then reads the present positions. Every camera is captured in its own thread. The
+    control loop exchanges data with these threads through :class:`LatestValue` slots only, so neither the
+    bus round trip nor the camera frame wait is on its critical path. With ``camera_sync_skew`` set, the
+    cameras are captured by a :class:`CaptureGroup` instead and read as time-aligned bundles.
+
+    Args:
+        bus: The connected motors bus. A simulated bus can be used for testing.
+        cameras: The connected cameras by name.
+        bus_freq: The rate of the bus read/write thread in Hz.
+        camera_freq: The rate of the camera threads in Hz.
+        overrun: The overrun policy of the I/O threads.
+        camera_sync_skew: The largest capture time spread in seconds of the frames returned together by
+            :meth:`read_frames`. None captures every camera independently.
+    """
+
+    def __init__(
+        self,
+        bus: MotorsBus,
+        cameras: dict[str, Camera] | None = None,
+        bus_freq: float = 100.0,
+        camera_freq: float = 30.0,
+        overrun: OverrunPolicy | str = OverrunPolicy.SKIP,
+        camera_sync_skew: float | None = None,
+    ):
+        self.bus = bus
+        self.cameras = cameras or {}
+        self.positions = LatestValue()
+        self.goal = LatestValue()
+        self.frames = {name: LatestValue() for name in self.cameras}
+        self._written_goal_seq = 0
+
+        self.capture = None
+        if camera_sync_skew is not None and self.cameras:
+            self.capture = CaptureGroup(self.cameras, max_skew_s=camera_sync_skew)
+            self.frames = {}
+
+        self.threads = [PeriodicThread("follower_bus", self._bus_step, bus_freq, overrun=overrun)]
+        for name in self.frames:
+            self.threads.append(
+                PeriodicThread(f"follower_camera_{name}", lambda name=name: self._camera_step(name), camera_freq, overrun=overrun)
+            )
+
+    @property
+    def is_running(self) -> bool:
+        return any(thread.is_alive for thread in self.threads)
+
+    def start(self, timeout: float = 1.0):
+        """Start the I/O threads and wait for the first positions and frames."""
+        for thread in self.threads:
+            thread.start()
+        if self.capture is not None:
+            self.capture.start()
+            self.capture.read_bundle(timeout_s=timeout)
+        for slot in [self.positions] + list(self.frames.values()):
+            if not slot.wait(timeout):
+                self.check()
+                raise TimeoutError(f"No data received from the follower within {timeout}s.")
+
+    def stop(self):
+        for thread in self.threads:
+            thread.stop()
+        if self.capture is not None:
+            self.capture.close()
+
+    def check(self):
+        """Re-raise the error of a stopped I/O thread."""
+        for thread in self.threads:
+            thread.check()
+        if self.capture is not None:
+            self.capture.check()
+
+    def read_positions(self) -> dict[str, Any]:
+        """Get a copy of the most recent present positions."""
+        self.check()
+        return dict(self.positions.get())
+
+    def send_goal(self, goal_pos: dict[str, Any]):
+        """Publish a goal position, it is written by the bus thread on its next tick."""
+        self.check()
+        self.goal.put(dict(goal_pos))
+
+    def read_frame(self, camera_name: str):
+        return self.read_frames([camera_name])[camera_name]
+
+    def read_frames(self, camera_names: list[str] | None = None) -> dict[str, Any]:
+        """Get the most recent frame of every camera, time-aligned when capturing with a :class:`CaptureGroup`."""
+        self.check()
+        if camera_names is None:
+            camera_names = list(self.cameras)
+        if self.capture is not None:
+            try:
+                bundle = self.capture.read_bundle(timeout_s=0.0, wait_new=False)
+            except TimeoutError:
+                # the newest frames are not aligned yet, keep the control loop going with the previous bundle
+                bundle = self.capture.last_bundle
+            return {name: bundle.frames[name] for name in camera_names}
+        return {name: self.frames[name].get() for name in camera_names}
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        stats = {thread.name: thread.stats.summary() for thread in self.threads}
+        if self.capture is not None:
+            stats["follower_capture"] = self.capture.stats()
+        return stats
+
+    """
+    Helper functions.
+    """
+
+    def _bus_step(self):
+        goal, seq, _ = self.goal.get_with_info()
+        if seq != self._written_goal_seq:
+            self.bus.sync_write("Goal_Position", goal)
+            self._written_goal_seq = seq
+        self.positions.put(self.bus.sync_read("Present_Position"))
+
+    def _camera_step(self, name: str):
+        self.frames[name].put(self.cameras[name].async_read())
@@ -0,0 +1,292 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Real-time helpers for the sim2real control loops.
+
+- :class:`RateScheduler` paces a loop on the monotonic clock with a fixed phase and collects jitter statistics.
+- :class:`LatestValue` hands the most recent value from a producer thread to its consumers without locking.
+- :class:`PeriodicThread` runs a function at a fixed rate in a background thread.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Callable
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class OverrunPolicy(str, Enum):
+    """What a :class:`RateScheduler` does when an iteration misses its deadline.
+
+    - ``WARN``: log a warning and re-anchor the schedule at the current time.
+    - ``SKIP``: keep the original phase and drop the missed ticks.
+    - ``CATCH_UP``: keep the original phase and run the missed ticks back to back.
+    - ``RAISE``: raise a :class:`RealtimeOverrunError`.
+    """
+
+    WARN = "warn"
+    SKIP = "skip"
+    CATCH_UP = "catch_up"
+    RAISE = "raise"
+
+
+class RealtimeOverrunError(RuntimeError):
+    def __init__(self, message="Real-time loop missed its deadline"):
+        self.message = message
+        super().__init__(self.message)
+
+
+class JitterStats:
+    """Rolling statistics of a periodic loop.
+
+    Args:
+        period: The nominal period in seconds.
+        window: Number of most recent iterations kept for the statistics.
+    """
+
+    def __init__(self, period: float, window: int = 1000):
+        self.period = period
+        self.lateness = deque(maxlen=window)
+        self.durations = deque(maxlen=window)
+        self.intervals = deque(maxlen=window)
+        self.num_ticks = 0
+        self.num_overruns = 0
+        self.num_skipped = 0
+
+    def record(self, lateness: float, duration: float, interval: float | None):
+        self.num_ticks += 1
+        self.lateness.append(lateness)
+        self.durations.append(duration)
+        if interval is not None:
+            self.intervals.append(interval)
+
+    def summary(self) -> dict[str, float]:
+        """Statistics of the current window, in milliseconds."""
+        summary = {
+            "ticks": self.num_ticks,
+            "overruns": self.num_overruns,
+            "skipped": self.num_skipped,
+        }
+        if len(self.lateness) > 0:
+            lateness = np.asarray(self.lateness) * 1000.0
+            durations = np.asarray(self.durations) * 1000.0
+            summary.update(
+                jitter_mean_ms=float(lateness.mean()),
+                jitter_p50_ms=float(np.percentile(lateness, 50)),
+                jitter_p99_ms=float(np.percentile(lateness, 99)),
+                jitter_max_ms=float(lateness.max()),
+                duration_mean_ms=float(durations.mean()),
+                duration_max_ms=float(durations.max()),
+            )
+        if len(self.intervals) > 0:
+            intervals = np.asarray(self.intervals) * 1000.0
+            summary.update(
+                period_mean_ms=float(intervals.mean()),
+                period_std_ms=float(intervals.std()),
+            )
+        return summary
+
+    def __str__(self) -> str:
+        return ", ".join(f"{k}={v:.3f}" if isinstance(v, float) else f"{k}={v}" for k, v in self.summary().items())
+
+
+class RateScheduler:
+    """Monotonic-clock scheduler for a fixed-rate loop.
+
+    Deadlines are placed on a fixed grid ``start + k * period`` so that sleep inaccuracies do not accumulate
+    into drift. The scheduler sleeps until shortly before the deadline and spins for the remaining time.
+
+    Example:
+        >>> scheduler = RateScheduler(100, overrun="skip")
+        >>> while running:
+        ...     step()
+        ...     scheduler.wait()
+
+    Args:
+        freq: The loop frequency in Hz.
+        overrun: The :class:`OverrunPolicy` (or its value) applied when an iteration misses its deadline.
+        spin_s: Time in seconds before the deadline at which sleeping switches to busy waiting.
+        stats_window: Number of iterations kept in :attr:`stats`.
+        clock: Monotonic clock returning seconds.
+    """
+
+    def __init__(
+        self,
+        freq: float,
+        overrun: OverrunPolicy | str = OverrunPolicy.WARN,
+        spin_s: float = 0.0005,
+        stats_window: int = 1000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if freq <= 0:
+            raise ValueError(f"Frequency must be positive, got {freq}.")
+        self.period = 1.0 / freq
+        self.overrun = OverrunPolicy(overrun)
+        self.spin_s = spin_s
+        self.clock = clock
+        self.stats = JitterStats(self.period, stats_window)
+        self._deadline = None
+        self._tick_start = None
+        self._last_tick_start = None
+
+    def start(self):
+        """(Re)start the schedule, the first deadline is one period from now."""
+        now = self.clock()
+        self._deadline = now + self.period
+        self._tick_start = now
+        self._last_tick_start = None
+
+    def wait(self) -> int:
+        """Finish the current iteration and block until the next deadline.
+
+        Returns:
+            The number of ticks dropped because of an overrun (only non-zero with ``OverrunPolicy.SKIP``).
+        """
+        if self._deadline is None:
+            self.start()
+        now = self.clock()
+        duration = now - self._tick_start
+        skipped = 0
+
+        if now > self._deadline:
+            self.stats.num_overruns += 1
+            missed = int((now - self._deadline) // self.period) + 1
+            if self.overrun == OverrunPolicy.RAISE:
+                raise RealtimeOverrunError(
+                    f"Real-time loop overrun ({duration:.4f}s > {self.period:.4f}s)"
+                )
+            elif self.overrun == OverrunPolicy.WARN:
+                logger.warning(f"Run period overtime ({duration:.4f}s > {self.period:.4f}s)")
+                self._deadline = now
+            elif self.overrun == OverrunPolicy.SKIP:
+                skipped = missed
+                self.stats.num_skipped += skipped
+                self._deadline += missed * self.period
+            # CATCH_UP: the deadline already passed, the next tick starts immediately
+
+        self._sleep_until(self._deadline)
+        wake = self.clock()
+        interval = None if self._last_tick_start is None else wake - self._last_tick_start
+        self.stats.record(max(wake - self._deadline, 0.0), duration, interval)
+        self._last_tick_start = wake
+        self._tick_start = wake
+        self._deadline += self.period
+        return skipped
+
+    def _sleep_until(self, deadline: float):
+        remaining = deadline - self.clock()
+        if remaining > self.spin_s:
+            time.sleep(remaining - self.spin_s)
+        while self.clock() < deadline:
+            pass
+
+
+class LatestValue:
+    """Single-slot handoff of the most recent value between threads.
+
+    The producer publishes by replacing one reference holding ``(sequence, timestamp, value)``, which is atomic
+    in CPython, so neither side ever takes a lock. Consumers always see a complete value and can tell from the
+    sequence number whether it changed since their last read. Values are not copied, producers must publish
+    new objects instead of mutating published ones.
+    """
+
+    def __init__(self):
+        self._slot = (0, None, None)
+        self._ready = threading.Event()
+
+    def put(self, value: Any):
+        seq = self._slot[0] + 1
+        self._slot = (seq, time.monotonic(), value)
+        if not self._ready.is_set():
+            self._ready.set()
+
+    def get(self) -> Any:
+        return self._slot[2]
+
+    def get_with_info(self) -> tuple[Any, int, float | None]:
+        """Get the value together with its sequence number and monotonic publish time."""
+        seq, stamp, value = self._slot
+        return value, seq, stamp
+
+    @property
+    def seq(self) -> int:
+        return self._slot[0]
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until a first value was published."""
+        return self._ready.wait(timeout)
+
+
+class PeriodicThread:
+    """Run a function at a fixed rate in a daemon thread.
+
+    An exception raised by the function stops the thread; it is kept in :attr:`error` and re-raised by
+    :meth:`check`.
+
+    Args:
+        name: The thread name.
+        fn: The function called once per tick.
+        freq: The rate in Hz.
+        overrun: The :class:`OverrunPolicy` of the underlying :class:`RateScheduler`.
+    """
+
+    def __init__(self, name: str, fn: Callable[[], None], freq: float, overrun: OverrunPolicy | str = OverrunPolicy.SKIP):
+        self.name = name
+        self.fn = fn
+        self.scheduler = RateScheduler(freq, overrun=overrun)
+        self.error = None
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    @property
+    def stats(self) -> JitterStats:
+        return self.scheduler.stats
+
+    @property
+    def is_alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.is_alive:
+            return
+        self._stop_event.clear()
+        self.error = None
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 1.0):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def check(self):
+        """Re-raise the exception that stopped the thread, if any."""
+        if self.error is not None:
+            raise RuntimeError(f"Thread '{self.name}' stopped") from self.error
+
+    def _run(self):
+        self.scheduler.start()
+        try:
+            while not self._stop_event.is_set():
+                self.fn()
+                self.scheduler.wait()
+        except Exception as e:
+            logger.error(f"Thread '{self.name}' stopped: {e}")
+            self.error = e
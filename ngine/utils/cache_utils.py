@@ -0,0 +1,121 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+_FILE_HASH_MEMO = {}
+
+
+def cache_enabled(name=None):
+    """
+    Check whether on-disk caches are enabled.
+
+    NGINE_DISABLE_CACHE=1 disables every cache, NGINE_DISABLE_CACHE=<name>[,<name>] only the listed ones.
+    """
+    disabled = os.environ.get("NGINE_DISABLE_CACHE", "")
+    if disabled in ("1", "true", "True", "all"):
+        return False
+    return name is None or name not in disabled.split(",")
+
+
+def get_cache_dir(name):
+    """
+    Get (and create) the directory of a named on-disk cache.
+
+    The root defaults to ~/.cache/ngine and can be moved with NGINE_CACHE_DIR.
+    """
+    root = os.environ.get("NGINE_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "ngine"))
+    cache_dir = Path(root) / name
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def file_hash(path, chunk_size=1 << 20):
+    """
+    Content hash of a file, memoized per process on (path, size, mtime).
+
+    Args:
+        path (str): file path
+
+        chunk_size (int): read size in bytes
+
+    Returns:
+        str: hex digest, or None if the file does not exist
+    """
+    path = os.path.abspath(str(path))
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    memo_key = (path, stat.st_size, stat.st_mtime_ns)
+    if memo_key in _FILE_HASH_MEMO:
+        return _FILE_HASH_MEMO[memo_key]
+    hasher = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            hasher.update(chunk)
+    digest = hasher.hexdigest()
+    _FILE_HASH_MEMO[memo_key] = digest
+    return digest
+
+
+def key_hash(*parts):
+    """Stable short hash of arbitrary json-serializable key parts."""
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def to_serializable(value):
+    """Recursively convert numpy arrays / scalars and tuples into json friendly values."""
+    if isinstance(value, dict):
+        return {str(k): to_serializable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_serializable(v) for v in value]
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def read_json(path):
+    """Read a json cache file, returning None if it is missing or corrupted."""
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError, OSError):
+        return None
+
+
+def atomic_write_json(path, data):
+    """
+    Write json data atomically so that concurrent readers never see a partial file.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(to_serializable(data), f)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
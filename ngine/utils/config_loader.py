@@ -13,56 +13,280 @@
 # limitations under the License.
 
 import argparse
+import copy
 import importlib.metadata
+import json
+import os
 from pathlib import Path
 
 import yaml
 
 from ngine import CONFIGS_PATH
+from ngine.utils.cache_utils import atomic_write_json, cache_enabled, get_cache_dir, key_hash, read_json
+
+# bump when the layout of cached entries or the merge rules change
+CONFIG_CACHE_VERSION = 1
+
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class ConfigSchemaError(ValueError):
+    """Invalid config, location is the 'file:line:column' of the offending value when known."""
+
+    def __init__(self, message, location=None):
+        self.location = location
+        super().__init__(f"{location}: {message}" if location else message)
+
+
+def _location(path, mark):
+    return f"{path}:{mark.line + 1}:{mark.column + 1}"
+
+
+def parse_yaml_with_locations(path):
+    """
+    Parse a yaml config, also returning where each key is defined.
+
+    Args:
+        path (str): yaml file
+
+    Returns:
+        tuple: (data, {key path tuple: "file:line:column"}), the empty key path is the document
+
+    Raises:
+        ConfigSchemaError: on yaml syntax errors and keys defined twice in the same mapping
+    """
+    with open(path, "r") as f:
+        loader = _YamlLoader(f)
+        try:
+            node = loader.get_single_node()
+            data = loader.construct_document(node) if node is not None else None
+        except yaml.MarkedYAMLError as e:
+            mark = e.problem_mark or e.context_mark
+            raise ConfigSchemaError(f"{e.context + ', ' if e.context else ''}{e.problem}", _location(path, mark) if mark else str(path)) from None
+        finally:
+            loader.dispose()
+    if node is None:
+        return data, {(): _location(path, yaml.Mark(str(path), 0, 0, 0, None, None))}
+    locations = {(): _location(path, node.start_mark)}
+    stack = [((), node)]
+    while stack:
+        key_path, node = stack.pop()
+        if isinstance(node, yaml.MappingNode):
+            for key_node, value_node in node.value:
+                if key_node.tag == "tag:yaml.org,2002:merge":
+                    continue
+                child_path = key_path + (str(key_node.value),)
+                if child_path in locations:
+                    raise ConfigSchemaError(
+                        f"duplicate key '{'.'.join(child_path)}', first defined at {locations[child_path]}",
+                        _location(path, key_node.start_mark),
+                    )
+                locations[child_path] = _location(path, key_node.start_mark)
+                stack.append((child_path, value_node))
+    return data, locations
+
+
+def _describe(spec):
+    if isinstance(spec, tuple):
+        return " or ".join(_describe(s) for s in spec)
+    if isinstance(spec, dict):
+        return "mapping"
+    if isinstance(spec, list):
+        return f"list of {_describe(spec[0])}"
+    return "null" if spec is type(None) else spec.__name__
+
+
+def _matches(value, spec):
+    if isinstance(spec, tuple):
+        return any(_matches(value, s) for s in spec)
+    if isinstance(spec, dict):
+        return isinstance(value, dict)
+    if isinstance(spec, list):
+        return isinstance(value, list)
+    if spec is float:
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    if spec is int:
+        return isinstance(value, int) and not isinstance(value, bool)
+    return isinstance(value, spec)
+
+
+def validate_config(cfg, schema, locations=None, key_path=()):
+    """
+    Check a resolved config against a schema.
+
+    The schema maps keys to a type, a tuple of types, a nested schema dict or a one element list [item spec].
+    Keys of the schema are required unless their spec allows None, keys missing from the schema are free.
+
+    Args:
+        cfg (dict): resolved config
+
+        schema (dict): expected keys and types
+
+        locations (dict): key locations of the resolved config, see ConfigLoader.resolve
+
+    Raises:
+        ConfigSchemaError: first mismatch, located at the file / line where the value was set
+    """
+    locations = locations or {}
+    for key, spec in schema.items():
+        path = key_path + (str(key),)
+        dotted = ".".join(path)
+        if key not in cfg:
+            optional = isinstance(spec, tuple) and type(None) in spec
+            if not optional:
+                raise ConfigSchemaError(f"missing key '{dotted}' ({_describe(spec)})", locations.get(key_path))
+            continue
+        value = cfg[key]
+        if not _matches(value, spec):
+            raise ConfigSchemaError(
+                f"'{dotted}' should be {_describe(spec)}, got {type(value).__name__} {value!r}", locations.get(path)
+            )
+        if isinstance(spec, dict):
+            validate_config(value, spec, locations, path)
+        elif isinstance(spec, list):
+            for i, item in enumerate(value):
+                if not _matches(item, spec[0]):
+                    raise ConfigSchemaError(
+                        f"'{dotted}[{i}]' should be {_describe(spec[0])}, got {type(item).__name__} {item!r}",
+                        locations.get(path),
+                    )
+                if isinstance(spec[0], dict):
+                    validate_config(item, spec[0], locations, path)
+
+
+# keys every teleop task config resolves to, read unconditionally by the teleop scripts and the perf capture
+TELEOP_CONFIG_SCHEMA = {
+    "task": str,
+    "robot": str,
+    "robot_scale": float,
+    "layout": str,
+    "scene_backend": str,
+    "task_backend": str,
+    "seed": (int, type(None)),
+    "sources": ([str], type(None)),
+    "object_projects": ([str], type(None)),
+    "usd_simplify": bool,
+    "disable_fabric": bool,
+    "num_envs": int,
+    "device": str,
+    "step_hz": float,
+    "teleop_device": (str, type(None)),
+    "record": bool,
+    "dataset_file": str,
+    "num_demos": int,
+}
 
 
 class ConfigLoader:
-    def __init__(self):
+    """
+    Resolve yaml configs by name, following their ``_base_`` chains.
+
+    Resolved configs are memoized in-process and persisted to the ``config_loader`` cache. An entry is
+    reused while every file of its inheritance chain keeps its mtime / size and config names still map
+    to the same files. The config files are discovered on first use.
+    """
+
+    def __init__(self, use_disk_cache=True):
         self.configs_root = CONFIGS_PATH
-        self.yml_meta = {}
-        self._collect_yml_files()
+        self.use_disk_cache = use_disk_cache and cache_enabled("config_loader")
+        self._yml_meta = None
+        self._memo = {}
+
+    @property
+    def yml_meta(self):
+        if self._yml_meta is None:
+            self._yml_meta = {}
+            self._collect_yml_files()
+        return self._yml_meta
+
+    def _collect_root(self, root):
+        # one walk per root, .yaml files take precedence over .yml files of the same name like before
+        yml, yaml_files = [], []
+        for dirpath, _, filenames in os.walk(root):
+            for filename in filenames:
+                if filename.endswith(".yml"):
+                    yml.append(os.path.join(dirpath, filename))
+                elif filename.endswith(".yaml"):
+                    yaml_files.append(os.path.join(dirpath, filename))
+        for yml_path in yml + yaml_files:
+            yml_path = Path(yml_path)
+            self._yml_meta[yml_path.stem] = yml_path.resolve()
 
     def _collect_yml_files(self):
-        for yml_path in self.configs_root.rglob("*.yml"):
-            name = yml_path.stem
-            self.yml_meta[name] = yml_path.resolve()
-        for yml_path in self.configs_root.rglob("*.yaml"):
-            name = yml_path.stem
-            self.yml_meta[name] = yml_path.resolve()
+        self._collect_root(self.configs_root)
 
         entry_points = importlib.metadata.entry_points()
         plugins = entry_points.select(group="ngine.plugins")
         for entry_point in plugins:
             if entry_point.name == "config_search_path":
                 additional_config_path = entry_point.load().__path__[0]
-                for yml_path in Path(additional_config_path).rglob("*.yml"):
-                    name = yml_path.stem
-                    self.yml_meta[name] = yml_path.resolve()
-                for yml_path in Path(additional_config_path).rglob("*.yaml"):
-                    name = yml_path.stem
-                    self.yml_meta[name] = yml_path.resolve()
+                self._collect_root(additional_config_path)
                 break
 
-    def load(self, name, loaded_files=None):
+    def _is_current(self, files):
+        for name, path, mtime_ns, size in files:
+            if str(self.yml_meta.get(name, path)) != path:
+                return False
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return False
+            if stat.st_mtime_ns != mtime_ns or stat.st_size != size:
+                return False
+        return True
+
+    def _disk_path(self, yaml_path):
+        return get_cache_dir("config_loader") / f"{key_hash(CONFIG_CACHE_VERSION, str(yaml_path))}.json"
+
+    def resolve(self, name, chain=()):
+        """
+        Resolve a config without building the Namespace.
+
+        Returns:
+            dict: {"config": merged dict, "locations": [[key path, "file:line:column"], ...],
+                "files": [[name, path, mtime_ns, size], ...]}, shared with the memo, do not modify
+        """
         if name not in self.yml_meta:
             raise FileNotFoundError(f"Config file not found: {name}")
         yaml_path = self.yml_meta[name]
-        if loaded_files is None:
-            loaded_files = set()
         abs_path = yaml_path.resolve()
-        if abs_path in loaded_files:
+        if abs_path in chain:
             raise RuntimeError(f"Circular reference detected: {abs_path}")
-        loaded_files.add(abs_path)
 
-        with open(yaml_path, "r") as f:
-            cfg = yaml.safe_load(f) or {}
+        entry = self._memo.get(name)
+        if entry is not None and entry["path"] == str(abs_path) and self._is_current(entry["files"]):
+            return entry
+        if self.use_disk_cache:
+            entry = read_json(self._disk_path(abs_path))
+            if entry is not None and entry.get("version") == CONFIG_CACHE_VERSION and self._is_current(entry["files"]):
+                self._memo[name] = entry
+                return entry
+
+        entry = self._resolve_files(name, abs_path, chain + (abs_path,))
+        self._memo[name] = entry
+        if self.use_disk_cache:
+            # yaml values json can not represent exactly (non string keys, dates, ...) stay in memory only
+            try:
+                exact = json.loads(json.dumps(entry["config"])) == entry["config"]
+            except (TypeError, ValueError):
+                exact = False
+            if exact:
+                try:
+                    atomic_write_json(self._disk_path(abs_path), entry)
+                except OSError:
+                    pass
+        return entry
+
+    def _resolve_files(self, name, yaml_path, chain):
+        stat = os.stat(yaml_path)
+        files = [[name, str(yaml_path), stat.st_mtime_ns, stat.st_size]]
+        cfg, own_locations = parse_yaml_with_locations(yaml_path)
+        cfg = cfg or {}
+        if not isinstance(cfg, dict):
+            raise ConfigSchemaError(f"a config must be a mapping, got {type(cfg).__name__}", own_locations[()])
 
         base_cfg = {}
+        locations = {}
         if "_base_" in cfg and cfg["_base_"]:
             base_files = cfg["_base_"]
             if not isinstance(base_files, list):
@@ -70,23 +294,50 @@ class ConfigLoader:
             for base_file in base_files:
                 if isinstance(base_file, str):
                     base_name = Path(base_file).stem
-                    if base_name in self.yml_meta:
-                        base_file_path = self.yml_meta[base_name]
-                    else:
+                    if base_name not in self.yml_meta:
                         base_file_path = (yaml_path.parent / base_file).resolve()
                         if not base_file_path.exists():
-                            raise FileNotFoundError(f"Base config file not found: {base_file}")
+                            raise FileNotFoundError(f"Base config file not found: {base_file} ({own_locations[('_base_',)]})")
                         self.yml_meta[base_name] = base_file_path
                 else:
-                    raise ValueError(f"_base_ only supports string: {base_file}")
-                base_cfg_part = self.load(base_name, loaded_files)
-                if isinstance(base_cfg_part, argparse.Namespace):
-                    base_cfg_part = vars(base_cfg_part)
-                base_cfg = self.merge_dicts(base_cfg, base_cfg_part)
+                    raise ConfigSchemaError(f"_base_ only supports string: {base_file}", own_locations[("_base_",)])
+                base_entry = self.resolve(base_name, chain)
+                base_cfg = self.merge_dicts(base_cfg, base_entry["config"])
+                locations.update((tuple(path), location) for path, location in base_entry["locations"])
+                files.extend(base_entry["files"])
             cfg.pop("_base_")
 
-        merged = self.merge_dicts(base_cfg, cfg)
-        return argparse.Namespace(**merged)
+        locations.update((path, location) for path, location in own_locations.items() if path[:1] != ("_base_",))
+        return {
+            "version": CONFIG_CACHE_VERSION,
+            "path": str(yaml_path),
+            "config": self.merge_dicts(base_cfg, cfg),
+            "locations": [[list(path), location] for path, location in locations.items()],
+            "files": files,
+        }
+
+    def load(self, name, loaded_files=None, schema=None):
+        """
+        Load a config by name (file stem), merged over its ``_base_`` configs.
+
+        Args:
+            name (str): config name
+
+            loaded_files (set): resolved paths of the configs being loaded, for circular reference detection
+
+            schema (dict): optional schema checked with validate_config
+
+        Returns:
+            argparse.Namespace: the merged config, a fresh copy for every call
+        """
+        entry = self.resolve(name, tuple(loaded_files or ()))
+        if schema is not None:
+            validate_config(entry["config"], schema, {tuple(path): location for path, location in entry["locations"]})
+        return argparse.Namespace(**copy.deepcopy(entry["config"]))
+
+    def clear_cache(self):
+        """Drop the in-process memo, the on-disk entries are checked against the files anyway."""
+        self._memo.clear()
 
     @staticmethod
     def merge_dicts(base, override):
@@ -0,0 +1,27 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import torch
+
+
+def calculate_contact_force(env, geom) -> torch.Tensor:
+    """
+    calculate the contact force on the geom, from the ``{geom}_contact`` sensor of the scene
+
+    Only reads ``env.scene.sensors``, so that the checkers can use it on recorded sensors without Isaac Lab.
+    """
+    if f"{geom}_contact" in env.scene.sensors:
+        return torch.max(env.scene.sensors[f"{geom}_contact"].data.net_forces_w, dim=-1).values
+    else:
+        return torch.tensor([0.0], device=env.device).repeat(env.num_envs)
@@ -13,27 +13,53 @@
 # limitations under the License.
 
 import ast
+import csv
 import importlib.metadata
+import os
+from collections import defaultdict
 from pathlib import Path
 
 import numpy as np
-import pandas as pd
 
 from ngine import CONFIGS_PATH
+from ngine.utils.cache_utils import atomic_write_json, cache_enabled, get_cache_dir, key_hash, read_json
+
+# bump when the layout of the cached index changes
+CSV_INDEX_VERSION = 2
+
+
+def layout_style(layout):
+    """Style id of a layout name such as robocasakitchen-61-5 (-> "5"), None if it has no style."""
+    parts = str(layout).split("-")
+    return parts[-1] if len(parts) >= 3 else None
 
 
 class CSVLoader:
+    """
+    Layout / task mapping tables (configs/**/*.csv and the plugin config search path).
+
+    The rows of all tables are parsed once into hash indices: (robot, layout, task) for the pose lookups and
+    one index per column for task / layout / style / robot queries. The parsed rows are cached on disk,
+    keyed on the paths, sizes and mtimes of the csv files, so later processes skip the csv parsing.
+    Rows keep the order of the files and of the rows in each file; lookups return the first match.
+    Cells are kept as strings, the pose lookups evaluate the literals of the matched row like the pandas based
+    loader did, so a cell which is not a literal (e.g. ``none``) raises ValueError.
+    """
+
     def __init__(self):
         self.configs_root = CONFIGS_PATH
-        self.csv_data = []
+        self.csv_paths = []
+        self.rows = []
         self._collect_csv_files()
+        self._load_rows()
+        self._build_indices()
         self.robot_pos = None
         self.robot_ori = None
         self.obj_offset = np.zeros(2,)
 
     def _collect_csv_files(self):
         for csv_path in self.configs_root.rglob("*.csv"):
-            self.csv_data.append(pd.read_csv(csv_path.resolve()))
+            self.csv_paths.append(csv_path.resolve())
 
         entry_points = importlib.metadata.entry_points()
         plugins = entry_points.select(group="ngine.plugins")
@@ -41,37 +67,104 @@ class CSVLoader:
             if entry_point.name == "config_search_path":
                 additional_config_path = entry_point.load().__path__[0]
                 for csv_path in Path(additional_config_path).rglob("*.csv"):
-                    self.csv_data.append(pd.read_csv(csv_path.resolve()))
+                    self.csv_paths.append(csv_path.resolve())
                 break
 
+    def _signature(self):
+        signature = []
+        for path in self.csv_paths:
+            stat = os.stat(path)
+            signature.append((str(path), stat.st_size, stat.st_mtime_ns))
+        return signature
+
+    def _load_rows(self):
+        enabled = cache_enabled("csv_index")
+        cache_path = None
+        if enabled:
+            cache_path = get_cache_dir("csv_index") / f"{key_hash(CSV_INDEX_VERSION, self._signature())}.json"
+            cached = read_json(cache_path)
+            if cached is not None and cached.get("version") == CSV_INDEX_VERSION:
+                self.rows = cached["rows"]
+                return
+
+        self.rows = []
+        for path in self.csv_paths:
+            with open(path, "r", newline="", encoding="utf-8") as f:
+                self.rows.extend(csv.DictReader(f))
+
+        if cache_path is not None:
+            try:
+                atomic_write_json(cache_path, {"version": CSV_INDEX_VERSION, "rows": self.rows})
+            except OSError:
+                pass
+
+    def _build_indices(self):
+        self.key_index = {}
+        self.task_index = defaultdict(list)
+        self.layout_index = defaultdict(list)
+        self.style_index = defaultdict(list)
+        self.robot_index = defaultdict(list)
+        for i, row in enumerate(self.rows):
+            self.key_index.setdefault((row.get("robot"), row.get("layout"), row.get("task")), i)
+            self.task_index[row.get("task")].append(i)
+            self.layout_index[row.get("layout")].append(i)
+            self.style_index[layout_style(row.get("layout"))].append(i)
+            self.robot_index[row.get("robot")].append(i)
+
+    def find_row(self, robot_name, scene_name, task_name):
+        """First row matching (robot, layout, task), or None."""
+        i = self.key_index.get((robot_name, scene_name, task_name))
+        return None if i is None else self.rows[i]
+
+    def query(self, task=None, layout=None, style=None, robot=None):
+        """
+        Rows matching every given column, in table order.
+
+        Args:
+            task (str): task name
+            layout (str): layout (scene) name, e.g. robocasakitchen-61-5
+            style (str): layout style id, e.g. "5"
+            robot (str): robot name
+
+        Returns:
+            list: matching rows (dicts)
+        """
+        candidates = None
+        for index, value in ((self.task_index, task), (self.layout_index, layout), (self.style_index, style), (self.robot_index, robot)):
+            if value is None:
+                continue
+            ids = index.get(value, [])
+            if candidates is None:
+                candidates = ids
+            else:
+                ids = set(ids)
+                candidates = [i for i in candidates if i in ids]
+        if candidates is None:
+            return list(self.rows)
+        return [self.rows[i] for i in candidates]
+
     def load_robot_pose(self, robot_name=None, scene_name=None, task_name=None):
         if robot_name is not None and scene_name is not None and task_name is not None:
-            for data in self.csv_data:
-                row = data[(data['robot'] == robot_name) &
-                           (data['layout'] == scene_name) &
-                           (data['task'] == task_name)]
-                if not row.empty:
-                    self.robot_pos = ast.literal_eval(row.iloc[0]['init_robot_base_pos'])
-                    self.robot_ori = ast.literal_eval(row.iloc[0]['init_robot_base_ori'])
-                    print(
-                        f"[CSV Match] {robot_name} | {scene_name} | {task_name} | "
-                        f"Init Pos:{self.robot_pos} - Init Ori:{self.robot_ori}"
-                    )
-                    return self.robot_pos, self.robot_ori
+            row = self.find_row(robot_name, scene_name, task_name)
+            if row is not None:
+                self.robot_pos = ast.literal_eval(row['init_robot_base_pos'])
+                self.robot_ori = ast.literal_eval(row['init_robot_base_ori'])
+                print(
+                    f"[CSV Match] {robot_name} | {scene_name} | {task_name} | "
+                    f"Init Pos:{self.robot_pos} - Init Ori:{self.robot_ori}"
+                )
+                return self.robot_pos, self.robot_ori
         return None, None
 
     def load_object_offset(self, robot_name=None, scene_name=None, task_name=None):
         if robot_name is not None and scene_name is not None and task_name is not None:
-            for data in self.csv_data:
-                row = data[(data['robot'] == robot_name) &
-                           (data['layout'] == scene_name) &
-                           (data['task'] == task_name)]
-                if not row.empty:
-                    self.obj_offset = ast.literal_eval(row.iloc[0]['object_init_offset'])
-                    print(
-                        f"[CSV Match] Init Obj Offset:{self.obj_offset}"
-                    )
-                    return self.obj_offset
+            row = self.find_row(robot_name, scene_name, task_name)
+            if row is not None:
+                self.obj_offset = ast.literal_eval(row['object_init_offset'])
+                print(
+                    f"[CSV Match] Init Obj Offset:{self.obj_offset}"
+                )
+                return self.obj_offset
         return np.zeros(2,)
 
 
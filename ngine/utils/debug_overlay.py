@@ -0,0 +1,196 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Retained-mode debug overlay.
+
+Lines and points are collected into a :class:`DebugOverlay` during a frame and submitted by :meth:`DebugOverlay.flush`
+as one ``draw_lines`` and one ``draw_points`` call. Static primitives are kept across frames and deduplicated by key,
+dynamic ones only live until the next flush. Debug draw primitives stay on screen until cleared, so a flush whose
+primitives equal the ones on screen submits nothing.
+
+The Isaac Sim debug draw interface is the default backend, :class:`HeadlessDrawBackend` records the submitted
+batches instead.
+"""
+
+
+def _vec(value, size):
+    vec = tuple(float(v) for v in value)
+    if len(vec) != size:
+        raise ValueError(f"Expected {size} components, got {len(vec)}")
+    return vec
+
+
+def _rgba(color):
+    color = tuple(float(c) for c in color)
+    return color + (1.0,) if len(color) == 3 else _vec(color, 4)
+
+
+def box_edges(center, extents):
+    """The 12 edges of the box of half ``extents`` (x, y, z) around ``center``."""
+    cx, cy, cz = _vec(center, 3)
+    ex, ey, ez = _vec(extents, 3)
+    corners = [(cx + sx * ex, cy + sy * ey, cz + sz * ez) for sx in (-1, 1) for sy in (-1, 1) for sz in (-1, 1)]
+    # corner index bits are (x, y, z), an edge joins corners differing in one bit
+    return [(corners[i], corners[i | bit]) for i in range(8) for bit in (4, 2, 1) if not i & bit]
+
+
+class IsaacDebugDrawBackend:
+    """Backend over the Isaac Sim debug draw interface."""
+
+    def __init__(self):
+        import isaacsim.util.debug_draw._debug_draw as omni_debug_draw
+
+        self.draw = omni_debug_draw.acquire_debug_draw_interface()
+
+    def draw_lines(self, starts, ends, colors, sizes):
+        self.draw.draw_lines(starts, ends, colors, sizes)
+
+    def draw_points(self, points, colors, sizes):
+        self.draw.draw_points(points, colors, sizes)
+
+    def clear(self):
+        self.draw.clear_lines()
+        self.draw.clear_points()
+
+
+class HeadlessDrawBackend:
+    """Backend recording the submitted draw calls, ``calls`` holds (kind, arguments) tuples."""
+
+    def __init__(self):
+        self.calls = []
+
+    def draw_lines(self, starts, ends, colors, sizes):
+        self.calls.append(("lines", (list(starts), list(ends), list(colors), list(sizes))))
+
+    def draw_points(self, points, colors, sizes):
+        self.calls.append(("points", (list(points), list(colors), list(sizes))))
+
+    def clear(self):
+        self.calls.append(("clear", ()))
+
+    def on_screen(self):
+        """The lines and points submitted since the last clear."""
+        lines, points = [], []
+        for kind, args in self.calls:
+            if kind == "clear":
+                lines, points = [], []
+            elif kind == "lines":
+                lines.extend(zip(*args))
+            else:
+                points.extend(zip(*args))
+        return lines, points
+
+
+class DebugOverlay:
+    """
+    Per-frame buffer of debug primitives flushed in one batch.
+
+    Args:
+        backend: draw backend, :class:`IsaacDebugDrawBackend` by default
+    """
+
+    def __init__(self, backend=None):
+        self.backend = backend if backend is not None else IsaacDebugDrawBackend()
+        self.static = {}
+        self.lines = {}
+        self.points = {}
+        self.num_flushes = 0
+        self.num_submits = 0
+        self._on_screen = None
+
+    def line(self, start, end, color=(1.0, 0.0, 0.0, 1.0), size=1.0, key=None):
+        """Adds a line, kept across frames under ``key`` when given, only for the current frame otherwise."""
+        self._add("lines", ((_vec(start, 3), _vec(end, 3), _rgba(color), float(size)),), key)
+
+    def segments(self, segments, color=(1.0, 0.0, 0.0, 1.0), size=1.0, key=None):
+        """Adds (start, end) line segments sharing one color and size."""
+        color, size = _rgba(color), float(size)
+        self._add("lines", tuple((_vec(start, 3), _vec(end, 3), color, size) for start, end in segments), key)
+
+    def box(self, center, extents, color=(1.0, 0.0, 0.0, 1.0), size=1.0, key=None):
+        """Adds the 12 edges of a box, ``extents`` are the half sizes."""
+        self.segments(box_edges(center, extents), color, size, key)
+
+    def aabb(self, bbox, color=(1.0, 0.0, 0.0, 1.0), size=1.0, key=None):
+        """Adds a ``Gf.Range3d`` (or anything with GetMidpoint and GetSize) as a box."""
+        self.box(bbox.GetMidpoint(), [s / 2.0 for s in bbox.GetSize()], color, size, key)
+
+    def point(self, position, color=(1.0, 0.0, 0.0, 1.0), size=5.0, key=None):
+        self._add("points", ((_vec(position, 3), _rgba(color), float(size)),), key)
+
+    def _add(self, kind, primitives, key):
+        if key is not None:
+            self.static[key] = (kind, primitives)
+            return
+        # dicts keep the insertion order and drop the primitives submitted twice in a frame
+        buffer = self.lines if kind == "lines" else self.points
+        for primitive in primitives:
+            buffer[primitive] = None
+
+    def remove(self, key):
+        self.static.pop(key, None)
+
+    def clear(self):
+        """Drops every primitive, the screen is cleared on the next flush."""
+        self.static.clear()
+        self.lines.clear()
+        self.points.clear()
+
+    def flush(self):
+        """
+        Submits the primitives of this frame and the static ones, then starts a new frame.
+
+        Returns:
+            bool: whether anything was submitted, False when the screen already shows these primitives
+        """
+        lines, points = {}, {}
+        for kind, primitives in self.static.values():
+            buffer = lines if kind == "lines" else points
+            for primitive in primitives:
+                buffer[primitive] = None
+        lines.update(self.lines)
+        points.update(self.points)
+        self.lines, self.points = {}, {}
+        self.num_flushes += 1
+
+        frame = (tuple(lines), tuple(points))
+        if frame == self._on_screen:
+            return False
+        self.backend.clear()
+        if lines:
+            self.backend.draw_lines(*(list(column) for column in zip(*lines)))
+        if points:
+            self.backend.draw_points(*(list(column) for column in zip(*points)))
+        self._on_screen = frame
+        self.num_submits += 1
+        return True
+
+    def stats(self):
+        return {
+            "flushes": self.num_flushes,
+            "submits": self.num_submits,
+            "static_primitives": sum(len(primitives) for _, primitives in self.static.values()),
+        }
+
+
+_overlay = None
+
+
+def get_debug_overlay():
+    """Returns the process wide overlay on the Isaac Sim debug draw interface."""
+    global _overlay
+    if _overlay is None:
+        _overlay = DebugOverlay()
+    return _overlay
+
@@ -15,3 +15,4 @@
 from .camera import Camera
 from .configs import CameraConfig, ColorMode, Cv2Rotation
 from .utils import make_cameras_from_configs
+from .capture_group import CaptureGroup, FrameBundle, SharedFrameRing
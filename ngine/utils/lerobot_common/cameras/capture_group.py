@@ -0,0 +1,364 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Synchronized multi-camera capture.
+
+Every camera of a :class:`CaptureGroup` is read in its own thread. The frames are stamped against one
+monotonic clock and written into a preallocated shared memory ring per camera (:class:`SharedFrameRing`),
+so no frame buffer is allocated while capturing and other processes can attach to the rings by name.
+:meth:`CaptureGroup.read_bundle` returns the newest set of frames, one per camera, whose timestamps lie
+within the configured skew.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from typing import Any, Callable
+
+import numpy as np
+
+from ngine.utils.lerobot_common.errors import DeviceNotConnectedError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CAPACITY = 8
+DEFAULT_MAX_SKEW_S = 0.010
+
+# sequence number of a slot while it is being written
+_WRITING = -1
+
+
+class SharedFrameRing:
+    """Fixed-size ring of frames in one shared memory block.
+
+    The block holds, per slot, the sequence number (int64), the monotonic timestamp (float64) and the frame.
+    A single writer fills slots in order with :meth:`begin_write` / :meth:`commit`; the sequence number of a
+    slot is set to -1 while it is written, which lets readers detect a frame overwritten under them.
+
+    Args:
+        shape: The frame shape, e.g. (height, width, 3).
+        dtype: The frame dtype.
+        capacity: The number of slots.
+        name: The shared memory name, to attach to an existing ring created with ``create=True``.
+        create: Whether to create the shared memory block or attach to an existing one.
+    """
+
+    def __init__(
+        self,
+        shape: tuple[int, ...],
+        dtype: Any = np.uint8,
+        capacity: int = DEFAULT_CAPACITY,
+        name: str | None = None,
+        create: bool = True,
+    ):
+        if capacity < 2:
+            raise ValueError(f"A frame ring needs at least 2 slots, got {capacity}.")
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.capacity = capacity
+        self.owner = create
+
+        header_bytes = capacity * 16
+        frame_bytes = int(np.prod(self.shape)) * self.dtype.itemsize
+        size = header_bytes + capacity * frame_bytes
+        self.shm = shared_memory.SharedMemory(name=name, create=create, size=size if create else 0)
+
+        buf = self.shm.buf
+        self.seqs = np.ndarray((capacity,), dtype=np.int64, buffer=buf, offset=0)
+        self.timestamps = np.ndarray((capacity,), dtype=np.float64, buffer=buf, offset=capacity * 8)
+        self.frames = np.ndarray((capacity, *self.shape), dtype=self.dtype, buffer=buf, offset=header_bytes)
+        if create:
+            self.seqs[:] = _WRITING
+            self.timestamps[:] = np.nan
+        self._next_seq = 0
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def spec(self) -> dict[str, Any]:
+        """Keyword arguments to attach to this ring from another process."""
+        return dict(shape=self.shape, dtype=self.dtype.str, capacity=self.capacity, name=self.name, create=False)
+
+    def begin_write(self) -> np.ndarray:
+        """Claim the next slot and return its frame buffer, to be filled in place before :meth:`commit`."""
+        slot = self._next_seq % self.capacity
+        self.seqs[slot] = _WRITING
+        return self.frames[slot]
+
+    def commit(self, timestamp: float) -> int:
+        """Publish the slot claimed by :meth:`begin_write`, returns its sequence number."""
+        seq = self._next_seq
+        slot = seq % self.capacity
+        self.timestamps[slot] = timestamp
+        self.seqs[slot] = seq
+        self._next_seq += 1
+        return seq
+
+    def latest_seq(self) -> int:
+        """Sequence number of the newest published frame, -1 if there is none."""
+        return int(self.seqs.max())
+
+    def entries(self) -> list[tuple[int, float]]:
+        """The published (sequence number, timestamp) pairs, oldest first."""
+        seqs = self.seqs.copy()
+        timestamps = self.timestamps.copy()
+        valid = seqs >= 0
+        order = np.argsort(seqs[valid])
+        return list(zip(seqs[valid][order].tolist(), timestamps[valid][order].tolist()))
+
+    def read(self, seq: int, out: np.ndarray | None = None) -> tuple[np.ndarray, float] | None:
+        """Copy frame ``seq`` out of the ring.
+
+        Returns:
+            The frame and its timestamp, or None if the frame was already overwritten.
+        """
+        slot = seq % self.capacity
+        if self.seqs[slot] != seq:
+            return None
+        timestamp = float(self.timestamps[slot])
+        if out is None:
+            out = self.frames[slot].copy()
+        else:
+            np.copyto(out, self.frames[slot])
+        # the writer may have lapped the reader during the copy
+        if self.seqs[slot] != seq:
+            return None
+        return out, timestamp
+
+    def close(self):
+        # drop the views before closing, the buffer cannot be released while they exist
+        self.seqs = self.timestamps = self.frames = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+@dataclass
+class FrameBundle:
+    """Time-aligned frames of a :class:`CaptureGroup`, one per camera.
+
+    Attributes:
+        frames: The frames by camera name.
+        timestamps: The monotonic capture timestamps by camera name, in seconds.
+        seqs: The ring sequence numbers by camera name.
+    """
+
+    frames: dict[str, np.ndarray]
+    timestamps: dict[str, float]
+    seqs: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def timestamp(self) -> float:
+        return float(np.mean(list(self.timestamps.values())))
+
+    @property
+    def skew(self) -> float:
+        """Spread of the capture timestamps in seconds."""
+        return max(self.timestamps.values()) - min(self.timestamps.values())
+
+
+class CaptureGroup:
+    """Captures a set of cameras against one monotonic clock.
+
+    Every camera is read in its own thread with its blocking ``read()``; a camera that also provides
+    ``read_into(out)`` renders directly into the ring slot. A frame is stamped when the read returns.
+
+    The most recent bundle returned by :meth:`read_bundle` is kept in :attr:`last_bundle`.
+
+    Example:
+        >>> group = CaptureGroup(cameras, max_skew_s=0.010)
+        >>> group.start()
+        >>> bundle = group.read_bundle()
+        >>> bundle.frames["front"], bundle.skew
+
+    Args:
+        cameras: The connected cameras by name.
+        max_skew_s: The largest timestamp spread of a bundle in seconds.
+        capacity: The number of frames kept per camera.
+        clock: Monotonic clock returning seconds.
+    """
+
+    def __init__(
+        self,
+        cameras: dict[str, Any],
+        max_skew_s: float = DEFAULT_MAX_SKEW_S,
+        capacity: int = DEFAULT_CAPACITY,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not cameras:
+            raise ValueError("A capture group needs at least one camera.")
+        self.cameras = cameras
+        self.max_skew_s = max_skew_s
+        self.capacity = capacity
+        self.clock = clock
+        self.rings: dict[str, SharedFrameRing] = {}
+        self.errors: dict[str, Exception] = {}
+        self.skews = deque(maxlen=1000)
+        self.num_frames = {name: 0 for name in cameras}
+        self.num_read_errors = {name: 0 for name in cameras}
+        self._new_frame = threading.Condition()
+        self._stop_event = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self.last_bundle: FrameBundle | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return any(thread.is_alive() for thread in self._threads)
+
+    def start(self):
+        """Allocate the rings from a first frame of every camera and start the capture threads."""
+        if self.is_running:
+            return
+        for name, camera in self.cameras.items():
+            if name not in self.rings:
+                frame = np.asarray(camera.read())
+                self.rings[name] = SharedFrameRing(frame.shape, frame.dtype, self.capacity)
+        self._stop_event.clear()
+        self.errors.clear()
+        self.last_bundle = None
+        self._threads = [
+            threading.Thread(target=self._capture_loop, args=(name,), name=f"capture_{name}", daemon=True)
+            for name in self.cameras
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout: float = 2.0):
+        self._stop_event.set()
+        with self._new_frame:
+            self._new_frame.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def close(self):
+        """Stop capturing and release the shared memory."""
+        self.stop()
+        for ring in self.rings.values():
+            ring.close()
+        self.rings = {}
+
+    def check(self):
+        """Re-raise the error of a stopped capture thread."""
+        for name, error in self.errors.items():
+            raise RuntimeError(f"Capture of camera '{name}' stopped") from error
+
+    def specs(self) -> dict[str, dict[str, Any]]:
+        """:meth:`SharedFrameRing.spec` of every camera, to read the frames from another process."""
+        return {name: ring.spec() for name, ring in self.rings.items()}
+
+    def read_bundle(
+        self, timeout_s: float = 0.5, max_skew_s: float | None = None, wait_new: bool = True
+    ) -> FrameBundle:
+        """Return the newest time-aligned frames of all cameras.
+
+        The bundle is anchored at the newest frame of the camera that lags behind the most; every other camera
+        contributes its frame closest to that anchor. Without such a set within the skew, the call waits for
+        the next frames.
+
+        Args:
+            timeout_s: Maximum time to wait for an aligned bundle.
+            max_skew_s: Overrides the group's ``max_skew_s``.
+            wait_new: Wait until the bundle differs from the one returned by the previous call.
+
+        Raises:
+            TimeoutError: If no aligned bundle becomes available within ``timeout_s``.
+        """
+        max_skew_s = self.max_skew_s if max_skew_s is None else max_skew_s
+        deadline = self.clock() + timeout_s
+        while True:
+            self.check()
+            bundle = self._try_bundle(max_skew_s, wait_new)
+            if bundle is not None:
+                self.last_bundle = bundle
+                self.skews.append(bundle.skew)
+                return bundle
+            remaining = deadline - self.clock()
+            if remaining <= 0 or self._stop_event.is_set():
+                raise TimeoutError(
+                    f"No camera bundle within {max_skew_s * 1e3:.1f}ms skew after {timeout_s * 1e3:.0f}ms "
+                    f"(frames: {self.num_frames})."
+                )
+            with self._new_frame:
+                self._new_frame.wait(remaining)
+
+    def stats(self) -> dict[str, float]:
+        """Captured frames per camera and the bundle skew statistics, in milliseconds."""
+        stats = {f"frames_{name}": count for name, count in self.num_frames.items()}
+        stats.update({f"read_errors_{name}": count for name, count in self.num_read_errors.items()})
+        if len(self.skews) > 0:
+            skews = np.asarray(self.skews) * 1000.0
+            stats.update(
+                bundles=len(skews),
+                skew_mean_ms=float(skews.mean()),
+                skew_p99_ms=float(np.percentile(skews, 99)),
+                skew_max_ms=float(skews.max()),
+            )
+        return stats
+
+    """
+    Helper functions.
+    """
+
+    def _capture_loop(self, name: str):
+        camera = self.cameras[name]
+        ring = self.rings[name]
+        read_into = getattr(camera, "read_into", None)
+        while not self._stop_event.is_set():
+            try:
+                slot = ring.begin_write()
+                if read_into is not None:
+                    read_into(slot)
+                else:
+                    np.copyto(slot, camera.read())
+                timestamp = self.clock()
+            except DeviceNotConnectedError as e:
+                self.errors[name] = e
+                break
+            except Exception as e:
+                self.num_read_errors[name] += 1
+                logger.warning(f"Error reading frame in capture thread of {name}: {e}")
+                continue
+            with self._new_frame:
+                ring.commit(timestamp)
+                self.num_frames[name] += 1
+                self._new_frame.notify_all()
+
+    def _try_bundle(self, max_skew_s: float, wait_new: bool) -> FrameBundle | None:
+        entries = {name: ring.entries() for name, ring in self.rings.items()}
+        if any(len(e) == 0 for e in entries.values()):
+            return None
+        anchor = min(e[-1][1] for e in entries.values())
+        chosen = {name: min(e, key=lambda entry: abs(entry[1] - anchor)) for name, e in entries.items()}
+        timestamps = [timestamp for _, timestamp in chosen.values()]
+        if max(timestamps) - min(timestamps) > max_skew_s:
+            return None
+        seqs = {name: seq for name, (seq, _) in chosen.items()}
+        if wait_new and self.last_bundle is not None:
+            if all(seqs[name] <= self.last_bundle.seqs.get(name, -1) for name in seqs):
+                return None
+
+        frames, stamps = {}, {}
+        for name, seq in seqs.items():
+            result = self.rings[name].read(seq)
+            if result is None:
+                # overwritten while reading, the next frame brings a newer bundle
+                return None
+            frames[name], stamps[name] = result
+        return FrameBundle(frames=frames, timestamps=stamps, seqs=seqs)
+
@@ -37,6 +37,23 @@ DEFAULT_BAUDRATE = 1_000_000
 DEFAULT_TIMEOUT_MS = 1000
 
 NORMALIZED_DATA = ["Goal_Position", "Present_Position"]
+# EPROM registers the servos never change on their own
+STATIC_DATA = [
+    "Firmware_Major_Version",
+    "Firmware_Minor_Version",
+    "Model_Number",
+    "ID",
+    "Baud_Rate",
+    "Return_Delay_Time",
+    "Min_Position_Limit",
+    "Max_Position_Limit",
+    "Max_Temperature_Limit",
+    "Max_Voltage_Limit",
+    "Min_Voltage_Limit",
+    "Max_Torque_Limit",
+    "Homing_Offset",
+    "Operating_Mode",
+]
 
 logger = logging.getLogger(__name__)
 
@@ -111,6 +128,7 @@ class FeetechMotorsBus(MotorsBus):
     model_number_table = deepcopy(MODEL_NUMBER_TABLE)
     model_resolution_table = deepcopy(MODEL_RESOLUTION)
     normalized_data = deepcopy(NORMALIZED_DATA)
+    static_data = deepcopy(STATIC_DATA)
 
     def __init__(
         self,
@@ -0,0 +1,353 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""In-memory stand-in of the Feetech SDK for testing bus clients without hardware.
+
+:class:`SimulatedServoChain` holds the register memory of the daisy-chained servos. The port handler, packet
+handler and group sync read/write classes implement the subset of the SDK protocols used by
+:class:`FeetechMotorsBus`, on top of that memory. Present positions move towards the goal positions on every
+read, each transaction can take a configurable latency and fail with a configurable probability, and
+concurrent transactions from several threads are detected since a real serial port does not support them.
+The bytes of the instruction and status packets of each transaction are counted, and their wire time at the
+port baud rate is accumulated in :attr:`SimulatedServoChain.bus_time_s` (and slept with ``byte_timing``).
+
+Example:
+    >>> bus = SimulatedFeetechMotorsBus("sim", motors={"gripper": Motor(6, "sts3215", MotorNormMode.RANGE_0_100)})
+    >>> bus.connect()
+    >>> bus.sync_read("Present_Position", normalize=False)
+"""
+
+import threading
+import time
+
+import numpy as np
+
+from ..motors_bus import Motor, MotorCalibration, MotorsBus, get_address
+from .feetech import DEFAULT_PROTOCOL_VERSION, FeetechMotorsBus
+from .tables import FIRMWARE_MAJOR_VERSION, FIRMWARE_MINOR_VERSION, MODEL_CONTROL_TABLE, MODEL_NUMBER, MODEL_NUMBER_TABLE, MODEL_RESOLUTION
+
+COMM_SUCCESS = 0
+COMM_TX_FAIL = -1001
+COMM_RX_TIMEOUT = -3001
+
+# start, 8 data and stop bits
+BITS_PER_BYTE = 10
+# 0xFF 0xFF, id, length, instruction / error, checksum
+PACKET_OVERHEAD = 6
+
+_COMM_RESULTS = {
+    COMM_SUCCESS: "[TxRxResult] Communication success!",
+    COMM_TX_FAIL: "[TxRxResult] Failed transmit instruction packet!",
+    COMM_RX_TIMEOUT: "[TxRxResult] There is no status packet!",
+}
+
+
+class SimulatedServoChain:
+    """Register memory of a chain of simulated Feetech servos.
+
+    Args:
+        motors: The motors of the chain by name.
+        latency_s: Duration of one bus transaction in seconds.
+        drop_rate: Probability that a transaction fails with a timeout.
+        tracking: Fraction of the remaining distance to the goal covered by the present position on each read.
+        seed: Seed of the failure injection.
+        byte_timing: Also sleep for the wire time of the packet bytes of each transaction.
+    """
+
+    def __init__(
+        self,
+        motors: dict[str, Motor],
+        latency_s: float = 0.0,
+        drop_rate: float = 0.0,
+        tracking: float = 1.0,
+        seed: int | None = None,
+        byte_timing: bool = False,
+    ):
+        self.motors = {m.id: m for m in motors.values()}
+        self.latency_s = latency_s
+        self.drop_rate = drop_rate
+        self.tracking = tracking
+        self.byte_timing = byte_timing
+        self.baudrate = 1_000_000
+        self.rng = np.random.default_rng(seed)
+        self.memory = {id_: bytearray(256) for id_ in self.motors}
+        self.num_transactions = 0
+        self.num_bytes = 0
+        self.bus_time_s = 0.0
+        self._port_lock = threading.Lock()
+
+        for id_, motor in self.motors.items():
+            self.write_value(id_, *MODEL_NUMBER, MODEL_NUMBER_TABLE[motor.model])
+            self.write_value(id_, *FIRMWARE_MAJOR_VERSION, 3)
+            self.write_value(id_, *FIRMWARE_MINOR_VERSION, 10)
+            middle = MODEL_RESOLUTION[motor.model] // 2
+            self.write_value(id_, *self._address(id_, "Present_Position"), middle)
+            self.write_value(id_, *self._address(id_, "Goal_Position"), middle)
+            self.write_value(id_, *self._address(id_, "Max_Position_Limit"), MODEL_RESOLUTION[motor.model] - 1)
+            self.write_value(id_, *self._address(id_, "Present_Voltage"), 120)
+            self.write_value(id_, *self._address(id_, "Present_Temperature"), 30)
+
+    def _address(self, id_: int, data_name: str) -> tuple[int, int]:
+        return get_address(MODEL_CONTROL_TABLE, self.motors[id_].model, data_name)
+
+    def read_value(self, id_: int, address: int, length: int) -> int:
+        return int.from_bytes(self.memory[id_][address:address + length], "little")
+
+    def write_value(self, id_: int, address: int, length: int, value: int):
+        self.memory[id_][address:address + length] = int(value).to_bytes(length, "little")
+
+    def transaction(self, num_bytes: int = 0) -> int:
+        """Account for one bus round trip of ``num_bytes`` packet bytes, returning its communication result."""
+        if not self._port_lock.acquire(blocking=False):
+            raise RuntimeError("Concurrent access to the simulated serial port.")
+        try:
+            self.num_transactions += 1
+            self.num_bytes += num_bytes
+            wire_time_s = num_bytes * BITS_PER_BYTE / self.baudrate
+            self.bus_time_s += self.latency_s + wire_time_s
+            duration_s = self.latency_s + (wire_time_s if self.byte_timing else 0.0)
+            if duration_s > 0:
+                time.sleep(duration_s)
+            if self.drop_rate > 0 and self.rng.random() < self.drop_rate:
+                return COMM_RX_TIMEOUT
+            return COMM_SUCCESS
+        finally:
+            self._port_lock.release()
+
+    def step_motors(self):
+        """Move the present positions towards the goal positions, the present velocities are the steps taken."""
+        for id_ in self.motors:
+            present_addr = self._address(id_, "Present_Position")
+            goal = self.read_value(id_, *self._address(id_, "Goal_Position"))
+            present = self.read_value(id_, *present_addr)
+            step = round(self.tracking * (goal - present))
+            self.write_value(id_, *present_addr, present + step)
+            # sign-magnitude, sign on bit 15
+            self.write_value(id_, *self._address(id_, "Present_Velocity"), abs(step) | (0x8000 if step < 0 else 0))
+
+
+class SimulatedPortHandler:
+    def __init__(self, chain: SimulatedServoChain, port_name: str):
+        self.chain = chain
+        self.port_name = port_name
+        self.is_open = False
+        self.is_using = False
+        self.baudrate = 1_000_000
+        self.packet_timeout = 0.0
+
+    def openPort(self):  # noqa: N802
+        self.is_open = True
+        return True
+
+    def closePort(self):  # noqa: N802
+        self.is_open = False
+
+    def clearPort(self):  # noqa: N802
+        pass
+
+    def setPortName(self, port_name):  # noqa: N802
+        self.port_name = port_name
+
+    def getPortName(self):  # noqa: N802
+        return self.port_name
+
+    def setBaudRate(self, baudrate):  # noqa: N802
+        self.baudrate = baudrate
+        self.chain.baudrate = baudrate
+        return True
+
+    def getBaudRate(self):  # noqa: N802
+        return self.baudrate
+
+    def setPacketTimeout(self, packet_length):  # noqa: N802
+        pass
+
+    def setPacketTimeoutMillis(self, msec):  # noqa: N802
+        self.packet_timeout = msec
+
+
+class SimulatedPacketHandler:
+    def __init__(self, chain: SimulatedServoChain):
+        self.chain = chain
+
+    def getTxRxResult(self, result):  # noqa: N802
+        return _COMM_RESULTS.get(result, f"[TxRxResult] Unknown result {result}")
+
+    def getRxPacketError(self, error):  # noqa: N802
+        return "" if error == 0 else f"[RxPacketError] error {error}"
+
+    def ping(self, port, id):  # noqa: A002
+        comm = self.chain.transaction(2 * PACKET_OVERHEAD)
+        if comm != COMM_SUCCESS or id not in self.chain.motors:
+            return 0, COMM_RX_TIMEOUT, 0
+        return self.chain.read_value(id, *MODEL_NUMBER), COMM_SUCCESS, 0
+
+    def readTxRx(self, port, id, address, length):  # noqa: N802, A002
+        comm = self.chain.transaction(PACKET_OVERHEAD + 2 + PACKET_OVERHEAD + length)
+        if comm != COMM_SUCCESS or id not in self.chain.motors:
+            return [], COMM_RX_TIMEOUT, 0
+        self.chain.step_motors()
+        return list(self.chain.memory[id][address:address + length]), COMM_SUCCESS, 0
+
+    def _read_value(self, id, address, length):  # noqa: A002
+        data, comm, error = self.readTxRx(None, id, address, length)
+        value = int.from_bytes(bytes(data), "little") if comm == COMM_SUCCESS else 0
+        return value, comm, error
+
+    def read1ByteTxRx(self, port, id, address):  # noqa: N802, A002
+        return self._read_value(id, address, 1)
+
+    def read2ByteTxRx(self, port, id, address):  # noqa: N802, A002
+        return self._read_value(id, address, 2)
+
+    def read4ByteTxRx(self, port, id, address):  # noqa: N802, A002
+        return self._read_value(id, address, 4)
+
+    def writeTxRx(self, port, id, address, length, data):  # noqa: N802, A002
+        comm = self.chain.transaction(PACKET_OVERHEAD + 1 + length + PACKET_OVERHEAD)
+        if comm != COMM_SUCCESS or id not in self.chain.motors:
+            return COMM_RX_TIMEOUT, 0
+        self.chain.memory[id][address:address + length] = bytes(data[:length])
+        return COMM_SUCCESS, 0
+
+    def writeTxOnly(self, port, id, address, length, data):  # noqa: N802, A002
+        return self.writeTxRx(port, id, address, length, data)[0]
+
+
+class SimulatedGroupSyncRead:
+    def __init__(self, port, ph, start_address, data_length):
+        self.port = port
+        self.ph = ph
+        self.start_address = start_address
+        self.data_length = data_length
+        self.ids = []
+        self.data_dict = {}
+
+    def clearParam(self):  # noqa: N802
+        self.ids = []
+        self.data_dict = {}
+
+    def addParam(self, id):  # noqa: N802, A002
+        if id in self.ids:
+            return False
+        self.ids.append(id)
+        return True
+
+    def removeParam(self, id):  # noqa: N802, A002
+        if id in self.ids:
+            self.ids.remove(id)
+
+    def txRxPacket(self):  # noqa: N802
+        chain = self.ph.chain
+        # instruction: start address, length and the ids, then one status packet per motor
+        comm = chain.transaction(PACKET_OVERHEAD + 2 + len(self.ids) + len(self.ids) * (PACKET_OVERHEAD + self.data_length))
+        if comm != COMM_SUCCESS:
+            return comm
+        chain.step_motors()
+        self.data_dict = {}
+        for id_ in self.ids:
+            if id_ not in chain.motors:
+                return COMM_RX_TIMEOUT
+            self.data_dict[id_] = chain.read_value(id_, self.start_address, self.data_length)
+        return COMM_SUCCESS
+
+    def isAvailable(self, id, address, data_length):  # noqa: N802, A002
+        return (
+            id in self.data_dict
+            and address >= self.start_address
+            and address + data_length <= self.start_address + self.data_length
+        )
+
+    def getData(self, id, address, data_length):  # noqa: N802, A002
+        if not self.isAvailable(id, address, data_length):
+            return 0
+        value = self.data_dict[id].to_bytes(self.data_length, "little")
+        offset = address - self.start_address
+        return int.from_bytes(value[offset:offset + data_length], "little")
+
+
+class SimulatedGroupSyncWrite:
+    def __init__(self, port, ph, start_address, data_length):
+        self.port = port
+        self.ph = ph
+        self.start_address = start_address
+        self.data_length = data_length
+        self.data_dict = {}
+
+    def clearParam(self):  # noqa: N802
+        self.data_dict = {}
+
+    def addParam(self, id, data):  # noqa: N802, A002
+        if id in self.data_dict:
+            return False
+        self.data_dict[id] = list(data)
+        return True
+
+    def changeParam(self, id, data):  # noqa: N802, A002
+        if id not in self.data_dict:
+            return False
+        self.data_dict[id] = list(data)
+        return True
+
+    def removeParam(self, id):  # noqa: N802, A002
+        self.data_dict.pop(id, None)
+
+    def txPacket(self):  # noqa: N802
+        chain = self.ph.chain
+        comm = chain.transaction(PACKET_OVERHEAD + 2 + len(self.data_dict) * (1 + self.data_length))
+        if comm != COMM_SUCCESS:
+            return comm
+        for id_, data in self.data_dict.items():
+            if id_ in chain.motors:
+                chain.memory[id_][self.start_address:self.start_address + self.data_length] = bytes(data[:self.data_length])
+        return COMM_SUCCESS
+
+
+class SimulatedFeetechMotorsBus(FeetechMotorsBus):
+    """A :class:`FeetechMotorsBus` talking to a :class:`SimulatedServoChain` instead of a serial port.
+
+    It has the same constructor signature as :class:`FeetechMotorsBus` and can be passed as ``bus_cls`` to the
+    followers. Extra keyword arguments are forwarded to :class:`SimulatedServoChain`.
+    """
+
+    def __init__(
+        self,
+        port: str,
+        motors: dict[str, Motor],
+        calibration: dict[str, MotorCalibration] | None = None,
+        protocol_version: int = DEFAULT_PROTOCOL_VERSION,
+        chain: SimulatedServoChain | None = None,
+        **chain_kwargs,
+    ):
+        # skip FeetechMotorsBus.__init__, which instantiates the scservo_sdk handlers
+        MotorsBus.__init__(self, port, motors, calibration)
+        self.protocol_version = protocol_version
+        self._assert_same_protocol()
+        self.chain = chain if chain is not None else SimulatedServoChain(motors, **chain_kwargs)
+        self.port_handler = SimulatedPortHandler(self.chain, port)
+        self.packet_handler = SimulatedPacketHandler(self.chain)
+        self.sync_reader = SimulatedGroupSyncRead(self.port_handler, self.packet_handler, 0, 0)
+        self.sync_writer = SimulatedGroupSyncWrite(self.port_handler, self.packet_handler, 0, 0)
+        self._comm_success = COMM_SUCCESS
+        self._no_error = 0x00
+
+    def _split_into_byte_chunks(self, value: int, length: int) -> list[int]:
+        return list(int(value).to_bytes(length, "little"))
+
+    def _broadcast_ping(self) -> tuple[dict[int, int], int]:
+        comm = self.chain.transaction(PACKET_OVERHEAD + len(self.chain.motors) * PACKET_OVERHEAD)
+        if comm != COMM_SUCCESS:
+            return {}, comm
+        return {id_: 0 for id_ in self.chain.motors}, COMM_SUCCESS
+
@@ -40,6 +40,10 @@ Value: TypeAlias = int | float
 
 logger = logging.getLogger(__name__)
 
+# Registers closer than this many bytes are read in one sync read transaction. Reading the bytes in between
+# costs `gap x number of motors` bytes on the wire, far less than the round trip of another transaction.
+SYNC_READ_MAX_GAP = 16
+
 
 def get_ctrl_table(model_ctrl_table: dict[str, dict], model: str) -> dict[str, tuple[int, int]]:
     ctrl_table = model_ctrl_table.get(model)
@@ -259,6 +263,8 @@ class MotorsBus(abc.ABC):
     model_number_table: dict[str, int]
     model_resolution_table: dict[str, int]
     normalized_data: list[str]
+    # registers only changed through this bus, their values are cached after the first read
+    static_data: list[str] = []
 
     def __init__(
         self,
@@ -277,6 +283,11 @@ class MotorsBus(abc.ABC):
         self._comm_success: int
         self._no_error: int
 
+        # sync readers by (start address, length, motor ids), their parameters are only set up once
+        self._sync_readers: dict[tuple[int, int, tuple[int, ...]], GroupSyncRead] = {}
+        # raw values of the static registers by (motor id, address, length)
+        self._static_cache: dict[tuple[int, int, int], int] = {}
+
         self._id_to_model_dict = {m.id: m.model for m in self.motors.values()}
         self._id_to_name_dict = {m.id: motor for motor, m in self.motors.items()}
         self._model_nb_to_model_dict = {v: k for k, v in self.model_number_table.items()}
@@ -438,6 +449,7 @@ class MotorsBus(abc.ABC):
         logger.debug(f"{self.__class__.__name__} connected.")
 
     def _connect(self, handshake: bool = True) -> None:
+        self.clear_static_cache()
         try:
             if not self.port_handler.openPort():
                 raise OSError(f"Failed to open port '{self.port}'.")
@@ -472,6 +484,7 @@ class MotorsBus(abc.ABC):
             self.disable_torque(num_retry=5)
 
         self.port_handler.closePort()
+        self.clear_static_cache()
         logger.debug(f"{self.__class__.__name__} disconnected.")
 
     @classmethod
@@ -633,6 +646,7 @@ class MotorsBus(abc.ABC):
         if present_bus_baudrate != baudrate:
             logger.info(f"Setting bus baud rate to {baudrate}. Previously {present_bus_baudrate}.")
             self.port_handler.setBaudRate(baudrate)
+            self.clear_static_cache()
 
             if self.port_handler.getBaudRate() != baudrate:
                 raise RuntimeError("Failed to write bus baud rate.")
@@ -941,8 +955,12 @@ class MotorsBus(abc.ABC):
         model = self.motors[motor].model
         addr, length = get_address(self.model_ctrl_table, model, data_name)
 
-        err_msg = f"Failed to read '{data_name}' on {id_=} after {num_retry + 1} tries."
-        value, _, _ = self._read(addr, length, id_, num_retry=num_retry, raise_on_error=True, err_msg=err_msg)
+        value = self._static_cache.get((id_, addr, length)) if data_name in self.static_data else None
+        if value is None:
+            err_msg = f"Failed to read '{data_name}' on {id_=} after {num_retry + 1} tries."
+            value, _, _ = self._read(addr, length, id_, num_retry=num_retry, raise_on_error=True, err_msg=err_msg)
+            if data_name in self.static_data:
+                self._static_cache[(id_, addr, length)] = value
 
         id_value = self._decode_sign(data_name, {id_: value})
 
@@ -1033,6 +1051,7 @@ class MotorsBus(abc.ABC):
         err_msg: str = "",
     ) -> tuple[int, int]:
         data = self._serialize_data(value, length)
+        self._invalidate_static_cache([motor_id], addr, length)
         for n_try in range(1 + num_retry):
             comm, error = self.packet_handler.writeTxRx(self.port_handler, motor_id, addr, length, data)
             if self._is_comm_success(comm):
@@ -1068,6 +1087,31 @@ class MotorsBus(abc.ABC):
         Returns:
             dict[str, Value]: Mapping *motor name → value*.
         """
+        return self.sync_read_group([data_name], motors, normalize=normalize, num_retry=num_retry)[data_name]
+
+    def sync_read_group(
+        self,
+        data_names: list[str],
+        motors: str | list[str] | None = None,
+        *,
+        normalize: bool = True,
+        num_retry: int = 0,
+    ) -> dict[str, dict[str, Value]]:
+        """Read several registers from several motors with as few bus transactions as possible.
+
+        Registers at close addresses (e.g. `Present_Position`, `Present_Velocity`, `Present_Load` and
+        `Present_Temperature`) are coalesced into one sync read spanning all of them, and the registers listed
+        in :pyattr:`static_data` are only read from the motors once.
+
+        Args:
+            data_names (list[str]): Register names.
+            motors (str | list[str] | None, optional): Motors to query. `None` (default) reads every motor.
+            normalize (bool, optional): Normalisation flag.  Defaults to `True`.
+            num_retry (int, optional): Retry attempts per transaction.  Defaults to `0`.
+
+        Returns:
+            dict[str, dict[str, Value]]: Mapping *register name → motor name → value*.
+        """
         if not self.is_connected:
             raise DeviceNotConnectedError(
                 f"{self.__class__.__name__}('{self.port}') is not connected. You need to run `{self.__class__.__name__}.connect()`."
@@ -1080,22 +1124,55 @@ class MotorsBus(abc.ABC):
         models = [self.motors[motor].model for motor in names]
 
         if self._has_different_ctrl_tables:
-            assert_same_address(self.model_ctrl_table, models, data_name)
+            for data_name in data_names:
+                assert_same_address(self.model_ctrl_table, models, data_name)
 
         model = next(iter(models))
-        addr, length = get_address(self.model_ctrl_table, model, data_name)
-
-        err_msg = f"Failed to sync read '{data_name}' on {ids=} after {num_retry + 1} tries."
-        ids_values, _ = self._sync_read(
-            addr, length, ids, num_retry=num_retry, raise_on_error=True, err_msg=err_msg
-        )
-
-        ids_values = self._decode_sign(data_name, ids_values)
-
-        if normalize and data_name in self.normalized_data:
-            ids_values = self._normalize(ids_values)
-
-        return {self._id_to_name(id_): value for id_, value in ids_values.items()}
+        registers = {data_name: get_address(self.model_ctrl_table, model, data_name) for data_name in data_names}
+
+        raw_values = {}
+        for data_name in data_names:
+            if data_name in self.static_data:
+                addr, length = registers[data_name]
+                cached = {id_: self._static_cache.get((id_, addr, length)) for id_ in ids}
+                if None not in cached.values():
+                    raw_values[data_name] = cached
+
+        to_read = {data_name: registers[data_name] for data_name in data_names if data_name not in raw_values}
+        for start, span_length, span_names in self._coalesce_registers(to_read):
+            err_msg = f"Failed to sync read '{', '.join(span_names)}' on {ids=} after {num_retry + 1} tries."
+            span_registers = [to_read[data_name] for data_name in span_names]
+            span_values, _ = self._sync_read_span(
+                start, span_length, ids, span_registers, num_retry=num_retry, raise_on_error=True, err_msg=err_msg
+            )
+            for data_name, register in zip(span_names, span_registers):
+                raw_values[data_name] = span_values[register]
+                if data_name in self.static_data:
+                    for id_, value in span_values[register].items():
+                        self._static_cache[(id_, *register)] = value
+
+        values = {}
+        for data_name in data_names:
+            ids_values = self._decode_sign(data_name, dict(raw_values[data_name]))
+            if normalize and data_name in self.normalized_data:
+                ids_values = self._normalize(ids_values)
+            values[data_name] = {self._id_to_name(id_): value for id_, value in ids_values.items()}
+
+        return values
+
+    @staticmethod
+    def _coalesce_registers(
+        registers: dict[str, tuple[int, int]], max_gap: int = SYNC_READ_MAX_GAP
+    ) -> list[tuple[int, int, list[str]]]:
+        """Group registers into contiguous address spans, returning *(start address, length, register names)*."""
+        spans = []
+        for data_name, (addr, length) in sorted(registers.items(), key=lambda item: item[1]):
+            if spans and addr <= spans[-1][0] + spans[-1][1] + max_gap:
+                start, span_length, span_names = spans[-1]
+                spans[-1] = (start, max(span_length, addr + length - start), span_names + [data_name])
+            else:
+                spans.append((addr, length, [data_name]))
+        return spans
 
     def _sync_read(
         self,
@@ -1107,28 +1184,63 @@ class MotorsBus(abc.ABC):
         raise_on_error: bool = True,
         err_msg: str = "",
     ) -> tuple[dict[int, int], int]:
-        self._setup_sync_reader(motor_ids, addr, length)
+        values, comm = self._sync_read_span(
+            addr, length, motor_ids, [(addr, length)], num_retry=num_retry, raise_on_error=raise_on_error, err_msg=err_msg
+        )
+        return values[(addr, length)], comm
+
+    def _sync_read_span(
+        self,
+        start: int,
+        span_length: int,
+        motor_ids: list[int],
+        registers: list[tuple[int, int]],
+        *,
+        num_retry: int = 0,
+        raise_on_error: bool = True,
+        err_msg: str = "",
+    ) -> tuple[dict[tuple[int, int], dict[int, int]], int]:
+        sync_reader = self._get_sync_reader(motor_ids, start, span_length)
         for n_try in range(1 + num_retry):
-            comm = self.sync_reader.txRxPacket()
+            comm = sync_reader.txRxPacket()
             if self._is_comm_success(comm):
                 break
             logger.debug(
-                f"Failed to sync read @{addr=} ({length=}) on {motor_ids=} ({n_try=}): "
+                f"Failed to sync read @{start=} ({span_length=}) on {motor_ids=} ({n_try=}): "
                 + self.packet_handler.getTxRxResult(comm)
             )
 
         if not self._is_comm_success(comm) and raise_on_error:
             raise ConnectionError(f"{err_msg} {self.packet_handler.getTxRxResult(comm)}")
 
-        values = {id_: self.sync_reader.getData(id_, addr, length) for id_ in motor_ids}
+        values = {
+            (addr, length): {id_: sync_reader.getData(id_, addr, length) for id_ in motor_ids}
+            for addr, length in registers
+        }
         return values, comm
 
-    def _setup_sync_reader(self, motor_ids: list[int], addr: int, length: int) -> None:
-        self.sync_reader.clearParam()
-        self.sync_reader.start_address = addr
-        self.sync_reader.data_length = length
-        for id_ in motor_ids:
-            self.sync_reader.addParam(id_)
+    def _get_sync_reader(self, motor_ids: list[int], addr: int, length: int) -> GroupSyncRead:
+        key = (addr, length, tuple(motor_ids))
+        sync_reader = self._sync_readers.get(key)
+        if sync_reader is None:
+            # same constructor as the SDK reader created by the subclass
+            sync_reader = type(self.sync_reader)(self.port_handler, self.packet_handler, addr, length)
+            for id_ in motor_ids:
+                sync_reader.addParam(id_)
+            self._sync_readers[key] = sync_reader
+        return sync_reader
+
+    def clear_static_cache(self) -> None:
+        """Forget the cached values of the :pyattr:`static_data` registers."""
+        self._static_cache.clear()
+
+    def _invalidate_static_cache(self, motor_ids, addr: int, length: int) -> None:
+        stale = [
+            key for key in self._static_cache
+            if key[0] in motor_ids and key[1] < addr + length and addr < key[1] + key[2]
+        ]
+        for key in stale:
+            del self._static_cache[key]
 
     # TODO(aliberts, pkooij): Implementing something like this could get even much faster read times if need be.
     # Would have to handle the logic of checking if a packet has been sent previously though but doable.
@@ -1196,6 +1308,7 @@ class MotorsBus(abc.ABC):
         err_msg: str = "",
     ) -> int:
         self._setup_sync_writer(ids_values, addr, length)
+        self._invalidate_static_cache(ids_values, addr, length)
         for n_try in range(1 + num_retry):
             comm = self.sync_writer.txPacket()
             if self._is_comm_success(comm):
@@ -0,0 +1,563 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Batched quaternion, matrix and pose operations for numpy arrays and torch tensors.
+
+Every function works on arbitrary leading dimensions (``(..., 4)`` quaternions, ``(..., 3, 3)`` rotations,
+``(..., 4, 4)`` poses) and dispatches on its inputs: torch tensors in, torch tensors out on the same device,
+numpy arrays (or lists) in, numpy arrays out. The dtype of floating inputs is preserved, integer inputs are
+promoted to float64 (numpy) / the default dtype (torch).
+
+NOTE: Quaternion convention is (x, y, z, w), except for the ``se3_*`` / ``quat_mul`` / ``quat_to_R`` /
+``quat_conj`` group which uses (w, x, y, z) like the pose delta helpers of numpy_impl / torch_impl.
+"""
+
+import sys
+
+import numpy as np
+
+from .consts import _AXES2TUPLE, _NEXT_AXIS
+
+EPS = np.finfo(np.float32).eps * 4.0
+
+
+class _NumpyOps:
+    name = "numpy"
+
+    @staticmethod
+    def asarray(x, like=None):
+        x = np.asarray(x)
+        return x if np.issubdtype(x.dtype, np.floating) else x.astype(np.float64)
+
+    stack = staticmethod(lambda xs, axis: np.stack(xs, axis=axis))
+    concat = staticmethod(lambda xs, axis: np.concatenate(xs, axis=axis))
+    sqrt = staticmethod(np.sqrt)
+    sin = staticmethod(np.sin)
+    cos = staticmethod(np.cos)
+    acos = staticmethod(np.arccos)
+    atan2 = staticmethod(np.arctan2)
+    clip = staticmethod(np.clip)
+    where = staticmethod(np.where)
+    maximum = staticmethod(np.maximum)
+    argmax = staticmethod(lambda x, axis: np.expand_dims(np.argmax(x, axis=axis), axis))
+    take = staticmethod(lambda x, index, axis: np.take_along_axis(x, index, axis=axis))
+    unbind = staticmethod(lambda x: tuple(np.moveaxis(x, -1, 0)))
+    swap = staticmethod(lambda x: np.swapaxes(x, -1, -2))
+    sum = staticmethod(lambda x, keepdims=False: np.sum(x, axis=-1, keepdims=keepdims))
+    zeros_like = staticmethod(np.zeros_like)
+    full = staticmethod(lambda shape, value, like: np.full(shape, value, dtype=like.dtype))
+
+
+class _TorchOps:
+    name = "torch"
+
+    @staticmethod
+    def asarray(x, like=None):
+        import torch
+
+        device = like.device if like is not None else None
+        if not isinstance(x, torch.Tensor):
+            dtype = like.dtype if like is not None else None
+            x = torch.as_tensor(np.asarray(x), device=device)
+            return x.to(dtype) if dtype is not None else (x if x.is_floating_point() else x.to(torch.get_default_dtype()))
+        if device is not None and x.device != device:
+            x = x.to(device)
+        return x if x.is_floating_point() else x.to(torch.get_default_dtype())
+
+    @staticmethod
+    def _torch():
+        import torch
+        return torch
+
+    stack = staticmethod(lambda xs, axis: _TorchOps._torch().stack(xs, dim=axis))
+    concat = staticmethod(lambda xs, axis: _TorchOps._torch().cat(xs, dim=axis))
+    sqrt = staticmethod(lambda x: _TorchOps._torch().sqrt(x))
+    sin = staticmethod(lambda x: _TorchOps._torch().sin(x))
+    cos = staticmethod(lambda x: _TorchOps._torch().cos(x))
+    acos = staticmethod(lambda x: _TorchOps._torch().acos(x))
+    atan2 = staticmethod(lambda y, x: _TorchOps._torch().atan2(y, x))
+    clip = staticmethod(lambda x, low, high: _TorchOps._torch().clamp(x, low, high))
+    where = staticmethod(
+        lambda cond, a, b: _TorchOps._torch().where(cond, _TorchOps._as_like(a, cond, b), _TorchOps._as_like(b, cond, a))
+    )
+    maximum = staticmethod(lambda x, value: _TorchOps._torch().clamp(x, min=value))
+    argmax = staticmethod(lambda x, axis: _TorchOps._torch().argmax(x, dim=axis, keepdim=True))
+    take = staticmethod(lambda x, index, axis: _TorchOps._torch().take_along_dim(x, index, dim=axis))
+    unbind = staticmethod(lambda x: x.unbind(-1))
+    swap = staticmethod(lambda x: x.transpose(-1, -2))
+    sum = staticmethod(lambda x, keepdims=False: x.sum(dim=-1, keepdim=keepdims))
+    zeros_like = staticmethod(lambda x: _TorchOps._torch().zeros_like(x))
+    full = staticmethod(lambda shape, value, like: _TorchOps._torch().full(shape, value, dtype=like.dtype, device=like.device))
+
+    @staticmethod
+    def _as_like(value, cond, other):
+        torch = _TorchOps._torch()
+        if isinstance(value, torch.Tensor):
+            return value
+        dtype = other.dtype if isinstance(other, torch.Tensor) else torch.get_default_dtype()
+        return torch.tensor(value, dtype=dtype, device=cond.device)
+
+
+def _is_torch(x) -> bool:
+    torch = sys.modules.get("torch")
+    return torch is not None and isinstance(x, torch.Tensor)
+
+
+def _backend(*xs):
+    """Pick the backend of the inputs and convert them, torch wins if any of them is a tensor."""
+    like = next((x for x in xs if _is_torch(x)), None)
+    ops = _TorchOps if like is not None else _NumpyOps
+    return ops, [ops.asarray(x, like) for x in xs]
+
+
+"""
+Quaternions (x, y, z, w).
+"""
+
+
+def convert_quat(q, to="xyzw"):
+    """
+    Convert quaternions between conventions, if to == 'xyzw' the input is 'wxyz' and vice versa.
+
+    Args:
+        q (array): (..., 4) quaternions
+        to (str): 'xyzw' or 'wxyz', target convention
+
+    Returns:
+        array: (..., 4) converted quaternions
+    """
+    ops, (q,) = _backend(q)
+    if to == "xyzw":
+        return ops.concat([q[..., 1:], q[..., :1]], -1)
+    if to == "wxyz":
+        return ops.concat([q[..., 3:], q[..., :3]], -1)
+    raise Exception("convert_quat: choose a valid `to` argument (xyzw or wxyz)")
+
+
+def quat_multiply(quaternion1, quaternion0):
+    """
+    Return the products of quaternions (q1 * q0).
+
+    Args:
+        quaternion1 (array): (..., 4) quaternions
+        quaternion0 (array): (..., 4) quaternions
+
+    Returns:
+        array: (..., 4) products, broadcast over the leading dimensions
+    """
+    ops, (q1, q0) = _backend(quaternion1, quaternion0)
+    x0, y0, z0, w0 = ops.unbind(q0)
+    x1, y1, z1, w1 = ops.unbind(q1)
+    return ops.stack(
+        [
+            x1 * w0 + y1 * z0 - z1 * y0 + w1 * x0,
+            -x1 * z0 + y1 * w0 + z1 * x0 + w1 * y0,
+            x1 * y0 - y1 * x0 + z1 * w0 + w1 * z0,
+            -x1 * x0 - y1 * y0 - z1 * z0 + w1 * w0,
+        ],
+        -1,
+    )
+
+
+def quat_conjugate(quaternion):
+    ops, (q,) = _backend(quaternion)
+    return ops.concat([-q[..., :3], q[..., 3:]], -1)
+
+
+def quat_inverse(quaternion):
+    ops, (q,) = _backend(quaternion)
+    return quat_conjugate(q) / ops.sum(q * q, keepdims=True)
+
+
+def quat_normalize(quaternion):
+    """Normalize (..., 4) quaternions (any convention) to unit length."""
+    ops, (q,) = _backend(quaternion)
+    return q / ops.sqrt(ops.sum(q * q, keepdims=True))
+
+
+def quat_distance(quaternion1, quaternion0):
+    """Return the quaternions d such that d * quaternion0 = quaternion1."""
+    return quat_multiply(quaternion1, quat_inverse(quaternion0))
+
+
+def quat_apply(quaternion, vectors):
+    """
+    Rotate vectors by (normalized) quaternions.
+
+    Args:
+        quaternion (array): (..., 4) quaternions
+        vectors (array): (..., 3) vectors
+
+    Returns:
+        array: (..., 3) rotated vectors
+    """
+    ops, (q, v) = _backend(quaternion, vectors)
+    q = quat_normalize(q)
+    u, w = q[..., :3], q[..., 3:]
+    t = 2.0 * _cross(ops, u, v)
+    return v + w * t + _cross(ops, u, t)
+
+
+def quat_slerp(quat0, quat1, fraction, shortestpath=True):
+    """
+    Spherical linear interpolation between quaternions.
+
+    Args:
+        quat0 (array): (..., 4) start quaternions
+        quat1 (array): (..., 4) end quaternions
+        fraction (float or array): interpolation fractions, broadcast against the leading dimensions
+        shortestpath (bool): whether to use the shortest path
+
+    Returns:
+        array: (..., 4) interpolated unit quaternions
+    """
+    ops, (q0, q1, fraction) = _backend(quat0, quat1, fraction)
+    q0 = quat_normalize(q0)
+    q1 = quat_normalize(q1)
+    d = ops.sum(q0 * q1, keepdims=True)
+    if shortestpath:
+        q1 = ops.where(d < 0.0, -q1, q1)
+        d = ops.where(d < 0.0, -d, d)
+    fraction = fraction[..., None] if fraction.ndim > 0 else fraction
+    angle = ops.acos(ops.clip(d, -1.0, 1.0))
+    isin = 1.0 / ops.maximum(ops.sin(angle), EPS)
+    out = q0 * (ops.sin((1.0 - fraction) * angle) * isin) + q1 * (ops.sin(fraction * angle) * isin)
+    degenerate = (abs(abs(d) - 1.0) < EPS) | (abs(angle) < EPS)
+    return ops.where(degenerate, q0 + 0.0 * q1, out)
+
+
+def quat2mat(quaternion):
+    """
+    Convert quaternions to rotation matrices, near-zero quaternions give the identity.
+
+    Args:
+        quaternion (array): (..., 4) quaternions
+
+    Returns:
+        array: (..., 3, 3) rotation matrices
+    """
+    ops, (q,) = _backend(quaternion)
+    n = ops.sum(q * q)
+    s = ops.where(n < EPS, 0.0, 2.0 / ops.maximum(n, EPS))
+    x, y, z, w = ops.unbind(q)
+    return _mat3(ops, [
+        1.0 - s * (y * y + z * z), s * (x * y - z * w), s * (x * z + y * w),
+        s * (x * y + z * w), 1.0 - s * (x * x + z * z), s * (y * z - x * w),
+        s * (x * z - y * w), s * (y * z + x * w), 1.0 - s * (x * x + y * y),
+    ])
+
+
+def mat2quat(rmat):
+    """
+    Convert rotation matrices to unit quaternions with w >= 0 (Shepperd's method).
+
+    Args:
+        rmat (array): (..., 3, 3) rotation matrices, (..., 4, 4) poses are accepted as well
+
+    Returns:
+        array: (..., 4) quaternions
+    """
+    ops, (m,) = _backend(rmat)
+    m = m[..., :3, :3]
+    m00, m01, m02 = m[..., 0, 0], m[..., 0, 1], m[..., 0, 2]
+    m10, m11, m12 = m[..., 1, 0], m[..., 1, 1], m[..., 1, 2]
+    m20, m21, m22 = m[..., 2, 0], m[..., 2, 1], m[..., 2, 2]
+    # one candidate per largest diagonal term, each of them is well conditioned in its own case
+    s0 = 2.0 * ops.sqrt(ops.maximum(1.0 + m00 + m11 + m22, EPS))
+    s1 = 2.0 * ops.sqrt(ops.maximum(1.0 + m00 - m11 - m22, EPS))
+    s2 = 2.0 * ops.sqrt(ops.maximum(1.0 - m00 + m11 - m22, EPS))
+    s3 = 2.0 * ops.sqrt(ops.maximum(1.0 - m00 - m11 + m22, EPS))
+    candidates = ops.stack([
+        ops.stack([(m21 - m12) / s0, (m02 - m20) / s0, (m10 - m01) / s0, 0.25 * s0], -1),
+        ops.stack([0.25 * s1, (m01 + m10) / s1, (m02 + m20) / s1, (m21 - m12) / s1], -1),
+        ops.stack([(m01 + m10) / s2, 0.25 * s2, (m12 + m21) / s2, (m02 - m20) / s2], -1),
+        ops.stack([(m02 + m20) / s3, (m12 + m21) / s3, 0.25 * s3, (m10 - m01) / s3], -1),
+    ], -2)
+    case = ops.argmax(ops.stack([m00 + m11 + m22, m00, m11, m22], -1), -1)
+    q = ops.take(candidates, case[..., None], -2)[..., 0, :]
+    q = ops.where(q[..., 3:] < 0.0, -q, q)
+    return quat_normalize(q)
+
+
+def quat2axisangle(quat):
+    """
+    Convert quaternions to axis-angle, unit axes scaled by the rotation angle.
+
+    Args:
+        quat (array): (..., 4) quaternions
+
+    Returns:
+        array: (..., 3) axis-angles
+    """
+    ops, (q,) = _backend(quat)
+    w = ops.clip(q[..., 3:], -1.0, 1.0)
+    den = ops.sqrt(1.0 - w * w)
+    scale = ops.where(den > 1e-12, 2.0 * ops.acos(w) / ops.maximum(den, 1e-12), 0.0)
+    return q[..., :3] * scale
+
+
+def axisangle2quat(vec):
+    """
+    Convert axis-angles to quaternions.
+
+    Args:
+        vec (array): (..., 3) axis-angles
+
+    Returns:
+        array: (..., 4) quaternions
+    """
+    ops, (v,) = _backend(vec)
+    angle = ops.sqrt(ops.sum(v * v, keepdims=True))
+    axis = v / ops.maximum(angle, 1e-12)
+    return ops.concat([axis * ops.sin(angle / 2.0), ops.cos(angle / 2.0)], -1)
+
+
+"""
+Rotation matrices and euler angles.
+"""
+
+
+def euler2mat(euler):
+    """
+    Convert (r, p, y) euler angles to rotation matrices.
+
+    Args:
+        euler (array): (..., 3) euler angles
+
+    Returns:
+        array: (..., 3, 3) rotation matrices
+    """
+    ops, (euler,) = _backend(euler)
+    assert euler.shape[-1] == 3, "Invalid shaped euler {}".format(euler)
+    ai, aj, ak = -euler[..., 2], -euler[..., 1], -euler[..., 0]
+    si, sj, sk = ops.sin(ai), ops.sin(aj), ops.sin(ak)
+    ci, cj, ck = ops.cos(ai), ops.cos(aj), ops.cos(ak)
+    cc, cs = ci * ck, ci * sk
+    sc, ss = si * ck, si * sk
+    return _mat3(ops, [
+        cj * ci, cj * si, -sj,
+        sj * cs - sc, sj * ss + cc, cj * sk,
+        sj * cc + ss, sj * sc - cs, cj * ck,
+    ])
+
+
+def mat2euler(rmat, axes="sxyz"):
+    """
+    Convert rotation matrices to euler angles (radians).
+
+    Args:
+        rmat (array): (..., 3, 3) rotation matrices
+        axes (str): axis sequence
+
+    Returns:
+        array: (..., 3) euler angles
+    """
+    try:
+        firstaxis, parity, repetition, frame = _AXES2TUPLE[axes.lower()]
+    except (AttributeError, KeyError):
+        firstaxis, parity, repetition, frame = axes
+    i = firstaxis
+    j = _NEXT_AXIS[i + parity]
+    k = _NEXT_AXIS[i - parity + 1]
+
+    ops, (M,) = _backend(rmat)
+    if repetition:
+        sy = ops.sqrt(M[..., i, j] * M[..., i, j] + M[..., i, k] * M[..., i, k])
+        regular = sy > EPS
+        ax = ops.where(regular, ops.atan2(M[..., i, j], M[..., i, k]), ops.atan2(-M[..., j, k], M[..., j, j]))
+        ay = ops.atan2(sy, M[..., i, i])
+        az = ops.where(regular, ops.atan2(M[..., j, i], -M[..., k, i]), 0.0)
+    else:
+        cy = ops.sqrt(M[..., i, i] * M[..., i, i] + M[..., j, i] * M[..., j, i])
+        regular = cy > EPS
+        ax = ops.where(regular, ops.atan2(M[..., k, j], M[..., k, k]), ops.atan2(-M[..., j, k], M[..., j, j]))
+        ay = ops.atan2(-M[..., k, i], cy)
+        az = ops.where(regular, ops.atan2(M[..., j, i], M[..., i, i]), 0.0)
+    if parity:
+        ax, ay, az = -ax, -ay, -az
+    if frame:
+        ax, az = az, ax
+    return ops.stack([ax, ay, az], -1)
+
+
+def rotate_2d_point(points, rot):
+    """
+    Rotate 2d points counterclockwise.
+
+    Args:
+        points (array): (..., 2) points
+        rot (float or array): rotation angles, broadcast against the leading dimensions
+
+    Returns:
+        array: (..., 2) rotated points
+    """
+    ops, (points, rot) = _backend(points, rot)
+    x, y = points[..., 0], points[..., 1]
+    c, s = ops.cos(rot), ops.sin(rot)
+    return ops.stack([x * c - y * s, x * s + y * c], -1)
+
+
+"""
+Homogeneous poses.
+"""
+
+
+def make_pose(translation, rotation):
+    """
+    Create homogeneous poses from translations and rotation matrices.
+
+    Args:
+        translation (array): (..., 3) translations
+        rotation (array): (..., 3, 3) rotation matrices
+
+    Returns:
+        array: (..., 4, 4) poses
+    """
+    ops, (t, R) = _backend(translation, rotation)
+    top = ops.concat([R, t[..., :, None] + ops.zeros_like(R[..., :, :1])], -1)
+    bottom = ops.zeros_like(top[..., :1, :])
+    bottom[..., 3] = 1.0
+    return ops.concat([top, bottom], -2)
+
+
+def pose2mat(pos, quat):
+    """
+    Convert (position, quaternion) poses to homogeneous matrices.
+
+    Args:
+        pos (array): (..., 3) positions
+        quat (array): (..., 4) quaternions
+
+    Returns:
+        array: (..., 4, 4) poses
+    """
+    return make_pose(pos, quat2mat(quat))
+
+
+def mat2pose(hmat):
+    """
+    Convert homogeneous matrices to (position, quaternion) poses.
+
+    Args:
+        hmat (array): (..., 4, 4) poses
+
+    Returns:
+        tuple: ((..., 3) positions, (..., 4) quaternions)
+    """
+    ops, (hmat,) = _backend(hmat)
+    return hmat[..., :3, 3], mat2quat(hmat[..., :3, :3])
+
+
+def pose_inv(pose):
+    """Invert (..., 4, 4) homogeneous poses."""
+    ops, (pose,) = _backend(pose)
+    Rt = ops.swap(pose[..., :3, :3])
+    return make_pose(-(Rt @ pose[..., :3, 3:])[..., 0], Rt)
+
+
+def pose_in_A_to_pose_in_B(pose_A, pose_A_in_B):
+    """
+    Transform poses of C in frame A to frame B.
+
+    Args:
+        pose_A (array): (..., 4, 4) poses of C in A
+        pose_A_in_B (array): (..., 4, 4) poses of A in B
+
+    Returns:
+        array: (..., 4, 4) poses of C in B
+    """
+    ops, (pose_A, pose_A_in_B) = _backend(pose_A, pose_A_in_B)
+    return pose_A_in_B @ pose_A
+
+
+"""
+(position, quaternion) poses with (w, x, y, z) quaternions.
+"""
+
+
+def quat_mul(q1, q2):
+    """Multiply (..., 4) quaternions in wxyz format, q1 * q2."""
+    ops, (q1, q2) = _backend(q1, q2)
+    w1, x1, y1, z1 = ops.unbind(q1)
+    w2, x2, y2, z2 = ops.unbind(q2)
+    return ops.stack([
+        w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+        w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+        w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+        w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2,
+    ], -1)
+
+
+def quat_conj(q):
+    """Conjugate of (..., 4) quaternions in wxyz format."""
+    ops, (q,) = _backend(q)
+    return ops.concat([q[..., :1], -q[..., 1:]], -1)
+
+
+def quat_to_R(q):
+    """Rotation matrices (..., 3, 3) of (..., 4) quaternions in wxyz format, normalized first."""
+    ops, (q,) = _backend(q)
+    w, x, y, z = ops.unbind(quat_normalize(q))
+    return _mat3(ops, [
+        1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w),
+        2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w),
+        2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y),
+    ])
+
+
+def se3_compose(p1, q1, p2, q2):
+    """Compose SE(3) transformations (p1, q1) ∘ (p2, q2), quaternions in wxyz format."""
+    ops, (p1, q1, p2, q2) = _backend(p1, q1, p2, q2)
+    p = p1 + (quat_to_R(q1) @ p2[..., None])[..., 0]
+    return p, quat_normalize(quat_mul(q1, q2))
+
+
+def se3_inverse(p, q):
+    """Invert SE(3) transformations (p, q), quaternions in wxyz format."""
+    ops, (p, q) = _backend(p, q)
+    Rt = ops.swap(quat_to_R(q))
+    return -(Rt @ p[..., None])[..., 0], quat_conj(quat_normalize(q))
+
+
+def compute_delta_pose(cur, tgt):
+    """Relative poses delta = tgt ∘ cur^-1 of (..., 7) [p, q_wxyz] poses."""
+    ops, (cur, tgt) = _backend(cur, tgt)
+    p_cur_inv, q_cur_inv = se3_inverse(cur[..., :3], cur[..., 3:])
+    dp, dq = se3_compose(p_cur_inv, q_cur_inv, tgt[..., :3], tgt[..., 3:])
+    return ops.concat([dp, dq], -1)
+
+
+def pose_left_multiply(a, b):
+    """Current poses T_curr = ΔT^-1 ∘ T_target of (..., 7) [p, q_wxyz] targets a and relative poses b."""
+    ops, (a, b) = _backend(a, b)
+    dp_inv, dq_inv = se3_inverse(b[..., :3], b[..., 3:])
+    p, q = se3_compose(a[..., :3], a[..., 3:], dp_inv, dq_inv)
+    return ops.concat([p, q], -1)
+
+
+"""
+Helper functions.
+"""
+
+
+def _mat3(ops, entries):
+    rows = [ops.stack(entries[3 * r:3 * r + 3], -1) for r in range(3)]
+    return ops.stack(rows, -2)
+
+
+def _cross(ops, a, b):
+    ax, ay, az = ops.unbind(a)
+    bx, by, bz = ops.unbind(b)
+    return ops.stack([ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx], -1)
@@ -15,13 +15,16 @@
 """
 Utility functions for matrix and vector transformations.
 
+The quaternion, rotation and pose functions are computed by :mod:`batched`, they accept leading batch
+dimensions as well and keep the output dtypes of the per-pose versions.
+
 NOTE: Quaternion convention is (x, y, z, w)
 """
 
 import math
 import numpy as np
 
-from .consts import _NEXT_AXIS, _AXES2TUPLE
+from . import batched as B
 
 PI = np.pi
 EPS = np.finfo(np.float32).eps * 4.0
@@ -40,11 +43,7 @@ def convert_quat(q, to="xyzw"):
     Returns:
         np.array: Converted quaternion
     """
-    if to == "xyzw":
-        return q[[1, 2, 3, 0]]
-    if to == "wxyz":
-        return q[[3, 0, 1, 2]]
-    raise Exception("convert_quat: choose a valid `to` argument (xyzw or wxyz)")
+    return B.convert_quat(q, to=to)
 
 
 def quat_multiply(quaternion1, quaternion0):
@@ -58,17 +57,7 @@ def quat_multiply(quaternion1, quaternion0):
     Returns:
         np.array: (x, y, z, w) multiplied quaternion
     """
-    x0, y0, z0, w0 = quaternion0
-    x1, y1, z1, w1 = quaternion1
-    return np.array(
-        (
-            x1 * w0 + y1 * z0 - z1 * y0 + w1 * x0,
-            -x1 * z0 + y1 * w0 + z1 * x0 + w1 * y0,
-            x1 * y0 - y1 * x0 + z1 * w0 + w1 * z0,
-            -x1 * x0 - y1 * y0 - z1 * z0 + w1 * w0,
-        ),
-        dtype=np.float32,
-    )
+    return B.quat_multiply(quaternion1, quaternion0).astype(np.float32)
 
 
 def quat_conjugate(quaternion):
@@ -81,10 +70,7 @@ def quat_conjugate(quaternion):
     Returns:
         np.array: (x, y, z, w) conjugate quaternion
     """
-    return np.array(
-        (-quaternion[0], -quaternion[1], -quaternion[2], quaternion[3]),
-        dtype=np.float32,
-    )
+    return B.quat_conjugate(quaternion).astype(np.float32)
 
 
 def quat_inverse(quaternion):
@@ -97,7 +83,7 @@ def quat_inverse(quaternion):
     Returns:
         np.array: (x, y, z, w) inverse quaternion
     """
-    return quat_conjugate(quaternion) / np.dot(quaternion, quaternion)
+    return B.quat_inverse(quaternion)
 
 
 def quat_distance(quaternion1, quaternion0):
@@ -127,26 +113,9 @@ def quat_slerp(quat0, quat1, fraction, shortestpath=True):
     Returns:
         np.array: (x, y, z, w) interpolated quaternion
     """
-    q0 = unit_vector(quat0[:4])
-    q1 = unit_vector(quat1[:4])
-    if fraction == 0.0:
-        return q0
-    elif fraction == 1.0:
-        return q1
-    d = np.dot(q0, q1)
-    if abs(abs(d) - 1.0) < EPS:
-        return q0
-    if shortestpath and d < 0.0:
-        d = -d
-        q1 *= -1.0
-    angle = math.acos(np.clip(d, -1, 1))
-    if abs(angle) < EPS:
-        return q0
-    isin = 1.0 / math.sin(angle)
-    q0 *= math.sin((1.0 - fraction) * angle) * isin
-    q1 *= math.sin(fraction * angle) * isin
-    q0 += q1
-    return q0
+    q0 = np.asarray(quat0, dtype=np.float32)[..., :4]
+    q1 = np.asarray(quat1, dtype=np.float32)[..., :4]
+    return B.quat_slerp(q0, q1, fraction, shortestpath).astype(np.float32)
 
 
 def random_quat(rand=None):
@@ -236,9 +205,7 @@ def mat2pose(hmat):
     Returns:
         tuple: (position, quaternion)
     """
-    pos = hmat[:3, 3]
-    orn = mat2quat(hmat[:3, :3])
-    return pos, orn
+    return np.asarray(hmat)[..., :3, 3], mat2quat(hmat)
 
 
 def mat2quat(rmat):
@@ -251,33 +218,7 @@ def mat2quat(rmat):
     Returns:
         np.array: (x, y, z, w) quaternion
     """
-    M = np.asarray(rmat).astype(np.float32)[:3, :3]
-
-    m00 = M[0, 0]
-    m01 = M[0, 1]
-    m02 = M[0, 2]
-    m10 = M[1, 0]
-    m11 = M[1, 1]
-    m12 = M[1, 2]
-    m20 = M[2, 0]
-    m21 = M[2, 1]
-    m22 = M[2, 2]
-    K = np.array(
-        [
-            [m00 - m11 - m22, np.float32(0.0), np.float32(0.0), np.float32(0.0)],
-            [m01 + m10, m11 - m00 - m22, np.float32(0.0), np.float32(0.0)],
-            [m02 + m20, m12 + m21, m22 - m00 - m11, np.float32(0.0)],
-            [m21 - m12, m02 - m20, m10 - m01, m00 + m11 + m22],
-        ]
-    )
-    K /= 3.0
-    w, V = np.linalg.eigh(K)
-    inds = np.array([3, 0, 1, 2])
-    q1 = V[inds, np.argmax(w)]
-    if q1[0] < 0.0:
-        np.negative(q1, q1)
-    inds = np.array([1, 2, 3, 0])
-    return q1[inds]
+    return B.mat2quat(np.asarray(rmat, dtype=np.float32))
 
 
 def euler2mat(euler):
@@ -290,26 +231,7 @@ def euler2mat(euler):
     Returns:
         np.array: 3x3 rotation matrix
     """
-    euler = np.asarray(euler, dtype=np.float64)
-    assert euler.shape[-1] == 3, "Invalid shaped euler {}".format(euler)
-
-    ai, aj, ak = -euler[..., 2], -euler[..., 1], -euler[..., 0]
-    si, sj, sk = np.sin(ai), np.sin(aj), np.sin(ak)
-    ci, cj, ck = np.cos(ai), np.cos(aj), np.cos(ak)
-    cc, cs = ci * ck, ci * sk
-    sc, ss = si * ck, si * sk
-
-    mat = np.empty(euler.shape[:-1] + (3, 3), dtype=np.float64)
-    mat[..., 2, 2] = cj * ck
-    mat[..., 2, 1] = sj * sc - cs
-    mat[..., 2, 0] = sj * cc + ss
-    mat[..., 1, 2] = cj * sk
-    mat[..., 1, 1] = sj * ss + cc
-    mat[..., 1, 0] = sj * cs - sc
-    mat[..., 0, 2] = -sj
-    mat[..., 0, 1] = cj * si
-    mat[..., 0, 0] = cj * ci
-    return mat
+    return B.euler2mat(np.asarray(euler, dtype=np.float64))
 
 
 def mat2euler(rmat, axes="sxyz"):
@@ -323,42 +245,7 @@ def mat2euler(rmat, axes="sxyz"):
     Returns:
         np.array: (r, p, y) euler angles
     """
-    try:
-        firstaxis, parity, repetition, frame = _AXES2TUPLE[axes.lower()]
-    except (AttributeError, KeyError):
-        firstaxis, parity, repetition, frame = axes
-
-    i = firstaxis
-    j = _NEXT_AXIS[i + parity]
-    k = _NEXT_AXIS[i - parity + 1]
-
-    M = np.asarray(rmat, dtype=np.float32)[:3, :3]
-    if repetition:
-        sy = math.sqrt(M[i, j] * M[i, j] + M[i, k] * M[i, k])
-        if sy > EPS:
-            ax = math.atan2(M[i, j], M[i, k])
-            ay = math.atan2(sy, M[i, i])
-            az = math.atan2(M[j, i], -M[k, i])
-        else:
-            ax = math.atan2(-M[j, k], M[j, j])
-            ay = math.atan2(sy, M[i, i])
-            az = 0.0
-    else:
-        cy = math.sqrt(M[i, i] * M[i, i] + M[j, i] * M[j, i])
-        if cy > EPS:
-            ax = math.atan2(M[k, j], M[k, k])
-            ay = math.atan2(-M[k, i], cy)
-            az = math.atan2(M[j, i], M[i, i])
-        else:
-            ax = math.atan2(-M[j, k], M[j, j])
-            ay = math.atan2(-M[k, i], cy)
-            az = 0.0
-
-    if parity:
-        ax, ay, az = -ax, -ay, -az
-    if frame:
-        ax, az = az, ax
-    return vec((ax, ay, az))
+    return B.mat2euler(np.asarray(rmat, dtype=np.float32)[..., :3, :3], axes)
 
 
 def pose2mat(pose):
@@ -371,11 +258,7 @@ def pose2mat(pose):
     Returns:
         np.array: 4x4 homogeneous matrix
     """
-    homo_pose_mat = np.zeros((4, 4), dtype=np.float32)
-    homo_pose_mat[:3, :3] = quat2mat(pose[1])
-    homo_pose_mat[:3, 3] = np.array(pose[0], dtype=np.float32)
-    homo_pose_mat[3, 3] = 1.0
-    return homo_pose_mat
+    return B.pose2mat(np.asarray(pose[0], dtype=np.float32), np.asarray(pose[1], dtype=np.float32))
 
 
 def quat2mat(quaternion):
@@ -388,21 +271,7 @@ def quat2mat(quaternion):
     Returns:
         np.array: 3x3 rotation matrix
     """
-    inds = np.array([3, 0, 1, 2])
-    q = np.asarray(quaternion).copy().astype(np.float32)[inds]
-
-    n = np.dot(q, q)
-    if n < EPS:
-        return np.identity(3)
-    q *= math.sqrt(2.0 / n)
-    q2 = np.outer(q, q)
-    return np.array(
-        [
-            [1.0 - q2[2, 2] - q2[3, 3], q2[1, 2] - q2[3, 0], q2[1, 3] + q2[2, 0]],
-            [q2[1, 2] + q2[3, 0], 1.0 - q2[1, 1] - q2[3, 3], q2[2, 3] - q2[1, 0]],
-            [q2[1, 3] - q2[2, 0], q2[2, 3] + q2[1, 0], 1.0 - q2[1, 1] - q2[2, 2]],
-        ]
-    )
+    return B.quat2mat(np.asarray(quaternion, dtype=np.float32))
 
 
 def quat2axisangle(quat):
@@ -415,16 +284,7 @@ def quat2axisangle(quat):
     Returns:
         np.array: (ax, ay, az) axis-angle
     """
-    if quat[3] > 1.0:
-        quat[3] = 1.0
-    elif quat[3] < -1.0:
-        quat[3] = -1.0
-
-    den = np.sqrt(1.0 - quat[3] * quat[3])
-    if math.isclose(den, 0.0):
-        return np.zeros(3)
-
-    return (quat[:3] * 2.0 * math.acos(quat[3])) / den
+    return B.quat2axisangle(quat)
 
 
 def axisangle2quat(vec):
@@ -437,14 +297,7 @@ def axisangle2quat(vec):
     Returns:
         np.array: (x, y, z, w) quaternion
     """
-    angle = np.linalg.norm(vec)
-    if math.isclose(angle, 0.0):
-        return np.array([0.0, 0.0, 0.0, 1.0])
-    axis = vec / angle
-    q = np.zeros(4)
-    q[3] = np.cos(angle / 2.0)
-    q[:3] = axis * np.sin(angle / 2.0)
-    return q
+    return B.axisangle2quat(np.asarray(vec, dtype=np.float64))
 
 
 def pose_in_A_to_pose_in_B(pose_A, pose_A_in_B):
@@ -458,7 +311,7 @@ def pose_in_A_to_pose_in_B(pose_A, pose_A_in_B):
     Returns:
         np.array: 4x4 pose of C in B
     """
-    return pose_A_in_B.dot(pose_A)
+    return B.pose_in_A_to_pose_in_B(pose_A, pose_A_in_B)
 
 
 def pose_inv(pose):
@@ -471,11 +324,7 @@ def pose_inv(pose):
     Returns:
         np.array: 4x4 inverse pose matrix
     """
-    pose_inv = np.zeros((4, 4))
-    pose_inv[:3, :3] = pose[:3, :3].T
-    pose_inv[:3, 3] = -pose_inv[:3, :3].dot(pose[:3, 3])
-    pose_inv[3, 3] = 1.0
-    return pose_inv
+    return B.pose_inv(np.asarray(pose, dtype=np.float64))
 
 
 def _skew_symmetric_translation(pos_A_in_B):
@@ -633,11 +482,7 @@ def make_pose(translation, rotation):
     Returns:
         np.array: 4x4 homogeneous matrix
     """
-    pose = np.zeros((4, 4))
-    pose[:3, :3] = rotation
-    pose[:3, 3] = translation
-    pose[3, 3] = 1.0
-    return pose
+    return B.make_pose(np.asarray(translation, dtype=np.float64), np.asarray(rotation, dtype=np.float64))
 
 
 def unit_vector(data, axis=None, out=None):
@@ -730,10 +575,7 @@ def rotate_2d_point(input, rot):
     Returns:
         np.array: rotated 1d-array
     """
-    input_x, input_y = input
-    x = input_x * np.cos(rot) - input_y * np.sin(rot)
-    y = input_x * np.sin(rot) + input_y * np.cos(rot)
-    return np.array([x, y])
+    return B.rotate_2d_point(input, rot)
 
 
 def compute_delta_pose(cur, tgt):
@@ -746,13 +588,7 @@ def compute_delta_pose(cur, tgt):
     Returns:
         Relative pose array of shape (T, 7) [dp, dq].
     """
-    p_cur = cur[:, :3]
-    q_cur = cur[:, 3:]
-    p_tgt = tgt[:, :3]
-    q_tgt = tgt[:, 3:]
-    p_cur_inv, q_cur_inv = se3_inverse(p_cur, q_cur)
-    dp, dq = se3_compose(p_cur_inv, q_cur_inv, p_tgt, q_tgt)
-    return np.concatenate([dp, dq], axis=-1)
+    return B.compute_delta_pose(np.asarray(cur, dtype=np.float64), np.asarray(tgt, dtype=np.float64))
 
 
 def pose_left_multiply(a, b):
@@ -765,13 +601,7 @@ def pose_left_multiply(a, b):
     Returns:
         Current pose array of shape (T, 7) [p_curr, q_curr].
     """
-    dp_rel = b[:, :3]
-    dq_rel = b[:, 3:]
-    p_tgt = a[:, :3]
-    q_tgt = a[:, 3:]
-    dp_rel_inv, dq_rel_inv = se3_inverse(dp_rel, dq_rel)
-    p_curr, q_curr = se3_compose(p_tgt, q_tgt, dp_rel_inv, dq_rel_inv)
-    return np.concatenate([p_curr, q_curr], axis=-1)
+    return B.pose_left_multiply(np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64))
 
 
 def se3_compose(p1, q1, p2, q2):
@@ -786,10 +616,7 @@ def se3_compose(p1, q1, p2, q2):
     Returns:
         Tuple of (composed_translation, composed_quaternion).
     """
-    R1 = quat_to_R(q1)
-    p = p1 + np.einsum('...ij,...j->...i', R1, p2)
-    q = quat_mul(q1, q2)
-    return p, quat_normalize(q)
+    return B.se3_compose(*(np.asarray(x, dtype=np.float64) for x in (p1, q1, p2, q2)))
 
 
 def se3_inverse(p, q):
@@ -802,11 +629,7 @@ def se3_inverse(p, q):
     Returns:
         Tuple of (inverse_translation, inverse_quaternion).
     """
-    R = quat_to_R(q)
-    Rt = np.swapaxes(R, -1, -2)
-    p_inv = -np.einsum('...ij,...j->...i', Rt, p)
-    q_inv = quat_conj(quat_normalize(q))
-    return p_inv, q_inv
+    return B.se3_inverse(np.asarray(p, dtype=np.float64), np.asarray(q, dtype=np.float64))
 
 
 def quat_to_R(q):
@@ -818,19 +641,7 @@ def quat_to_R(q):
     Returns:
         Rotation matrix array of shape (..., 3, 3).
     """
-    q = quat_normalize(q)
-    w, x, y, z = np.moveaxis(q, -1, 0)
-    R = np.empty(q.shape[:-1] + (3, 3), dtype=np.float64)
-    R[..., 0, 0] = 1 - 2 * (y * y + z * z)
-    R[..., 0, 1] = 2 * (x * y - z * w)
-    R[..., 0, 2] = 2 * (x * z + y * w)
-    R[..., 1, 0] = 2 * (x * y + z * w)
-    R[..., 1, 1] = 1 - 2 * (x * x + z * z)
-    R[..., 1, 2] = 2 * (y * z - x * w)
-    R[..., 2, 0] = 2 * (x * z - y * w)
-    R[..., 2, 1] = 2 * (y * z + x * w)
-    R[..., 2, 2] = 1 - 2 * (x * x + y * y)
-    return R
+    return B.quat_to_R(np.asarray(q, dtype=np.float64))
 
 
 def quat_mul(q1, q2):
@@ -843,13 +654,7 @@ def quat_mul(q1, q2):
     Returns:
         Product quaternion q1 * q2 of shape (..., 4).
     """
-    w1, x1, y1, z1 = np.moveaxis(q1, -1, 0)
-    w2, x2, y2, z2 = np.moveaxis(q2, -1, 0)
-    w = w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2
-    x = w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2
-    y = w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2
-    z = w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2
-    return np.stack([w, x, y, z], axis=-1)
+    return B.quat_mul(q1, q2)
 
 
 def quat_normalize(q):
@@ -861,8 +666,7 @@ def quat_normalize(q):
     Returns:
         Normalized quaternion of same shape.
     """
-    q = np.asarray(q, dtype=np.float64)
-    return q / np.linalg.norm(q, axis=-1, keepdims=True)
+    return B.quat_normalize(np.asarray(q, dtype=np.float64))
 
 
 def quat_conj(q):
@@ -874,5 +678,4 @@ def quat_conj(q):
     Returns:
         Conjugate quaternion [w, -x, -y, -z] of same shape.
     """
-    w, x, y, z = np.moveaxis(q, -1, 0)
-    return np.stack([w, -x, -y, -z], axis=-1)
+    return B.quat_conj(q)
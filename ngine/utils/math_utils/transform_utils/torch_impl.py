@@ -15,13 +15,16 @@
 """
 Utility functions for matrix and vector transformations.
 
+The quaternion, rotation and pose functions are computed by :mod:`batched`, they accept leading batch
+dimensions as well and keep the output dtypes of the per-pose versions.
+
 NOTE: Quaternion convention is (x, y, z, w)
 """
 
 import math
 import torch
 
-from .consts import _NEXT_AXIS, _AXES2TUPLE
+from . import batched as B
 
 PI = torch.pi
 EPS = torch.finfo(torch.float32).eps * 4.0
@@ -39,11 +42,7 @@ def convert_quat(q, to="xyzw"):
     Returns:
         torch.Tensor: Converted quaternion
     """
-    if to == "xyzw":
-        return q[[1, 2, 3, 0]]
-    if to == "wxyz":
-        return q[[3, 0, 1, 2]]
-    raise Exception("convert_quat_torch: choose a valid `to` argument (xyzw or wxyz)")
+    return B.convert_quat(q, to=to)
 
 
 def quat_multiply(quaternion1, quaternion0):
@@ -57,14 +56,7 @@ def quat_multiply(quaternion1, quaternion0):
     Returns:
         torch.Tensor: (x, y, z, w) multiplied quaternion
     """
-    x0, y0, z0, w0 = quaternion0
-    x1, y1, z1, w1 = quaternion1
-    return torch.stack((
-        x1 * w0 + y1 * z0 - z1 * y0 + w1 * x0,
-        -x1 * z0 + y1 * w0 + z1 * x0 + w1 * y0,
-        x1 * y0 - y1 * x0 + z1 * w0 + w1 * z0,
-        -x1 * x0 - y1 * y0 - z1 * z0 + w1 * w0,
-    ))
+    return B.quat_multiply(quaternion1, quaternion0)
 
 
 def quat_conjugate(quaternion):
@@ -77,9 +69,7 @@ def quat_conjugate(quaternion):
     Returns:
         torch.Tensor: (x, y, z, w) conjugate quaternion
     """
-    return torch.stack((
-        -quaternion[0], -quaternion[1], -quaternion[2], quaternion[3]
-    ))
+    return B.quat_conjugate(quaternion)
 
 
 def quat_inverse(quaternion):
@@ -92,7 +82,7 @@ def quat_inverse(quaternion):
     Returns:
         torch.Tensor: (x, y, z, w) inverse quaternion
     """
-    return quat_conjugate(quaternion) / torch.dot(quaternion, quaternion)
+    return B.quat_inverse(quaternion)
 
 
 def quat_distance(quaternion1, quaternion0):
@@ -122,32 +112,7 @@ def quat_slerp(quat0, quat1, fraction, shortestpath=True):
     Returns:
         torch.Tensor: (x, y, z, w) interpolated quaternion
     """
-    def unit_vector(data):
-        norm = torch.norm(data)
-        if norm == 0:
-            return data
-        return data / norm
-
-    q0 = unit_vector(quat0[:4])
-    q1 = unit_vector(quat1[:4])
-    if fraction == 0.0:
-        return q0
-    elif fraction == 1.0:
-        return q1
-    d = torch.dot(q0, q1)
-    if torch.abs(torch.abs(d) - 1.0) < EPS:
-        return q0
-    if shortestpath and d < 0.0:
-        d = -d
-        q1 = -q1
-    angle = torch.acos(torch.clamp(d, -1, 1))
-    if torch.abs(angle) < EPS:
-        return q0
-    isin = 1.0 / torch.sin(angle)
-    q0 = q0 * (torch.sin((1.0 - fraction) * angle) * isin)
-    q1 = q1 * (torch.sin(fraction * angle) * isin)
-    q0 = q0 + q1
-    return q0
+    return B.quat_slerp(quat0[..., :4], quat1[..., :4], fraction, shortestpath)
 
 
 def random_quat(rand=None, device=None):
@@ -236,9 +201,7 @@ def mat2pose(hmat):
     Returns:
         tuple: (position, quaternion)
     """
-    pos = hmat[:3, 3]
-    orn = mat2quat(hmat[:3, :3])
-    return pos, orn
+    return hmat[..., :3, 3], mat2quat(hmat)
 
 
 def mat2quat(rmat):
@@ -251,30 +214,7 @@ def mat2quat(rmat):
     Returns:
         torch.Tensor: (x, y, z, w) quaternion
     """
-    M = rmat[:3, :3].float()
-    m00 = M[0, 0]
-    m01 = M[0, 1]
-    m02 = M[0, 2]
-    m10 = M[1, 0]
-    m11 = M[1, 1]
-    m12 = M[1, 2]
-    m20 = M[2, 0]
-    m21 = M[2, 1]
-    m22 = M[2, 2]
-    K = torch.tensor([
-        [m00 - m11 - m22, 0.0, 0.0, 0.0],
-        [m01 + m10, m11 - m00 - m22, 0.0, 0.0],
-        [m02 + m20, m12 + m21, m22 - m00 - m11, 0.0],
-        [m21 - m12, m02 - m20, m10 - m01, m00 + m11 + m22],
-    ], dtype=torch.float32)
-    K /= 3.0
-    w, V = torch.linalg.eigh(K)
-    inds = torch.tensor([3, 0, 1, 2])
-    q1 = V[:, torch.argmax(w)][inds]
-    if q1[0] < 0.0:
-        q1 = -q1
-    inds2 = torch.tensor([1, 2, 3, 0])
-    return q1[inds2]
+    return B.mat2quat(rmat.float())
 
 
 def euler2mat(euler):
@@ -287,25 +227,7 @@ def euler2mat(euler):
     Returns:
         torch.Tensor: 3x3 rotation matrix
     """
-    euler = euler.float()
-    assert euler.shape[-1] == 3, "Invalid shaped euler {}".format(euler)
-    ai, aj, ak = -euler[..., 2], -euler[..., 1], -euler[..., 0]
-    si, sj, sk = torch.sin(ai), torch.sin(aj), torch.sin(ak)
-    ci, cj, ck = torch.cos(ai), torch.cos(aj), torch.cos(ak)
-    cc, cs = ci * ck, ci * sk
-    sc, ss = si * ck, si * sk
-
-    mat = torch.empty(euler.shape[:-1] + (3, 3), dtype=torch.float32, device=euler.device)
-    mat[..., 2, 2] = cj * ck
-    mat[..., 2, 1] = sj * sc - cs
-    mat[..., 2, 0] = sj * cc + ss
-    mat[..., 1, 2] = cj * sk
-    mat[..., 1, 1] = sj * ss + cc
-    mat[..., 1, 0] = sj * cs - sc
-    mat[..., 0, 2] = -sj
-    mat[..., 0, 1] = cj * si
-    mat[..., 0, 0] = cj * ci
-    return mat
+    return B.euler2mat(euler.float())
 
 
 def mat2euler(rmat, axes="sxyz"):
@@ -319,42 +241,7 @@ def mat2euler(rmat, axes="sxyz"):
     Returns:
         torch.Tensor: (r, p, y) euler angles
     """
-    try:
-        firstaxis, parity, repetition, frame = _AXES2TUPLE[axes.lower()]
-    except (AttributeError, KeyError):
-        firstaxis, parity, repetition, frame = axes
-
-    i = firstaxis
-    j = _NEXT_AXIS[i + parity]
-    k = _NEXT_AXIS[i - parity + 1]
-
-    M = rmat[:3, :3].float()
-    if repetition:
-        sy = torch.sqrt(M[i, j] * M[i, j] + M[i, k] * M[i, k])
-        if sy > EPS:
-            ax = torch.atan2(M[i, j], M[i, k])
-            ay = torch.atan2(sy, M[i, i])
-            az = torch.atan2(M[j, i], -M[k, i])
-        else:
-            ax = torch.atan2(-M[j, k], M[j, j])
-            ay = torch.atan2(sy, M[i, i])
-            az = torch.tensor(0.0, device=M.device)
-    else:
-        cy = torch.sqrt(M[i, i] * M[i, i] + M[j, i] * M[j, i])
-        if cy > EPS:
-            ax = torch.atan2(M[k, j], M[k, k])
-            ay = torch.atan2(-M[k, i], cy)
-            az = torch.atan2(M[j, i], M[i, i])
-        else:
-            ax = torch.atan2(-M[j, k], M[j, j])
-            ay = torch.atan2(-M[k, i], cy)
-            az = torch.tensor(0.0, device=M.device)
-
-    if parity:
-        ax, ay, az = -ax, -ay, -az
-    if frame:
-        ax, az = az, ax
-    return torch.stack((ax, ay, az)).to(dtype=torch.float32)
+    return B.mat2euler(rmat[..., :3, :3].float(), axes)
 
 
 def pose2mat(pose):
@@ -367,11 +254,7 @@ def pose2mat(pose):
     Returns:
         torch.Tensor: 4x4 homogeneous matrix
     """
-    homo_pose_mat = torch.zeros((4, 4), dtype=torch.float32, device=pose[0].device)
-    homo_pose_mat[:3, :3] = quat2mat(pose[1])
-    homo_pose_mat[:3, 3] = pose[0].float()
-    homo_pose_mat[3, 3] = 1.0
-    return homo_pose_mat
+    return B.pose2mat(pose[0].float(), pose[1].float())
 
 
 def quat2mat(quaternion):
@@ -384,19 +267,7 @@ def quat2mat(quaternion):
     Returns:
         torch.Tensor: 3x3 rotation matrix
     """
-    inds = torch.tensor([3, 0, 1, 2], dtype=torch.long, device=quaternion.device)
-    q = quaternion.clone().float()[inds]
-
-    n = torch.dot(q, q)
-    if n < EPS:
-        return torch.eye(3, dtype=torch.float32, device=quaternion.device)
-    q = q * torch.sqrt(torch.tensor(2.0, device=q.device) / n)
-    q2 = torch.ger(q, q)
-    return torch.stack([
-        torch.stack([1.0 - q2[2, 2] - q2[3, 3], q2[1, 2] - q2[3, 0], q2[1, 3] + q2[2, 0]]),
-        torch.stack([q2[1, 2] + q2[3, 0], 1.0 - q2[1, 1] - q2[3, 3], q2[2, 3] - q2[1, 0]]),
-        torch.stack([q2[1, 3] - q2[2, 0], q2[2, 3] + q2[1, 0], 1.0 - q2[1, 1] - q2[2, 2]])
-    ])
+    return B.quat2mat(quaternion.float())
 
 
 def quat2axisangle(quat):
@@ -412,13 +283,7 @@ def quat2axisangle(quat):
     """
     if not torch.is_tensor(quat):
         quat = torch.tensor(quat, dtype=torch.float32)
-    w = quat[3].clamp(-1.0, 1.0)
-    xyz = quat[:3]
-    den = torch.sqrt(1.0 - w * w)
-    if torch.isclose(den, torch.tensor(0.0, dtype=quat.dtype)):
-        return torch.zeros(3, dtype=quat.dtype, device=quat.device)
-    angle = 2.0 * torch.acos(w)
-    return xyz * angle / den
+    return B.quat2axisangle(quat)
 
 
 def axisangle2quat(vec):
@@ -431,14 +296,7 @@ def axisangle2quat(vec):
     Returns:
         torch.Tensor: (x, y, z, w) quaternion
     """
-    angle = torch.norm(vec)
-    if torch.isclose(angle, torch.tensor(0.0, dtype=vec.dtype, device=vec.device)):
-        return torch.tensor([0.0, 0.0, 0.0, 1.0], dtype=vec.dtype, device=vec.device)
-    axis = vec / angle
-    q = torch.zeros(4, dtype=vec.dtype, device=vec.device)
-    q[3] = torch.cos(angle / 2.0)
-    q[:3] = axis * torch.sin(angle / 2.0)
-    return q
+    return B.axisangle2quat(vec)
 
 
 def pose_in_A_to_pose_in_B(pose_A, pose_A_in_B):
@@ -452,7 +310,7 @@ def pose_in_A_to_pose_in_B(pose_A, pose_A_in_B):
     Returns:
         torch.Tensor: 4x4 pose of C in B
     """
-    return torch.matmul(pose_A_in_B, pose_A)
+    return B.pose_in_A_to_pose_in_B(pose_A, pose_A_in_B)
 
 
 def pose_inv(pose):
@@ -465,11 +323,7 @@ def pose_inv(pose):
     Returns:
         torch.Tensor: 4x4 inverse pose matrix
     """
-    pose_inv = torch.zeros((4, 4), dtype=pose.dtype, device=pose.device)
-    pose_inv[:3, :3] = pose[:3, :3].T
-    pose_inv[:3, 3] = -torch.matmul(pose_inv[:3, :3], pose[:3, 3])
-    pose_inv[3, 3] = 1.0
-    return pose_inv
+    return B.pose_inv(pose)
 
 
 def _skew_symmetric_translation(pos_A_in_B):
@@ -619,11 +473,7 @@ def make_pose(translation, rotation):
     Returns:
         torch.Tensor: 4x4 pose matrix
     """
-    pose = torch.zeros((4, 4), dtype=rotation.dtype, device=rotation.device)
-    pose[:3, :3] = rotation
-    pose[:3, 3] = translation
-    pose[3, 3] = 1.0
-    return pose
+    return B.make_pose(translation, rotation).to(rotation.dtype)
 
 
 def unit_vector(data, axis=None, out=None):
@@ -713,10 +563,7 @@ def rotate_2d_point(input, rot):
     Returns:
         torch.Tensor: rotated 1d-array
     """
-    input_x, input_y = input
-    x = input_x * torch.cos(rot) - input_y * torch.sin(rot)
-    y = input_x * torch.sin(rot) + input_y * torch.cos(rot)
-    return torch.stack([x, y])
+    return B.rotate_2d_point(input, rot)
 
 
 def compute_delta_pose(cur: torch.Tensor, tgt: torch.Tensor) -> torch.Tensor:
@@ -729,13 +576,7 @@ def compute_delta_pose(cur: torch.Tensor, tgt: torch.Tensor) -> torch.Tensor:
     Returns:
         Relative pose tensor of shape (T, 7) [dp, dq].
     """
-    p_cur = cur[:, :3]
-    q_cur = cur[:, 3:]
-    p_tgt = tgt[:, :3]
-    q_tgt = tgt[:, 3:]
-    p_cur_inv, q_cur_inv = se3_inverse(p_cur, q_cur)
-    dp, dq = se3_compose(p_cur_inv, q_cur_inv, p_tgt, q_tgt)
-    return torch.cat([dp, dq], dim=-1)
+    return B.compute_delta_pose(cur.double(), tgt.double())
 
 
 def pose_left_multiply(a: torch.Tensor, b: torch.Tensor) -> torch.Tensor:
@@ -748,13 +589,7 @@ def pose_left_multiply(a: torch.Tensor, b: torch.Tensor) -> torch.Tensor:
     Returns:
         Current pose tensor of shape (T, 7) [p_curr, q_curr].
     """
-    dp_rel = b[:, :3]
-    dq_rel = b[:, 3:]
-    p_tgt = a[:, :3]
-    q_tgt = a[:, 3:]
-    dp_rel_inv, dq_rel_inv = se3_inverse(dp_rel, dq_rel)
-    p_curr, q_curr = se3_compose(p_tgt, q_tgt, dp_rel_inv, dq_rel_inv)
-    return torch.cat([p_curr, q_curr], dim=-1)
+    return B.pose_left_multiply(a.double(), b.double())
 
 
 def se3_compose(p1: torch.Tensor, q1: torch.Tensor, p2: torch.Tensor, q2: torch.Tensor):
@@ -769,10 +604,7 @@ def se3_compose(p1: torch.Tensor, q1: torch.Tensor, p2: torch.Tensor, q2: torch.
     Returns:
         Tuple of (composed_translation, composed_quaternion).
     """
-    R1 = quat_to_R(q1)
-    p = p1 + torch.einsum('...ij,...j->...i', R1, p2)
-    q = quat_mul(q1, q2)
-    return p, quat_normalize(q)
+    return B.se3_compose(p1.double(), q1.double(), p2.double(), q2.double())
 
 
 def se3_inverse(p: torch.Tensor, q: torch.Tensor):
@@ -785,11 +617,7 @@ def se3_inverse(p: torch.Tensor, q: torch.Tensor):
     Returns:
         Tuple of (inverse_translation, inverse_quaternion).
     """
-    R = quat_to_R(q)
-    Rt = torch.swapaxes(R, -1, -2)
-    p_inv = -torch.einsum('...ij,...j->...i', Rt, p)
-    q_inv = quat_conj(quat_normalize(q))
-    return p_inv, q_inv
+    return B.se3_inverse(p.double(), q.double())
 
 
 def quat_to_R(q: torch.Tensor) -> torch.Tensor:
@@ -801,19 +629,7 @@ def quat_to_R(q: torch.Tensor) -> torch.Tensor:
     Returns:
         Rotation matrix tensor of shape (..., 3, 3).
     """
-    q = quat_normalize(q)
-    w, x, y, z = torch.moveaxis(q, -1, 0)
-    R = torch.empty(q.shape[:-1] + (3, 3), dtype=q.dtype, device=q.device)
-    R[..., 0, 0] = 1 - 2 * (y * y + z * z)
-    R[..., 0, 1] = 2 * (x * y - z * w)
-    R[..., 0, 2] = 2 * (x * z + y * w)
-    R[..., 1, 0] = 2 * (x * y + z * w)
-    R[..., 1, 1] = 1 - 2 * (x * x + z * z)
-    R[..., 1, 2] = 2 * (y * z - x * w)
-    R[..., 2, 0] = 2 * (x * z - y * w)
-    R[..., 2, 1] = 2 * (y * z + x * w)
-    R[..., 2, 2] = 1 - 2 * (x * x + y * y)
-    return R
+    return B.quat_to_R(q.double())
 
 
 def quat_mul(q1: torch.Tensor, q2: torch.Tensor) -> torch.Tensor:
@@ -826,13 +642,7 @@ def quat_mul(q1: torch.Tensor, q2: torch.Tensor) -> torch.Tensor:
     Returns:
         Product quaternion q1 * q2 of shape (..., 4).
     """
-    w1, x1, y1, z1 = torch.moveaxis(q1, -1, 0)
-    w2, x2, y2, z2 = torch.moveaxis(q2, -1, 0)
-    w = w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2
-    x = w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2
-    y = w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2
-    z = w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2
-    return torch.stack([w, x, y, z], dim=-1)
+    return B.quat_mul(q1, q2)
 
 
 def quat_normalize(q: torch.Tensor) -> torch.Tensor:
@@ -844,8 +654,7 @@ def quat_normalize(q: torch.Tensor) -> torch.Tensor:
     Returns:
         Normalized quaternion tensor of same shape.
     """
-    q = q.to(dtype=torch.float64)
-    return q / torch.linalg.norm(q, dim=-1, keepdim=True)
+    return B.quat_normalize(q.double())
 
 
 def quat_conj(q: torch.Tensor) -> torch.Tensor:
@@ -857,5 +666,4 @@ def quat_conj(q: torch.Tensor) -> torch.Tensor:
     Returns:
         Conjugate quaternion [w, -x, -y, -z] of same shape.
     """
-    w, x, y, z = torch.moveaxis(q, -1, 0)
-    return torch.stack([w, -x, -y, -z], dim=-1)
+    return B.quat_conj(q)
@@ -17,11 +17,14 @@ import time
 
 import torch
 
+from .profile_utils import span, traced
+
 
 def patch_reset():
     from isaaclab.envs.manager_based_rl_env import ManagerBasedRLEnv
     from isaacsim.core.simulation_manager import SimulationManager
 
+    @traced("env/reset")
     def reset(
         self: ManagerBasedRLEnv, seed: int | None = None, env_ids=None, options=None
     ):
@@ -60,7 +63,8 @@ def patch_reset():
         self.sim.forward()
         # if sensors are added to the scene, make sure we render to reflect changes in reset
         if self.sim.has_rtx_sensors() and self.cfg.rerender_on_reset:
-            self.sim.render()
+            with span("env/render"):
+                self.sim.render()
 
         # trigger recorder terms for post-reset calls
         self.recorder_manager.record_post_reset(env_ids)
@@ -70,7 +74,8 @@ def patch_reset():
 
         if self.cfg.wait_for_textures and self.sim.has_rtx_sensors():
             while SimulationManager.assets_loading():
-                self.sim.render()
+                with span("env/render"):
+                    self.sim.render()
         if hasattr(self.cfg.isaaclab_arena_env.task, "foreground_semantic_id_mapping"):
             self.cfg.isaaclab_arena_env.task.foreground_semantic_id_mapping
             # self.cfg.setup_camera_and_foreground(self.scene)
@@ -140,6 +145,7 @@ def patch_recorder_manager_ep_meta():
 
     orig_export_episodes = RecorderManager.export_episodes
 
+    @traced("recorder/export")
     def export_episodes(self, env_ids=None) -> None:
         if env_ids is None:
             env_ids = list(range(self._env.num_envs))
@@ -253,6 +259,10 @@ def patch_recorder_manager_joint_targets():
     EpisodeData.get_state = get_state
 
     def add(self, key: str, value: torch.Tensor | dict):
+        with span("recorder/add"):
+            _add(self, key, value)
+
+    def _add(self, key: str, value: torch.Tensor | dict):
         """Add a key-value pair to the dataset.
 
         The key can be nested by using the "/" character.
@@ -265,7 +275,7 @@ def patch_recorder_manager_joint_targets():
         # check datatype
         if isinstance(value, dict):
             for sub_key, sub_value in value.items():
-                self.add(f"{key}/{sub_key}", sub_value)
+                _add(self, f"{key}/{sub_key}", sub_value)
             return
 
         sub_keys = key.split("/")
@@ -284,6 +294,7 @@ def patch_recorder_manager_joint_targets():
             current_dataset_pointer = current_dataset_pointer[sub_keys[sub_key_index]]
     EpisodeData.add = add
 
+    @traced("recorder/pre_export")
     def pre_export(self):
         def pre_export_helper(data):
             for key, value in data.items():
@@ -301,6 +312,7 @@ def patch_recorder_manager_joint_targets():
 def patch_step():
     from isaaclab.envs.manager_based_rl_env import ManagerBasedRLEnv
 
+    @traced("env/step")
     def step(self, action: torch.Tensor):
         """Execute one time-step of the environment's dynamics and reset terminated environments.
 
@@ -337,13 +349,15 @@ def patch_step():
             # set actions into simulator
             self.scene.write_data_to_sim()
             # simulate
-            self.sim.step(render=False)
+            with span("env/physics"):
+                self.sim.step(render=False)
             self.recorder_manager.record_pre_physics_step()
             # render between steps only if the GUI or an RTX sensor needs it
             # note: we assume the render interval to be the shortest accepted rendering interval.
             #    If a camera needs rendering at a faster frequency, this will lead to unexpected behavior.
             if self._sim_step_counter % self.cfg.sim.render_interval == 0 and is_rendering:
-                self.sim.render()
+                with span("env/render"):
+                    self.sim.render()
             # update buffers at sim dt
             self.scene.update(dt=self.physics_dt)
 
@@ -379,7 +393,8 @@ def patch_step():
 
             # if sensors are added to the scene, make sure we render to reflect changes in reset
             if self.sim.has_rtx_sensors() and self.cfg.rerender_on_reset:
-                self.sim.render()
+                with span("env/render"):
+                    self.sim.render()
 
             # trigger recorder terms for post-reset calls
             self.recorder_manager.record_post_reset(reset_env_ids)
@@ -443,7 +458,8 @@ def patch_step():
 
         # if sensors are added to the scene, make sure we render to reflect changes in reset
         if self.sim.has_rtx_sensors() and self.cfg.rerender_on_reset:
-            self.sim.render()
+            with span("env/render"):
+                self.sim.render()
 
         # trigger recorder terms for post-reset calls
         # self.recorder_manager.record_post_reset(env_ids)
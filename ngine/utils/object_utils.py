@@ -24,6 +24,7 @@ from isaaclab.utils.math import matrix_from_quat, euler_xyz_from_quat
 
 import ngine.utils.math_utils.transform_utils.numpy_impl as T
 from ngine.engine.models.fixtures import Fixture
+from ngine.utils.contact_utils import calculate_contact_force  # noqa: F401
 from ngine.utils.usd_utils import OpenUsd as usd
 
 
@@ -1138,16 +1139,6 @@ def check_contact(env: ManagerBasedEnv, geoms_1: str | USDObject | Fixture, geom
     return torch.tensor([False], device=env.device).repeat(env.num_envs)
 
 
-def calculate_contact_force(env: ManagerBasedEnv, geom: str | USDObject | Fixture) -> torch.Tensor:
-    """
-    calculate the contact force on the geom
-    """
-    if f"{geom}_contact" in env.scene.sensors:
-        return torch.max(env.scene.sensors[f"{geom}_contact"].data.net_forces_w, dim=-1).values
-    else:
-        return torch.tensor([0.0], device=env.device).repeat(env.num_envs)
-
-
 def set_obj_rgb(env, obj_name, rgb_value):
     """
     Set the RGB color of an object in the USD stage.
@@ -13,19 +13,27 @@
 # limitations under the License.
 
 import asyncio
+import base64
 import traceback
 from multiprocessing import Array, Process, Value, shared_memory
 
 import numpy as np
 
 from vuer import Vuer
-from vuer.schemas import DefaultScene, Hands, MotionControllers, WebRTCStereoVideoPlane
+from vuer.schemas import DefaultScene, Hands, ImageBackground, MotionControllers, WebRTCStereoVideoPlane
+
+from ngine.utils.stereo_stream import StereoFrameBuffer, StereoStreamEncoder
 # from webrtc.zed_server import *
 
 
 class OpenTeleVision:
-    def __init__(self, img_shape, shm_name, device_type, stream_mode="image", cert_file="./cert.pem", key_file="./key.pem", ngrok=True):
+    def __init__(self, img_shape, shm_name, device_type, stream_mode="image", cert_file="./cert.pem", key_file="./key.pem", ngrok=True,
+                 encoding=None, encoding_quality=80, max_fps=60):
         # device_type: "controller" or "hand"
+        # encoding: None to share raw frames through `shm_name`, or "jpeg" to stream the freshest frame of the
+        #   StereoFrameBuffer named `shm_name` as pre-encoded left / right JPEG tiles (see ngine.utils.stereo_stream)
+        if encoding not in (None, "jpeg"):
+            raise ValueError("encoding must be either None or 'jpeg', the viewer only displays image tiles")
         self.device_type = device_type
         self.img_shape = (img_shape[0], img_shape[1], 3)
         self.img_height, self.img_width = img_shape[:2]
@@ -36,6 +44,9 @@ class OpenTeleVision:
         self.cert_file = cert_file
         self.key_file = key_file
         self.ngrok = ngrok
+        self.encoding = encoding
+        self.encoding_quality = encoding_quality
+        self.max_fps = max_fps
 
         self.left_hand_shared = Array('d', 16, lock=True)
         self.right_hand_shared = Array('d', 16, lock=True)
@@ -68,7 +79,12 @@ class OpenTeleVision:
             raise ValueError("device_type must be either 'hand' or 'controller'")
         self.app.add_handler("CAMERA_MOVE")(self.on_cam_move)
 
-        if self.stream_mode == "image":
+        if self.stream_mode == "image" and self.encoding is not None:
+            self.encoder = StereoStreamEncoder(
+                StereoFrameBuffer(self.shm_name), codec=self.encoding, quality=self.encoding_quality, max_fps=self.max_fps
+            ).start()
+            self.app.spawn(start=True)(self.main_encoded_image)
+        elif self.stream_mode == "image":
             existing_shm = shared_memory.SharedMemory(name=self.shm_name)
             self.img_array = np.ndarray((self.img_shape[0], self.img_shape[1], 3), dtype=np.uint8, buffer=existing_shm.buf)
             self.app.spawn(start=True)(self.main_image)
@@ -243,6 +259,33 @@ class OpenTeleVision:
             # )
             await asyncio.sleep(0.03)
 
+    async def main_encoded_image(self, session, fps=60):
+        if self.device_type == "hand":
+            session.upsert @ Hands(fps=fps, stream=True, key="hands")
+        elif self.device_type == "controller":
+            session.upsert @ MotionControllers(stream=True, key="motion-controller-right", right=True)
+            session.upsert @ MotionControllers(stream=True, key="motion-controller-left", left=True)
+        loop = asyncio.get_running_loop()
+        while True:
+            # always the freshest encoded frame, frames the session could not keep up with are dropped
+            frame = await loop.run_in_executor(None, self.encoder.latest, 0.1)
+            if frame is None:
+                continue
+            left, right = (f"data:image/jpeg;base64,{base64.b64encode(tile).decode()}" for tile in frame.tiles)
+            # layers 1 / 2 are rendered by the left / right eye camera only
+            session.upsert(
+                [
+                    ImageBackground(src=left, aspect=1.778, height=1, distanceToCamera=1, layers=1,
+                                    key="background-left", interpolate=True),
+                    ImageBackground(src=right, aspect=1.778, height=1, distanceToCamera=1, layers=2,
+                                    key="background-right", interpolate=True),
+                ],
+                to="bgChildren",
+            )
+            self.encoder.ack(frame)
+            if frame.index % 600 == 0:
+                print(f"stereo stream: {self.encoder.stats()}")
+
     @property
     def left_hand(self):
         # with self.left_hand_shared.get_lock():
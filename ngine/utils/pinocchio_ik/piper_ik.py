@@ -17,6 +17,9 @@ from typing import Optional, Tuple
 
 import numpy as np
 
+from ngine.utils.math_utils.transform_utils.batched import convert_quat, pose2mat
+from ngine.utils.profile_utils import traced
+
 try:
     import pinocchio as pin
     from pinocchio.robot_wrapper import RobotWrapper
@@ -196,15 +199,9 @@ class PiperPinocchioIK:
 
     @staticmethod
     def _homogeneous_from_pose(pos_wxyz: np.ndarray) -> np.ndarray:
-        """Construct 4x4 homogeneous matrix from pos(3) + quat(wxyz,4) as float64."""
+        """Construct (..., 4, 4) homogeneous matrices from (..., 7) pos(3) + quat(wxyz,4) as float64."""
         vec = np.asarray(pos_wxyz, dtype=np.float64)
-        t = np.eye(4, dtype=np.float64)
-        t[0:3, 3] = vec[0:3]
-        w, x, y, z = vec[3:7]
-        # Ensure double precision for pinocchio Quaternion
-        R = pin.Quaternion(w, x, y, z).toRotationMatrix()
-        t[0:3, 0:3] = R
-        return t
+        return pose2mat(vec[..., 0:3], convert_quat(vec[..., 3:7], to="xyzw"))
 
     def _ensure_batch(self, batch_size: int):
         if self._last_q is None or self._last_q.shape[0] != batch_size:
@@ -243,6 +240,7 @@ class PiperPinocchioIK:
         except Exception:
             return np.zeros(self._model.nq), False, False, np.zeros(self._model.nv)
 
+    @traced("ik/piper")
     def solve_pose_to_joints(self, targets_pos_wxyz: np.ndarray,
                              warm_start: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
         """Solve batched IK.
@@ -260,7 +258,7 @@ class PiperPinocchioIK:
 
         q_out = np.zeros((B, self._model.nq), dtype=np.float64)
         success = np.zeros((B,), dtype=bool)
-        T_targets = [self._homogeneous_from_pose(targets_pos_wxyz[i]) for i in range(B)]
+        T_targets = self._homogeneous_from_pose(targets_pos_wxyz)
         for i in range(B):
             warm_q = None if warm_start is None else warm_start[i]
             sol_q, converged, _, _ = self._ik_single(T_targets[i], warm_q)
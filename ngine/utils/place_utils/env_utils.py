@@ -35,6 +35,7 @@ from ngine.utils.log_utils import get_default_logger
 from ngine.utils.place_utils.kitchen_objects import OBJECT_INFO_CACHE
 from ngine.utils.place_utils.kitchen_object_utils import extract_failed_object_name, recreate_object, clear_obj_cache
 from ngine.utils.place_utils.placement_samplers import SequentialCompositeSampler, UniformRandomSampler
+from ngine.utils.place_utils.spatial_index import get_scene_spatial_index
 from ngine.utils.usd_utils import OpenUsd
 
 
@@ -1191,6 +1192,20 @@ def generate_random_robot_pos(anchor_pos, anchor_ori, pos_dev_x, pos_dev_y):
     return anchor_pos + global_deviation
 
 
+def generate_random_robot_positions(anchor_pos, anchor_ori, pos_dev_x, pos_dev_y, num_positions):
+    """
+    Batched generate_random_robot_pos: draws the same random numbers as num_positions sequential calls.
+    """
+    local_deviation = np.random.uniform(
+        low=(-pos_dev_x, -pos_dev_y),
+        high=(pos_dev_x, pos_dev_y),
+        size=(num_positions, 2),
+    )
+    local_deviation = np.concatenate((local_deviation, np.zeros((num_positions, 1))), axis=1)
+    global_deviation = -local_deviation @ T.euler2mat(anchor_ori + [0, 0, np.pi / 2]).T
+    return np.asarray(anchor_pos) + global_deviation
+
+
 def sample_robot_base_helper(
     env: ManagerBasedRLEnv,
     anchor_pos,
@@ -1210,20 +1225,27 @@ def sample_robot_base_helper(
     if execute_mode in (ExecuteMode.REPLAY_ACTION, ExecuteMode.REPLAY_TELEOP, ExecuteMode.REPLAY_JOINT_TARGETS, ExecuteMode.REPLAY_STATE, ExecuteMode.EVAL):
         return anchor_pos
 
+    # the robot footprint and the obstacle index are computed once, candidates are checked in batches
+    robot_bbox = calculate_robot_bbox(env, anchor_pos)
     cur_dev_pos_x = pos_dev_x
     cur_dev_pos_y = pos_dev_y
     while not found_valid:
-        for attempt_position in range(50):
-            robot_pos = generate_random_robot_pos(
-                anchor_pos=anchor_pos,
-                anchor_ori=anchor_ori,
-                pos_dev_x=cur_dev_pos_x,
-                pos_dev_y=cur_dev_pos_y,
-            )
-            if check_valid_robot_pose(env, robot_pos, env_ids=env_ids):
-                found_valid = True
-                break
-            # env.scene.articulations["robot"].write_root_pose_to_sim(init_pose_copy)
+        rng_state = np.random.get_state()
+        robot_positions = generate_random_robot_positions(
+            anchor_pos=anchor_pos,
+            anchor_ori=anchor_ori,
+            pos_dev_x=cur_dev_pos_x,
+            pos_dev_y=cur_dev_pos_y,
+            num_positions=50,
+        )
+        valid = check_valid_robot_poses(env, robot_positions, env_ids=env_ids, robot_bbox=robot_bbox)
+        if valid.any():
+            found_valid = True
+            first_valid = int(np.argmax(valid))
+            robot_pos = robot_positions[first_valid]
+            # only consume the random numbers the sequential attempts would have drawn
+            np.random.set_state(rng_state)
+            np.random.uniform(size=(first_valid + 1, 2))
         # if valid position not found, increase range by 10 cm for x and 5 cm for y
         cur_dev_pos_x += 0.10
         cur_dev_pos_y += 0.05
@@ -1281,53 +1303,50 @@ def check_valid_robot_pose(env: ManagerBasedRLEnv, robot_pos, env_ids=None):
     Returns:
         bool: True if the robot pose is valid, False otherwise.
     """
-    # TODO: disable collision check
-    # 1. check if the robot is in collision with the environment
-    # if detect_robot_collision(env, env_ids=env_ids):
-    #     print(f"Robot pose: {robot_pos} is in collision with the environment")
-    #     return False
-
-    # 2. check if the robot is out of the scene
-    # clear_debug_drawing()
-    robot_bbox = calculate_robot_bbox(env, robot_pos)
-    scene_prim = None
-    for prim in env.sim.stage.Traverse():
-        if prim.IsValid() and prim.GetName().lower() == "scene":
-            scene_prim = prim
-            break
-    scene_bbox = OpenUsd.get_prim_aabb_bounding_box(scene_prim) if scene_prim else None
+    return bool(check_valid_robot_poses(env, np.asarray(robot_pos)[None], env_ids=env_ids, verbose=True)[0])
 
-    # draw_aabb_from_bbox(robot_bbox)
 
-    if scene_bbox is not None:
-        if detect_robot_out_of_scene(env, robot_bbox, scene_bbox):
-            get_default_logger().info(f"Robot pose: {robot_pos} is out of the scene bounds: {scene_bbox.GetMin()} - {scene_bbox.GetMax()}")
-            return False
+def check_valid_robot_poses(env: ManagerBasedRLEnv, robot_positions, env_ids=None, robot_bbox=None, verbose=False):
+    """
+    Check a batch of candidate robot positions against the scene bounds and the obstacle boxes.
 
-    # 3. check if the robot is in overlap with the objects in the scene
-    # all rigid prim in the scene except the robot
-    # get_default_logger().info(f"check env prim collision with robot")
-    for obs_prim in scene_prim.GetChildren():
-        if not obs_prim.IsValid() or obs_prim.GetAttribute("type").Get() == "WallLayout":
-            continue
-        # Compute the world-space bounding box for prim
-        obs_bbox = OpenUsd.get_prim_aabb_bounding_box(obs_prim, use_cache=False)
-
-        # Check if the robot bounding box overlaps with the current object bounding box
-        if check_overlap(env, robot_bbox, obs_bbox):
-            get_default_logger().info(f"Collision detected between robot and object: {obs_prim.GetPath()}")
-            get_default_logger().info(f"Robot BBox: {robot_bbox.GetMin()} - {robot_bbox.GetMax()}")
-            get_default_logger().info(f"Robot Size: {robot_bbox.GetSize()}")
-            get_default_logger().info(f"Object BBox: {obs_bbox.GetMin()} - {obs_bbox.GetMax()}")
-            get_default_logger().info(f"Object Prim Size: {obs_bbox.GetSize()}")
-            return False
-
-    for fixtr in env.cfg.isaaclab_arena_env.task.fixture_refs.values():
-        fixtr_body_bboxes = fixtr.get_body_bbox(env)
-        for body_name, body_bbox in fixtr_body_bboxes.items():
-            if check_overlap(env, robot_bbox, body_bbox):
-                return False
-    return True
+    The obstacles are looked up in the scene spatial index, which is only rebuilt when fixtures or
+    scene prims moved, instead of traversing the stage and recomputing every bounding box per candidate.
+
+    Args:
+        env: The environment object.
+        robot_positions: (M, 3) candidate robot positions.
+        env_ids: The environment IDs to check the robot pose for.
+        robot_bbox: Robot footprint from calculate_robot_bbox, computed from the first candidate if None.
+        verbose: Whether to log the reason of every rejected candidate.
+
+    Returns:
+        np.ndarray: (M,) mask of the valid candidates.
+    """
+    robot_positions = np.asarray(robot_positions, dtype=np.float64).reshape(-1, 3)
+    if robot_bbox is None:
+        robot_bbox = calculate_robot_bbox(env, robot_positions[0])
+    # the footprint only depends on the candidate through its xy translation
+    center = np.array(robot_bbox.GetMidpoint())
+    shift = np.zeros_like(robot_positions)
+    shift[:, :2] = robot_positions[:, :2] - center[:2]
+    robot_mins = np.array(robot_bbox.GetMin()) + shift
+    robot_maxs = np.array(robot_bbox.GetMax()) + shift
+
+    index = get_scene_spatial_index(env)
+    out_of_scene = index.out_of_scene(robot_mins, robot_maxs)
+    collision = index.tree.first_overlaps(robot_mins, robot_maxs)
+    valid = ~out_of_scene & (collision < 0)
+
+    if verbose:
+        for i in np.flatnonzero(~valid):
+            if out_of_scene[i]:
+                get_default_logger().info(f"Robot pose: {robot_positions[i]} is out of the scene bounds: {index.scene_min} - {index.scene_max}")
+            else:
+                get_default_logger().info(f"Collision detected between robot and object: {index.names[collision[i]]}")
+                get_default_logger().info(f"Robot BBox: {robot_mins[i]} - {robot_maxs[i]}")
+                get_default_logger().info(f"Object BBox: {index.tree.mins[collision[i]]} - {index.tree.maxs[collision[i]]}")
+    return valid
 
 
 def calculate_robot_bbox(env: ManagerBasedRLEnv, robot_pos, arm_margin=0.1, floor_margin=0.1, env_ids=None):
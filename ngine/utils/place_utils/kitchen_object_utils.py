@@ -22,6 +22,7 @@ from termcolor import colored
 
 import ngine.utils.place_utils.env_utils as EnvUtils
 from ngine.utils.place_utils.kitchen_objects import FIXTURE_GROUPS, OBJ_GROUPS, OBJECT_INFO_CACHE, SOURCE_MAPPING
+from ngine.utils.place_utils.object_index import ObjectSamplingIndex, get_object_sampling_index
 from ngine.utils.place_utils.usd_object import USDObject
 
 
@@ -92,6 +93,10 @@ def sample_kitchen_object(
 
         ignore_cache (bool): whether to ignore the cache and force to sample a new object
 
+    Objects are first sampled from the node-wide object index (see ObjectSamplingIndex), which applies
+    max_size as a filter. The asset loader is queried while the index does not hold enough candidates,
+    and for a fraction of the samples until the index knows every candidate of the query.
+
 
     Returns:
         model (USDObject): the sampled object
@@ -99,21 +104,30 @@ def sample_kitchen_object(
         obj_info (dict): the info of the sampled object
     """
 
+    object_index = get_object_sampling_index()
+    index_key = ObjectSamplingIndex.make_key(object_cfgs, source=source, projects=projects, version=version)
+    # a pinned asset / version only has a single candidate
+    min_pool_size = 1 if (version is not None or object_cfgs["asset_name"]) else None
+    cache_key = object_cfgs.get("task_name")
+    exclude_paths = []
+    if ignore_cache and cache_key and cache_key in OBJECT_INFO_CACHE:
+        # force a different object when the cached one is being replaced
+        exclude_paths.append(OBJECT_INFO_CACHE[cache_key]["obj_path"])
+
     valid_object_sampled = False
     while not valid_object_sampled:
-        cache_key = object_cfgs.get("task_name")
+        from_slot_cache = False
+        from_loader = False
+        merged_obj_files = []
 
         if not ignore_cache and cache_key and cache_key in OBJECT_INFO_CACHE:
             print(f"--- Fast Reset: Found '{cache_key}' in runtime cache. Bypassing loader. ---")
-            acquire_start_time = time.time()
             cached_data = OBJECT_INFO_CACHE[cache_key]
             obj_path = cached_data['obj_path']
             obj_name = cached_data['obj_name']
             obj_res = cached_data['obj_res']
             category = cached_data['category']
-            acquire_end_time = time.time()
-            total_acquire_time = acquire_end_time - acquire_start_time
-            print(f"Total Acquire Time: {total_acquire_time:.4f}s")
+            from_slot_cache = True
         elif load_from_local:
             obj_path = object_cfgs["asset_name"]
             obj_name = object_cfgs["asset_name"].split("/")[-1].split(".")[0]
@@ -125,50 +139,70 @@ def sample_kitchen_object(
                 "property": {},
             }
         else:
-            if cache_key:
-                print(f"--- First Run: '{cache_key}' not in cache. Using object_loader. ---")
-
-            if version is not None:
-                acquire_start_time = time.time()
-                obj_path, obj_name, obj_res = get_loader().acquire_by_file_version(version)
-                acquire_end_time = time.time()
-                total_acquire_time = acquire_end_time - acquire_start_time
-                print(f"Total Acquire Time: {total_acquire_time:.4f}s")
-
-            elif object_cfgs["asset_name"]:
-                if "/" in object_cfgs["asset_name"]:
-                    filename = object_cfgs["asset_name"].split("/")[-1].split(".")[0]
-                else:
-                    filename = object_cfgs["asset_name"].split(".")[0]
-
-                acquire_start_time = time.time()
-                obj_path, obj_name, obj_res = get_loader().acquire_by_registry(
-                    asset_type=object_cfgs["asset_type"],
-                    file_name=filename,
-                    source=list(source) if source is not None else [],
-                    projects=list(projects) if projects is not None else [],
-                )
-                acquire_end_time = time.time()
-                total_acquire_time = acquire_end_time - acquire_start_time
-                print(f"Total Acquire Time: {total_acquire_time:.4f}s")
-
+            candidate = object_index.sample(
+                index_key,
+                max_size=max_size,
+                object_scale=object_scale,
+                exclude_paths=exclude_paths,
+                min_pool_size=min_pool_size,
+            )
+            if candidate is not None:
+                print(f"--- Index Hit: sampled '{cache_key}' from object index. Bypassing loader. ---")
+                obj_path = candidate["obj_path"]
+                obj_name = candidate["obj_name"]
+                obj_res = candidate["obj_res"]
+                category = candidate["category"]
+                merged_obj_files = candidate["variants"]
             else:
-                acquire_start_time = time.time()
-                obj_groups = FIXTURE_GROUPS if object_cfgs["asset_type"] == "fixtures" else OBJ_GROUPS
-                categories = [item for c in object_cfgs["obj_groups"] for item in obj_groups[c]]
-                obj_path, obj_name, obj_res = get_loader().acquire_by_registry(
-                    asset_type=object_cfgs["asset_type"],
-                    registry_name=categories,
-                    eqs=None if not object_cfgs["properties"] else object_cfgs["properties"],
-                    source=list(source) if source is not None else [],
-                    projects=list(projects) if projects is not None else [],
-                    contains=None,
-                    exclude_registry_name=[] if object_cfgs["exclude_obj_groups"] is None else object_cfgs["exclude_obj_groups"],
-                )
-                acquire_end_time = time.time()
-                total_acquire_time = acquire_end_time - acquire_start_time
-                print(f"Total Acquire Time: {total_acquire_time:.4f}s")
-            category = obj_res["registryName"]
+                if cache_key:
+                    print(f"--- First Run: '{cache_key}' not in cache. Using object_loader. ---")
+                from_loader = True
+
+                if version is not None:
+                    acquire_start_time = time.time()
+                    obj_path, obj_name, obj_res = get_loader().acquire_by_file_version(version)
+                    acquire_end_time = time.time()
+                    total_acquire_time = acquire_end_time - acquire_start_time
+                    print(f"Total Acquire Time: {total_acquire_time:.4f}s")
+
+                elif object_cfgs["asset_name"]:
+                    if "/" in object_cfgs["asset_name"]:
+                        filename = object_cfgs["asset_name"].split("/")[-1].split(".")[0]
+                    else:
+                        filename = object_cfgs["asset_name"].split(".")[0]
+
+                    acquire_start_time = time.time()
+                    obj_path, obj_name, obj_res = get_loader().acquire_by_registry(
+                        asset_type=object_cfgs["asset_type"],
+                        file_name=filename,
+                        source=list(source) if source is not None else [],
+                        projects=list(projects) if projects is not None else [],
+                    )
+                    acquire_end_time = time.time()
+                    total_acquire_time = acquire_end_time - acquire_start_time
+                    print(f"Total Acquire Time: {total_acquire_time:.4f}s")
+
+                else:
+                    acquire_start_time = time.time()
+                    obj_groups = FIXTURE_GROUPS if object_cfgs["asset_type"] == "fixtures" else OBJ_GROUPS
+                    categories = [item for c in object_cfgs["obj_groups"] for item in obj_groups[c]]
+                    obj_path, obj_name, obj_res = get_loader().acquire_by_registry(
+                        asset_type=object_cfgs["asset_type"],
+                        registry_name=categories,
+                        eqs=None if not object_cfgs["properties"] else object_cfgs["properties"],
+                        source=list(source) if source is not None else [],
+                        projects=list(projects) if projects is not None else [],
+                        contains=None,
+                        exclude_registry_name=[] if object_cfgs["exclude_obj_groups"] is None else object_cfgs["exclude_obj_groups"],
+                    )
+                    acquire_end_time = time.time()
+                    total_acquire_time = acquire_end_time - acquire_start_time
+                    print(f"Total Acquire Time: {total_acquire_time:.4f}s")
+                category = obj_res["registryName"]
+
+                base_obj_dir = os.path.dirname(obj_path)
+                pattern = os.path.join(base_obj_dir, f"{obj_name}_*/{obj_name}_*.usd")
+                merged_obj_files = glob.glob(pattern)
 
         obj_info = ObjInfo(
             name=obj_name,
@@ -226,11 +260,20 @@ def sample_kitchen_object(
         obj_info.set_attrs(obj_res["property"])
         obj_info.obj_path = model.obj_path
 
+        if from_loader:
+            # index the size without the caller scale, so that max_size can be checked for any object_scale
+            unscaled_size = np.array(model.size) / (1.0 if object_scale is None else np.array(object_scale))
+            object_index.add(index_key, obj_path, obj_name, category, obj_res, unscaled_size, merged_obj_files)
+            if min_pool_size == 1:
+                object_index.mark_complete(index_key)
+
         valid_object_sampled = True
         for i in range(3):
             if max_size[i] is not None and obj_info.size[i] > max_size[i]:
                 valid_object_sampled = False
-                OBJECT_INFO_CACHE.clear()
+                # only drop the slot of this object, other objects of the task keep their cached assets
+                if cache_key:
+                    OBJECT_INFO_CACHE.pop(cache_key, None)
                 break
 
         groups_containing_sampled_obj = []
@@ -239,7 +282,7 @@ def sample_kitchen_object(
                 groups_containing_sampled_obj.append(type)
         obj_info.groups_containing_sampled_obj = groups_containing_sampled_obj
 
-    if cache_key:
+    if cache_key and not from_slot_cache:
         OBJECT_INFO_CACHE[cache_key] = {
             'obj_path': obj_path,
             'obj_name': obj_name,
@@ -247,18 +290,14 @@ def sample_kitchen_object(
             'category': category,
         }
 
-        base_obj_dir = os.path.dirname(obj_path)
-        pattern = os.path.join(base_obj_dir, f"{obj_name}_*/{obj_name}_*.usd")
-        merged_obj_files = glob.glob(pattern)
-        if merged_obj_files:
-            for merged_obj_path in merged_obj_files:
-                merged_obj_name = os.path.basename(os.path.dirname(merged_obj_path))
-                OBJECT_INFO_CACHE[f"{cache_key}_{merged_obj_name.lower().split('_')[1]}"] = {
-                    'obj_path': merged_obj_path,
-                    'obj_name': merged_obj_name,
-                    'obj_res': obj_res,
-                    'category': category,
-                }
+        for merged_obj_path in merged_obj_files:
+            merged_obj_name = os.path.basename(os.path.dirname(merged_obj_path))
+            OBJECT_INFO_CACHE[f"{cache_key}_{merged_obj_name.lower().split('_')[1]}"] = {
+                'obj_path': merged_obj_path,
+                'obj_name': merged_obj_name,
+                'obj_res': obj_res,
+                'category': category,
+            }
 
     print(colored(f"Sampled {object_cfgs['task_name']}: {obj_info.name} from {obj_info.source}", "green"))
 
@@ -0,0 +1,281 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import sqlite3
+import time
+
+import numpy as np
+
+from ngine.utils.cache_utils import cache_enabled, get_cache_dir, key_hash, to_serializable
+
+# minimal number of candidates a query needs before sampling is served from the index only
+DEFAULT_MIN_POOL_SIZE = int(os.environ.get("NGINE_OBJECT_INDEX_MIN_POOL", 16))
+# probability of asking the loader for a new candidate while the pool of a query is not known to be complete
+DEFAULT_EXPLORE_PROB = float(os.environ.get("NGINE_OBJECT_INDEX_EXPLORE", 0.25))
+# minimal number of loader results in a row already in the index after which the pool is considered complete
+DEFAULT_SATURATION = int(os.environ.get("NGINE_OBJECT_INDEX_SATURATION", 8))
+# seconds a complete pool is trusted before the loader is asked again for new registry assets
+DEFAULT_COMPLETE_TTL = float(os.environ.get("NGINE_OBJECT_INDEX_TTL", 24 * 3600))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS candidates (
+    query_key TEXT NOT NULL,
+    obj_path TEXT NOT NULL,
+    obj_name TEXT NOT NULL,
+    category TEXT,
+    obj_res TEXT NOT NULL,
+    variants TEXT NOT NULL,
+    size_x REAL NOT NULL,
+    size_y REAL NOT NULL,
+    size_z REAL NOT NULL,
+    PRIMARY KEY (query_key, obj_path)
+);
+CREATE INDEX IF NOT EXISTS candidates_size ON candidates (query_key, size_x, size_y, size_z);
+CREATE TABLE IF NOT EXISTS queries (
+    query_key TEXT PRIMARY KEY,
+    known_streak INTEGER NOT NULL DEFAULT 0,
+    complete_at REAL
+);
+"""
+
+
+class ObjectSamplingIndex:
+    """
+    Node-wide index of sampled kitchen object candidates, stored in a sqlite database.
+
+    Every object acquired from the asset loader is recorded under its query key
+    (asset type, groups, properties, sources, projects, version) together with its unscaled size.
+    Once a query has enough candidates, sampling is served from the index with the max_size filter
+    applied in SQL, so env-server processes on the same node share the loader results and never
+    need to sample, reject and resample oversized objects.
+
+    The registry can only be sampled, not enumerated, so the pool of a query is grown while it may
+    be incomplete: a fraction explore_prob of the samples is left to the loader. When the loader
+    returns max(saturation, 3 * pool size) candidates in a row that are already indexed, the pool is
+    considered complete and served from the index only, until complete_ttl expires.
+
+    Args:
+        db_path (str): path of the sqlite file. Defaults to <cache dir>/object_index/index.sqlite
+
+        min_pool_size (int): minimal number of matching candidates before the loader is bypassed
+
+        explore_prob (float): probability of leaving a sample to the loader while the pool is incomplete
+
+        saturation (int): minimal number of known loader results in a row after which the pool is complete
+
+        complete_ttl (float): seconds a complete pool is served without asking the loader
+    """
+
+    def __init__(
+        self,
+        db_path=None,
+        min_pool_size=DEFAULT_MIN_POOL_SIZE,
+        explore_prob=DEFAULT_EXPLORE_PROB,
+        saturation=DEFAULT_SATURATION,
+        complete_ttl=DEFAULT_COMPLETE_TTL,
+    ):
+        self.enabled = cache_enabled("object_index")
+        self.db_path = db_path
+        self.min_pool_size = min_pool_size
+        self.explore_prob = explore_prob
+        self.saturation = saturation
+        self.complete_ttl = complete_ttl
+        self._conn = None
+        self._conn_pid = None
+
+    @property
+    def conn(self):
+        # sqlite connections must not be shared across forked env-server processes
+        if self._conn is None or self._conn_pid != os.getpid():
+            if self.db_path is None:
+                self.db_path = str(get_cache_dir("object_index") / "index.sqlite")
+            self._conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    @staticmethod
+    def make_key(object_cfgs, source=None, projects=None, version=None):
+        """
+        Build the query key of a sample_kitchen_object request
+        """
+        return key_hash(
+            object_cfgs["asset_type"],
+            sorted(object_cfgs.get("obj_groups") or []),
+            sorted(object_cfgs.get("exclude_obj_groups") or []),
+            object_cfgs.get("asset_name"),
+            to_serializable(object_cfgs.get("properties") or {}),
+            sorted(source) if source is not None else [],
+            sorted(projects) if projects is not None else [],
+            version,
+        )
+
+    @staticmethod
+    def _size_filter(max_size, object_scale):
+        scale = np.ones(3) if object_scale is None else np.broadcast_to(np.array(object_scale, dtype=float), (3,))
+        clauses, params = [], []
+        for axis, limit, s in zip(("size_x", "size_y", "size_z"), max_size, scale):
+            if limit is not None:
+                clauses.append(f"{axis} * ? <= ?")
+                params.extend([float(s), float(limit)])
+        return clauses, params
+
+    def query(self, query_key, max_size=(None, None, None), object_scale=None, exclude_paths=()):
+        """
+        Get all candidates of a query that fit into max_size once scaled by object_scale
+
+        Returns:
+            list[dict]: candidates with obj_path, obj_name, category, obj_res, variants and size
+        """
+        if not self.enabled:
+            return []
+        clauses, params = self._size_filter(max_size, object_scale)
+        sql = "SELECT obj_path, obj_name, category, obj_res, variants, size_x, size_y, size_z FROM candidates WHERE query_key = ?"
+        sql += "".join(f" AND {c}" for c in clauses)
+        sql += " ORDER BY obj_path"
+        rows = self.conn.execute(sql, [query_key] + params).fetchall()
+        candidates = []
+        for obj_path, obj_name, category, obj_res, variants, size_x, size_y, size_z in rows:
+            if obj_path in exclude_paths:
+                continue
+            candidates.append(dict(
+                obj_path=obj_path,
+                obj_name=obj_name,
+                category=category,
+                obj_res=json.loads(obj_res),
+                variants=json.loads(variants),
+                size=[size_x, size_y, size_z],
+            ))
+        return candidates
+
+    def sample(self, query_key, max_size=(None, None, None), object_scale=None, exclude_paths=(), min_pool_size=None, rng=None):
+        """
+        Sample a candidate from the index
+
+        Returns:
+            dict: sampled candidate, or None if the loader should be used, because the query does not
+            have enough candidates yet or this sample explores an incomplete pool
+        """
+        min_pool_size = self.min_pool_size if min_pool_size is None else min_pool_size
+        candidates = self.query(query_key, max_size, object_scale, exclude_paths)
+        stale = [c for c in candidates if not os.path.exists(c["obj_path"])]
+        if stale:
+            self.remove(query_key, [c["obj_path"] for c in stale])
+            candidates = [c for c in candidates if c not in stale]
+        if len(candidates) == 0 or len(candidates) < min_pool_size:
+            return None
+        rng = np.random if rng is None else rng
+        if not self.is_complete(query_key) and rng.random_sample() < self.explore_prob:
+            return None
+        return candidates[rng.randint(len(candidates))]
+
+    def is_complete(self, query_key):
+        """
+        Whether the pool of a query is known to hold every registry candidate
+        """
+        if not self.enabled:
+            return False
+        row = self.conn.execute("SELECT complete_at FROM queries WHERE query_key = ?", (query_key,)).fetchone()
+        return row is not None and row[0] is not None and time.time() - row[0] < self.complete_ttl
+
+    def mark_complete(self, query_key):
+        """
+        Mark the pool of a query as complete, e.g. for a pinned asset that only has a single candidate
+        """
+        if not self.enabled:
+            return
+        self.conn.execute(
+            "INSERT INTO queries (query_key, known_streak, complete_at) VALUES (?, 0, ?) "
+            "ON CONFLICT (query_key) DO UPDATE SET complete_at = excluded.complete_at",
+            (query_key, time.time()),
+        )
+
+    def add(self, query_key, obj_path, obj_name, category, obj_res, size, variants=()):
+        """
+        Record a candidate acquired from the asset loader
+
+        A candidate that is already indexed extends the streak of known loader results of the query,
+        the pool is marked complete once the streak is long enough. A new candidate resets it.
+
+        Args:
+            size (list): size of the object without the caller object_scale applied
+
+        Returns:
+            bool: whether the candidate was new to the index
+        """
+        if not self.enabled:
+            return False
+        conn = self.conn
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            known = conn.execute(
+                "SELECT 1 FROM candidates WHERE query_key = ? AND obj_path = ?", (query_key, obj_path)
+            ).fetchone() is not None
+            conn.execute(
+                "INSERT OR REPLACE INTO candidates VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    query_key,
+                    obj_path,
+                    obj_name,
+                    category,
+                    json.dumps(to_serializable(obj_res)),
+                    json.dumps(list(variants)),
+                    float(size[0]),
+                    float(size[1]),
+                    float(size[2]),
+                ),
+            )
+            row = conn.execute("SELECT known_streak FROM queries WHERE query_key = ?", (query_key,)).fetchone()
+            streak = (row[0] + 1 if row is not None else 1) if known else 0
+            complete_at = None
+            pool_size = conn.execute("SELECT COUNT(*) FROM candidates WHERE query_key = ?", (query_key,)).fetchone()[0]
+            # with n known candidates, a uniformly sampled registry missing one more candidate returns
+            # 3 * n known results in a row with a probability below 5%
+            if streak >= max(self.saturation, 3 * pool_size):
+                # a complete pool needs a new streak to be confirmed again once complete_ttl expired
+                streak, complete_at = 0, time.time()
+            conn.execute(
+                "INSERT INTO queries (query_key, known_streak, complete_at) VALUES (?, ?, ?) "
+                "ON CONFLICT (query_key) DO UPDATE SET known_streak = excluded.known_streak, "
+                "complete_at = CASE WHEN ? THEN complete_at ELSE excluded.complete_at END",
+                (query_key, streak, complete_at, known and complete_at is None),
+            )
+        return not known
+
+    def remove(self, query_key, obj_paths):
+        if not self.enabled:
+            return
+        self.conn.executemany(
+            "DELETE FROM candidates WHERE query_key = ? AND obj_path = ?",
+            [(query_key, p) for p in obj_paths],
+        )
+
+    def pool_size(self, query_key):
+        if not self.enabled:
+            return 0
+        return self.conn.execute("SELECT COUNT(*) FROM candidates WHERE query_key = ?", (query_key,)).fetchone()[0]
+
+
+_object_sampling_index = None
+
+
+def get_object_sampling_index():
+    global _object_sampling_index
+    if _object_sampling_index is None:
+        _object_sampling_index = ObjectSamplingIndex()
+    return _object_sampling_index
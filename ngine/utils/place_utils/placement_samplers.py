@@ -16,11 +16,10 @@ import collections
 from copy import copy
 
 import numpy as np
-from scipy.spatial.transform import Rotation as R
 
 from ngine.engine.models.fixtures import Fixture
 from ngine.utils.errors import SamplingError
-from ngine.utils.math_utils.transform_utils.numpy_impl import (
+from ngine.utils.math_utils.transform_utils.batched import (
     convert_quat,
     euler2mat,
     mat2quat,
@@ -401,10 +400,7 @@ class UniformRandomSampler(ObjectPositionSampler):
                         [self.x_range[0], self.y_range[1], 0],
                     ]
                 )
-                for i in range(len(region_points)):
-                    region_points[i][0:2] = rotate_2d_point(
-                        region_points[i][0:2], rot=reference_rot
-                    )
+                region_points[:, 0:2] = rotate_2d_point(region_points[:, 0:2], rot=reference_rot)
                 region_points += base_offset
 
                 # random rotation
@@ -414,15 +410,8 @@ class UniformRandomSampler(ObjectPositionSampler):
                     quat = quat_multiply(quat, obj.init_quat)
 
                 if obj_size is not None and quat is not None:
-                    rot = R.from_quat(quat)
-                    size_vecs = [
-                        [obj_size[0], 0, 0],
-                        [0, obj_size[1], 0],
-                    ]
-                    x_vec = rot.apply(size_vecs[0])
-                    y_vec = rot.apply(size_vecs[1])
-                    x_proj = abs(x_vec[0]) + abs(y_vec[0])
-                    y_proj = abs(x_vec[1]) + abs(y_vec[1])
+                    # xy extent of the rotated x / y size vectors
+                    x_proj, y_proj = np.abs(quat2mat(quat)[:2, :2]) @ np.asarray(obj_size[:2])
                     rotated_obj_size = (x_proj, y_proj, obj_size[2] if len(obj_size) > 2 else 0)
 
                 if self.ensure_object_boundary_in_range and \
@@ -0,0 +1,305 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import torch
+
+
+class AABBTree:
+    """
+    Bounding volume hierarchy over axis aligned boxes.
+
+    The tree is built top-down by median split along the longest axis of the node bounds and stored in
+    flat arrays. Queries are batched: all query boxes descend the tree together, one vectorized overlap
+    test per level, so a batch of M footprints costs O(M log N) box tests instead of O(M N).
+
+    Overlap is strict on every axis (touching boxes do not overlap), matching env_utils.check_overlap.
+
+    Args:
+        mins (np.ndarray): (N, 3) box min corners
+
+        maxs (np.ndarray): (N, 3) box max corners
+
+        leaf_size (int): maximum number of boxes per leaf
+    """
+
+    def __init__(self, mins, maxs, leaf_size=4):
+        self.mins = np.asarray(mins, dtype=np.float64).reshape(-1, 3)
+        self.maxs = np.asarray(maxs, dtype=np.float64).reshape(-1, 3)
+        assert self.mins.shape == self.maxs.shape
+        self.leaf_size = max(int(leaf_size), 1)
+        self._build()
+
+    def __len__(self):
+        return len(self.mins)
+
+    def _build(self):
+        num_boxes = len(self.mins)
+        self.order = np.arange(num_boxes)
+        node_min, node_max, left, right, start, count = [], [], [], [], [], []
+        if num_boxes == 0:
+            self.node_min = np.zeros((0, 3))
+            self.node_max = np.zeros((0, 3))
+            self.node_left = self.node_right = self.node_start = self.node_count = np.zeros(0, dtype=np.int64)
+            return
+
+        centers = (self.mins + self.maxs) / 2
+
+        def new_node(lo, hi):
+            idx = self.order[lo:hi]
+            node_min.append(self.mins[idx].min(axis=0))
+            node_max.append(self.maxs[idx].max(axis=0))
+            left.append(-1)
+            right.append(-1)
+            start.append(lo)
+            count.append(hi - lo)
+            return len(node_min) - 1
+
+        stack = [(new_node(0, num_boxes), 0, num_boxes)]
+        while stack:
+            node, lo, hi = stack.pop()
+            if hi - lo <= self.leaf_size:
+                continue
+            idx = self.order[lo:hi]
+            axis = int(np.argmax(node_max[node] - node_min[node]))
+            # stable sort so that equal centers keep their input order
+            self.order[lo:hi] = idx[np.argsort(centers[idx, axis], kind="stable")]
+            mid = (lo + hi) // 2
+            left[node] = new_node(lo, mid)
+            right[node] = new_node(mid, hi)
+            count[node] = 0
+            stack.append((left[node], lo, mid))
+            stack.append((right[node], mid, hi))
+
+        self.node_min = np.array(node_min)
+        self.node_max = np.array(node_max)
+        self.node_left = np.array(left, dtype=np.int64)
+        self.node_right = np.array(right, dtype=np.int64)
+        self.node_start = np.array(start, dtype=np.int64)
+        self.node_count = np.array(count, dtype=np.int64)
+
+    @staticmethod
+    def _overlap(qmin, qmax, bmin, bmax):
+        return np.all((qmin < bmax) & (qmax > bmin), axis=-1)
+
+    def first_overlaps(self, qmins, qmaxs):
+        """
+        Find, for every query box, the lowest index of the boxes it overlaps
+
+        Args:
+            qmins (np.ndarray): (M, 3) query min corners
+
+            qmaxs (np.ndarray): (M, 3) query max corners
+
+        Returns:
+            np.ndarray: (M,) index of the first overlapping box (in input order), -1 if none
+        """
+        qmins = np.asarray(qmins, dtype=np.float64).reshape(-1, 3)
+        qmaxs = np.asarray(qmaxs, dtype=np.float64).reshape(-1, 3)
+        num_queries = len(qmins)
+        sentinel = len(self.mins)
+        result = np.full(num_queries, sentinel, dtype=np.int64)
+        if sentinel == 0 or num_queries == 0:
+            return np.full(num_queries, -1, dtype=np.int64)
+
+        queries = np.arange(num_queries)
+        nodes = np.zeros(num_queries, dtype=np.int64)
+        while len(queries) > 0:
+            hit = self._overlap(qmins[queries], qmaxs[queries], self.node_min[nodes], self.node_max[nodes])
+            queries, nodes = queries[hit], nodes[hit]
+
+            is_leaf = self.node_count[nodes] > 0
+            leaf_queries, leaf_nodes = queries[is_leaf], nodes[is_leaf]
+            if len(leaf_queries) > 0:
+                counts = self.node_count[leaf_nodes]
+                offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+                boxes = self.order[np.repeat(self.node_start[leaf_nodes], counts) + offsets]
+                box_queries = np.repeat(leaf_queries, counts)
+                box_hit = self._overlap(qmins[box_queries], qmaxs[box_queries], self.mins[boxes], self.maxs[boxes])
+                np.minimum.at(result, box_queries[box_hit], boxes[box_hit])
+
+            queries, nodes = queries[~is_leaf], nodes[~is_leaf]
+            queries = np.concatenate([queries, queries])
+            nodes = np.concatenate([self.node_left[nodes], self.node_right[nodes]])
+
+        result[result == sentinel] = -1
+        return result
+
+    def query(self, qmin, qmax):
+        """
+        Get the indices of all boxes overlapping a single query box
+        """
+        qmin = np.asarray(qmin, dtype=np.float64)
+        qmax = np.asarray(qmax, dtype=np.float64)
+        found = []
+        stack = [0] if len(self.node_min) > 0 else []
+        while stack:
+            node = stack.pop()
+            if not self._overlap(qmin, qmax, self.node_min[node], self.node_max[node]):
+                continue
+            if self.node_count[node] > 0:
+                boxes = self.order[self.node_start[node]:self.node_start[node] + self.node_count[node]]
+                found.extend(boxes[self._overlap(qmin, qmax, self.mins[boxes], self.maxs[boxes])].tolist())
+            else:
+                stack.append(self.node_left[node])
+                stack.append(self.node_right[node])
+        return sorted(found)
+
+
+class SceneSpatialIndex:
+    """
+    Obstacle boxes of a scene for robot base placement checks.
+
+    Holds the scene bounds and a AABBTree over the world boxes of the scene prim children (except wall
+    layouts) followed by the fixture bodies, all expressed in the frame of env_0 like check_overlap does.
+    A signature of the obstacle transforms is kept, so the index is only rebuilt when something moved.
+
+    Args:
+        scene_min / scene_max (np.ndarray): scene bounds, None if the stage has no scene prim
+
+        mins / maxs (np.ndarray): (N, 3) obstacle boxes
+
+        names (list): obstacle prim paths / fixture body names, for logging
+
+        signature: value of scene_index_signature() at build time
+
+        scene_prim_path (str): path of the scene prim, so that later lookups skip the stage traversal
+    """
+
+    def __init__(self, scene_min, scene_max, mins, maxs, names, signature=None, scene_prim_path=None):
+        self.scene_prim_path = scene_prim_path
+        self.scene_min = scene_min
+        self.scene_max = scene_max
+        self.tree = AABBTree(mins, maxs)
+        self.names = names
+        self.signature = signature
+
+    def out_of_scene(self, qmins, qmaxs):
+        """(M,) mask of footprints not strictly inside the scene bounds in x and y"""
+        qmins = np.asarray(qmins).reshape(-1, 3)
+        qmaxs = np.asarray(qmaxs).reshape(-1, 3)
+        if self.scene_min is None:
+            return np.zeros(len(qmins), dtype=bool)
+        inside = (
+            (self.scene_min[0] < qmins[:, 0]) & (self.scene_max[0] > qmaxs[:, 0])
+            & (self.scene_min[1] < qmins[:, 1]) & (self.scene_max[1] > qmaxs[:, 1])
+        )
+        return ~inside
+
+
+def _find_scene_prim(stage):
+    for prim in stage.Traverse():
+        if prim.IsValid() and prim.GetName().lower() == "scene":
+            return prim
+    return None
+
+
+def scene_index_signature(env, scene_prim):
+    """
+    Cheap fingerprint of everything the index depends on: the local transforms of the scene prim
+    children and the body positions of the fixture articulations.
+    """
+    from pxr import UsdGeom
+
+    transforms = []
+    if scene_prim is not None:
+        for prim in scene_prim.GetChildren():
+            xformable = UsdGeom.Xformable(prim)
+            matrix = xformable.GetLocalTransformation() if xformable else None
+            transforms.append((str(prim.GetPath()), None if matrix is None else tuple(float(v) for row in matrix for v in row)))
+    bodies = []
+    for fixtr in env.cfg.isaaclab_arena_env.task.fixture_refs.values():
+        if fixtr.name in env.scene.articulations:
+            data = env.scene.articulations[fixtr.name].data
+            bodies.append(torch.cat([data.body_com_pos_w, data.body_com_quat_w], dim=-1).clone())
+    return transforms, bodies
+
+
+def _same_signature(sig_a, sig_b):
+    if sig_a is None or sig_b is None:
+        return False
+    transforms_a, bodies_a = sig_a
+    transforms_b, bodies_b = sig_b
+    if transforms_a != transforms_b or len(bodies_a) != len(bodies_b):
+        return False
+    return all(a.shape == b.shape and torch.equal(a, b) for a, b in zip(bodies_a, bodies_b))
+
+
+def build_scene_spatial_index(env, scene_prim=None, signature=None):
+    """
+    Compute the obstacle boxes of the scene once and build the SceneSpatialIndex.
+    """
+    from pxr import Usd, UsdGeom
+
+    if scene_prim is None:
+        scene_prim = _find_scene_prim(env.sim.stage)
+    env_origin = env.scene.env_origins[0].cpu().numpy()
+    # a single bbox cache shared by all prims of this build
+    bbox_cache = UsdGeom.BBoxCache(Usd.TimeCode.Default(), [UsdGeom.Tokens.default_])
+
+    scene_min = scene_max = None
+    mins, maxs, names = [], [], []
+    if scene_prim is not None:
+        scene_bbox = bbox_cache.ComputeWorldBound(scene_prim).ComputeAlignedBox()
+        scene_min = np.array(scene_bbox.GetMin()) - env_origin
+        scene_max = np.array(scene_bbox.GetMax()) - env_origin
+        for obs_prim in scene_prim.GetChildren():
+            if not obs_prim.IsValid() or obs_prim.GetAttribute("type").Get() == "WallLayout":
+                continue
+            obs_bbox = bbox_cache.ComputeWorldBound(obs_prim).ComputeAlignedBox()
+            if obs_bbox.IsEmpty():
+                continue
+            mins.append(np.array(obs_bbox.GetMin()) - env_origin)
+            maxs.append(np.array(obs_bbox.GetMax()) - env_origin)
+            names.append(str(obs_prim.GetPath()))
+
+    for fixtr in env.cfg.isaaclab_arena_env.task.fixture_refs.values():
+        for body_name, body_bbox in fixtr.get_body_bbox(env).items():
+            mins.append(np.array(body_bbox.GetMin()) - env_origin)
+            maxs.append(np.array(body_bbox.GetMax()) - env_origin)
+            names.append(f"{fixtr.name}/{body_name}")
+
+    if signature is None:
+        signature = scene_index_signature(env, scene_prim)
+    return SceneSpatialIndex(
+        scene_min,
+        scene_max,
+        np.array(mins).reshape(-1, 3),
+        np.array(maxs).reshape(-1, 3),
+        names,
+        signature=signature,
+        scene_prim_path=str(scene_prim.GetPath()) if scene_prim is not None else None,
+    )
+
+
+def get_scene_spatial_index(env):
+    """
+    Get the spatial index of the env scene, rebuilding it only if the obstacles moved since the last build.
+    """
+    index = getattr(env, "_ngine_scene_spatial_index", None)
+    scene_prim = None
+    if index is not None and index.scene_prim_path is not None:
+        scene_prim = env.sim.stage.GetPrimAtPath(index.scene_prim_path)
+    if scene_prim is None or not scene_prim.IsValid():
+        scene_prim = _find_scene_prim(env.sim.stage)
+    signature = scene_index_signature(env, scene_prim)
+    if index is None or not _same_signature(index.signature, signature):
+        index = build_scene_spatial_index(env, scene_prim, signature=signature)
+        env._ngine_scene_spatial_index = index
+    return index
+
+
+def invalidate_scene_spatial_index(env):
+    """Drop the cached spatial index, e.g. after a new scene layout was loaded."""
+    env._ngine_scene_spatial_index = None
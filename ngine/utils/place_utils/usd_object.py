@@ -15,6 +15,8 @@
 import numpy as np
 
 import ngine.utils.math_utils.transform_utils.numpy_impl as T
+from ngine.utils.cache_utils import file_hash
+from ngine.utils.usd_metadata_cache import get_usd_metadata_cache
 from ngine.utils.usd_utils import OpenUsd
 from ngine.utils.usd_utils import OpenUsdWrapper as Usd
 
@@ -35,6 +37,7 @@ class USDObject():
         rgb_replace=None,
         asset_type="objects",
         is_deformable=False,
+        metadata=None,
     ):
         # get scale in x, y, z
         if isinstance(object_scale, float):
@@ -57,14 +60,9 @@ class USDObject():
         self.rotate_upright = rotate_upright
         self.init_quat = np.array([0, 0, 0, 1])  # xyzw
         self._regions = dict()
-        usd = None
+        if self.rotate_upright:
+            self.init_quat = np.array([0.5, 0.5, 0.5, 0.5])
         if prim is None:
-            usd = Usd(self.obj_path)
-            self._setup_region_dict(usd)
-            # remove fixed joints
-            self.remove_fixed_joint(usd)
-            usd.set_contact_force_threshold(name=self.name, contact_force_threshold=0.0)
-            # get rgb_replace
             if rgb_replace is not None:
                 if isinstance(rgb_replace, tuple) or isinstance(rgb_replace, list):
                     assert len(rgb_replace) == 3
@@ -74,26 +72,70 @@ class USDObject():
                 else:
                     raise Exception("got invalid rgb_replace: {}".format(rgb_replace))
                 rgb_replace = np.array(rgb_replace)
-                usd.set_rgb(rgb=rgb_replace)
-                rgb_str = "_".join([f"{scale:.2f}" for scale in rgb_replace])
-                self.obj_path = self.obj_path.replace(".usd", f"_rgb_{rgb_str}.usd")
-            usd.export(self.obj_path)
+            self._load_from_asset(rgb_replace)
         else:
-            usd = prim
-            self._setup_region_dict(usd, fxtr2obj=True)
+            # fixture prims live in the scene stage, the caller owns their metadata
+            raw_regions = metadata["regions"] if metadata is not None else self._parse_regions(prim, fxtr2obj=True)
+            self.metadata = {"regions": raw_regions}
+            self._setup_region_dict(raw_regions)
 
-        # try:
-        #     del usd
-        #     gc.collect()
-        # except Exception as e:
-        #     print(f"warning: failed to clean usd: {e}")
+    def _load_from_asset(self, rgb_replace=None):
+        """
+        Load regions from the metadata cache, falling back to parsing the USD file.
+        The modified copy (fixed joints removed, contact threshold, rgb) is only exported once.
+        """
+        cache = get_usd_metadata_cache()
+        src_path = self.obj_path
+        variant = ""
+        out_path = src_path
+        if rgb_replace is not None:
+            variant = "_".join([f"{scale:.2f}" for scale in rgb_replace])
+            out_path = src_path.replace(".usd", f"_rgb_{variant}.usd")
 
-    def _setup_region_dict(self, usd, fxtr2obj=False):
-        if self.rotate_upright:
-            self.init_quat = np.array([0.5, 0.5, 0.5, 0.5])
+        entry = cache.get(src_path)
+        if entry is not None and cache.export_is_valid(entry, variant):
+            self.metadata = entry
+            self.obj_path = entry["exports"][variant]["path"]
+            self._setup_region_dict(entry["regions"])
+            return
+
+        usd = Usd(src_path)
+        raw_regions = self._parse_regions(usd)
+        # remove fixed joints
+        removed_joints = self.remove_fixed_joint(usd)
+        usd.set_contact_force_threshold(name=self.name, contact_force_threshold=0.0)
+        if rgb_replace is not None:
+            usd.set_rgb(rgb=rgb_replace)
+        usd.export(out_path)
+        self.obj_path = out_path
+
+        exports = dict(entry.get("exports", {})) if entry is not None else {}
+        exports[variant] = {"path": out_path, "hash": file_hash(out_path)}
+        self.metadata = {
+            "regions": raw_regions,
+            "extent": self._regions_extent(raw_regions),
+            "fixed_joints": removed_joints if entry is None else entry.get("fixed_joints", removed_joints),
+            "joints": [str(j.GetPrimPath()) for j in usd.get_all_joints()],
+            "exports": exports,
+        }
+        if out_path == src_path:
+            # the exported file overwrote the source, record it under its new content hash
+            # (processing is idempotent, so the exported file is its own modified copy)
+            cache.put(out_path, self.metadata)
+        else:
+            cache.put(src_path, self.metadata)
+        self._setup_region_dict(raw_regions)
+
+    def _parse_regions(self, usd, fxtr2obj=False):
+        """
+        Parse the unscaled reg_* regions of the object
+
+        Returns:
+            dict: region name -> {reg_halfsize, reg_pos, reg_offset}
+        """
+        raw_regions = dict()
         reg_bboxes = usd.get_prim_by_prefix("reg_", only_xform=False) if not fxtr2obj else OpenUsd.get_prim_by_prefix(usd, "reg_", only_xform=False)
         for reg_bbox in reg_bboxes:
-            reg_dict = dict()
             if fxtr2obj:
                 reg_pos, _, reg_scale = OpenUsd.get_prim_pos_rot_in_world(reg_bbox)
                 reg_halfsize = np.array(reg_scale)
@@ -117,7 +159,29 @@ class USDObject():
                 reg_pos = np.array([0, 0, 0])
             else:
                 reg_pos = np.array(reg_pos)
-            reg_halfsize = reg_halfsize * self.object_scale
+            prefix = reg_bbox.GetName().replace("reg_", "")
+            raw_regions[prefix] = {
+                "reg_halfsize": np.broadcast_to(reg_halfsize, (3,)).tolist(),
+                "reg_pos": reg_pos.tolist(),
+                "reg_offset": reg_offset.tolist(),
+            }
+        return raw_regions
+
+    @staticmethod
+    def _regions_extent(raw_regions):
+        """Unscaled axis-aligned extent [min, max] covering all regions"""
+        if not raw_regions:
+            return None
+        mins = [np.array(r["reg_pos"]) - np.abs(r["reg_halfsize"]) for r in raw_regions.values()]
+        maxs = [np.array(r["reg_pos"]) + np.abs(r["reg_halfsize"]) for r in raw_regions.values()]
+        return [np.min(mins, axis=0).tolist(), np.max(maxs, axis=0).tolist()]
+
+    def _setup_region_dict(self, raw_regions):
+        for prefix, raw_region in raw_regions.items():
+            reg_dict = dict()
+            reg_pos = np.array(raw_region["reg_pos"])
+            reg_offset = np.array(raw_region["reg_offset"])
+            reg_halfsize = np.array(raw_region["reg_halfsize"]) * self.object_scale
             p0 = reg_pos + [-reg_halfsize[0], -reg_halfsize[1], -reg_halfsize[2]]
             px = reg_pos + [reg_halfsize[0], -reg_halfsize[1], -reg_halfsize[2]]
             py = reg_pos + [-reg_halfsize[0], reg_halfsize[1], -reg_halfsize[2]]
@@ -129,18 +193,21 @@ class USDObject():
             reg_dict["reg_halfsize"] = reg_halfsize
             reg_dict["reg_pos"] = reg_pos
             reg_dict["reg_offset"] = reg_offset
-            prefix = reg_bbox.GetName().replace("reg_", "")
             self._regions[prefix] = reg_dict
 
     def remove_fixed_joint(self, usd):
         """
         Remove fixed joints that are bound to the world (body0 is empty).
+
+        Returns:
+            list: prim paths of the removed joints
         """
         # Get all PhysicsFixedJoint prims in the scene
         fixed_joints = usd.get_prim_by_types(["PhysicsFixedJoint"])
 
         from pxr import UsdPhysics
 
+        removed_joints = []
         for fix_joint_prim in fixed_joints:
             if fix_joint_prim and fix_joint_prim.IsValid():
                 # Check if body0 is connected to world (empty targets)
@@ -149,7 +216,9 @@ class USDObject():
                     body0_rel = joint.GetBody0Rel()
                     if body0_rel and len(body0_rel.GetTargets()) == 0:
                         # This joint is bound to world, remove it
+                        removed_joints.append(str(fix_joint_prim.GetPrimPath()))
                         usd.stage.RemovePrim(str(fix_joint_prim.GetPrimPath()))
+        return removed_joints
 
     @property
     def bounded_region_name(self):
@@ -0,0 +1,202 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Per-stage index of prim names and types backing the OpenUsd.get_prim_by_* lookups.
+
+The index holds every prim of the stage in pre-order (the order of Usd.PrimRange and of the recursive
+GetAllChildren walks), so the prims under a start prim are one contiguous slice and a lookup is a bisect in
+a name / type bucket instead of a traversal. A Usd.Notice.ObjectsChanged listener marks the index stale
+when prims are resynced (added, removed, retyped, (de)activated, ...), the next lookup rebuilds it.
+
+Lookups starting at an instance proxy, or with NGINE_PRIM_INDEX=0, fall back to traversals.
+"""
+
+import os
+from bisect import bisect_left
+from collections import OrderedDict
+
+from pxr import Tf, Usd
+
+# stages indexed at the same time, the least recently used index is dropped first
+MAX_INDEXED_STAGES = 16
+
+_INDEXES = OrderedDict()
+
+
+def prim_index_enabled():
+    return os.environ.get("NGINE_PRIM_INDEX", "1") != "0"
+
+
+class PrimIndex:
+    """
+    Name / lowercase name / type index of all prims of a stage.
+
+    Args:
+        stage (Usd.Stage): indexed stage
+    """
+
+    def __init__(self, stage):
+        self.stage = stage
+        self.num_builds = 0
+        self._stale = True
+        self._listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, self._on_objects_changed, stage)
+
+    def _on_objects_changed(self, notice, sender):
+        if not self._stale and any(path.IsPrimPath() or path.IsAbsoluteRootPath() for path in notice.GetResyncedPaths()):
+            self._stale = True
+
+    def _build(self):
+        self._prims = []
+        self._names = []
+        self._types = []
+        self._ends = []
+        # deepest ancestor-or-self not matching Usd.PrimDefaultPredicate, -1 if none
+        self._blockers = []
+        self._index_of = {}
+        self._by_name = {}
+        self._by_lower = {}
+        self._by_type = {}
+        self._matches = {}
+
+        blockers = [-1]
+        prim_range = iter(Usd.PrimRange.PreAndPostVisit(self.stage.GetPseudoRoot(), Usd.PrimAllPrimsPredicate))
+        for prim in prim_range:
+            if prim_range.IsPostVisit():
+                self._ends[self._index_of[prim.GetPath()]] = len(self._prims)
+                blockers.pop()
+                continue
+            i = len(self._prims)
+            name, type_name = prim.GetName(), str(prim.GetTypeName())
+            default = prim.IsActive() and prim.IsLoaded() and prim.IsDefined() and not prim.IsAbstract()
+            blocker = blockers[-1] if default else i
+            blockers.append(blocker)
+            self._prims.append(prim)
+            self._names.append(name)
+            self._types.append(type_name)
+            self._ends.append(i + 1)
+            self._blockers.append(blocker)
+            self._index_of[prim.GetPath()] = i
+            self._by_name.setdefault(name, []).append(i)
+            self._by_lower.setdefault(name.lower(), []).append(i)
+            self._by_type.setdefault(type_name, []).append(i)
+        self._stale = False
+        self.num_builds += 1
+
+    def _start(self, prim):
+        """Index of the start prim, None if the lookup has to fall back to a traversal."""
+        if self._stale:
+            self._build()
+        if prim.IsInstanceProxy():
+            return None
+        return self._index_of.get(prim.GetPath())
+
+    def _match(self, kind, pattern):
+        """Sorted indices of the prims whose name matches, memoized until the next rebuild."""
+        key = (kind, pattern)
+        if key not in self._matches:
+            if kind == "prefix":
+                buckets = [v for k, v in self._by_lower.items() if k.startswith(pattern)]
+            elif kind == "suffix":
+                buckets = [v for k, v in self._by_lower.items() if k.endswith(pattern)]
+            else:
+                buckets = [v for k, v in self._by_name.items() if pattern in k]
+            self._matches[key] = sorted(i for bucket in buckets for i in bucket)
+        return self._matches[key]
+
+    def _select(self, start, candidates, type_name=None, default_predicate=False, limit=None):
+        lo = bisect_left(candidates, start)
+        hi = bisect_left(candidates, self._ends[start], lo)
+        result = []
+        for i in candidates[lo:hi]:
+            if type_name is not None and self._types[i] != type_name:
+                continue
+            if default_predicate and self._blockers[i] >= start:
+                continue
+            result.append(self._prims[i])
+            if limit is not None and len(result) >= limit:
+                break
+        return result
+
+    def find_by_name(self, prim, name, case_sensitive=False, type_name=None, default_predicate=False, only_first=False):
+        """
+        Prims at or below prim named name, None if the index cannot answer.
+
+        Args:
+            default_predicate (bool): only the prims visited by Usd.PrimRange(prim) (active, loaded, defined,
+                non abstract), otherwise all prims like the GetAllChildren walks
+        """
+        start = self._start(prim)
+        if start is None:
+            return None
+        candidates = self._by_name.get(name, []) if case_sensitive else self._by_lower.get(name.lower(), [])
+        return self._select(start, candidates, type_name, default_predicate, 1 if only_first else None)
+
+    def find_by_prefix(self, prim, prefix, type_name=None):
+        """Prims at or below prim whose lowercase name starts with the lowercase prefix."""
+        start = self._start(prim)
+        if start is None:
+            return None
+        return self._select(start, self._match("prefix", prefix.lower()), type_name)
+
+    def find_by_suffix(self, prim, suffix, type_name=None):
+        """Prims at or below prim whose lowercase name ends with the lowercase suffix."""
+        start = self._start(prim)
+        if start is None:
+            return None
+        return self._select(start, self._match("suffix", suffix.lower()), type_name)
+
+    def find_by_subname(self, prim, subname, type_name=None):
+        """Prims at or below prim whose name contains subname (case sensitive)."""
+        start = self._start(prim)
+        if start is None:
+            return None
+        return self._select(start, self._match("subname", subname), type_name)
+
+    def find_by_types(self, prim, include_types=None, exclude_types=None):
+        """Prims at or below prim with a type in include_types (all if None) and not in exclude_types."""
+        start = self._start(prim)
+        if start is None:
+            return None
+        if include_types is None:
+            candidates = range(start, self._ends[start])
+        else:
+            candidates = sorted(i for t in set(include_types) for i in self._by_type.get(t, []))
+        exclude_types = () if exclude_types is None else exclude_types
+        return [self._prims[i] for i in self._select_range(start, candidates) if self._types[i] not in exclude_types]
+
+    def _select_range(self, start, candidates):
+        if isinstance(candidates, range):
+            return candidates
+        lo = bisect_left(candidates, start)
+        return candidates[lo:bisect_left(candidates, self._ends[start], lo)]
+
+
+def get_prim_index(stage):
+    """
+    Get the prim index of a stage, None when disabled (NGINE_PRIM_INDEX=0).
+    """
+    if not prim_index_enabled() or stage is None:
+        return None
+    for key in [key for key, index in _INDEXES.items() if index.stage.expired]:
+        del _INDEXES[key]
+    key = hash(stage)
+    index = _INDEXES.get(key)
+    if index is None:
+        index = _INDEXES[key] = PrimIndex(stage)
+        while len(_INDEXES) > MAX_INDEXED_STAGES:
+            _INDEXES.popitem(last=False)
+    else:
+        _INDEXES.move_to_end(key)
+    return index
+
@@ -12,13 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import atexit
+import bisect
 import cProfile
 import datetime
+import functools
+import json
 import os
 import pstats
+import threading
 import time
 from collections import deque, defaultdict
 from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
 # all active profilers
@@ -189,20 +195,263 @@ def debug_print(*args, **kwargs):
 DEBUG_FRAME_ANALYZER = DebugFrameAnalyzer()
 
 
-def tictoc(name):
-    def wrapper(func):
-        return func
-
-        def wrapper_inner(*args, **kwargs):
-            start_time = datetime.now()
-            result = func(*args, **kwargs)
-            end_time = datetime.now()
-            print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')}: {name}{args[1:]} took {(end_time - start_time).total_seconds()*1000:.2f}ms")
-            return result
-        return wrapper_inner
-    if isinstance(name, str):
+# ============================================================================
+# Span Telemetry
+# ============================================================================
+
+# upper bounds of the histogram buckets, in seconds
+SPAN_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class SpanStats:
+    """Statistics of one span name: cumulative histogram plus a ring buffer of the most recent durations."""
+
+    def __init__(self, window: int = 1024):
+        self.window = window
+        self.recent = [0.0] * window
+        self.bucket_counts = [0] * (len(SPAN_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, duration: float):
+        self.recent[self.count % self.window] = duration
+        self.bucket_counts[bisect.bisect_left(SPAN_BUCKETS, duration)] += 1
+        self.count += 1
+        self.total += duration
+        if duration > self.max:
+            self.max = duration
+
+    def summary(self) -> dict:
+        """Count and total over the whole run, percentiles over the ring buffer, in milliseconds."""
+        recent = sorted(self.recent[:min(self.count, self.window)])
+        if len(recent) == 0:
+            return {"count": 0}
+
+        def percentile(q):
+            return 1000.0 * recent[min(int(q * len(recent)), len(recent) - 1)]
+
+        return {
+            "count": self.count,
+            "total_ms": 1000.0 * self.total,
+            "mean_ms": 1000.0 * self.total / self.count,
+            "p50_ms": percentile(0.5),
+            "p99_ms": percentile(0.99),
+            "max_ms": 1000.0 * self.max,
+        }
+
+
+class Telemetry:
+    """Collector of the spans recorded by :func:`span` and :func:`traced`.
+
+    Enabled with ``NGINE_TELEMETRY=1``. Each span updates the statistics of its name and is appended to a ring
+    buffer of trace events, exported with :meth:`export_chrome_trace` (open in chrome://tracing or Perfetto).
+    :meth:`prometheus_text` renders the histograms in the Prometheus text format, :meth:`serve_prometheus`
+    exposes them on an HTTP endpoint.
+
+    Env vars read at import:
+        - ``NGINE_TELEMETRY=1``: enable the collection.
+        - ``NGINE_TELEMETRY_TRACE=<path>``: write the Chrome trace to ``path`` at exit.
+        - ``NGINE_TELEMETRY_PORT=<port>``: serve the Prometheus metrics on ``port``.
+        - ``NGINE_TELEMETRY_HOST=<host>``: interface the metrics are served on, ``127.0.0.1`` by default.
+    """
+
+    def __init__(self, enabled: bool = False, window: int = 1024, max_events: int = 100_000):
+        self.enabled = enabled
+        self.window = window
+        self.stats: dict[str, SpanStats] = {}
+        self.events = deque(maxlen=max_events)
+        self.thread_names = {}
+        self.origin_ns = time.perf_counter_ns()
+        self._lock = threading.Lock()
+        self._server = None
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def clear(self):
+        with self._lock:
+            self.stats.clear()
+            self.events.clear()
+
+    def record(self, name: str, start_ns: int, end_ns: int, args: dict | None = None):
+        tid = threading.get_ident()
+        with self._lock:
+            stats = self.stats.get(name)
+            if stats is None:
+                stats = self.stats[name] = SpanStats(self.window)
+            stats.add((end_ns - start_ns) * 1e-9)
+            self.events.append((name, start_ns, end_ns, tid, args))
+            if tid not in self.thread_names:
+                self.thread_names[tid] = threading.current_thread().name
+
+    def summary(self) -> dict:
+        with self._lock:
+            return {name: stats.summary() for name, stats in sorted(self.stats.items())}
+
+    def print_summary(self):
+        print("\n=== Span Telemetry ===")
+        for name, summary in self.summary().items():
+            if summary["count"] > 0:
+                print(
+                    f"{name}: count={summary['count']}, mean={summary['mean_ms']:.3f}ms, p50={summary['p50_ms']:.3f}ms, "
+                    f"p99={summary['p99_ms']:.3f}ms, max={summary['max_ms']:.3f}ms"
+                )
+
+    def chrome_trace(self) -> dict:
+        """The recorded spans in the Chrome trace event format."""
+        pid = os.getpid()
+        with self._lock:
+            events = list(self.events)
+            thread_names = dict(self.thread_names)
+        trace_events = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for tid, name in thread_names.items()
+        ]
+        for name, start_ns, end_ns, tid, args in events:
+            event = {
+                "name": name,
+                "cat": name.split("/", 1)[0],
+                "ph": "X",
+                "ts": (start_ns - self.origin_ns) / 1000.0,
+                "dur": (end_ns - start_ns) / 1000.0,
+                "pid": pid,
+                "tid": tid,
+            }
+            if args:
+                event["args"] = {k: v if isinstance(v, (int, float, str, bool)) else str(v) for k, v in args.items()}
+            trace_events.append(event)
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: str | Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f)
+        return path
+
+    def prometheus_text(self, prefix: str = "ngine_span_duration_seconds") -> str:
+        lines = [
+            f"# HELP {prefix} Duration of the instrumented ngine stages.",
+            f"# TYPE {prefix} histogram",
+        ]
+        with self._lock:
+            items = [(name, list(stats.bucket_counts), stats.total, stats.count) for name, stats in sorted(self.stats.items())]
+        for name, bucket_counts, total, count in items:
+            label = name.replace("\\", "\\\\").replace('"', '\\"')
+            cumulative = 0
+            for bound, bucket_count in zip(SPAN_BUCKETS, bucket_counts):
+                cumulative += bucket_count
+                lines.append(f'{prefix}_bucket{{span="{label}",le="{bound}"}} {cumulative}')
+            lines.append(f'{prefix}_bucket{{span="{label}",le="+Inf"}} {count}')
+            lines.append(f'{prefix}_sum{{span="{label}"}} {total}')
+            lines.append(f'{prefix}_count{{span="{label}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+    def serve_prometheus(self, port: int = 9464, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """Serve :meth:`prometheus_text` on ``http://host:port/metrics`` from a daemon thread.
+
+        Only local clients can connect by default, pass ``host="0.0.0.0"`` to expose the metrics on every interface.
+        """
+        if self._server is not None:
+            return self._server
+        telemetry = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):  # noqa: N802
+                if self.path.rstrip("/") not in ("", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = telemetry.prometheus_text().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):  # noqa: A002
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), MetricsHandler)
+        threading.Thread(target=self._server.serve_forever, name="telemetry_prometheus", daemon=True).start()
+        print(f"Serving telemetry metrics on http://{host}:{port}/metrics")
+        return self._server
+
+
+TELEMETRY = Telemetry(enabled=os.environ.get("NGINE_TELEMETRY") == "1")
+
+if TELEMETRY.enabled and os.environ.get("NGINE_TELEMETRY_TRACE"):
+    atexit.register(TELEMETRY.export_chrome_trace, os.environ["NGINE_TELEMETRY_TRACE"])
+if TELEMETRY.enabled and os.environ.get("NGINE_TELEMETRY_PORT"):
+    TELEMETRY.serve_prometheus(int(os.environ["NGINE_TELEMETRY_PORT"]), os.environ.get("NGINE_TELEMETRY_HOST", "127.0.0.1"))
+
+
+class _Span:
+    __slots__ = ("name", "args", "start_ns")
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        TELEMETRY.record(self.name, self.start_ns, time.perf_counter_ns(), self.args)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name: str, **args):
+    """Time a block as a span named ``name``, e.g. ``with span("env/step"): ...``.
+
+    When telemetry is disabled this returns a shared no-op context manager, the call and the ``with`` block still
+    cost about 0.3-0.45us on CPython 3.11. Paths called many times per step (e.g. the checkers) test
+    ``TELEMETRY.enabled`` first and only enter the span when it is set, which brings the disabled cost down to an
+    attribute check (see the telemetry_span perf cases). Keyword arguments are attached to the trace event.
+    """
+    if not TELEMETRY.enabled:
+        return _NULL_SPAN
+    return _Span(name, args or None)
+
+
+def traced(name=None):
+    """Decorator recording every call of the function as a span, named ``name`` or the function qualname."""
+    def decorator(func):
+        span_name = name if isinstance(name, str) else func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not TELEMETRY.enabled:
+                return func(*args, **kwargs)
+            start_ns = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                TELEMETRY.record(span_name, start_ns, time.perf_counter_ns())
         return wrapper
-    else:
-        func = name
-        name = func.__name__
-        return wrapper(func=func)
+    if callable(name):
+        return decorator(name)
+    return decorator
+
+
+def tictoc(name):
+    """Record the calls of the decorated function as spans, see :func:`traced`."""
+    return traced(name)
+
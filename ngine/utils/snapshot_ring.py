@@ -0,0 +1,288 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Bounded ring of in-memory scene snapshots for instant teleop rewinds.
+
+A snapshot is taken every ``interval`` recorded frames and holds the articulation, rigid object, action and action
+term state as device-resident copies. Leaves equal to the ones of the previous snapshot are not copied again,
+the snapshots share them (copy-on-write: a leaf is only copied once it changed), so static objects cost nothing
+per snapshot. Rewinding writes a snapshot straight back to the scene, without an environment reset and without
+indexing the recorder episode data.
+
+Set NGINE_SNAPSHOT_RING=0 to disable the ring, NGINE_SNAPSHOT_INTERVAL and NGINE_SNAPSHOT_CAPACITY to tune it.
+"""
+
+import copy
+import os
+import sys
+from collections import deque
+
+import numpy as np
+
+DEFAULT_INTERVAL = 5
+DEFAULT_CAPACITY = 64
+
+
+def snapshot_ring_enabled():
+    return os.environ.get("NGINE_SNAPSHOT_RING", "1") != "0"
+
+
+def _is_torch_tensor(value):
+    torch = sys.modules.get("torch")
+    return torch is not None and isinstance(value, torch.Tensor)
+
+
+def _leaf_equal(a, b):
+    if _is_torch_tensor(a) or _is_torch_tensor(b):
+        if not (_is_torch_tensor(a) and _is_torch_tensor(b)):
+            return False
+        return a.shape == b.shape and a.dtype == b.dtype and a.device == b.device and bool(sys.modules["torch"].equal(a, b))
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        if not (isinstance(a, np.ndarray) and isinstance(b, np.ndarray)):
+            return False
+        return a.shape == b.shape and a.dtype == b.dtype and np.array_equal(a, b)
+    try:
+        return type(a) is type(b) and bool(a == b)
+    except Exception:
+        return False
+
+
+def _leaves_equal(pairs):
+    """
+    :func:`_leaf_equal` of each (a, b) pair, the tensor comparisons of a device are stacked and read back at once
+    instead of synchronizing the device once per leaf.
+    """
+    equal = [False] * len(pairs)
+    pending = {}
+    for i, (a, b) in enumerate(pairs):
+        if _is_torch_tensor(a) and _is_torch_tensor(b):
+            if a.shape == b.shape and a.dtype == b.dtype and a.device == b.device:
+                pending.setdefault(a.device, []).append((i, (a == b).all()))
+        else:
+            equal[i] = _leaf_equal(a, b)
+    for results in pending.values():
+        values = sys.modules["torch"].stack([result for _, result in results]).tolist()
+        for (i, _), value in zip(results, values):
+            equal[i] = value
+    return equal
+
+
+def _leaf_copy(value):
+    if _is_torch_tensor(value):
+        return value.detach().clone()
+    if isinstance(value, np.ndarray):
+        return value.copy()
+    return copy.deepcopy(value)
+
+
+def _leaf_nbytes(value):
+    if _is_torch_tensor(value):
+        return value.numel() * value.element_size()
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    return 0
+
+
+def flatten_state(state, prefix=()):
+    """Flattens a nested state dict into {key path tuple: leaf}."""
+    flat = {}
+    for key, value in state.items():
+        path = prefix + (key,)
+        if isinstance(value, dict):
+            flat.update(flatten_state(value, path))
+        else:
+            flat[path] = value
+    return flat
+
+
+def unflatten_state(flat):
+    state = {}
+    for path, value in flat.items():
+        node = state
+        for key in path[:-1]:
+            node = node.setdefault(key, {})
+        node[path[-1]] = value
+    return state
+
+
+class Snapshot:
+    """
+    One snapshot of the ring.
+
+    Args:
+        frame (int): recorder frame the captured state belongs to
+        leaves (dict): {key path: leaf}, leaves may be shared with neighbouring snapshots
+        copied (int): bytes copied for this snapshot, the shared leaves excluded
+    """
+
+    __slots__ = ("frame", "leaves", "copied")
+
+    def __init__(self, frame, leaves, copied):
+        self.frame = frame
+        self.leaves = leaves
+        self.copied = copied
+
+    def state(self):
+        """Returns a private nested copy of the snapshot state, safe to hand to the simulation."""
+        return unflatten_state({path: _leaf_copy(value) for path, value in self.leaves.items()})
+
+
+class SceneSnapshotRing:
+    """
+    Bounded ring of scene snapshots.
+
+    Args:
+        provider: object with ``capture() -> nested dict`` and ``restore(state)``, see :class:`EnvStateProvider`
+        interval (int): recorder frames between two snapshots
+        capacity (int): snapshots kept, the oldest one is dropped first
+    """
+
+    def __init__(self, provider, interval=DEFAULT_INTERVAL, capacity=DEFAULT_CAPACITY):
+        if interval < 1 or capacity < 1:
+            raise ValueError(f"interval and capacity must be positive, got {interval} and {capacity}")
+        self.provider = provider
+        self.interval = interval
+        self.snapshots = deque(maxlen=capacity)
+
+    def __len__(self):
+        return len(self.snapshots)
+
+    @property
+    def frames(self):
+        return [snapshot.frame for snapshot in self.snapshots]
+
+    def clear(self):
+        self.snapshots.clear()
+
+    def _drop_from(self, frame):
+        while self.snapshots and self.snapshots[-1].frame >= frame:
+            self.snapshots.pop()
+
+    def take(self, frame):
+        """Captures the current state as the snapshot of ``frame``, snapshots at or after ``frame`` are replaced."""
+        # a frame at or before the newest snapshot means the timeline was rewound or the episode reset
+        self._drop_from(frame)
+        previous = self.snapshots[-1].leaves if self.snapshots else {}
+        captured = flatten_state(self.provider.capture())
+        shared = [path for path in captured if previous.get(path) is not None]
+        unchanged = {
+            path for path, equal in zip(shared, _leaves_equal([(previous[path], captured[path]) for path in shared]))
+            if equal
+        }
+        leaves = {}
+        copied = 0
+        for path, value in captured.items():
+            if path in unchanged:
+                leaves[path] = previous[path]
+            else:
+                leaves[path] = _leaf_copy(value)
+                copied += _leaf_nbytes(value)
+        snapshot = Snapshot(frame, leaves, copied)
+        self.snapshots.append(snapshot)
+        return snapshot
+
+    def maybe_take(self, frame):
+        """Takes a snapshot when ``frame`` is on the interval grid, returns it or None."""
+        if frame < 0 or frame % self.interval:
+            return None
+        return self.take(frame)
+
+    def latest_at_or_before(self, frame):
+        for snapshot in reversed(self.snapshots):
+            if snapshot.frame <= frame:
+                return snapshot
+        return None
+
+    def rewind(self, frame):
+        """
+        Restores the newest snapshot at or before ``frame``, the snapshots after it are dropped.
+
+        Returns:
+            int or None: frame of the restored snapshot, None if no snapshot is old enough
+        """
+        snapshot = self.latest_at_or_before(frame)
+        if snapshot is None:
+            return None
+        self.provider.restore(snapshot.state())
+        self._drop_from(snapshot.frame + 1)
+        return snapshot.frame
+
+    def memory_stats(self):
+        unique = {}
+        for snapshot in self.snapshots:
+            for value in snapshot.leaves.values():
+                unique[id(value)] = value
+        return {
+            "snapshots": len(self.snapshots),
+            "stored_bytes": sum(_leaf_nbytes(value) for value in unique.values()),
+            "full_copy_bytes": sum(_leaf_nbytes(value) for snapshot in self.snapshots for value in snapshot.leaves.values()),
+        }
+
+
+class EnvStateProvider:
+    """
+    Scene state provider of a ManagerBasedRLEnv.
+
+    The scene part is :meth:`InteractiveScene.get_state` (articulations, deformable and rigid objects, relative to the
+    environment origins), the actions part the current and previous action buffers of the action manager and the
+    action terms part the ``save_check_point`` payloads of the terms supporting it.
+    """
+
+    def __init__(self, env):
+        self.env = env
+
+    def capture(self):
+        action_manager = self.env.action_manager
+        state = {
+            "scene": self.env.scene.get_state(is_relative=True),
+            "actions": {"action": action_manager._action, "prev_action": action_manager._prev_action},
+            "action_terms": {},
+        }
+        for name, term in action_manager._terms.items():
+            if hasattr(term, "save_check_point"):
+                state["action_terms"][name] = term.save_check_point()
+        return state
+
+    def restore(self, state):
+        env = self.env
+        # written straight to the scene, _reset_idx would reset the managers and the episode buffers
+        env.scene.reset_to(state["scene"], None, is_relative=True)
+        env.sim.forward()
+        actions = state.get("actions", {})
+        if "action" in actions:
+            env.action_manager._action.copy_(actions["action"])
+        if "prev_action" in actions:
+            env.action_manager._prev_action.copy_(actions["prev_action"])
+        for name, term in env.action_manager._terms.items():
+            if hasattr(term, "load_check_point") and name in state.get("action_terms", {}):
+                term.load_check_point(state["action_terms"][name])
+        env.obs_buf = env.observation_manager.compute(update_history=True)
+        if hasattr(env.sim, "render"):
+            env.sim.render()
+
+
+def get_snapshot_ring(env):
+    """Returns the snapshot ring attached to ``env``, creating it on first use, None when disabled."""
+    if not snapshot_ring_enabled():
+        return None
+    ring = getattr(env, "_snapshot_ring", None)
+    if ring is None:
+        ring = SceneSnapshotRing(
+            EnvStateProvider(env),
+            interval=int(os.environ.get("NGINE_SNAPSHOT_INTERVAL", DEFAULT_INTERVAL)),
+            capacity=int(os.environ.get("NGINE_SNAPSHOT_CAPACITY", DEFAULT_CAPACITY)),
+        )
+        env._snapshot_ring = ring
+    return ring
+
@@ -0,0 +1,404 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compressed stereo streaming for the VR viewer.
+
+The pipeline has three stages, each of them only ever works on the freshest frame:
+
+- :class:`StereoFrameBuffer`: latest-frame double buffer in shared memory. The simulation publishes side by side
+  stereo frames with their capture timestamp, readers always get the most recent complete frame.
+- :class:`StereoStreamEncoder`: background thread encoding the left / right halves of the newest frame as JPEG
+  or H.264 tiles. Frames published while it was busy are skipped.
+- :class:`LatestFrameMailbox`: single slot between the encoder and the viewer. An encoded frame the viewer did
+  not pick up yet is replaced by the next one, so a slow viewer never falls behind.
+
+Every frame carries its capture, encode and delivery timestamps, :class:`LatencyTracker` aggregates the stage
+and end-to-end latencies.
+
+Example:
+    >>> frames = StereoFrameBuffer.create((720, 2560, 3))
+    >>> encoder = StereoStreamEncoder(StereoFrameBuffer(frames.name), codec="jpeg").start()
+    >>> frames.publish(image)
+    >>> encoded = encoder.latest(timeout=0.1)
+    >>> encoder.ack(encoded)
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+
+import numpy as np
+
+STEREO_STREAM_CODECS = ("jpeg", "h264")
+
+
+class StereoFrameBuffer:
+    """Latest-frame double buffer of stereo images in shared memory.
+
+    The header holds the number of started and completed publishes and the capture time of both slots. Publish
+    ``n`` writes slot ``n % 2`` while readers copy the slot of the last completed publish, a copy is valid when
+    no publish started writing into that slot meanwhile (seqlock). Single writer, any number of readers.
+    """
+
+    _HEADER = 8  # int64: write_seq, seq, capture_ns slot 0, capture_ns slot 1, height, width, channels, reserved
+
+    def __init__(self, name: str, shape: tuple[int, int, int] | None = None, create: bool = False):
+        if create:
+            size = 8 * self._HEADER + 2 * int(np.prod(shape))
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.header = np.ndarray((self._HEADER,), dtype=np.int64, buffer=self.shm.buf)
+        if create:
+            self.header[:] = 0
+            self.header[4:7] = shape
+        self.shape = tuple(int(x) for x in self.header[4:7])
+        self.slots = np.ndarray((2,) + self.shape, dtype=np.uint8, buffer=self.shm.buf, offset=8 * self._HEADER)
+        self.owner = create
+
+    @classmethod
+    def create(cls, shape: tuple[int, int, int], name: str | None = None) -> "StereoFrameBuffer":
+        return cls(name, shape, create=True)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    @property
+    def seq(self) -> int:
+        """Number of completed publishes."""
+        return int(self.header[1])
+
+    def publish(self, image: np.ndarray, capture_ns: int | None = None) -> int:
+        """Publish a side by side stereo image of :attr:`shape` and return its sequence number."""
+        seq = int(self.header[1]) + 1
+        slot = seq % 2
+        self.header[0] = seq
+        self.slots[slot] = image
+        self.header[2 + slot] = capture_ns if capture_ns is not None else time.perf_counter_ns()
+        self.header[1] = seq
+        return seq
+
+    def read_latest(self, out: np.ndarray, after_seq: int = 0, retries: int = 3) -> tuple[int, int] | None:
+        """Copy the latest frame into ``out`` if it is newer than ``after_seq``.
+
+        Returns:
+            ``(seq, capture_ns)`` of the copied frame, None when there is no newer frame.
+        """
+        for _ in range(retries):
+            seq = int(self.header[1])
+            if seq <= after_seq:
+                return None
+            slot = seq % 2
+            capture_ns = int(self.header[2 + slot])
+            np.copyto(out, self.slots[slot])
+            # the slot is rewritten by publish seq + 2, which bumps write_seq before touching it
+            if int(self.header[0]) < seq + 2:
+                return seq, capture_ns
+        return None
+
+    def close(self):
+        del self.header, self.slots
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+@dataclass
+class EncodedFrame:
+    seq: int
+    index: int  # position in the encoded stream, a gap means the consumer missed a frame
+    codec: str
+    tiles: list[bytes]
+    shape: tuple[int, int, int]
+    capture_ns: int
+    read_ns: int
+    encode_ns: int
+    keyframe: bool = True
+    skipped: int = 0  # frames published since the previous encoded frame and never encoded
+
+
+class JpegTileEncoder:
+    codec = "jpeg"
+    # every JPEG frame decodes on its own
+    last_keyframe = True
+
+    def __init__(self, quality: int = 80):
+        import cv2
+
+        self._cv2 = cv2
+        self.params = [int(cv2.IMWRITE_JPEG_QUALITY), int(quality)]
+
+    def encode(self, tiles: list[np.ndarray], keyframe: bool = False) -> list[bytes]:
+        encoded = []
+        for tile in tiles:
+            # the frames are RGB, opencv expects BGR
+            ok, buffer = self._cv2.imencode(".jpg", tile[..., ::-1], self.params)
+            if not ok:
+                raise RuntimeError("JPEG encoding failed")
+            encoded.append(buffer.tobytes())
+        return encoded
+
+
+class H264TileEncoder:
+    """Low latency H.264 (no B-frames, zerolatency tuning) with one encoder per tile.
+
+    Each call returns the Annex B packets of one frame per tile. A consumer that missed a frame has to wait for
+    a keyframe, the encoder forces one whenever ``keyframe=True`` and every ``gop`` frames. ``last_keyframe``
+    tells from the packet flags whether the last encoded frame is a keyframe in every tile.
+    """
+    codec = "h264"
+
+    def __init__(self, quality: int = 80, fps: int = 60, gop: int = 60, preset: str = "ultrafast"):
+        try:
+            import av
+        except ImportError as e:
+            raise ImportError("H.264 streaming requires PyAV, install it with `pip install ngine[stream]`.") from e
+
+        self._av = av
+        self.fps = fps
+        self.gop = gop
+        # map the 0-100 quality of the jpeg encoder to the x264 crf range
+        self.crf = int(round(51 - 0.4 * max(0, min(100, quality))))
+        self.preset = preset
+        self.contexts = None
+        self.frame_index = 0
+        self.last_keyframe = False
+
+    def _open(self, tiles: list[np.ndarray]):
+        self.contexts = []
+        for tile in tiles:
+            context = self._av.CodecContext.create("libx264", "w")
+            context.width = tile.shape[1] - tile.shape[1] % 2
+            context.height = tile.shape[0] - tile.shape[0] % 2
+            context.pix_fmt = "yuv420p"
+            context.framerate = self.fps
+            context.gop_size = self.gop
+            context.max_b_frames = 0
+            context.options = {"preset": self.preset, "tune": "zerolatency", "crf": str(self.crf)}
+            self.contexts.append(context)
+
+    def encode(self, tiles: list[np.ndarray], keyframe: bool = False) -> list[bytes]:
+        if self.contexts is None:
+            self._open(tiles)
+            keyframe = True
+        encoded = []
+        all_keyframes = True
+        for context, tile in zip(self.contexts, tiles):
+            frame = self._av.VideoFrame.from_ndarray(
+                np.ascontiguousarray(tile[:context.height, :context.width]), format="rgb24"
+            )
+            frame.pts = self.frame_index
+            if keyframe:
+                frame.pict_type = self._av.video.frame.PictureType.I
+            packets = context.encode(frame)
+            all_keyframes = all_keyframes and bool(packets) and all(packet.is_keyframe for packet in packets)
+            encoded.append(b"".join(bytes(packet) for packet in packets))
+        self.frame_index += 1
+        self.last_keyframe = all_keyframes
+        return encoded
+
+
+def make_tile_encoder(codec: str, **kwargs):
+    if codec == "jpeg":
+        return JpegTileEncoder(**kwargs)
+    if codec == "h264":
+        return H264TileEncoder(**kwargs)
+    raise ValueError(f"Unknown stereo stream codec '{codec}', available: {STEREO_STREAM_CODECS}")
+
+
+class LatencyTracker:
+    """Rolling latencies (ms) per stage, thread-safe."""
+
+    def __init__(self, window: int = 1000):
+        self.window = window
+        self.samples: dict[str, deque] = {}
+        self.counts: dict[str, int] = {}
+        self.lock = threading.Lock()
+
+    def record(self, stage: str, ms: float):
+        with self.lock:
+            if stage not in self.samples:
+                self.samples[stage] = deque(maxlen=self.window)
+                self.counts[stage] = 0
+            self.samples[stage].append(ms)
+            self.counts[stage] += 1
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        with self.lock:
+            samples = {stage: np.asarray(values) for stage, values in self.samples.items()}
+            counts = dict(self.counts)
+        return {
+            stage: {
+                "count": counts[stage],
+                "mean": float(values.mean()),
+                "p50": float(np.percentile(values, 50)),
+                "p99": float(np.percentile(values, 99)),
+                "max": float(values.max()),
+            }
+            for stage, values in samples.items() if len(values) > 0
+        }
+
+
+class LatestFrameMailbox:
+    """Single-slot mailbox: :meth:`put` replaces an item which was not taken yet and counts it as dropped."""
+
+    def __init__(self):
+        self.item = None
+        self.dropped = 0
+        self.cond = threading.Condition()
+
+    def put(self, item) -> bool:
+        """Returns True when an untaken item was replaced."""
+        with self.cond:
+            replaced = self.item is not None
+            self.dropped += int(replaced)
+            self.item = item
+            self.cond.notify_all()
+        return replaced
+
+    def pending(self) -> bool:
+        """Whether an item is waiting, the next :meth:`put` replaces it unless it is taken first."""
+        with self.cond:
+            return self.item is not None
+
+    def take(self, timeout: float | None = None):
+        with self.cond:
+            if self.item is None and not self.cond.wait_for(lambda: self.item is not None, timeout=timeout):
+                return None
+            item, self.item = self.item, None
+            return item
+
+
+class StereoStreamEncoder:
+    """Encode the freshest frame of a :class:`StereoFrameBuffer` on a background thread.
+
+    Args:
+        frame_buffer: Source of the side by side stereo frames.
+        codec: ``"jpeg"`` or ``"h264"``.
+        quality: 0-100 quality, the JPEG quality or mapped to the H.264 crf.
+        max_fps: Upper bound of the encoded frame rate.
+        tiles: Number of horizontal tiles the frame is split into, 2 for a side by side stereo frame.
+        latency: Tracker of the stage latencies, a new one by default.
+        encoder_kwargs: Extra arguments of the tile encoder.
+
+    Latency stages (ms): ``capture_to_read`` (waiting in the frame buffer), ``encode``, ``encode_to_deliver``
+    (waiting in the mailbox) and ``end_to_end`` from capture to :meth:`ack`.
+    """
+
+    def __init__(self, frame_buffer: StereoFrameBuffer, codec: str = "jpeg", quality: int = 80, max_fps: float = 60.0,
+                 tiles: int = 2, latency: LatencyTracker | None = None, **encoder_kwargs):
+        if codec not in STEREO_STREAM_CODECS:
+            raise ValueError(f"Unknown stereo stream codec '{codec}', available: {STEREO_STREAM_CODECS}")
+        if frame_buffer.shape[1] % tiles != 0:
+            raise ValueError(f"Frame width {frame_buffer.shape[1]} is not divisible into {tiles} tiles")
+        self.frame_buffer = frame_buffer
+        self.codec = codec
+        self.encoder = make_tile_encoder(codec, quality=quality, **encoder_kwargs)
+        self.min_interval = 1.0 / max_fps if max_fps else 0.0
+        self.num_tiles = tiles
+        self.latency = latency or LatencyTracker()
+        self.mailbox = LatestFrameMailbox()
+        self.frame = np.empty(frame_buffer.shape, dtype=np.uint8)
+        self.last_seq = 0
+        self.num_encoded = 0
+        self.num_skipped = 0
+        self.num_delivered = 0
+        self.error = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self) -> "StereoStreamEncoder":
+        self._thread = threading.Thread(target=self._run, name="StereoStreamEncoder", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def latest(self, timeout: float | None = None) -> EncodedFrame | None:
+        """The freshest encoded frame not delivered yet, None on timeout."""
+        if self.error is not None:
+            raise RuntimeError(f"The stereo stream encoder failed: {self.error}") from self.error
+        return self.mailbox.take(timeout)
+
+    def ack(self, frame: EncodedFrame, deliver_ns: int | None = None):
+        """Record the delivery of a frame to the viewer."""
+        deliver_ns = deliver_ns if deliver_ns is not None else time.perf_counter_ns()
+        self.num_delivered += 1
+        self.latency.record("encode_to_deliver", (deliver_ns - frame.encode_ns) / 1e6)
+        self.latency.record("end_to_end", (deliver_ns - frame.capture_ns) / 1e6)
+
+    def stats(self) -> dict:
+        return {
+            "codec": self.codec,
+            "published": self.frame_buffer.seq,
+            "encoded": self.num_encoded,
+            "delivered": self.num_delivered,
+            "skipped": self.num_skipped,
+            "dropped": self.mailbox.dropped,
+            "latency_ms": self.latency.summary(),
+        }
+
+    def encode_frame(self, keyframe: bool = False) -> EncodedFrame | None:
+        """Encode the newest published frame, None when nothing was published since the last call."""
+        result = self.frame_buffer.read_latest(self.frame, after_seq=self.last_seq)
+        if result is None:
+            return None
+        seq, capture_ns = result
+        read_ns = time.perf_counter_ns()
+        skipped = seq - self.last_seq - 1 if self.last_seq > 0 else 0
+        width = self.frame.shape[1] // self.num_tiles
+        tiles = [self.frame[:, i * width:(i + 1) * width] for i in range(self.num_tiles)]
+        encoded = self.encoder.encode(tiles, keyframe=keyframe)
+        encode_ns = time.perf_counter_ns()
+        self.last_seq = seq
+        self.num_encoded += 1
+        self.num_skipped += skipped
+        self.latency.record("capture_to_read", (read_ns - capture_ns) / 1e6)
+        self.latency.record("encode", (encode_ns - read_ns) / 1e6)
+        return EncodedFrame(
+            seq=seq, index=self.num_encoded - 1, codec=self.codec, tiles=encoded, shape=self.frame_buffer.shape, capture_ns=capture_ns,
+            read_ns=read_ns, encode_ns=encode_ns, keyframe=self.encoder.last_keyframe, skipped=skipped,
+        )
+
+    """
+    Helper functions.
+    """
+
+    def _run(self):
+        next_time = time.perf_counter()
+        try:
+            while not self._stop.is_set():
+                # a frame still in the mailbox is replaced by this one and never reaches the viewer, this frame
+                # has to be a keyframe for the decoder to resync (at worst the viewer takes it meanwhile and
+                # gets an extra keyframe)
+                frame = self.encode_frame(keyframe=self.codec == "h264" and self.mailbox.pending())
+                if frame is None:
+                    # nothing new, poll the frame buffer again shortly
+                    self._stop.wait(0.001)
+                    continue
+                self.mailbox.put(frame)
+                next_time = max(next_time + self.min_interval, time.perf_counter())
+                self._stop.wait(max(0.0, next_time - time.perf_counter()))
+        except Exception as e:
+            self.error = e
+            with self.mailbox.cond:
+                self.mailbox.cond.notify_all()
+
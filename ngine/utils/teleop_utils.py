@@ -20,6 +20,7 @@ This module provides utility functions for teleoperation operations including:
 - Enhanced reset functionality with data preservation
 - Episode data manipulation
 - State management utilities
+- Instant rewinds from the in-memory snapshot ring
 """
 
 import copy
@@ -35,6 +36,8 @@ from termcolor import colored
 from tqdm import tqdm
 from urllib3.util.retry import Retry
 
+from ngine.utils.snapshot_ring import get_snapshot_ring
+
 
 def download_file(url, output_dir, file_name="input_dataset.hdf5"):
     """
@@ -606,13 +609,30 @@ def get_state_by_frame(episode_data, frame_index: int):
     return index_node(data["states"])
 
 
-def quick_rewind(env, frames_back=10):
+def _reset_rewind_state(env, frame_index, teleop_interface=None):
+    """
+    Reset the per-frame state kept outside of the scene after rewinding to ``frame_index``.
+
+    The checkers and the contact queues compare against previous frames which were dropped, so they start over,
+    and the VR rollback action points at the restored frame.
+    """
+    task = env.cfg.isaaclab_arena_env.task
+    for checker in task.checkers:
+        checker.reset()
+    for contact_queue in task.contact_queues:
+        contact_queue.clear()
+    if teleop_interface is not None and hasattr(teleop_interface, "set_checkpoint_frame_idx"):
+        teleop_interface.set_checkpoint_frame_idx(frame_index)
+
+
+def quick_rewind(env, frames_back=10, teleop_interface=None):
     """
     Quick rewind function that goes back a specified number of frames.
 
     Args:
         env: The environment
         frames_back: Number of frames to go back (default: 10)
+        teleop_interface: The teleop device, its checkpoint frame is moved to the restored frame
 
     Returns:
         bool: True if successful, False otherwise
@@ -632,12 +652,52 @@ def quick_rewind(env, frames_back=10):
         target_frame = max(0, current_frame - frames_back)
         print(f"[quick_rewind] Going back from frame {current_frame} to frame {target_frame}")
 
-        return reset_and_keep_to(env, episode_data, target_frame, None)
+        ring = get_snapshot_ring(env)
+        if ring is not None:
+            restored_frame = ring.rewind(target_frame)
+            if restored_frame is not None:
+                for env_id, ep_data in episodes.items():
+                    ep_data._data = _truncate_episode_data(ep_data._data, restored_frame + 1)
+                    update_checkpoint_to_hdf5(env, restored_frame, env_id)
+                _reset_rewind_state(env, restored_frame, teleop_interface)
+                print(f"[quick_rewind] Restored in-memory snapshot of frame {restored_frame}")
+                return True
+            print(f"[quick_rewind] No snapshot at or before frame {target_frame}, resetting from episode data")
+
+        if not reset_and_keep_to(env, episode_data, target_frame, None):
+            return False
+        _reset_rewind_state(env, target_frame, teleop_interface)
+        return True
     except Exception as e:
         print(f"[quick_rewind] Error: {e}")
         return False
 
 
+def record_snapshot(env):
+    """
+    Feed the rewind snapshot ring, to be called after each env.step.
+
+    The recorder stores the post-step states, so the current scene state is the one of the latest recorded frame.
+
+    Args:
+        env: The environment
+
+    Returns:
+        int or None: Frame index of the snapshot taken at this step, None if none was taken
+    """
+    ring = get_snapshot_ring(env)
+    if ring is None:
+        return None
+    episodes = getattr(env.recorder_manager, "_episodes", None)
+    if not isinstance(episodes, dict) or 0 not in episodes:
+        return None
+    frame_index = _get_current_frame_index(episodes[0])
+    if frame_index is None:
+        return None
+    snapshot = ring.maybe_take(frame_index)
+    return None if snapshot is None else snapshot.frame
+
+
 def load_checkpoints_from_hdf5(episode_data):
     """
     Load all checkpoints from HDF5 episode data.
@@ -862,6 +922,15 @@ def get_raw_input_by_frame(episode_data, step_index):
 
         raw_input_data = episode_data._data["obs"]["raw_input"]
 
+        # Packed VR frames
+        if isinstance(raw_input_data.get("frame"), torch.Tensor):
+            from ngine.utils.vr_frames import unpack_vr_frame
+
+            if step_index >= len(raw_input_data["frame"]):
+                print(f"Warning: Step index {step_index} out of range for raw input frames")
+                return None
+            return unpack_vr_frame(raw_input_data["frame"][step_index].reshape(-1).cpu().numpy())
+
         # Load each raw input component
         for key, tensor_data in raw_input_data.items():
             if isinstance(tensor_data, torch.Tensor):
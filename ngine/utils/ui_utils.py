@@ -344,6 +344,61 @@ def setup_cameras(env, viewports=None):
     return viewports
 
 
+def _author_attribute(prim_spec, name, type_name, value, variability=None):
+    from pxr import Sdf
+
+    variability = Sdf.VariabilityVarying if variability is None else variability
+    attr = Sdf.AttributeSpec(prim_spec, name, type_name, variability)
+    if value is not None:
+        attr.default = value
+    return attr
+
+
+def _author_cylinder_with_xform(layer, xform_path, cylinder_name, cfg):
+    """
+    Authors the xform, cylinder and preview material specs of one helper directly in ``layer``.
+
+    Sdf level authoring can be batched in one ``Sdf.ChangeBlock``, the stage then recomposes once for all helpers.
+    """
+    from pxr import Sdf, Gf
+
+    def define(path, type_name):
+        spec = Sdf.CreatePrimInLayer(layer, path)
+        spec.specifier = Sdf.SpecifierDef
+        spec.typeName = type_name
+        return spec
+
+    xform = define(xform_path, "Xform")
+    # a double3 translate op holding the float precision values, as AddTranslateOp().Set(Gf.Vec3f(...)) authors it
+    _author_attribute(xform, "xformOp:translate", Sdf.ValueTypeNames.Double3, Gf.Vec3d(Gf.Vec3f(*cfg["translation"])))
+    _author_attribute(xform, "xformOp:orient", Sdf.ValueTypeNames.Quatf, Gf.Quatf(*cfg["orientation"]))
+    _author_attribute(
+        xform, "xformOpOrder", Sdf.ValueTypeNames.TokenArray, ["xformOp:translate", "xformOp:orient"], Sdf.VariabilityUniform
+    )
+
+    cyl_path = xform_path.AppendChild(cylinder_name)
+    cyl = define(cyl_path, "Cylinder")
+    _author_attribute(cyl, "radius", Sdf.ValueTypeNames.Double, cfg["spawn"].radius)
+    _author_attribute(cyl, "height", Sdf.ValueTypeNames.Double, cfg["spawn"].height)
+    _author_attribute(cyl, "axis", Sdf.ValueTypeNames.Token, cfg["spawn"].axis, Sdf.VariabilityUniform)
+
+    material_path = xform_path.AppendChild(f"{cylinder_name}_Material")
+    material = define(material_path, "Material")
+    shader_path = material_path.AppendChild("Shader")
+    shader = define(shader_path, "Shader")
+    _author_attribute(shader, "info:id", Sdf.ValueTypeNames.Token, "UsdPreviewSurface", Sdf.VariabilityUniform)
+    _author_attribute(shader, "inputs:diffuseColor", Sdf.ValueTypeNames.Color3f, Gf.Vec3f(*cfg["color"]))
+    _author_attribute(shader, "inputs:roughness", Sdf.ValueTypeNames.Float, 0.4)
+    _author_attribute(shader, "inputs:metallic", Sdf.ValueTypeNames.Float, 0.0)
+    _author_attribute(shader, "outputs:surface", Sdf.ValueTypeNames.Token, None)
+    surface = _author_attribute(material, "outputs:surface", Sdf.ValueTypeNames.Token, None)
+    surface.connectionPathList.explicitItems = [shader_path.AppendProperty("outputs:surface")]
+
+    cyl.SetInfo("apiSchemas", Sdf.TokenListOp.Create(prependedItems=["MaterialBindingAPI"]))
+    binding = Sdf.RelationshipSpec(cyl, "material:binding", False)
+    binding.targetPathList.explicitItems = [material_path]
+
+
 def spawn_cylinder_with_xform(
     parent_prim_path,
     xform_name,
@@ -351,7 +406,7 @@ def spawn_cylinder_with_xform(
     cfg,
     env,
 ):
-    from pxr import UsdGeom, Sdf, Gf, UsdShade
+    from pxr import UsdGeom, Sdf
     stage = env.sim.stage
 
     xform_path = f"{parent_prim_path}/{xform_name}"
@@ -359,55 +414,35 @@ def spawn_cylinder_with_xform(
     if xform_prim and xform_prim.IsValid():
         return xform_prim
 
-    xform = UsdGeom.Xform.Define(stage, Sdf.Path(xform_path))
-
-    xform.AddTranslateOp().Set(Gf.Vec3f(*cfg["translation"]))
-    xform.AddOrientOp().Set(Gf.Quatf(*cfg["orientation"]))
-
-    cyl_path = f"{xform_path}/{cylinder_name}"
-    cyl = UsdGeom.Cylinder.Define(stage, Sdf.Path(cyl_path))
-    cyl.CreateRadiusAttr(cfg["spawn"].radius)
-    cyl.CreateHeightAttr(cfg["spawn"].height)
-    cyl.CreateAxisAttr(cfg["spawn"].axis)
-
-    material_path = f"{xform_path}/{cylinder_name}_Material"
-    material = UsdShade.Material.Define(stage, Sdf.Path(material_path))
-    shader = UsdShade.Shader.Define(stage, Sdf.Path(f"{material_path}/Shader"))
-    shader.CreateIdAttr("UsdPreviewSurface")
-    shader.CreateInput("diffuseColor", Sdf.ValueTypeNames.Color3f).Set(Gf.Vec3f(*cfg["color"]))
-    shader.CreateInput("roughness", Sdf.ValueTypeNames.Float).Set(0.4)
-    shader.CreateInput("metallic", Sdf.ValueTypeNames.Float).Set(0.0)
-
-    surface_output = material.CreateSurfaceOutput()
-    shader_output = shader.CreateOutput("surface", Sdf.ValueTypeNames.Token)
-    surface_output.ConnectToSource(shader_output)
-
-    UsdShade.MaterialBindingAPI(cyl).Bind(material)
-
-    return xform
+    edit_target = stage.GetEditTarget()
+    _author_cylinder_with_xform(edit_target.GetLayer(), edit_target.MapToSpecPath(Sdf.Path(xform_path)), cylinder_name, cfg)
+    return UsdGeom.Xform(stage.GetPrimAtPath(xform_path))
 
 
 def spawn_robot_vis_helper_general(env):
     # check if the robot_vis_helper_cfg is available
     if not hasattr(env.cfg, "robot_vis_helper_cfg"):
         return
+    from pxr import Sdf, UsdGeom
 
-    vis_helper_prims = []
-
-    for prim in env.sim.stage.Traverse():
+    stage = env.sim.stage
+    for prim in stage.Traverse():
         if prim.GetName().lower() == "robot":
             robot_prim_path = prim.GetPath()
-    for key, cfg in env.cfg.robot_vis_helper_cfg.items():
-        prim_path = robot_prim_path.AppendPath(cfg["relative_prim_path"])
-        cylinder_prim = spawn_cylinder_with_xform(
-            parent_prim_path=prim_path,
-            xform_name=key,
-            cylinder_name="mesh",
-            cfg=cfg,
-            env=env,
-        )
-        vis_helper_prims.append(cylinder_prim)
-    return vis_helper_prims
+
+    xform_paths = {
+        key: robot_prim_path.AppendPath(cfg["relative_prim_path"]).AppendChild(key)
+        for key, cfg in env.cfg.robot_vis_helper_cfg.items()
+    }
+    missing = [key for key, path in xform_paths.items() if not stage.GetPrimAtPath(path).IsValid()]
+
+    # author every helper in one change block, a single recomposition instead of one per authored spec
+    edit_target = stage.GetEditTarget()
+    with Sdf.ChangeBlock():
+        for key in missing:
+            cfg = env.cfg.robot_vis_helper_cfg[key]
+            _author_cylinder_with_xform(edit_target.GetLayer(), edit_target.MapToSpecPath(xform_paths[key]), "mesh", cfg)
+    return [UsdGeom.Xform(stage.GetPrimAtPath(path)) for path in xform_paths.values()]
 
 
 def spawn_robot_vis_helper(env):
@@ -434,9 +469,12 @@ def spawn_robot_vis_helper(env):
 def destroy_robot_vis_helper(prim_list, env):
     if not prim_list:
         return
-    for prim in prim_list:
-        if prim.GetPrim().IsValid():
-            env.sim.stage.RemovePrim(prim.GetPath())
+    from pxr import Sdf
+
+    paths = [prim.GetPath() for prim in prim_list if prim.GetPrim().IsValid()]
+    with Sdf.ChangeBlock():
+        for path in paths:
+            env.sim.stage.RemovePrim(path)
 
 
 def hide_ui_windows(sim_app):
@@ -573,37 +611,49 @@ def generate_box_edges(center, extents):
     return edges
 
 
-def draw_line(start, end, color=(1.0, 0.0, 0.0, 1.0), size=1.0):
+def _draw_segments(segments, color, size, overlay, key):
+    if overlay is not None:
+        overlay.segments(segments, color, size, key)
+        return
+    import isaacsim.util.debug_draw._debug_draw as omni_debug_draw
+    draw = omni_debug_draw.acquire_debug_draw_interface()
+    draw.draw_lines([start for start, _ in segments], [end for _, end in segments], [color] * len(segments), [size] * len(segments))
+
+
+def draw_line(start, end, color=(1.0, 0.0, 0.0, 1.0), size=1.0, overlay=None, key=None):
     """
     Draws a single line between two points.
+
+    With an ``overlay`` (see :func:`ngine.utils.debug_overlay.get_debug_overlay`) the line is queued and drawn by the next
+    ``overlay.flush()``, kept across frames under ``key`` when given.
     """
-    import isaacsim.util.debug_draw._debug_draw as omni_debug_draw
-    draw = omni_debug_draw.acquire_debug_draw_interface()
-    draw.draw_lines([start], [end], [color], [size])
+    _draw_segments([(start, end)], color, size, overlay, key)
 
 
-def draw_box(center, extents, color=(1.0, 0.0, 0.0, 1.0), size=1.0):
+def draw_box(center, extents, color=(1.0, 0.0, 0.0, 1.0), size=1.0, overlay=None, key=None):
     """
-    Draws a box defined by its center and extents.
+    Draws a box defined by its center and extents, all edges in one draw call.
     """
-    edges = generate_box_edges(center, extents)
-    for start, end in edges:
-        draw_line(start, end, color, size)
+    _draw_segments(generate_box_edges(center, extents), color, size, overlay, key)
 
 
-def draw_aabb_from_bbox(bbox):
+def draw_aabb_from_bbox(bbox, overlay=None, key=None):
     """
     Draws the axis-aligned bounding box of a given object.
     """
     ctr = bbox.GetMidpoint()
     ext = bbox.GetSize() / 2.0
-    draw_box(ctr, ext)
+    draw_box(ctr, ext, overlay=overlay, key=key)
 
 
-def clear_debug_drawing():
+def clear_debug_drawing(overlay=None):
     """
-    Clears all debug drawings.
+    Clears all debug drawings, and the primitives of ``overlay``.
     """
+    if overlay is not None:
+        overlay.clear()
+        overlay.flush()
+        return
     import isaacsim.util.debug_draw._debug_draw as omni_debug_draw
     draw = omni_debug_draw.acquire_debug_draw_interface()
     draw.clear_lines()
@@ -0,0 +1,240 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Pure pxr version of OpenUsd.convert_asset_instanceable, for single assets and whole asset trees.
+
+The conversion has the two passes of the omni.usd version:
+
+1. every geometry prim gets a new ``<name>_xform`` Xform parent (its spec is reparented in the root layer),
+2. the parent of every geometry prim is made instanceable.
+
+Each pass gathers its prims in one traversal and applies the edits on the root layer in one change block /
+namespace edit, the layer is then exported once. convert_tree runs the assets of a directory tree in a
+process pool and records source / output content hashes in a manifest, so unchanged assets are skipped.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from pxr import Sdf, Usd
+
+from ngine.utils.cache_utils import atomic_write_json, file_hash, read_json
+
+# bump when the conversion changes, converted assets are redone
+INSTANCEABLE_CONVERTER_VERSION = 1
+
+GEOMETRY_TYPES = ("Mesh", "Capsule", "Sphere", "Box")
+USD_EXTENSIONS = (".usd", ".usda", ".usdc")
+MANIFEST_NAME = "instanceable_manifest.json"
+
+
+def _collect_geometry(stage, geometry_types):
+    """Geometry prims in breadth-first order, without descending into geometry prims or instances."""
+    found = []
+    prim_range = iter(Usd.PrimRange(stage.GetPseudoRoot()))
+    for prim in prim_range:
+        if prim.GetTypeName() in geometry_types:
+            found.append(prim)
+            prim_range.PruneChildren()
+    # pre-order visits the prims of one depth in breadth-first order, a stable sort gives the whole order
+    return sorted(found, key=lambda prim: prim.GetPath().pathElementCount)
+
+
+def add_geometry_xforms(stage, geometry_types=GEOMETRY_TYPES):
+    """
+    Reparent every geometry prim under a new ``<path>_xform`` Xform, on the root layer of the stage.
+
+    Geometry without a spec in the root layer (brought in by a reference / sublayer) is left as is.
+
+    Returns:
+        int: number of inserted Xforms
+    """
+    layer = stage.GetRootLayer()
+    geometry = [prim.GetPath() for prim in _collect_geometry(stage, geometry_types) if layer.GetPrimAtPath(prim.GetPath())]
+    edits = Sdf.BatchNamespaceEdit()
+    with Sdf.ChangeBlock():
+        for path in geometry:
+            xform_path = Sdf.Path(path.pathString + "_xform")
+            xform_spec = Sdf.CreatePrimInLayer(layer, xform_path)
+            xform_spec.specifier = Sdf.SpecifierDef
+            xform_spec.typeName = "Xform"
+            edits.Add(Sdf.NamespaceEdit.Reparent(path, xform_path, 0))
+    if geometry and not layer.Apply(edits):
+        raise RuntimeError(f"Cannot reparent the geometry of {layer.identifier} under Xforms")
+    return len(geometry)
+
+
+def make_geometry_parents_instanceable(stage, geometry_types=GEOMETRY_TYPES):
+    """
+    Make the parent of every geometry prim instanceable, on the root layer of the stage.
+
+    Parents which already are instances are left as is. Like the sequential version, the geometry is
+    gathered before any edit, so nested parents are all made instanceable.
+
+    Returns:
+        int: number of prims made instanceable
+    """
+    instanced = []
+    for prim in _collect_geometry(stage, geometry_types):
+        parent = prim.GetParent()
+        if parent and not parent.IsInstance() and parent.GetPath() not in instanced:
+            instanced.append(parent.GetPath())
+    layer = stage.GetRootLayer()
+    with Sdf.ChangeBlock():
+        for path in instanced:
+            Sdf.CreatePrimInLayer(layer, path).instanceable = True
+    return len(instanced)
+
+
+def _export_args(path):
+    """Keep the text / binary encoding of .usd files."""
+    if os.path.splitext(path)[1].lower() != ".usd":
+        return {}
+    with open(path, "rb") as f:
+        return {"format": "usda" if f.read(5) == b"#usda" else "usdc"}
+
+
+def convert_asset(asset_usd_path, save_as_path=None, create_xforms=True, geometry_types=GEOMETRY_TYPES):
+    """
+    Make all geometry prims of an asset instanceable, optionally inserting Xform parents first.
+
+    Args:
+        asset_usd_path (str): source asset
+
+        save_as_path (str): output path, the source is overwritten if None. Relative asset paths of the
+            root layer resolve against the output location.
+
+        create_xforms (bool): insert ``<name>_xform`` parents before making the parents instanceable
+
+        geometry_types (tuple): prim type names treated as geometry
+
+    Returns:
+        dict: number of inserted Xforms and of instanceable prims
+    """
+    output_path = save_as_path if save_as_path else asset_usd_path
+    export_args = _export_args(asset_usd_path)
+    stage = Usd.Stage.Open(asset_usd_path)
+    layer = stage.GetRootLayer()
+    try:
+        num_xforms = add_geometry_xforms(stage, geometry_types) if create_xforms else 0
+        num_instanceable = make_geometry_parents_instanceable(stage, geometry_types)
+        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+        base, ext = os.path.splitext(output_path)
+        tmp_path = f"{base}.{os.getpid()}.tmp{ext}"
+        try:
+            if not layer.Export(tmp_path, args=export_args):
+                raise RuntimeError(f"Cannot export {layer.identifier} to {tmp_path}")
+            os.replace(tmp_path, output_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    finally:
+        # the edited layer stays in the layer registry of this process otherwise
+        layer.Reload(force=True)
+    return {"num_xforms": num_xforms, "num_instanceable": num_instanceable}
+
+
+def _convert_task(source, output, create_xforms, geometry_types):
+    """Process pool task, errors are reported in the manifest entry instead of raised."""
+    entry = {"source_hash": file_hash(source), "create_xforms": create_xforms, "geometry_types": list(geometry_types),
+             "version": INSTANCEABLE_CONVERTER_VERSION}
+    try:
+        entry.update(convert_asset(source, output, create_xforms, geometry_types))
+        entry["status"] = "converted"
+        entry["output_hash"] = file_hash(output)
+    except Exception as e:
+        entry["status"] = "failed"
+        entry["error"] = f"{type(e).__name__}: {e}"
+    return entry
+
+
+def find_assets(root, extensions=USD_EXTENSIONS):
+    """Relative paths of the USD files below root, sorted."""
+    assets = []
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            if filename.lower().endswith(extensions) and ".tmp." not in filename:
+                assets.append(os.path.relpath(os.path.join(dirpath, filename), root))
+    return sorted(assets)
+
+
+def _is_current(entry, source, output, create_xforms, geometry_types, in_place):
+    if not entry or entry.get("status") != "converted":
+        return False
+    if entry.get("version") != INSTANCEABLE_CONVERTER_VERSION or entry.get("create_xforms") != create_xforms:
+        return False
+    if entry.get("geometry_types") != list(geometry_types):
+        return False
+    output_hash = file_hash(output)
+    if output_hash is None or output_hash != entry.get("output_hash"):
+        return False
+    # converting twice nests the Xforms again, an in place output is its own source
+    return in_place or file_hash(source) == entry.get("source_hash")
+
+
+def convert_tree(input_dir, output_dir=None, create_xforms=True, geometry_types=GEOMETRY_TYPES, workers=None,
+                 force=False, manifest_path=None, log=print):
+    """
+    Convert every USD asset below input_dir, skipping the assets converted before from the same content.
+
+    Args:
+        input_dir (str): root of the asset tree
+
+        output_dir (str): root of the mirrored output tree, assets are converted in place if None
+
+        workers (int): size of the process pool (cpu count if None), 0 converts in this process
+
+        force (bool): convert every asset, ignoring the manifest
+
+        manifest_path (str): defaults to <output root>/instanceable_manifest.json
+
+    Returns:
+        dict: the manifest, {"version": ..., "assets": {relative path: entry}}
+    """
+    input_dir = os.path.abspath(input_dir)
+    output_root = os.path.abspath(output_dir) if output_dir else input_dir
+    in_place = output_root == input_dir
+    manifest_path = manifest_path or os.path.join(output_root, MANIFEST_NAME)
+    manifest = read_json(manifest_path) or {}
+    manifest = {"version": INSTANCEABLE_CONVERTER_VERSION, "assets": manifest.get("assets", {})}
+    assets = manifest["assets"]
+
+    rel_paths = find_assets(input_dir)
+    todo = []
+    for rel_path in rel_paths:
+        source, output = os.path.join(input_dir, rel_path), os.path.join(output_root, rel_path)
+        if force or not _is_current(assets.get(rel_path), source, output, create_xforms, geometry_types, in_place):
+            todo.append((rel_path, source, output))
+    log(f"{len(todo)} assets to convert, {len(rel_paths) - len(todo)} unchanged")
+
+    def record(rel_path, entry):
+        assets[rel_path] = entry
+        atomic_write_json(manifest_path, manifest)
+        message = entry.get("error", f"{entry.get('num_xforms')} xforms, {entry.get('num_instanceable')} instanceable")
+        log(f"[{entry['status']}] {rel_path}: {message}")
+
+    if workers == 0:
+        for rel_path, source, output in todo:
+            record(rel_path, _convert_task(source, output, create_xforms, geometry_types))
+    elif todo:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(_convert_task, source, output, create_xforms, tuple(geometry_types)): rel_path
+                for rel_path, source, output in todo
+            }
+            for future in as_completed(futures):
+                record(futures[future], future.result())
+    atomic_write_json(manifest_path, manifest)
+    return manifest
+
@@ -0,0 +1,149 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+from ngine.utils.cache_utils import atomic_write_json, cache_enabled, file_hash, get_cache_dir, key_hash, read_json
+
+# bump when the layout of cached entries changes
+USD_METADATA_VERSION = 2
+
+
+def layer_dependencies(usd_path):
+    """
+    Absolute paths of the layers an asset sublayers, references or payloads, recursively
+
+    Only the layers are opened, the stage is not composed.
+
+    Args:
+        usd_path (str): path of the root USD file
+
+    Returns:
+        list: sorted layer paths, without the root layer
+    """
+    from pxr import Sdf
+
+    root = os.path.normpath(os.path.abspath(usd_path))
+    seen = {root}
+    pending = [root]
+    while pending:
+        layer = Sdf.Layer.FindOrOpen(pending.pop())
+        if layer is None:
+            continue
+        for asset_path in layer.GetCompositionAssetDependencies():
+            dependency = os.path.normpath(layer.ComputeAbsolutePath(asset_path))
+            if dependency not in seen:
+                seen.add(dependency)
+                pending.append(dependency)
+    seen.discard(root)
+    return sorted(seen)
+
+
+class UsdMetadataCache:
+    """
+    On-disk index of geometry metadata parsed from USD assets.
+
+    Entries are keyed by (namespace, absolute asset path, file content hash) and record the content
+    hash of every layer the asset sublayers, references or payloads. An entry is stale as soon as any
+    of these layers changes, so an asset that is re-downloaded or edited is parsed again. Each entry
+    is a json file shared by all processes on the node; writes are atomic.
+    """
+
+    def __init__(self, cache_dir=None):
+        self.enabled = cache_enabled("usd_metadata")
+        self.cache_dir = cache_dir
+        self._memory = {}
+
+    def _entry_path(self, namespace, usd_path, usd_hash):
+        if self.cache_dir is None:
+            self.cache_dir = get_cache_dir("usd_metadata")
+        return os.path.join(self.cache_dir, namespace, f"{key_hash(os.path.abspath(usd_path))}_{usd_hash}.json")
+
+    def get(self, usd_path, namespace="objects"):
+        """
+        Get cached metadata of an asset
+
+        Args:
+            usd_path (str): path of the USD file
+
+            namespace (str): kind of metadata (objects, fixtures, ...)
+
+        Returns:
+            dict: cached entry, or None if missing / stale
+        """
+        if not self.enabled or usd_path is None:
+            return None
+        usd_hash = file_hash(usd_path)
+        if usd_hash is None:
+            return None
+        memory_key = (namespace, os.path.abspath(usd_path), usd_hash)
+        entry = self._memory.get(memory_key)
+        if entry is None:
+            entry = read_json(self._entry_path(namespace, usd_path, usd_hash))
+            if entry is None or entry.get("version") != USD_METADATA_VERSION:
+                return None
+        if not self._layers_unchanged(entry):
+            self._memory.pop(memory_key, None)
+            return None
+        self._memory[memory_key] = entry
+        return entry
+
+    @staticmethod
+    def _layers_unchanged(entry):
+        # file_hash is memoized on (size, mtime), so validating an entry is a stat per layer
+        return all(file_hash(path) == layer_hash for path, layer_hash in entry.get("layers", {}).items())
+
+    def put(self, usd_path, entry, namespace="objects"):
+        """
+        Store metadata of an asset, keyed on the current content of usd_path
+        """
+        if not self.enabled or usd_path is None:
+            return
+        usd_hash = file_hash(usd_path)
+        if usd_hash is None:
+            return
+        entry = dict(entry)
+        entry["version"] = USD_METADATA_VERSION
+        entry["usd_path"] = os.path.abspath(usd_path)
+        entry["layers"] = {path: file_hash(path) for path in layer_dependencies(usd_path)}
+        try:
+            atomic_write_json(self._entry_path(namespace, usd_path, usd_hash), entry)
+        except OSError as e:
+            print(f"warning: failed to write usd metadata cache for {usd_path}: {e}")
+            return
+        self._memory[(namespace, os.path.abspath(usd_path), usd_hash)] = entry
+
+    def export_is_valid(self, entry, variant):
+        """
+        Check whether the modified copy recorded for variant still exists unchanged on disk
+        """
+        if entry is None:
+            return False
+        export = entry.get("exports", {}).get(variant)
+        if export is None:
+            return False
+        return file_hash(export["path"]) == export["hash"]
+
+    def clear_memory(self):
+        self._memory.clear()
+
+
+_usd_metadata_cache = None
+
+
+def get_usd_metadata_cache():
+    global _usd_metadata_cache
+    if _usd_metadata_cache is None:
+        _usd_metadata_cache = UsdMetadataCache()
+    return _usd_metadata_cache
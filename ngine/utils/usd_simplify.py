@@ -0,0 +1,197 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Layer-level version of OpenUsd.usd_simplify.
+
+The edits of the simplification (removed physics schemas, contact report attributes, joint and collision
+prims) are gathered in a single traversal of the composed stage and applied with Sdf calls inside one
+Sdf.ChangeBlock on a copy of the root layer, which is what OpenUsd.usd_simplify edits and exports. The
+simplified layer is cached on disk, keyed by the content of every layer used by the stage and the reference
+fixture names, so reloading the same scene copies a file instead of walking the stage again.
+
+Only pxr.Usd / Sdf / UsdPhysics are needed, PhysX schemas are handled by name.
+"""
+
+import hashlib
+import os
+import shutil
+
+from pxr import Sdf, Usd, UsdPhysics
+
+from ngine.utils.cache_utils import cache_enabled, file_hash, get_cache_dir, key_hash
+
+# bump when the simplification rules change
+USD_SIMPLIFY_VERSION = 1
+
+# (composed schema checked with HasAPI, applied schema names removed from the prim)
+SIMPLIFY_API_SCHEMAS = (
+    (UsdPhysics.RigidBodyAPI, ("PhysicsRigidBodyAPI", "PhysxRigidBodyAPI")),
+    (UsdPhysics.CollisionAPI, ("PhysicsCollisionAPI", "PhysxCollisionAPI")),
+    (UsdPhysics.ArticulationRootAPI, ("PhysicsArticulationRootAPI", "PhysxArticulationAPI")),
+)
+CONTACT_REPORT_API = "PhysxContactReportAPI"
+CONTACT_REPORT_ATTRS = ("physxContactReportThreshold", "physxContactReportForceThreshold")
+REMOVED_NAME_KEYWORDS = ("joint", "collisions")
+
+
+def collect_simplify_edits(stage, ref_fixture_names):
+    """
+    Gather the edits of the simplification in one pre-order traversal of the stage.
+
+    Subtrees of reference fixtures and of removed prims are pruned, like in OpenUsd.usd_simplify.
+
+    Args:
+        stage (Usd.Stage): composed stage
+
+        ref_fixture_names (list): names of the prims to keep untouched (with their descendants)
+
+    Returns:
+        dict: {"remove_apis": [(path, [schema, ...])], "remove_properties": [(path, [name, ...])],
+            "remove_prims": [path]} in traversal order
+    """
+    ref_fixture_names = set(ref_fixture_names)
+    edits = {"remove_apis": [], "remove_properties": [], "remove_prims": []}
+    prim_range = iter(Usd.PrimRange(stage.GetPseudoRoot(), Usd.PrimAllPrimsPredicate))
+    for prim in prim_range:
+        if prim.IsPseudoRoot():
+            continue
+        name = prim.GetName()
+        if name in ref_fixture_names:
+            prim_range.PruneChildren()
+            continue
+        path = prim.GetPath().pathString
+        if any(keyword in name.lower() for keyword in REMOVED_NAME_KEYWORDS) or prim.IsA(UsdPhysics.Joint):
+            # edits on a removed prim vanish with its spec
+            edits["remove_prims"].append(path)
+            prim_range.PruneChildren()
+            continue
+        apis = [schema for api, schemas in SIMPLIFY_API_SCHEMAS if prim.HasAPI(api) for schema in schemas]
+        if CONTACT_REPORT_API in prim.GetAppliedSchemas():
+            apis.append(CONTACT_REPORT_API)
+        if apis:
+            edits["remove_apis"].append((path, apis))
+        properties = [attr for attr in CONTACT_REPORT_ATTRS if prim.HasAttribute(attr)]
+        if properties:
+            edits["remove_properties"].append((path, properties))
+    return edits
+
+
+def _remove_api_schema(prim_spec, schema):
+    """Sdf equivalent of UsdPrim.RemoveAppliedSchema on the layer of prim_spec."""
+    list_op = prim_spec.GetInfo("apiSchemas") if prim_spec.HasInfo("apiSchemas") else Sdf.TokenListOp()
+    if list_op.isExplicit:
+        list_op.explicitItems = [item for item in list_op.explicitItems if item != schema]
+    else:
+        list_op.prependedItems = [item for item in list_op.prependedItems if item != schema]
+        list_op.appendedItems = [item for item in list_op.appendedItems if item != schema]
+        if schema not in list_op.deletedItems:
+            list_op.deletedItems = list(list_op.deletedItems) + [schema]
+    prim_spec.SetInfo("apiSchemas", list_op)
+
+
+def apply_simplify_edits(layer, edits):
+    """
+    Apply edits gathered by collect_simplify_edits to a layer in one change block.
+
+    Prim and property removals only drop the specs authored in this layer, schema removals author
+    (over) specs where needed, matching the Usd edits on a stage whose edit target is this layer.
+    """
+    with Sdf.ChangeBlock():
+        for path, schemas in edits["remove_apis"]:
+            prim_spec = Sdf.CreatePrimInLayer(layer, path)
+            for schema in schemas:
+                _remove_api_schema(prim_spec, schema)
+        for path, names in edits["remove_properties"]:
+            prim_spec = layer.GetPrimAtPath(path)
+            if prim_spec is None:
+                continue
+            for name in names:
+                prop_spec = prim_spec.properties.get(name)
+                if prop_spec is not None:
+                    prim_spec.RemoveProperty(prop_spec)
+        for path in edits["remove_prims"]:
+            prim_spec = layer.GetPrimAtPath(path)
+            if prim_spec is None:
+                continue
+            del prim_spec.nameParent.nameChildren[prim_spec.name]
+    return layer
+
+
+def simplify_layer(stage, ref_fixture_names):
+    """
+    Build the simplified root layer of a stage without editing the stage.
+
+    Returns:
+        Sdf.Layer: anonymous copy of the root layer with the simplification applied
+    """
+    edits = collect_simplify_edits(stage, ref_fixture_names)
+    layer = Sdf.Layer.CreateAnonymous(".usd")
+    layer.TransferContent(stage.GetRootLayer())
+    return apply_simplify_edits(layer, edits)
+
+
+def _layer_hash(layer):
+    if not layer.anonymous and not layer.dirty and layer.realPath and os.path.exists(layer.realPath):
+        return file_hash(layer.realPath)
+    return hashlib.sha1(layer.ExportToString().encode("utf-8")).hexdigest()
+
+
+def stage_simplify_key(stage, ref_fixture_names):
+    """Cache key of the simplified scene, from the content of every used layer and the kept fixtures."""
+    root_identifier = stage.GetRootLayer().identifier
+    layer_hashes = sorted(
+        ("<root>" if layer.identifier == root_identifier else os.path.basename(layer.identifier), _layer_hash(layer))
+        for layer in stage.GetUsedLayers()
+    )
+    return key_hash(USD_SIMPLIFY_VERSION, layer_hashes, sorted(set(ref_fixture_names)))
+
+
+def simplify_to_file(stage, ref_fixture_names, output_path, use_cache=True):
+    """
+    Write the simplified root layer of a stage to output_path, reusing the cached layer when possible.
+
+    The cached layer is byte-copied, so relative asset paths resolve like in a layer exported by
+    OpenUsd.usd_simplify as long as output_path sits next to the source scene.
+
+    Args:
+        stage (Usd.Stage): composed scene stage, left unchanged
+
+        ref_fixture_names (list): names of the prims to keep untouched
+
+        output_path (str): path of the simplified scene
+
+        use_cache (bool): read / write the usd_simplify cache (NGINE_DISABLE_CACHE=usd_simplify disables it)
+
+    Returns:
+        str: output_path
+    """
+    if not (use_cache and cache_enabled("usd_simplify")):
+        simplify_layer(stage, ref_fixture_names).Export(output_path)
+        return output_path
+
+    cache_path = os.path.join(get_cache_dir("usd_simplify"), f"{stage_simplify_key(stage, ref_fixture_names)}.usd")
+    if not os.path.exists(cache_path):
+        # export next to the entry, the extension picks the file format
+        tmp_path = f"{cache_path[:-4]}.{os.getpid()}.tmp.usd"
+        try:
+            simplify_layer(stage, ref_fixture_names).Export(tmp_path)
+            os.replace(tmp_path, cache_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    tmp_output = f"{os.path.splitext(output_path)[0]}.{os.getpid()}.tmp.usd"
+    shutil.copyfile(cache_path, tmp_output)
+    os.replace(tmp_output, output_path)
+    return output_path
+
@@ -20,6 +20,14 @@ import numpy as np
 from pxr import Gf, PhysxSchema, Sdf, Usd, UsdGeom, UsdPhysics, UsdShade, UsdSkel
 
 import ngine.utils.math_utils.transform_utils.numpy_impl as T
+from ngine.utils.prim_index import get_prim_index
+from ngine.utils.usd_instanceable import convert_asset
+from ngine.utils.usd_simplify import simplify_to_file
+
+
+def _prim_index(prim):
+    """Prim index of the stage of prim, None to traverse (invalid prim or index disabled)"""
+    return get_prim_index(prim.GetStage()) if prim else None
 
 
 class OpenUsd:
@@ -92,6 +100,11 @@ class OpenUsd:
             OpenUsd.usd_simplify(stage, ref_fixture_names, child)
         return stage
 
+    @staticmethod
+    def usd_simplify_to_file(stage, ref_fixture_names, output_path, use_cache=True):
+        """Write the simplified root layer to output_path without editing the stage, see ngine.utils.usd_simplify"""
+        return simplify_to_file(stage, ref_fixture_names, output_path, use_cache=use_cache)
+
     @staticmethod
     def activate_prim(stage, name):
         import omni
@@ -272,54 +285,9 @@ class OpenUsd:
         """
             Makes all mesh/geometry prims instanceable (and optionally inserts Xform parents) while preserving materials.
             All operations are performed within the save_as_path file; no additional mesh files are generated.
+            Pure pxr, see ngine.utils.usd_instanceable for converting whole asset trees.
         """
-        import omni.usd
-
-        working_path = save_as_path if save_as_path else asset_usd_path
-        root_path = "/"
-
-        if create_xforms:
-            omni.usd.get_context().open_stage(asset_usd_path)
-            stage = omni.usd.get_context().get_stage()
-            prims = [stage.GetPrimAtPath(root_path)]
-            edits = Sdf.BatchNamespaceEdit()
-
-            while len(prims) > 0:
-                prim = prims.pop(0)
-                if prim.GetTypeName() in ["Mesh", "Capsule", "Sphere", "Box"]:
-                    new_xform = UsdGeom.Xform.Define(
-                        stage, str(prim.GetPath()) + "_xform")
-                    edits.Add(Sdf.NamespaceEdit.Reparent(
-                        prim.GetPath(), new_xform.GetPath(), 0))
-                    continue
-                children_prims = prim.GetChildren()
-                prims += children_prims
-
-            stage.GetRootLayer().Apply(edits)
-            if save_as_path is None:
-                omni.usd.get_context().save_stage()
-            else:
-                omni.usd.get_context().save_as_stage(save_as_path)
-
-        omni.usd.get_context().open_stage(working_path)
-        stage = omni.usd.get_context().get_stage()
-        prims = [stage.GetPrimAtPath(root_path)]
-
-        while len(prims) > 0:
-            prim = prims.pop(0)
-            if prim:
-                if prim.GetTypeName() in ["Mesh", "Capsule", "Sphere", "Box"]:
-                    parent_prim = prim.GetParent()
-                    if parent_prim and not parent_prim.IsInstance():
-                        parent_prim.SetInstanceable(True)
-                        continue
-                children_prims = prim.GetChildren()
-                prims += children_prims
-
-        if save_as_path is None:
-            omni.usd.get_context().save_stage()
-        else:
-            omni.usd.get_context().save_as_stage(save_as_path)
+        return convert_asset(asset_usd_path, save_as_path, create_xforms)
 
     @staticmethod
     def export(stage, path):
@@ -356,6 +324,13 @@ class OpenUsd:
     @staticmethod
     def get_prim_by_name(prim, name, only_xform=True, case_sensitive=False, only_first=False):
         """Get prim by name"""
+        index = _prim_index(prim)
+        if index is not None:
+            result = index.find_by_name(
+                prim, name, case_sensitive, "Xform" if only_xform else None, default_predicate=True, only_first=only_first
+            )
+            if result is not None:
+                return result
         result = []
         if not case_sensitive:
             lower_name = name.lower()
@@ -379,6 +354,11 @@ class OpenUsd:
     @staticmethod
     def get_prim_by_type(prim, include_types=None, exclude_types=None):
         """Get prim by type"""
+        index = _prim_index(prim)
+        if index is not None and not isinstance(include_types, str) and not isinstance(exclude_types, str):
+            result = index.find_by_types(prim, include_types, exclude_types)
+            if result is not None:
+                return result
         result = []
         if (
             (include_types is None or prim.GetTypeName() in include_types)
@@ -392,6 +372,11 @@ class OpenUsd:
     @staticmethod
     def get_prim_by_name_and_type(prim, name, type):
         """Get prim by name and type"""
+        index = _prim_index(prim)
+        if index is not None:
+            result = index.find_by_name(prim, name, type_name=type)
+            if result is not None:
+                return result
         result = []
         if prim.GetName().lower() == name.lower() and prim.GetTypeName() == type:
             result.append(prim)
@@ -402,6 +387,11 @@ class OpenUsd:
     @staticmethod
     def get_prim_by_prefix(prim, prefix, only_xform=True):
         """Get prim by prefix"""
+        index = _prim_index(prim)
+        if index is not None:
+            result = index.find_by_prefix(prim, prefix, "Xform" if only_xform else None)
+            if result is not None:
+                return result
         result = []
         if prim.GetName().lower().startswith(prefix.lower()):
             if not only_xform or prim.GetTypeName() == "Xform":
@@ -413,6 +403,11 @@ class OpenUsd:
     @staticmethod
     def get_prim_by_prefix_and_type(prim, prefix, type):
         """Get prim by prefix and type"""
+        index = _prim_index(prim)
+        if index is not None:
+            result = index.find_by_prefix(prim, prefix, type)
+            if result is not None:
+                return result
         result = []
         if prim.GetName().lower().startswith(prefix.lower()) and prim.GetTypeName() == type:
             result.append(prim)
@@ -423,6 +418,11 @@ class OpenUsd:
     @staticmethod
     def get_prim_by_suffix(prim, suffix, only_xform=True):
         """Get prim by suffix"""
+        index = _prim_index(prim)
+        if index is not None:
+            result = index.find_by_suffix(prim, suffix, "Xform" if only_xform else None)
+            if result is not None:
+                return result
         result = []
         if prim.GetName().lower().endswith(suffix.lower()):
             if not only_xform or prim.GetTypeName() == "Xform":
@@ -434,6 +434,11 @@ class OpenUsd:
     @staticmethod
     def get_prim_by_suffix_and_type(prim, suffix, type):
         """Get prim by suffix and type"""
+        index = _prim_index(prim)
+        if index is not None:
+            result = index.find_by_suffix(prim, suffix, type)
+            if result is not None:
+                return result
         result = []
         if prim.GetName().lower().endswith(suffix.lower()) and prim.GetTypeName() == type:
             result.append(prim)
@@ -444,6 +449,11 @@ class OpenUsd:
     @staticmethod
     def get_prim_by_subname(prim, subname):
         """Get prim by subname"""
+        index = _prim_index(prim)
+        if index is not None:
+            result = index.find_by_subname(prim, subname)
+            if result is not None:
+                return result
         result = []
         if subname in prim.GetName():
             result.append(prim)
@@ -454,6 +464,11 @@ class OpenUsd:
     @staticmethod
     def get_prim_by_subname_and_type(prim, subname, type):
         """Get prim by subname and type"""
+        index = _prim_index(prim)
+        if index is not None:
+            result = index.find_by_subname(prim, subname, type)
+            if result is not None:
+                return result
         result = []
         if subname in prim.GetName() and prim.GetTypeName() == type:
             result.append(prim)
@@ -464,6 +479,11 @@ class OpenUsd:
     @staticmethod
     def get_prim_by_types(prim, types):
         """Get prim by types"""
+        index = _prim_index(prim)
+        if index is not None and not isinstance(types, str):
+            result = index.find_by_types(prim, types)
+            if result is not None:
+                return result
         result = []
         if prim.GetTypeName() in types:
             result.append(prim)
@@ -542,7 +562,22 @@ class OpenUsd:
         return bbox_cache.ComputeWorldBound(prim).ComputeAlignedBox()
 
     @staticmethod
-    def get_fixture_placements(root_prim, fixture_cfgs):
+    def get_fixture_placements(root_prim, fixture_cfgs, usd_path=None):
+        """
+        Get placements of the fixtures that carry reg_* regions
+
+        Args:
+            root_prim: root prim of the scene stage
+
+            fixture_cfgs (list): fixture configurations
+
+            usd_path (str): file the scene stage was loaded from. If set, fixture regions are read from
+                and written to the usd metadata cache instead of being parsed from the stage every time
+        """
+        from ngine.utils.usd_metadata_cache import get_usd_metadata_cache
+        metadata_cache = get_usd_metadata_cache()
+        cached_regions = metadata_cache.get(usd_path, namespace="fixture_regions") if usd_path is not None else None
+        fixture_regions = {}
         valid_fixture_names = []
         fixture_placements = {}
         for fxr_cfg in fixture_cfgs:
@@ -571,11 +606,16 @@ class OpenUsd:
                 prim=prim,
                 obj_path=None,
                 object_scale=(1.0, 1.0, 1.0),
-                asset_type="fixtures"
+                asset_type="fixtures",
+                metadata=cached_regions["fixtures"].get(name) if cached_regions is not None else None,
             )
+            fixture_regions[name] = usd_obj.metadata
 
             fixture_placements[name] = (fixture_pos, fixture_quat, usd_obj)
 
+        if usd_path is not None and (cached_regions is None or set(cached_regions["fixtures"]) != set(fixture_regions)):
+            metadata_cache.put(usd_path, {"fixtures": fixture_regions}, namespace="fixture_regions")
+
         return fixture_placements
 
     @staticmethod
@@ -748,10 +788,10 @@ class OpenUsdWrapper:
             prim = self.root_prim
         return self._usd.get_all_child_xform_names(prim)
 
-    def get_fixture_placements(self, fixture_cfgs, fixtures, root_prim=None):
+    def get_fixture_placements(self, fixture_cfgs, root_prim=None, usd_path=None):
         if root_prim is None:
             root_prim = self.root_prim
-        return self._usd.get_fixture_placements(root_prim, fixture_cfgs, fixtures)
+        return self._usd.get_fixture_placements(root_prim, fixture_cfgs, usd_path)
 
     def replace_prim(self, prim, new_prim_path):
         return self._usd.replace_prim(self.stage, prim, new_prim_path)
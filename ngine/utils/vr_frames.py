@@ -0,0 +1,326 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Packed VR frames and a buffered HDF5 writer for the VR raw input.
+
+A VR frame packs the head / wrist matrices, the controller states and the internal device state of one step
+into a single float32 row with a fixed layout (see :data:`VR_FRAME_FIELDS`). The recorder stores one such row
+per step under ``obs/raw_input/frame`` instead of ~30 separate keys.
+
+:class:`VRFrameWriter` additionally streams the frames to a standalone HDF5 file: frames are packed into a
+preallocated ring buffer on the teleop thread and a background thread appends them to a chunked, resizable
+dataset in contiguous blocks.
+
+Example:
+    >>> writer = VRFrameWriter("vr_frames.hdf5")
+    >>> writer.write(step, head_mat, abs_left, abs_right, rel_left, rel_right, left_state, right_state, internal_state)
+    >>> writer.close()
+    >>> data = read_vr_frames("vr_frames.hdf5")
+    >>> raw_input = unpack_vr_frame(data["frames"][0])
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+VR_FRAME_VERSION = 1
+
+VR_MATRIX_KEYS = ("head_mat", "abs_left_wrist_mat", "abs_right_wrist_mat", "rel_left_wrist_mat", "rel_right_wrist_mat")
+VR_CONTROLLER_KEYS = ("left_controller_state", "right_controller_state")
+# same order as OpenTeleVision.left_controller_state / right_controller_state
+VR_CONTROLLER_STATE_KEYS = ("trigger", "squeeze", "thumbstick_x", "thumbstick_y", "thumbstick", "a_button", "b_button")
+VR_CONTROLLER_BOOL_KEYS = ("thumbstick", "a_button", "b_button")
+VR_INTERNAL_STATE_KEYS = (
+    "has_started", "started", "base_mode_flag", "last_thumbstick_state", "last_x_button_state",
+    "last_y_button_state", "last_start_state", "is_body_moving", "is_body_moving_last_frame", "has_keep",
+    "rollback_keep", "last_checkpoint_frame_idx",
+)
+
+# (name, size) of every field of a frame, in order
+VR_FRAME_FIELDS = (
+    [("version", 1)]
+    + [(key, 16) for key in VR_MATRIX_KEYS]
+    + [(f"{key}/{state_key}", 1) for key in VR_CONTROLLER_KEYS for state_key in VR_CONTROLLER_STATE_KEYS]
+    + [(f"internal_state/{key}", 1) for key in VR_INTERNAL_STATE_KEYS]
+)
+VR_FRAME_OFFSETS = {}
+_offset = 0
+for _name, _size in VR_FRAME_FIELDS:
+    VR_FRAME_OFFSETS[_name] = (_offset, _offset + _size)
+    _offset += _size
+VR_FRAME_SIZE = _offset
+
+_MATRICES = slice(VR_FRAME_OFFSETS[VR_MATRIX_KEYS[0]][0], VR_FRAME_OFFSETS[VR_MATRIX_KEYS[-1]][1])
+_CONTROLLERS = slice(_MATRICES.stop, _MATRICES.stop + len(VR_CONTROLLER_KEYS) * len(VR_CONTROLLER_STATE_KEYS))
+_INTERNAL_STATE = slice(_CONTROLLERS.stop, VR_FRAME_SIZE)
+
+
+def vr_frame_layout() -> dict:
+    """The frame layout as a json-serializable dict, stored along with the streamed frames."""
+    return {"version": VR_FRAME_VERSION, "size": VR_FRAME_SIZE, "fields": [list(field) for field in VR_FRAME_FIELDS]}
+
+
+def pack_vr_frame(out: np.ndarray, head_mat, abs_left_wrist_mat, abs_right_wrist_mat, rel_left_wrist_mat,
+                  rel_right_wrist_mat, left_controller_state: dict, right_controller_state: dict,
+                  internal_state: dict) -> np.ndarray:
+    """Pack the raw input of one step into ``out``, a float32 array of :data:`VR_FRAME_SIZE` elements.
+
+    Missing matrices are stored as NaN, missing controller / internal state values as 0.
+    """
+    out[0] = VR_FRAME_VERSION
+    matrices = out[_MATRICES].reshape(len(VR_MATRIX_KEYS), 16)
+    for i, matrix in enumerate((head_mat, abs_left_wrist_mat, abs_right_wrist_mat, rel_left_wrist_mat, rel_right_wrist_mat)):
+        if matrix is None:
+            matrices[i] = np.nan
+        else:
+            matrices[i] = np.asarray(matrix).reshape(16)
+    controllers = out[_CONTROLLERS].reshape(len(VR_CONTROLLER_KEYS), len(VR_CONTROLLER_STATE_KEYS))
+    for i, state in enumerate((left_controller_state, right_controller_state)):
+        state = state or {}
+        controllers[i] = [float(state.get(key, 0.0)) for key in VR_CONTROLLER_STATE_KEYS]
+    out[_INTERNAL_STATE] = [float(internal_state.get(key, 0.0)) for key in VR_INTERNAL_STATE_KEYS]
+    return out
+
+
+def unpack_vr_frame(frame) -> dict:
+    """Unpack a frame into the raw input dict of ``Device.load_raw_input_from_hdf5``."""
+    frame = np.asarray(frame, dtype=np.float32).reshape(-1)
+    if frame.shape[0] != VR_FRAME_SIZE or int(frame[0]) != VR_FRAME_VERSION:
+        raise ValueError(f"Unsupported VR frame (size {frame.shape[0]}, version {frame[0] if len(frame) else None})")
+    raw_input = {}
+    matrices = frame[_MATRICES].reshape(len(VR_MATRIX_KEYS), 4, 4)
+    for key, matrix in zip(VR_MATRIX_KEYS, matrices):
+        if not np.isnan(matrix).any():
+            raw_input[key] = matrix.copy()
+    controllers = frame[_CONTROLLERS].reshape(len(VR_CONTROLLER_KEYS), len(VR_CONTROLLER_STATE_KEYS))
+    for key, values in zip(VR_CONTROLLER_KEYS, controllers):
+        raw_input[key] = {
+            state_key: bool(value) if state_key in VR_CONTROLLER_BOOL_KEYS else float(value)
+            for state_key, value in zip(VR_CONTROLLER_STATE_KEYS, values)
+        }
+    raw_input["internal_state"] = {key: float(value) for key, value in zip(VR_INTERNAL_STATE_KEYS, frame[_INTERNAL_STATE])}
+    return raw_input
+
+
+class VRFrameRingBuffer:
+    """Preallocated single-producer / single-consumer ring of packed frames.
+
+    The producer packs frames in place with :meth:`push`, the consumer reads the pending frames as at most two
+    contiguous views with :meth:`pending` and releases them with :meth:`consume`. When the ring is full the
+    producer waits for the consumer, frames are never dropped. A consumer that stops calls :meth:`close`, which
+    wakes a waiting producer and makes :meth:`push` raise instead of waiting forever.
+    """
+
+    def __init__(self, capacity: int = 4096):
+        self.capacity = capacity
+        self.frames = np.zeros((capacity, VR_FRAME_SIZE), dtype=np.float32)
+        self.steps = np.zeros(capacity, dtype=np.int64)
+        self.times = np.zeros(capacity, dtype=np.float64)
+        self.episodes = np.zeros(capacity, dtype=np.int32)
+        self.head = 0  # number of frames pushed
+        self.tail = 0  # number of frames consumed
+        self.cond = threading.Condition()
+        self.closed = False
+        self.error = None
+
+    def __len__(self):
+        return self.head - self.tail
+
+    def push(self, step: int, episode: int, *frame_args, timeout: float | None = None) -> bool:
+        with self.cond:
+            if self.head - self.tail >= self.capacity:
+                if not self.cond.wait_for(lambda: self.closed or self.head - self.tail < self.capacity, timeout=timeout):
+                    return False
+            if self.closed:
+                raise RuntimeError(f"The VR frame ring is closed: {self.error}") from self.error
+        index = self.head % self.capacity
+        pack_vr_frame(self.frames[index], *frame_args)
+        self.steps[index] = step
+        self.times[index] = time.time()
+        self.episodes[index] = episode
+        with self.cond:
+            self.head += 1
+            self.cond.notify_all()
+        return True
+
+    def pending(self, max_frames: int | None = None) -> list[slice]:
+        """Ring slices of the pending frames, oldest first."""
+        count = self.head - self.tail
+        if max_frames is not None:
+            count = min(count, max_frames)
+        start = self.tail % self.capacity
+        if start + count <= self.capacity:
+            return [slice(start, start + count)] if count > 0 else []
+        return [slice(start, self.capacity), slice(0, start + count - self.capacity)]
+
+    def consume(self, count: int):
+        with self.cond:
+            self.tail += count
+            self.cond.notify_all()
+
+    def close(self, error: BaseException | None = None):
+        """Stop accepting frames, ``error`` is the reason the consumer stopped, if any."""
+        with self.cond:
+            self.closed = True
+            self.error = error
+            self.cond.notify_all()
+
+
+class VRFrameWriter:
+    """Stream packed VR frames to an HDF5 file from a background thread.
+
+    The file holds the ``vr/frames`` (N, VR_FRAME_SIZE) float32 dataset with the frame layout as json in its
+    ``layout`` attribute, and the per-frame ``vr/step``, ``vr/time`` and ``vr/episode`` datasets.
+
+    Args:
+        path: Output HDF5 file, overwritten if it exists.
+        capacity: Number of frames of the ring buffer.
+        chunk_frames: Frames per HDF5 chunk, the writer flushes as soon as that many frames are pending.
+        flush_interval: Maximum time in seconds a frame stays in the ring buffer.
+        compression: HDF5 compression filter of the datasets, or None.
+    """
+
+    def __init__(self, path: str | Path, capacity: int = 4096, chunk_frames: int = 256, flush_interval: float = 1.0,
+                 compression: str | None = "lzf"):
+        import h5py
+
+        if chunk_frames > capacity:
+            raise ValueError(f"chunk_frames ({chunk_frames}) must not exceed the capacity ({capacity})")
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.chunk_frames = chunk_frames
+        self.flush_interval = flush_interval
+        self.ring = VRFrameRingBuffer(capacity)
+        self.episode = 0
+        self.num_written = 0
+        self.error = None
+
+        self._file = h5py.File(self.path, "w")
+        group = self._file.create_group("vr")
+        self._datasets = {
+            "frames": group.create_dataset("frames", shape=(0, VR_FRAME_SIZE), maxshape=(None, VR_FRAME_SIZE),
+                                           chunks=(chunk_frames, VR_FRAME_SIZE), dtype=np.float32, compression=compression),
+        }
+        for name, dtype in (("step", np.int64), ("time", np.float64), ("episode", np.int32)):
+            self._datasets[name] = group.create_dataset(name, shape=(0,), maxshape=(None,), chunks=(chunk_frames,),
+                                                        dtype=dtype, compression=compression)
+        self._datasets["frames"].attrs["layout"] = json.dumps(vr_frame_layout())
+
+        self._closed = False
+        self._flush_requested = False
+        self._thread = threading.Thread(target=self._run, name="VRFrameWriter", daemon=True)
+        self._thread.start()
+
+    def write(self, step: int, head_mat, abs_left_wrist_mat, abs_right_wrist_mat, rel_left_wrist_mat,
+              rel_right_wrist_mat, left_controller_state: dict, right_controller_state: dict, internal_state: dict):
+        """Pack a frame into the ring buffer, the HDF5 write happens on the writer thread."""
+        if self._closed:
+            raise RuntimeError("The VR frame writer is closed")
+        if self.error is not None:
+            raise RuntimeError(f"The VR frame writer failed: {self.error}") from self.error
+        self.ring.push(step, self.episode, head_mat, abs_left_wrist_mat, abs_right_wrist_mat, rel_left_wrist_mat,
+                       rel_right_wrist_mat, left_controller_state, right_controller_state, internal_state)
+
+    def new_episode(self):
+        self.episode += 1
+
+    def flush(self):
+        """Block until all the frames written so far are in the file."""
+        with self.ring.cond:
+            self._flush_requested = True
+            self.ring.cond.notify_all()
+            self.ring.cond.wait_for(lambda: len(self.ring) == 0 or self.error is not None or not self._thread.is_alive())
+        if self.error is None:
+            self._file.flush()
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        with self.ring.cond:
+            self.ring.cond.notify_all()
+        self._thread.join()
+        self._file.close()
+        if self.error is not None:
+            raise RuntimeError(f"The VR frame writer failed: {self.error}") from self.error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    """
+    Helper functions.
+    """
+
+    def _run(self):
+        ring = self.ring
+        try:
+            while True:
+                with ring.cond:
+                    ring.cond.wait_for(
+                        lambda: len(ring) >= self.chunk_frames or self._flush_requested or self._closed,
+                        timeout=self.flush_interval,
+                    )
+                    closed = self._closed
+                    self._flush_requested = False
+                # whole chunks as soon as they are full, the rest on timeout, flush or close
+                count = len(ring)
+                if count > 0:
+                    self._write_block(ring.pending(count))
+                    ring.consume(count)
+                elif closed:
+                    break
+        except Exception as e:
+            self.error = e
+        finally:
+            # wake a producer waiting on a full ring, nothing consumes it anymore
+            ring.close(self.error)
+
+    def _write_block(self, slices: list[slice]):
+        count = sum(s.stop - s.start for s in slices)
+        start = self.num_written
+        for dataset in self._datasets.values():
+            dataset.resize(start + count, axis=0)
+        offset = start
+        for s in slices:
+            n = s.stop - s.start
+            self._datasets["frames"][offset:offset + n] = self.ring.frames[s]
+            self._datasets["step"][offset:offset + n] = self.ring.steps[s]
+            self._datasets["time"][offset:offset + n] = self.ring.times[s]
+            self._datasets["episode"][offset:offset + n] = self.ring.episodes[s]
+            offset += n
+        self.num_written += count
+
+
+def read_vr_frames(path: str | Path, episode: int | None = None) -> dict:
+    """Read the frames streamed by :class:`VRFrameWriter`, optionally of a single episode."""
+    import h5py
+
+    with h5py.File(path, "r") as f:
+        group = f["vr"]
+        layout = json.loads(group["frames"].attrs["layout"])
+        if layout["size"] != VR_FRAME_SIZE or layout["version"] != VR_FRAME_VERSION:
+            raise ValueError(f"Unsupported VR frame layout in {path}: {layout}")
+        data = {name: group[name][()] for name in ("frames", "step", "time", "episode")}
+    if episode is not None:
+        mask = data["episode"] == episode
+        data = {name: values[mask] for name, values in data.items()}
+    data["layout"] = layout
+    return data
+
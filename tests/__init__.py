@@ -0,0 +1 @@
+"""Tests for ngine, run with ``python -m pytest tests``."""
@@ -0,0 +1,261 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+The batched transforms against the per-pose functions numpy_impl / torch_impl had before they were routed through
+batched (tests/transform_reference), and the torch backend against numpy.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+# the transform_utils package imports torch_impl
+torch = pytest.importorskip("torch")
+
+from ngine.utils.math_utils.transform_utils import batched as Tb  # noqa: E402
+from ngine.utils.math_utils.transform_utils import numpy_impl, torch_impl  # noqa: E402
+from tests.transform_reference import numpy_impl as Tn  # noqa: E402
+from tests.transform_reference import torch_impl as Tt  # noqa: E402
+
+ATOL = 1e-4
+
+
+@pytest.fixture(scope="module")
+def data():
+    rng = np.random.default_rng(0)
+    num = 256
+    quats = Tb.quat_normalize(rng.standard_normal((num, 4)))
+    quats2 = Tb.quat_normalize(rng.standard_normal((num, 4)))
+    positions = rng.uniform(-2.0, 2.0, (num, 3))
+    eulers = rng.uniform(-np.pi, np.pi, (num, 3))
+    eulers[:, 1] /= 2.0  # away from the pitch singularity
+    return SimpleNamespace(
+        quats=quats,
+        quats2=quats2,
+        positions=positions,
+        eulers=eulers,
+        fractions=rng.uniform(0.0, 1.0, num),
+        axisangles=rng.uniform(-3.0, 3.0, (num, 3)),
+        mats=Tb.quat2mat(quats),
+        hmats=Tb.pose2mat(positions, quats),
+        poses7=np.concatenate([positions, Tb.convert_quat(quats, to="wxyz")], -1),
+        poses7b=np.concatenate([positions[::-1], Tb.convert_quat(quats2, to="wxyz")], -1),
+    )
+
+
+def same_rotation(q0, q1):
+    """Quaternions q and -q are the same rotation."""
+    q0, q1 = np.asarray(q0, dtype=np.float64), np.asarray(q1, dtype=np.float64)
+    return np.all(np.minimum(np.abs(q0 - q1).max(axis=-1), np.abs(q0 + q1).max(axis=-1)) <= ATOL)
+
+
+# name: (batched, per-pose reference, compare as rotations)
+PER_POSE_CASES = {
+    "quat_multiply": (
+        lambda d: Tb.quat_multiply(d.quats, d.quats2),
+        lambda d: [Tn.quat_multiply(a, b) for a, b in zip(d.quats, d.quats2)],
+        False,
+    ),
+    "quat_inverse": (lambda d: Tb.quat_inverse(d.quats), lambda d: [Tn.quat_inverse(q) for q in d.quats], False),
+    "quat_distance": (
+        lambda d: Tb.quat_distance(d.quats, d.quats2),
+        lambda d: [Tn.quat_distance(a, b) for a, b in zip(d.quats, d.quats2)],
+        False,
+    ),
+    "quat_slerp": (
+        lambda d: Tb.quat_slerp(d.quats, d.quats2, d.fractions),
+        lambda d: [Tn.quat_slerp(a, b, f) for a, b, f in zip(d.quats, d.quats2, d.fractions)],
+        True,
+    ),
+    "quat2mat": (lambda d: d.mats, lambda d: [Tn.quat2mat(q) for q in d.quats], False),
+    "mat2quat": (lambda d: Tb.mat2quat(d.mats), lambda d: [Tn.mat2quat(m) for m in d.mats], True),
+    "quat2axisangle": (
+        lambda d: Tb.quat2axisangle(d.quats),
+        lambda d: [Tn.quat2axisangle(q.copy()) for q in d.quats],
+        False,
+    ),
+    "axisangle2quat": (
+        lambda d: Tb.axisangle2quat(d.axisangles),
+        lambda d: [Tn.axisangle2quat(v) for v in d.axisangles],
+        False,
+    ),
+    "euler2mat": (lambda d: Tb.euler2mat(d.eulers), lambda d: [Tn.euler2mat(e) for e in d.eulers], False),
+    "mat2euler": (
+        lambda d: Tb.mat2euler(Tb.euler2mat(d.eulers)),
+        lambda d: [Tn.mat2euler(Tn.euler2mat(e)) for e in d.eulers],
+        False,
+    ),
+    "quat_apply": (
+        lambda d: Tb.quat_apply(d.quats, d.positions),
+        lambda d: [Tn.quat2mat(q) @ p for q, p in zip(d.quats, d.positions)],
+        False,
+    ),
+    "pose2mat": (lambda d: d.hmats, lambda d: [Tn.pose2mat((p, q)) for p, q in zip(d.positions, d.quats)], False),
+    "mat2pose": (
+        lambda d: np.concatenate(Tb.mat2pose(d.hmats), -1),
+        lambda d: [np.concatenate(Tn.mat2pose(h)) for h in d.hmats],
+        False,
+    ),
+    "pose_inv": (lambda d: Tb.pose_inv(d.hmats), lambda d: [Tn.pose_inv(h) for h in d.hmats], False),
+    "pose_in_A_to_pose_in_B": (
+        lambda d: Tb.pose_in_A_to_pose_in_B(d.hmats, d.hmats[::-1]),
+        lambda d: [Tn.pose_in_A_to_pose_in_B(a, b) for a, b in zip(d.hmats, d.hmats[::-1])],
+        False,
+    ),
+    "rotate_2d_point": (
+        lambda d: Tb.rotate_2d_point(d.positions[:, :2], d.eulers[:, 2]),
+        lambda d: [Tn.rotate_2d_point(p, r) for p, r in zip(d.positions[:, :2], d.eulers[:, 2])],
+        False,
+    ),
+    "compute_delta_pose": (
+        lambda d: Tb.compute_delta_pose(d.poses7, d.poses7b),
+        lambda d: Tn.compute_delta_pose(d.poses7, d.poses7b),
+        False,
+    ),
+    "pose_left_multiply": (
+        lambda d: Tb.pose_left_multiply(d.poses7, d.poses7b),
+        lambda d: Tn.pose_left_multiply(d.poses7, d.poses7b),
+        False,
+    ),
+    "leading_dims": (lambda d: Tb.quat2mat(d.quats.reshape(4, -1, 4)).reshape(-1, 3, 3), lambda d: d.mats, False),
+}
+
+# name: (function, names of the data fields it is called with)
+TORCH_CASES = {
+    "quat_multiply": (Tb.quat_multiply, ("quats", "quats2")),
+    "quat_slerp": (Tb.quat_slerp, ("quats", "quats2", "fractions")),
+    "quat2mat": (Tb.quat2mat, ("quats",)),
+    "mat2quat": (Tb.mat2quat, ("mats",)),
+    "quat2axisangle": (Tb.quat2axisangle, ("quats",)),
+    "axisangle2quat": (Tb.axisangle2quat, ("axisangles",)),
+    "euler2mat": (Tb.euler2mat, ("eulers",)),
+    "mat2euler": (Tb.mat2euler, ("mats",)),
+    "quat_apply": (Tb.quat_apply, ("quats", "positions")),
+    "pose2mat": (Tb.pose2mat, ("positions", "quats")),
+    "pose_inv": (Tb.pose_inv, ("hmats",)),
+    "compute_delta_pose": (Tb.compute_delta_pose, ("poses7", "poses7b")),
+}
+
+
+@pytest.mark.parametrize("name", PER_POSE_CASES)
+def test_matches_per_pose_functions(data, name):
+    batched_fn, reference_fn, rotation = PER_POSE_CASES[name]
+    batched = np.asarray(batched_fn(data), dtype=np.float64)
+    reference = np.asarray(reference_fn(data), dtype=np.float64)
+    if rotation:
+        assert same_rotation(batched, reference)
+    else:
+        np.testing.assert_allclose(batched, reference, atol=ATOL)
+
+
+@pytest.mark.parametrize("name", TORCH_CASES)
+def test_torch_matches_numpy(data, name):
+    fn, fields = TORCH_CASES[name]
+    args = [getattr(data, field) for field in fields]
+    actual = fn(*[torch.as_tensor(arg) for arg in args])
+    assert isinstance(actual, torch.Tensor)
+    np.testing.assert_allclose(actual.numpy(), fn(*args), atol=ATOL)
+
+
+# name: (names of the per-pose data fields it is called with, compare as rotations)
+ENTRY_POINT_CASES = {
+    "convert_quat": (("quats",), False),
+    "quat_multiply": (("quats", "quats2"), False),
+    "quat_conjugate": (("quats",), False),
+    "quat_inverse": (("quats",), False),
+    "quat_distance": (("quats", "quats2"), False),
+    "quat_slerp": (("quats", "quats2", "fractions"), True),
+    "quat2mat": (("quats",), False),
+    "mat2quat": (("mats",), True),
+    "quat2axisangle": (("quats",), False),
+    "axisangle2quat": (("axisangles",), False),
+    "euler2mat": (("eulers",), False),
+    "mat2euler": (("mats",), False),
+    "pose2mat": (("pose_tuples",), False),
+    "mat2pose": (("hmats",), False),
+    "make_pose": (("positions", "mats"), False),
+    "pose_inv": (("hmats",), False),
+    "pose_in_A_to_pose_in_B": (("hmats", "hmats_reversed"), False),
+    "rotate_2d_point": (("points2d", "angles"), False),
+    "quat_mul": (("quats", "quats2"), False),
+    "quat_conj": (("quats",), False),
+    "quat_normalize": (("quats",), False),
+    "quat_to_R": (("quats",), False),
+    "se3_inverse": (("positions", "quats"), False),
+    "se3_compose": (("positions", "quats", "positions_reversed", "quats2"), False),
+}
+NUM_POSES = 16
+
+
+def per_pose_args(data, fields, k, to):
+    values = {
+        "pose_tuples": (data.positions[k], data.quats[k]),
+        "hmats_reversed": data.hmats[-1 - k],
+        "positions_reversed": data.positions[-1 - k],
+        "points2d": data.positions[k, :2],
+        "angles": data.eulers[k, 2],
+    }
+    args = [values[field] if field in values else getattr(data, field)[k] for field in fields]
+    return [tuple(to(x) for x in arg) if isinstance(arg, tuple) else to(arg) for arg in args]
+
+
+def assert_same(actual, expected, rotation):
+    if isinstance(expected, tuple):
+        for a, e in zip(actual, expected):
+            assert_same(a, e, rotation)
+        return
+    actual = np.asarray(actual, dtype=np.float64)
+    expected = np.asarray(expected, dtype=np.float64)
+    assert actual.shape == expected.shape
+    if rotation:
+        assert same_rotation(actual, expected)
+    else:
+        np.testing.assert_allclose(actual, expected, atol=ATOL)
+
+
+@pytest.mark.parametrize("name", ENTRY_POINT_CASES)
+def test_numpy_impl_matches_reference(data, name):
+    fields, rotation = ENTRY_POINT_CASES[name]
+    for k in range(NUM_POSES):
+        # copies, the reference quat2axisangle clips its input in place
+        expected = getattr(Tn, name)(*per_pose_args(data, fields, k, np.array))
+        actual = getattr(numpy_impl, name)(*per_pose_args(data, fields, k, np.array))
+        assert_same(actual, expected, rotation)
+        if isinstance(expected, np.ndarray):
+            assert actual.dtype == expected.dtype, (name, actual.dtype, expected.dtype)
+
+
+@pytest.mark.parametrize("name", ENTRY_POINT_CASES)
+def test_torch_impl_matches_reference(data, name):
+    fields, rotation = ENTRY_POINT_CASES[name]
+    for k in range(NUM_POSES):
+        args = per_pose_args(data, fields, k, torch.tensor)
+        expected = getattr(Tt, name)(*args)
+        actual = getattr(torch_impl, name)(*args)
+        assert_same(
+            tuple(x.numpy() for x in actual) if isinstance(actual, tuple) else actual.numpy(),
+            tuple(x.numpy() for x in expected) if isinstance(expected, tuple) else expected.numpy(),
+            rotation,
+        )
+        if isinstance(expected, torch.Tensor):
+            assert actual.dtype == expected.dtype, (name, actual.dtype, expected.dtype)
+
+
+def test_entry_points_take_batches(data):
+    np.testing.assert_allclose(numpy_impl.quat2mat(data.quats), data.mats, atol=ATOL)
+    eulers = torch.as_tensor(data.eulers)
+    np.testing.assert_allclose(torch_impl.euler2mat(eulers).numpy(), Tb.euler2mat(data.eulers), atol=ATOL)
+    np.testing.assert_allclose(numpy_impl.convert_quat(data.quats, to="wxyz"), data.poses7[:, 3:])
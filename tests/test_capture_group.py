@@ -0,0 +1,155 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Alignment of a capture group of fake cameras producing frames on jittered schedules."""
+
+import time
+from typing import Callable
+
+import numpy as np
+import pytest
+
+# the cameras package imports its configs
+pytest.importorskip("draccus")
+
+from ngine.utils.lerobot_common.cameras.capture_group import CaptureGroup, SharedFrameRing  # noqa: E402
+from ngine.utils.lerobot_common.errors import DeviceNotConnectedError  # noqa: E402
+
+DURATION_S = 1.0
+MAX_SKEW_S = 0.005
+
+
+class FakeCamera:
+    """Camera backend producing synthetic frames on a jittered schedule.
+
+    Frames are due every ``1 / fps`` seconds from ``phase_s`` on, each delayed by a random jitter drawn
+    uniformly from [0, jitter_s]. Every pixel of a frame holds its frame index modulo 256.
+
+    Args:
+        fps: The nominal frame rate.
+        width: The frame width.
+        height: The frame height.
+        jitter_s: The largest delay of a frame past its due time.
+        phase_s: The offset of the schedule.
+        seed: The jitter random seed.
+        clock: Monotonic clock returning seconds.
+    """
+
+    def __init__(
+        self,
+        fps: float = 30.0,
+        width: int = 64,
+        height: int = 48,
+        jitter_s: float = 0.002,
+        phase_s: float = 0.0,
+        seed: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.fps = fps
+        self.width = width
+        self.height = height
+        self.jitter_s = jitter_s
+        self.clock = clock
+        self.rng = np.random.default_rng(seed)
+        self.start_time = clock() + phase_s
+        self.index = 0
+        self.emitted: list[float] = []
+        self.connected = True
+
+    @property
+    def is_connected(self) -> bool:
+        return self.connected
+
+    def disconnect(self):
+        self.connected = False
+
+    def _wait_next(self) -> int:
+        if not self.connected:
+            raise DeviceNotConnectedError("FakeCamera is not connected.")
+        due = self.start_time + self.index / self.fps + self.rng.uniform(0.0, self.jitter_s)
+        # skip the frames already missed, as a camera driver drops them
+        while due < self.clock() - 1.0 / self.fps:
+            self.index += 1
+            due = self.start_time + self.index / self.fps + self.rng.uniform(0.0, self.jitter_s)
+        delay = due - self.clock()
+        if delay > 0:
+            time.sleep(delay)
+        index = self.index
+        self.index += 1
+        self.emitted.append(due)
+        return index
+
+    def read(self, color_mode=None) -> np.ndarray:
+        frame = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        return self.read_into(frame)
+
+    def read_into(self, out: np.ndarray) -> np.ndarray:
+        out.fill(self._wait_next() % 256)
+        return out
+
+    def async_read(self, timeout_ms: float = 200) -> np.ndarray:
+        return self.read()
+
+
+@pytest.fixture
+def group():
+    """Three fake cameras at different rates and phases."""
+    cameras = {
+        "front": FakeCamera(fps=30, jitter_s=0.002, seed=0),
+        "wrist": FakeCamera(fps=30, jitter_s=0.003, phase_s=0.001, seed=1),
+        "top": FakeCamera(fps=60, jitter_s=0.002, phase_s=0.002, seed=2),
+    }
+    group = CaptureGroup(cameras, max_skew_s=MAX_SKEW_S, capacity=8)
+    group.start()
+    yield group
+    group.close()
+
+
+def read_bundles(group, duration_s=DURATION_S):
+    bundles = []
+    end = time.monotonic() + duration_s
+    while time.monotonic() < end:
+        bundles.append(group.read_bundle(timeout_s=0.5))
+    return bundles
+
+
+def test_bundles_are_aligned(group):
+    bundles = read_bundles(group)
+    assert len(bundles) >= 0.8 * DURATION_S * 30
+    assert all(bundle.skew <= MAX_SKEW_S for bundle in bundles)
+    # the timeline only moves forward and no bundle is handed out twice
+    assert all(b.timestamp > a.timestamp for a, b in zip(bundles, bundles[1:]))
+    # the pixels identify the frame, a frame torn by an overwrite would mix two values
+    for bundle in bundles:
+        for name, frame in bundle.frames.items():
+            assert (frame == frame.flat[0]).all(), name
+    stats = group.stats()
+    assert all(stats[f"frames_{name}"] > 0 for name in group.rings)
+
+
+def test_zero_skew_times_out(group):
+    read_bundles(group, duration_s=0.1)
+    # frames of independent clocks never coincide exactly
+    with pytest.raises(TimeoutError):
+        group.read_bundle(timeout_s=0.1, max_skew_s=0.0)
+
+
+def test_rings_attach_by_name(group):
+    read_bundles(group, duration_s=0.1)
+    # a second process would attach by name, the frames are the same memory
+    attached = SharedFrameRing(**group.specs()["front"])
+    try:
+        assert attached.latest_seq() >= 0
+    finally:
+        attached.close()
@@ -0,0 +1,142 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""The streamed state comparison of HDF5 files, on generated episode files."""
+
+import json
+
+import numpy as np
+import pytest
+
+h5py = pytest.importorskip("h5py")
+
+from ngine.engine.checks.compare_hdf5_states import HDF5StateComparator, main  # noqa: E402
+
+STATE = "articulation/robot/joint_position"
+
+
+def write_states(path, states, num_episodes=2):
+    """Writes ``states`` {path under states/: array} into every episode of a new file."""
+    with h5py.File(path, "w") as f:
+        for episode in range(num_episodes):
+            for name, values in states.items():
+                f.create_dataset(f"data/demo_{episode}/states/{name}", data=values, chunks=True)
+    return str(path)
+
+
+def compare(tmp_path, states1, states2, **kwargs):
+    comparator = HDF5StateComparator(
+        write_states(tmp_path / "a.hdf5", states1), write_states(tmp_path / "b.hdf5", states2), **kwargs
+    )
+    return comparator.compare_files()
+
+
+def state_diff(result, episode="demo_0"):
+    category = result["state_differences"]["episode_differences"][episode]["category_differences"]["articulation"]
+    return category["entity_differences"]["robot"]["state_differences"]["joint_position"]
+
+
+@pytest.fixture
+def joint_pos():
+    return np.random.default_rng(0).standard_normal((500, 20)).astype(np.float32)
+
+
+@pytest.mark.parametrize("block_bytes", [64, 1 << 20])
+def test_identical(tmp_path, joint_pos, block_bytes):
+    states = {STATE: joint_pos, "rigid_object/cube/root_pose": joint_pos[:, :7]}
+    result = compare(tmp_path, states, states, block_bytes=block_bytes)
+    assert result["summary"]["files_identical"]
+
+
+def test_tolerance_edge(tmp_path, joint_pos):
+    joint_pos = joint_pos.astype(np.float64)
+    other = joint_pos.copy()
+    other[10, 3] += 0.5
+    other[20, 4] += 0.25
+    # a difference equal to the tolerance is not a violation
+    result = compare(tmp_path, {STATE: joint_pos}, {STATE: other}, tolerance=0.5)
+    assert result["summary"]["files_identical"]
+
+    result = compare(tmp_path, {STATE: joint_pos}, {STATE: other}, tolerance=0.3, block_bytes=64)
+    diff = state_diff(result)
+    assert diff["value_differences"]["num_different_elements"] == 1
+    assert diff["value_differences"]["first_divergence"] == [10, 3]
+    assert diff["max_difference"] == pytest.approx(0.5)
+
+
+def test_nan(tmp_path, joint_pos):
+    joint_pos[5, 2] = np.nan
+    # matching NaNs are equal
+    assert compare(tmp_path, {STATE: joint_pos}, {STATE: joint_pos})["summary"]["files_identical"]
+
+    other = joint_pos.copy()
+    other[7, 1] = np.nan
+    diff = state_diff(compare(tmp_path, {STATE: joint_pos}, {STATE: other}))
+    assert diff["value_differences"]["first_divergence"] == [7, 1]
+    assert diff["value_differences"]["num_different_elements"] == 1
+    assert diff["max_difference"] == np.inf
+
+
+def test_inf(tmp_path):
+    values = np.array([[1.0, np.inf, -np.inf, np.nan]] * 4)
+    # matching infinities are equal
+    assert compare(tmp_path, {STATE: values}, {STATE: values})["summary"]["files_identical"]
+
+    other = values.copy()
+    other[2, 1] = -np.inf
+    other[3, 0] = np.inf
+    diff = state_diff(compare(tmp_path, {STATE: values}, {STATE: other}))
+    assert diff["value_differences"]["num_different_elements"] == 2
+    assert diff["value_differences"]["first_divergence"] == [2, 1]
+    assert diff["max_difference"] == np.inf
+
+
+def test_mismatched_shape(tmp_path, joint_pos):
+    result = compare(tmp_path, {STATE: joint_pos}, {STATE: joint_pos[:-1]})
+    diff = state_diff(result)
+    assert diff["shape_difference"]
+    assert diff["shape1"] == joint_pos.shape and diff["shape2"] == joint_pos[:-1].shape
+    assert not result["summary"]["files_identical"]
+
+
+def test_integer_states(tmp_path):
+    values = np.arange(100, dtype=np.int64).reshape(50, 2)
+    other = values.copy()
+    other[30, 1] = -1
+    diff = state_diff(compare(tmp_path, {STATE: values}, {STATE: other}, block_bytes=16))
+    assert diff["value_differences"]["first_divergence"] == [30, 1]
+
+
+def test_workers_match_serial(tmp_path, joint_pos):
+    other = joint_pos.copy()
+    other[100:, 0] += 1.0
+    states1 = {STATE: joint_pos, "rigid_object/cube/root_pose": joint_pos[:, :7]}
+    states2 = {STATE: other, "rigid_object/cube/root_pose": joint_pos[:, :7] * 2}
+    serial = compare(tmp_path, states1, states2)
+    parallel = compare(tmp_path, states1, states2, num_workers=2)
+    assert parallel["state_differences"] == serial["state_differences"]
+
+
+def test_report_is_strict_json(tmp_path, monkeypatch):
+    values = np.array([[1.0, 2.0]] * 3)
+    other = values.copy()
+    other[1, 0] = np.nan
+    file1 = write_states(tmp_path / "a.hdf5", {STATE: values})
+    file2 = write_states(tmp_path / "b.hdf5", {STATE: other})
+    output = tmp_path / "report.json"
+    monkeypatch.setattr("sys.argv", ["compare_hdf5_states", file1, file2, "--output", str(output)])
+    assert main() == 1
+
+    report = json.loads(output.read_text(), parse_constant=lambda constant: pytest.fail(f"{constant} in the report"))
+    assert state_diff(report)["max_difference"] == "inf"
@@ -0,0 +1,150 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Cold, memoized and disk cached loads of the shipped configs against the uncached resolution, and schema checks."""
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from ngine import CONFIGS_PATH
+from ngine.utils.config_loader import TELEOP_CONFIG_SCHEMA, ConfigLoader, ConfigSchemaError, parse_yaml_with_locations
+
+
+def reference_load(yml_meta, name, loaded_files=None):
+    """Uncached resolution of the previous ConfigLoader.load."""
+    yaml_path = yml_meta[name]
+    loaded_files = set() if loaded_files is None else loaded_files
+    loaded_files.add(yaml_path.resolve())
+    with open(yaml_path, "r") as f:
+        cfg = yaml.safe_load(f) or {}
+    base_cfg = {}
+    if "_base_" in cfg and cfg["_base_"]:
+        base_files = cfg["_base_"] if isinstance(cfg["_base_"], list) else [cfg["_base_"]]
+        for base_file in base_files:
+            base_name = Path(base_file).stem
+            if base_name not in yml_meta:
+                yml_meta[base_name] = (yaml_path.parent / base_file).resolve()
+            base_cfg = ConfigLoader.merge_dicts(base_cfg, reference_load(yml_meta, base_name, loaded_files))
+        cfg.pop("_base_")
+    return ConfigLoader.merge_dicts(base_cfg, cfg)
+
+
+@pytest.fixture(scope="module")
+def reference():
+    yml_meta = ConfigLoader(use_disk_cache=False).yml_meta
+    return {name: reference_load(dict(yml_meta), name) for name in sorted(yml_meta)}
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("NGINE_CACHE_DIR", str(tmp_path))
+    monkeypatch.delenv("NGINE_DISABLE_CACHE", raising=False)
+
+
+def assert_loads_match(loader, reference):
+    for name, expected in reference.items():
+        # the second load comes from the memo
+        for _ in range(2):
+            assert vars(loader.load(name)) == expected, name
+
+
+def test_cold_loads_match_reference(reference):
+    assert reference
+    assert_loads_match(ConfigLoader(use_disk_cache=False), reference)
+
+
+def test_disk_cached_loads_match_reference(reference):
+    # the first loader writes the entries, the second one reads them
+    assert_loads_match(ConfigLoader(), reference)
+    assert_loads_match(ConfigLoader(), reference)
+
+
+def test_loads_are_copies(reference):
+    loader = ConfigLoader()
+    name = next(iter(reference))
+    vars(loader.load(name))["_mutated"] = True
+    assert vars(loader.load(name)) == reference[name]
+
+
+SCHEMA = {"task": str, "robot_scale": float, "seed": (int, type(None)), "sources": [str], "sim": {"dt": float}}
+
+BASE = """\
+task: PnPCounterToSink
+robot_scale: fast
+sources:
+  - objaverse
+sim:
+  dt: 0.01
+"""
+
+
+def write_configs(root, files):
+    loader = ConfigLoader(use_disk_cache=False)
+    loader._yml_meta = {}
+    for name, text in files.items():
+        path = root / f"{name}.yml"
+        path.write_text(text)
+        loader._yml_meta[name] = path.resolve()
+    return loader
+
+
+def test_wrong_type_is_located_in_the_base_file(tmp_path):
+    loader = write_configs(tmp_path, {"base": BASE, "task": "_base_: base.yml\nseed: 3\n"})
+    with pytest.raises(ConfigSchemaError) as info:
+        loader.load("task", schema=SCHEMA)
+    assert info.value.location == f"{tmp_path / 'base.yml'}:2:1"
+    assert "'robot_scale' should be float, got str 'fast'" in str(info.value)
+
+    # overriding the value in the child fixes it
+    loader = write_configs(tmp_path, {"base": BASE, "task": "_base_: base.yml\nrobot_scale: 1\n"})
+    assert loader.load("task", schema=SCHEMA).robot_scale == 1
+
+
+def test_wrong_nested_type(tmp_path):
+    loader = write_configs(tmp_path, {"base": BASE, "task": "_base_: base.yml\nrobot_scale: 1.0\nsim:\n  dt: null\n"})
+    with pytest.raises(ConfigSchemaError) as info:
+        loader.load("task", schema=SCHEMA)
+    assert info.value.location == f"{tmp_path / 'task.yml'}:4:3"
+
+
+def test_missing_required_key(tmp_path):
+    loader = write_configs(tmp_path, {"task": "robot_scale: 1.0\nsources: []\nsim: {dt: 0.01}\n"})
+    with pytest.raises(ConfigSchemaError, match="missing key 'task'"):
+        loader.load("task", schema=SCHEMA)
+    # keys allowing None are optional
+    loader = write_configs(tmp_path, {"task": "task: t\nrobot_scale: 1.0\nsources: []\nsim: {dt: 0.01}\n"})
+    assert not hasattr(loader.load("task", schema=SCHEMA), "seed")
+
+
+def test_duplicate_key(tmp_path):
+    path = tmp_path / "duplicate.yml"
+    path.write_text("task: a\nsim:\n  dt: 0.01\n  dt: 0.02\n")
+    with pytest.raises(ConfigSchemaError) as info:
+        parse_yaml_with_locations(path)
+    assert info.value.location == f"{path}:4:3"
+    assert f"duplicate key 'sim.dt', first defined at {path}:3:3" in str(info.value)
+    # also raised through the loader
+    with pytest.raises(ConfigSchemaError):
+        write_configs(tmp_path, {"duplicate": path.read_text()}).load("duplicate")
+
+
+def test_shipped_teleop_configs_match_the_schema():
+    loader = ConfigLoader(use_disk_cache=False)
+    teleop_dir = (CONFIGS_PATH / "data_collection" / "teleop").resolve()
+    names = [name for name, path in loader.yml_meta.items() if Path(path).parent == teleop_dir]
+    assert names
+    for name in names:
+        loader.load(name, schema=TELEOP_CONFIG_SCHEMA)
@@ -0,0 +1,120 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import ast
+
+import numpy as np
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from ngine.utils.csv_loader import CSVLoader, layout_style  # noqa: E402
+
+
+class PandasCSVLoader:
+    """The pandas based loader the indexed one replaced, one filter per table and lookup."""
+
+    def __init__(self, csv_paths):
+        self.csv_data = [pd.read_csv(path) for path in csv_paths]
+
+    def load_robot_pose(self, robot_name, scene_name, task_name):
+        for data in self.csv_data:
+            row = data[(data['robot'] == robot_name) & (data['layout'] == scene_name) & (data['task'] == task_name)]
+            if not row.empty:
+                row = row.iloc[0]
+                return ast.literal_eval(row['init_robot_base_pos']), ast.literal_eval(row['init_robot_base_ori'])
+        return None, None
+
+    def load_object_offset(self, robot_name, scene_name, task_name):
+        for data in self.csv_data:
+            row = data[(data['robot'] == robot_name) & (data['layout'] == scene_name) & (data['task'] == task_name)]
+            if not row.empty:
+                return ast.literal_eval(row.iloc[0]['object_init_offset'])
+        return np.zeros(2,)
+
+
+def outcome(fn, *args):
+    try:
+        return "ok", fn(*args)
+    except (ValueError, SyntaxError) as e:
+        return "error", type(e)
+
+
+@pytest.fixture(params=["cold", "cached"])
+def loaders(request, tmp_path, monkeypatch):
+    monkeypatch.setenv("NGINE_CACHE_DIR", str(tmp_path))
+    monkeypatch.delenv("NGINE_DISABLE_CACHE", raising=False)
+    loader = CSVLoader()
+    if request.param == "cached":
+        loader = CSVLoader()
+    return loader, PandasCSVLoader(loader.csv_paths)
+
+
+def lookup_keys(loader):
+    keys = list(dict.fromkeys((row["robot"], row["layout"], row["task"]) for row in loader.rows))
+    robot, layout, task = keys[0]
+    # misses on each column
+    return keys + [("NoRobot", layout, task), (robot, "NoLayout", task), (robot, layout, "NoTask")]
+
+
+def test_pose_lookups_match_pandas(loaders):
+    loader, reference = loaders
+    assert loader.rows
+    for key in lookup_keys(loader):
+        assert outcome(loader.load_robot_pose, *key) == outcome(reference.load_robot_pose, *key), key
+        expected = outcome(reference.load_object_offset, *key)
+        actual = outcome(loader.load_object_offset, *key)
+        assert actual[0] == expected[0] and np.array_equal(actual[1], expected[1]), key
+
+
+def test_find_row_matches_linear_scan(loaders):
+    loader, _ = loaders
+    for key in lookup_keys(loader):
+        expected = next((row for row in loader.rows if (row["robot"], row["layout"], row["task"]) == key), None)
+        assert loader.find_row(*key) is expected, key
+
+
+def test_unparseable_base_pos_raises(loaders):
+    loader, reference = loaders
+    rows = [row for row in loader.rows if row["init_robot_base_pos"] == "none"]
+    assert rows
+    for row in rows:
+        key = (row["robot"], row["layout"], row["task"])
+        if loader.find_row(*key) is row:
+            with pytest.raises(ValueError):
+                loader.load_robot_pose(*key)
+            with pytest.raises(ValueError):
+                reference.load_robot_pose(*key)
+
+
+def test_query_matches_pandas(loaders):
+    loader, reference = loaders
+    table = pd.concat(reference.csv_data, ignore_index=True)
+    row = loader.rows[0]
+    style = layout_style(row["layout"])
+    queries = [
+        {"task": row["task"]},
+        {"layout": row["layout"]},
+        {"robot": row["robot"], "style": style},
+        {"task": row["task"], "layout": row["layout"], "robot": row["robot"]},
+    ]
+    for query in queries:
+        mask = np.ones(len(table), dtype=bool)
+        for column in ("task", "layout", "robot"):
+            if column in query:
+                mask &= (table[column] == query[column]).to_numpy()
+        if "style" in query:
+            mask &= table["layout"].map(layout_style).eq(query["style"]).to_numpy()
+        expected = table[mask][["robot", "layout", "task"]].values.tolist()
+        assert [[r["robot"], r["layout"], r["task"]] for r in loader.query(**query)] == expected, query
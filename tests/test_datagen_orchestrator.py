@@ -0,0 +1,148 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""The sharded data generation orchestrator, with stub workers instead of Isaac Sim."""
+
+import importlib
+import json
+import shlex
+import sys
+
+import numpy as np
+import pytest
+
+h5py = pytest.importorskip("h5py")
+pytest.importorskip("yaml")
+
+from ngine.scripts.datagen import orchestrator  # noqa: E402
+from ngine.scripts.datagen.orchestrator import (  # noqa: E402
+    STUB_COMMAND,
+    DataGenOrchestrator,
+    Manifest,
+    expand_grid,
+    merge_hdf5,
+    parse_seeds,
+)
+from ngine.scripts.datagen.stub_worker import write_stub_dataset  # noqa: E402
+
+# writes its output from the given attempt on, fails before
+FLAKY_WORKER = """
+import os, sys
+if int(os.environ["NGINE_SHARD_ATTEMPT"]) < int(sys.argv[2]):
+    sys.exit(3)
+open(sys.argv[1], "w").close()
+"""
+
+
+def flaky_command(tmp_path, succeed_from):
+    script = tmp_path / "flaky_worker.py"
+    script.write_text(FLAKY_WORKER)
+    return f"{shlex.quote(sys.executable)} {shlex.quote(str(script))} {{output}} {succeed_from}"
+
+
+def run(tmp_path, shards, command, **kwargs):
+    manifest = Manifest(tmp_path / "out" / "manifest.json", shards, command)
+    counts = DataGenOrchestrator(manifest, command, tmp_path / "out", **kwargs).run(poll_interval=0.01)
+    return manifest, counts
+
+
+def test_parse_seeds():
+    assert parse_seeds("0-3, 7,9") == [0, 1, 2, 3, 7, 9]
+    assert parse_seeds("5") == [5]
+    assert parse_seeds([1, "2"]) == [1, 2]
+    assert parse_seeds("") == []
+
+
+def test_expand_grid():
+    shards = expand_grid(["PnPCounterToSink", "OpenDrawer"], ["robocasakitchen-1-1", "kitchen/2"], [0, 1, 2])
+    assert len(shards) == 12
+    assert len({shard.shard_id for shard in shards}) == 12
+    assert (shards[0].task, shards[0].layout, shards[0].seed) == ("PnPCounterToSink", "robocasakitchen-1-1", 0)
+    # usable as a file name
+    assert all("/" not in shard.shard_id for shard in shards)
+    assert all(shard.status == "pending" and shard.attempts == 0 for shard in shards)
+
+
+def test_stub_command_quotes_the_interpreter(monkeypatch):
+    monkeypatch.setattr(sys, "executable", "/opt/my python/bin/python")
+    try:
+        command = importlib.reload(orchestrator).STUB_COMMAND
+    finally:
+        monkeypatch.undo()
+        importlib.reload(orchestrator)
+    assert shlex.split(command)[0] == "/opt/my python/bin/python"
+
+
+def test_retry_then_done(tmp_path):
+    manifest, counts = run(tmp_path, expand_grid(["task"], ["layout"], [0, 1]), flaky_command(tmp_path, 2), max_retries=2)
+    assert counts == {"pending": 0, "running": 0, "done": 2, "failed": 0}
+    assert all(shard.attempts == 2 and shard.error is None for shard in manifest.shards.values())
+
+
+def test_retry_then_failed(tmp_path):
+    manifest, counts = run(tmp_path, expand_grid(["task"], ["layout"], [0]), flaky_command(tmp_path, 99), max_retries=2)
+    assert counts["failed"] == 1
+    (shard,) = manifest.shards.values()
+    assert shard.attempts == 3 and shard.error == "exit code 3"
+    # one log per attempt
+    assert len(list((tmp_path / "out" / "logs").glob(f"{shard.shard_id}.attempt*.log"))) == 3
+
+    saved = json.loads((tmp_path / "out" / "manifest.json").read_text())
+    assert [state["status"] for state in saved["shards"]] == ["failed"]
+
+
+def test_resume_from_the_manifest(tmp_path):
+    command = STUB_COMMAND + " --episodes 1 --steps 5"
+    shards = expand_grid(["task"], ["layout"], [0, 1, 2])
+    first, counts = run(tmp_path, shards, command, workers=2)
+    assert counts["done"] == 3
+
+    # an interrupted run and a deleted output are run again, the other done shards are kept
+    saved = json.loads((tmp_path / "out" / "manifest.json").read_text())
+    saved["shards"][1]["status"] = "running"
+    (tmp_path / "out" / "manifest.json").write_text(json.dumps(saved))
+    deleted = first.shards[shards[2].shard_id].output
+    (tmp_path / "out" / "shards" / deleted.rsplit("/", 1)[-1]).unlink()
+
+    resumed, counts = run(tmp_path, expand_grid(["task"], ["layout"], [0, 1, 2]), command)
+    assert counts["done"] == 3
+    attempts = [shard.attempts for shard in resumed.shards.values()]
+    assert attempts == [1, 2, 2]
+
+
+def test_merge_renumbers_the_demos(tmp_path):
+    shards = expand_grid(["PnPCounterToSink"], ["layout_a", "layout_b"], [0])
+    episodes = [11, 2]
+    for shard, num_episodes in zip(shards, episodes):
+        shard.output = str(tmp_path / f"{shard.shard_id}.hdf5")
+        write_stub_dataset(shard.output, shard.task, shard.layout, shard.seed, num_episodes, steps=4)
+
+    summary = merge_hdf5(shards, tmp_path / "merged.hdf5")
+    assert summary == {"episodes": 13, "samples": 13 * 4, "shards": 2}
+    with h5py.File(tmp_path / "merged.hdf5", "r") as merged:
+        data = merged["data"]
+        assert sorted(data, key=lambda name: int(name.split("_")[1])) == [f"demo_{i}" for i in range(13)]
+        assert data.attrs["total"] == 13 * 4
+        assert json.loads(data.attrs["env_args"])["layout"] == "layout_a"
+        offset = 0
+        for shard, num_episodes in zip(shards, episodes):
+            with h5py.File(shard.output, "r") as src:
+                for i in range(num_episodes):
+                    # numeric order of the source demos, demo_10 after demo_9
+                    episode = data[f"demo_{offset + i}"]
+                    np.testing.assert_array_equal(episode["actions"][()], src[f"data/demo_{i}/actions"][()])
+                    assert episode.attrs["shard_id"] == shard.shard_id
+                    assert episode.attrs["layout"] == shard.layout
+                    assert json.loads(episode.attrs["env_args"])["layout"] == shard.layout
+            offset += num_episodes
@@ -0,0 +1,80 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Frames of the debug overlay on the headless backend, every frame must be one batch showing exactly its primitives."""
+
+import pytest
+
+from ngine.utils.debug_overlay import DebugOverlay, HeadlessDrawBackend, box_edges
+
+
+@pytest.fixture
+def overlay():
+    overlay = DebugOverlay(HeadlessDrawBackend())
+    overlay.box((0, 0, 0), (1, 1, 1), key="table")
+    overlay.box((0, 0, 0), (1, 1, 1), key="table")
+    return overlay
+
+
+def test_static_primitives_are_submitted_once(overlay):
+    backend = overlay.backend
+    assert overlay.flush()
+    assert len(backend.calls) == 2 and len(backend.calls[1][1][0]) == 12
+    # the screen already shows the static set
+    assert not overlay.flush()
+    assert len(backend.calls) == 2
+
+
+def test_dynamic_primitives_live_one_frame(overlay):
+    backend = overlay.backend
+    overlay.flush()
+    # one clear and one draw call per kind, duplicates dropped
+    for _ in range(2):
+        overlay.line((0, 0, 0), (0, 0, 1), color=(0, 1, 0))
+    overlay.point((0, 0, 1))
+    assert overlay.flush()
+    assert [kind for kind, _ in backend.calls[2:]] == ["clear", "lines", "points"]
+    lines, points = backend.on_screen()
+    assert len(lines) == 13 and len(points) == 1
+    assert lines[-1] == ((0.0, 0.0, 0.0), (0.0, 0.0, 1.0), (0.0, 1.0, 0.0, 1.0), 1.0)
+
+    assert overlay.flush()
+    lines, points = backend.on_screen()
+    assert len(lines) == 12 and not points
+
+
+def test_static_primitives_by_key(overlay):
+    backend = overlay.backend
+    overlay.flush()
+    # replacing a static entry by key redraws it
+    overlay.box((0, 0, 1), (1, 1, 1), key="table")
+    assert overlay.flush()
+    assert max(line[0][2] for line in backend.on_screen()[0]) == 2.0
+    # removing the last one clears the screen
+    overlay.remove("table")
+    assert overlay.flush()
+    assert backend.on_screen() == ([], [])
+    assert not overlay.flush()
+
+
+def test_box_edges():
+    # every box edge has length 2 * extent along exactly one axis
+    edges = box_edges((1, 2, 3), (0.5, 1, 2))
+    lengths = sorted(sum(abs(a - b) for a, b in zip(start, end)) for start, end in edges)
+    assert lengths == [1.0] * 4 + [2.0] * 4 + [4.0] * 4
+
+
+def test_invalid_vector():
+    with pytest.raises(ValueError):
+        DebugOverlay(HeadlessDrawBackend()).point((0, 0))
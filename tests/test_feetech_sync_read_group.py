@@ -0,0 +1,86 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Grouped sync reads and the static register cache of the Feetech bus, on a simulated servo chain."""
+
+import numpy as np
+import pytest
+
+# dependencies of motors_bus
+pytest.importorskip("serial")
+pytest.importorskip("deepdiff")
+
+from ngine.utils.lerobot_common.motors.feetech.simulated import (  # noqa: E402
+    SimulatedFeetechMotorsBus,
+    SimulatedServoChain,
+)
+from ngine.utils.lerobot_common.motors.motors_bus import Motor, MotorNormMode  # noqa: E402
+
+DATA_NAMES = ["Present_Position", "Present_Velocity", "Present_Load", "Present_Temperature", "Present_Current"]
+
+
+@pytest.fixture
+def bus():
+    rng = np.random.default_rng(0)
+    motors = {f"joint_{i}": Motor(i + 1, "sts3215", MotorNormMode.RANGE_M100_100) for i in range(6)}
+    chain = SimulatedServoChain(motors)
+    bus = SimulatedFeetechMotorsBus("sim", motors, chain=chain)
+    bus.connect()
+    for id_ in chain.motors:
+        chain.write_value(id_, *chain._address(id_, "Present_Load"), int(rng.integers(0, 1000)))
+        chain.write_value(id_, *chain._address(id_, "Present_Temperature"), int(rng.integers(25, 60)))
+        chain.write_value(id_, *chain._address(id_, "Present_Current"), int(rng.integers(0, 500)))
+    # motors at rest, so that successive reads see the same state
+    chain.tracking = 0.0
+    chain.num_transactions, chain.bus_time_s = 0, 0.0
+    yield bus
+    bus.disconnect(disable_torque=False)
+
+
+def test_grouped_read_matches_single_reads(bus):
+    chain = bus.chain
+    single = {data_name: bus.sync_read(data_name, normalize=False) for data_name in DATA_NAMES}
+    single_transactions, single_time = chain.num_transactions, chain.bus_time_s
+
+    chain.num_transactions, chain.bus_time_s = 0, 0.0
+    assert bus.sync_read_group(DATA_NAMES, normalize=False) == single
+    # one transaction for contiguous registers
+    assert chain.num_transactions == 1 < single_transactions
+    assert chain.bus_time_s < single_time
+
+
+def test_sync_readers_are_reused(bus):
+    bus.sync_read_group(DATA_NAMES, normalize=False)
+    readers = dict(bus._sync_readers)
+    bus.sync_read_group(DATA_NAMES, normalize=False)
+    assert bus._sync_readers == readers
+
+
+def test_static_registers_are_cached(bus):
+    chain = bus.chain
+    calibration = bus.read_calibration()
+    assert chain.num_transactions > 0
+
+    chain.num_transactions = 0
+    assert bus.read_calibration() == calibration
+    bus.sync_read_group(["Homing_Offset", "Min_Position_Limit"], normalize=False)
+    assert chain.num_transactions == 0
+
+
+def test_written_static_register_is_invalidated(bus):
+    offsets = bus.sync_read_group(["Homing_Offset", "Min_Position_Limit"], normalize=False)
+    motor = next(iter(bus.motors))
+    assert offsets["Homing_Offset"][motor] != 7
+    bus.write("Homing_Offset", motor, 7, normalize=False)
+    assert bus.read("Homing_Offset", motor, normalize=False) == 7
@@ -0,0 +1,126 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Offline checker evaluation of synthetic episodes with known defects."""
+
+import numpy as np
+import pytest
+
+h5py = pytest.importorskip("h5py")
+pytest.importorskip("torch")
+
+from ngine.engine.checks import offline_eval  # noqa: E402
+from ngine.engine.checks.offline_eval import CHECKER_INPUTS, CLIPPING_SENSORS, evaluate_datasets  # noqa: E402
+from ngine.engine.checks.quality_report import REPORT_DIR, QualityReportStore  # noqa: E402
+
+SYNTHETIC_JOINT_NAMES = ("arm_left_elbow_pitch_joint", "arm_right_elbow_pitch_joint") + tuple(
+    f"joint_{i}" for i in range(2, 20)
+)
+NAMES = {"body_names": [f"arm_link{i}" for i in range(6)], "joint_names": list(SYNTHETIC_JOINT_NAMES)}
+
+
+def write_synthetic_episodes(path, num_frames=300, num_joints=len(SYNTHETIC_JOINT_NAMES), num_objects=3, seed=0):
+    """
+    Writes a dataset of four episodes: clean, an object drop, a gripper force spike and a robot body jump.
+
+    Returns:
+        dict: {episode name: checkers expected to fail}
+    """
+    rng = np.random.default_rng(seed)
+    num_bodies = 6
+
+    def walk(*shape, scale):
+        return np.cumsum(rng.standard_normal((num_frames,) + shape) * scale, axis=0).astype(np.float32)
+
+    expected = {"demo_0": set(), "demo_1": {"obj_drop"}, "demo_2": {"clipping"}, "demo_3": {"motion"}}
+    with h5py.File(path, "w") as f:
+        for name, failing in expected.items():
+            group = f.create_group(f"data/{name}")
+            group.attrs["success"] = True
+            joint_pos = walk(num_joints, scale=0.002) + 0.3
+            # elbows bent at 90 degrees, the range of the arm_joint_angle checker
+            joint_pos[:, :2] += np.pi / 2 - 0.3
+            group["states/articulation/robot/joint_position"] = joint_pos
+            group["actions"] = joint_pos + rng.uniform(-0.01, 0.01, joint_pos.shape).astype(np.float32)
+
+            for i in range(num_objects):
+                pose = np.zeros((num_frames, 7), dtype=np.float32)
+                pose[:, :3] = np.array([0.2 * i, 0.0, 0.9]) + walk(3, scale=0.0002)
+                pose[:, 3] = 1.0
+                if "obj_drop" in failing and i == 0:
+                    # falls off the table at frame 150, about 2.5 m/s at the end
+                    t = np.clip(np.arange(num_frames) - 150, 0, None) * 0.02
+                    pose[:, 2] = np.maximum(pose[:, 2] - 0.5 * 9.81 * t ** 2, 0.0)
+                group[f"states/rigid_object/object_{i}/root_pose"] = pose
+
+            body_pose = np.zeros((num_frames, num_bodies, 7), dtype=np.float32)
+            body_pose[..., :3] = np.array([0.0, 0.0, 0.8]) + walk(num_bodies, 3, scale=0.0005)
+            body_pose[..., 3] = 1.0
+            if "motion" in failing:
+                body_pose[120:, 2, :3] += 0.1
+            group["checker_signals/robot_body_com_pose_w"] = body_pose
+
+            for sensor in CLIPPING_SENSORS:
+                force = np.zeros((num_frames, 1, 3), dtype=np.float32)
+                force[60:260, 0, 2] = 10.0 + rng.uniform(0.0, 1.0, 200)
+                if "clipping" in failing and sensor == "left_gripper":
+                    force[140:150, 0, 2] = 400.0
+                group[f"checker_signals/contact_forces/{sensor}"] = force
+    return expected
+
+
+@pytest.fixture(scope="module")
+def evaluated(tmp_path_factory):
+    root = tmp_path_factory.mktemp("offline_eval")
+    expected = write_synthetic_episodes(root / "synthetic.hdf5")
+    verdicts = evaluate_datasets(
+        str(root), checker_types=list(CHECKER_INPUTS), names=NAMES, workers=0, log=lambda *_: None
+    )
+    return root, expected, verdicts["files"]["synthetic.hdf5"]["episodes"]
+
+
+def test_defects_fail_their_checker(evaluated):
+    _, expected, episodes = evaluated
+    assert set(episodes) == set(expected)
+    for name, failing in expected.items():
+        failed = {t for t, entry in episodes[name]["checkers"].items() if entry["status"] == "failed"}
+        assert failing <= failed, name
+        # only the clean episode passes
+        assert episodes[name]["passed"] == (not failing), name
+
+
+def test_no_checker_is_skipped(evaluated):
+    # every input is in the synthetic dataset
+    _, _, episodes = evaluated
+    for name, episode in episodes.items():
+        assert {entry["status"] for entry in episode["checkers"].values()} <= {"passed", "failed"}, name
+
+
+def test_verdicts_are_added_to_the_quality_report(evaluated):
+    root, _, episodes = evaluated
+    report = QualityReportStore(root / REPORT_DIR).read(["metric="])
+    assert report.num_rows == sum(len(episode["checkers"]) for episode in episodes.values())
+
+
+def test_only_the_checker_inputs_are_read(tmp_path, monkeypatch):
+    path = tmp_path / "synthetic.hdf5"
+    write_synthetic_episodes(path)
+    with h5py.File(path, "a") as f:
+        f["data/demo_0/obs/camera_rgb"] = np.zeros((300, 8, 8, 3), dtype=np.uint8)
+        f["data/demo_0/raw_input"] = np.zeros((300, 4), dtype=np.float32)
+    read = []
+    monkeypatch.setattr(offline_eval, "evaluate_episode", lambda episode, *args: read.append(set(episode)) or {})
+    offline_eval.evaluate_file(path, ["obj_drop"])
+    assert read and all(keys <= set(offline_eval.EPISODE_INPUTS) for keys in read)
+    assert read[0] == {"states", "actions", "checker_signals"}
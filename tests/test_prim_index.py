@@ -0,0 +1,169 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""The prim index against Usd.PrimRange traversals, and the index-backed OpenUsd.get_prim_by_* lookups."""
+
+import pytest
+
+pytest.importorskip("pxr")
+
+from pxr import Usd  # noqa: E402
+
+from ngine.utils.prim_index import get_prim_index  # noqa: E402
+
+STARTS = [
+    "/",
+    "/World",
+    "/World/fixture_0_Drawer",
+    "/World/fixture_0_Drawer/part_0",
+    "/World/fixture_19_cab",
+]
+
+# (OpenUsd method, arguments after the start prim, keyword arguments)
+LOOKUPS = [
+    ("get_prim_by_name", ("handle_joint",), {}),
+    ("get_prim_by_name", ("Handle_joint",), {"only_xform": False, "case_sensitive": True}),
+    ("get_prim_by_name", ("handle_joint",), {"only_xform": False, "only_first": True}),
+    ("get_prim_by_prefix", ("FIXTURE_",), {}),
+    ("get_prim_by_prefix", ("part",), {"only_xform": False}),
+    ("get_prim_by_suffix", ("_JOINT",), {"only_xform": False}),
+    ("get_prim_by_suffix", ("drawer",), {}),
+    ("get_prim_by_subname", ("joint",), {}),
+    ("get_prim_by_name_and_type", ("HANDLE_JOINT", "PhysicsRevoluteJoint"), {}),
+    ("get_prim_by_prefix_and_type", ("part_", "Mesh"), {}),
+    ("get_prim_by_suffix_and_type", ("_joint", "Xform"), {}),
+    ("get_prim_by_subname_and_type", ("visual", "Scope"), {}),
+    ("get_prim_by_types", (["Mesh", "Scope"],), {}),
+    ("get_prim_by_type", (), {"exclude_types": ["Xform"]}),
+    ("get_prim_by_type", (), {"include_types": ["PhysicsRevoluteJoint"]}),
+]
+
+
+def build_synthetic_stage(num_fixtures=20, parts_per_fixture=8):
+    """In-memory stage shaped like a kitchen scene, with inactive, over and class prims mixed in."""
+    stage = Usd.Stage.CreateInMemory()
+    stage.DefinePrim("/World", "Xform")
+    for f in range(num_fixtures):
+        root = f"/World/fixture_{f}_{'cab' if f % 3 else 'Drawer'}"
+        stage.DefinePrim(root, "Xform")
+        for p in range(parts_per_fixture):
+            part = stage.DefinePrim(f"{root}/part_{p}", "Xform" if p % 2 else "Mesh")
+            stage.DefinePrim(f"{part.GetPath()}/Handle_joint", "PhysicsRevoluteJoint" if p % 4 == 1 else "Xform")
+            stage.DefinePrim(f"{part.GetPath()}/visuals", "Scope")
+        if f % 17 == 0:
+            stage.GetPrimAtPath(f"{root}/part_0").SetActive(False)
+        if f % 19 == 0:
+            stage.OverridePrim(f"{root}/over_only").GetPrim()
+            stage.DefinePrim(f"{root}/over_only/Handle_joint", "Xform")
+    stage.CreateClassPrim("/_class_handle")
+    stage.DefinePrim("/_class_handle/Handle_joint", "Xform")
+    return stage
+
+
+def edit_stage(stage):
+    """Resyncs which reach the index through the ObjectsChanged listener."""
+    stage.DefinePrim("/World/fixture_0_Drawer/part_3/new_handle_joint", "Xform")
+    stage.RemovePrim("/World/fixture_1_cab/part_2")
+    stage.GetPrimAtPath("/World/fixture_2_cab").SetActive(False)
+    stage.GetPrimAtPath("/World/fixture_0_Drawer/part_1").SetTypeName("Mesh")
+
+
+def prim_range(start, default_predicate=False):
+    return list(Usd.PrimRange(start) if default_predicate else Usd.PrimRange(start, Usd.PrimAllPrimsPredicate))
+
+
+# (PrimIndex method, arguments after the start prim, keyword arguments, reference predicate on the traversed prims)
+INDEX_LOOKUPS = [
+    ("find_by_name", ("handle_joint",), {}, lambda p: p.GetName().lower() == "handle_joint"),
+    ("find_by_name", ("Handle_joint",), {"case_sensitive": True}, lambda p: p.GetName() == "Handle_joint"),
+    ("find_by_name", ("handle_JOINT",), {"type_name": "PhysicsRevoluteJoint"},
+     lambda p: p.GetName().lower() == "handle_joint" and p.GetTypeName() == "PhysicsRevoluteJoint"),
+    ("find_by_prefix", ("FIXTURE_",), {}, lambda p: p.GetName().lower().startswith("fixture_")),
+    ("find_by_prefix", ("part_",), {"type_name": "Mesh"},
+     lambda p: p.GetName().startswith("part_") and p.GetTypeName() == "Mesh"),
+    ("find_by_suffix", ("_JOINT",), {}, lambda p: p.GetName().lower().endswith("_joint")),
+    ("find_by_suffix", ("drawer",), {"type_name": "Xform"},
+     lambda p: p.GetName().lower().endswith("drawer") and p.GetTypeName() == "Xform"),
+    ("find_by_subname", ("joint",), {}, lambda p: "joint" in p.GetName()),
+    ("find_by_subname", ("visual",), {"type_name": "Scope"},
+     lambda p: "visual" in p.GetName() and p.GetTypeName() == "Scope"),
+    ("find_by_types", (), {"include_types": ["Mesh", "Scope"]}, lambda p: p.GetTypeName() in ("Mesh", "Scope")),
+    ("find_by_types", (), {"exclude_types": ["Xform"]}, lambda p: p.GetTypeName() != "Xform"),
+    ("find_by_types", (), {}, lambda p: True),
+]
+
+
+def assert_index_matches_prim_range(stage):
+    index = get_prim_index(stage)
+    for path in STARTS + ["/_class_handle", "/World/fixture_0_Drawer/over_only", "/World/fixture_17_cab/part_0"]:
+        start = stage.GetPrimAtPath(path)
+        for name, args, kwargs, predicate in INDEX_LOOKUPS:
+            expected = [p.GetPath() for p in prim_range(start) if predicate(p)]
+            assert [p.GetPath() for p in getattr(index, name)(start, *args, **kwargs)] == expected, (name, args, path)
+        for default_predicate in (False, True):
+            traversed = prim_range(start, default_predicate)
+            expected = [p.GetPath() for p in traversed if p.GetName().lower() == "handle_joint"]
+            found = index.find_by_name(start, "handle_joint", default_predicate=default_predicate)
+            assert [p.GetPath() for p in found] == expected, (path, default_predicate)
+            first = index.find_by_name(start, "handle_joint", default_predicate=default_predicate, only_first=True)
+            assert [p.GetPath() for p in first] == expected[:1], (path, default_predicate)
+
+
+def assert_same_as_traversal(stage, monkeypatch):
+    # usd_utils needs the PhysX schemas of Isaac Sim
+    pytest.importorskip("pxr.PhysxSchema")
+    from ngine.utils.usd_utils import OpenUsd as usd
+
+    for name, args, kwargs in LOOKUPS:
+        for path in STARTS:
+            start = stage.GetPrimAtPath(path)
+            indexed = getattr(usd, name)(start, *args, **kwargs)
+            with monkeypatch.context() as m:
+                m.setenv("NGINE_PRIM_INDEX", "0")
+                traversed = getattr(usd, name)(start, *args, **kwargs)
+            assert [p.GetPath() for p in indexed] == [p.GetPath() for p in traversed], (name, args, kwargs, path)
+
+
+@pytest.fixture
+def stage(monkeypatch):
+    monkeypatch.delenv("NGINE_PRIM_INDEX", raising=False)
+    return build_synthetic_stage()
+
+
+def test_index_matches_prim_range(stage):
+    assert_index_matches_prim_range(stage)
+    assert get_prim_index(stage).num_builds == 1
+
+
+def test_index_matches_prim_range_after_edits(stage):
+    index = get_prim_index(stage)
+    assert_index_matches_prim_range(stage)
+    edit_stage(stage)
+    assert_index_matches_prim_range(stage)
+    # one rebuild after the edits
+    assert index.num_builds == 2
+
+
+def test_lookups_match_traversal(stage, monkeypatch):
+    assert_same_as_traversal(stage, monkeypatch)
+    assert get_prim_index(stage).num_builds == 1
+
+
+def test_lookups_match_traversal_after_edits(stage, monkeypatch):
+    index = get_prim_index(stage)
+    assert_same_as_traversal(stage, monkeypatch)
+    edit_stage(stage)
+    assert_same_as_traversal(stage, monkeypatch)
+    # one rebuild after the edits
+    assert index.num_builds == 2
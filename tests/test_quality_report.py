@@ -0,0 +1,89 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Queries of a quality report holding synthetic results of two batches."""
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from ngine.engine.checks.quality_report import (  # noqa: E402
+    REPORT_DIR,
+    QualityReportStore,
+    aggregate,
+    append_checker_results,
+    rows_from_verdicts,
+)
+
+VERDICTS = {
+    "files": {
+        "a.hdf5": {
+            "status": "ok",
+            "episodes": {
+                "demo_0": {"num_frames": 100, "checkers": {
+                    "obj_drop": {"status": "passed", "metrics": {}},
+                    "velocity_jump": {"status": "passed", "metrics": {"success": True}},
+                }},
+                "demo_1": {"num_frames": 80, "checkers": {
+                    "obj_drop": {"status": "failed", "metrics": {"obj_1": True}, "first_failure_frame": 42},
+                    "velocity_jump": {"status": "failed", "metrics": {"robot": {"joint_1": 3, "joint_2": 1}}},
+                }},
+            },
+        },
+        "b.hdf5": {"status": "failed", "error": "OSError: truncated file"},
+    }
+}
+
+# get_checker_results of a teleop session
+SESSION = {"velocity_jump": {"robot": {"joint_1": 5}, "success": False}, "clipping": {}}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = QualityReportStore(tmp_path / REPORT_DIR)
+    store.append(rows_from_verdicts(VERDICTS), batch="offline")
+    append_checker_results(tmp_path, SESSION, dataset="teleop.hdf5", episode="2")
+    return store
+
+
+def test_one_part_per_batch(store):
+    assert len(store.parts()) == 2
+
+
+def test_verdict_counts(store):
+    by_checker = {row["checker"]: row for row in aggregate(store.read(), ["checker"]).to_pylist()}
+    assert by_checker["velocity_jump"]["verdicts"] == 3
+    assert by_checker["velocity_jump"]["failed"] == 2
+    assert by_checker["obj_drop"]["fail_rate"] == 0.5
+    assert by_checker["clipping"]["failed"] == 0
+    # the unreadable file
+    assert by_checker[""]["errors"] == 1
+
+
+def test_metric_summary(store):
+    joint = aggregate(store.read(), ["checker"], metric="robot.joint_1").to_pylist()
+    assert joint == [{"checker": "velocity_jump", "count": 2, "mean": 4.0, "min": 3.0, "max": 5.0, "sum": 8.0}]
+
+
+def test_where_filters(store):
+    failing = store.read(["status=failed", "metric=", "batch=offline"])
+    assert sorted(failing["episode"].to_pylist()) == ["demo_1", "demo_1"]
+    assert store.read(["first_failure_frame>=40"])["checker"].to_pylist() == ["obj_drop", "obj_drop"]
+
+
+def test_compact_keeps_the_rows(store):
+    before = aggregate(store.read(), ["batch", "checker"])
+    assert store.compact() == 2
+    assert len(store.parts()) == 1
+    assert aggregate(store.read(), ["batch", "checker"]).equals(before)
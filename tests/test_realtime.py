@@ -0,0 +1,260 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""The real-time helpers of the sim2real loops, and the threaded follower I/O on a simulated servo chain."""
+
+import threading
+import time
+
+import pytest
+
+from ngine.sim2real import realtime
+from ngine.sim2real.realtime import LatestValue, PeriodicThread, RateScheduler, RealtimeOverrunError
+
+PERIOD = 0.01
+
+
+class FakeClock:
+    """Monotonic clock advancing only when slept on, or by ``tick`` on every read so that spinning ends."""
+
+    def __init__(self, tick=1e-6):
+        self.now = 0.0
+        self.tick = tick
+
+    def __call__(self):
+        self.now += self.tick
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += max(seconds, 0.0)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(realtime.time, "sleep", clock.sleep)
+    return clock
+
+
+def make_scheduler(clock, overrun):
+    scheduler = RateScheduler(1.0 / PERIOD, overrun=overrun, clock=clock)
+    scheduler.start()
+    return scheduler
+
+
+def test_pacing_on_a_fixed_grid(clock):
+    scheduler = make_scheduler(clock, "skip")
+    for k in range(1, 101):
+        # work shorter than the period does not shift the phase
+        clock.now += 0.3 * PERIOD
+        assert scheduler.wait() == 0
+        assert clock.now == pytest.approx(k * PERIOD, abs=1e-4)
+    stats = scheduler.stats.summary()
+    assert stats["ticks"] == 100 and stats["overruns"] == 0
+    assert stats["period_mean_ms"] == pytest.approx(PERIOD * 1000.0, abs=0.1)
+
+
+def test_skip_overrun_keeps_the_phase(clock):
+    scheduler = make_scheduler(clock, "skip")
+    clock.now += 3.5 * PERIOD
+    # the deadlines at 1, 2 and 3 periods were missed, the loop wakes up on the grid at 4 periods
+    assert scheduler.wait() == 3
+    assert clock.now == pytest.approx(4 * PERIOD, abs=1e-4)
+    assert scheduler.stats.num_overruns == 1 and scheduler.stats.num_skipped == 3
+    scheduler.wait()
+    assert clock.now == pytest.approx(5 * PERIOD, abs=1e-4)
+
+
+def test_catch_up_overrun_runs_the_missed_ticks(clock):
+    scheduler = make_scheduler(clock, "catch_up")
+    clock.now += 2.5 * PERIOD
+    wakes = []
+    for _ in range(3):
+        scheduler.wait()
+        wakes.append(clock.now)
+    # two late ticks back to back, then back on the grid
+    assert wakes[0] == pytest.approx(2.5 * PERIOD, abs=1e-4)
+    assert wakes[1] == pytest.approx(2.5 * PERIOD, abs=1e-4)
+    assert wakes[2] == pytest.approx(3 * PERIOD, abs=1e-4)
+
+
+def test_warn_overrun_reanchors(clock):
+    scheduler = make_scheduler(clock, "warn")
+    clock.now += 2.5 * PERIOD
+    scheduler.wait()
+    assert clock.now == pytest.approx(2.5 * PERIOD, abs=1e-4)
+    scheduler.wait()
+    assert clock.now == pytest.approx(3.5 * PERIOD, abs=1e-4)
+
+
+def test_raise_overrun(clock):
+    scheduler = make_scheduler(clock, "raise")
+    clock.now += 1.5 * PERIOD
+    with pytest.raises(RealtimeOverrunError):
+        scheduler.wait()
+
+
+def test_invalid_frequency():
+    with pytest.raises(ValueError):
+        RateScheduler(0)
+
+
+def test_latest_value_overwrites():
+    slot = LatestValue()
+    assert slot.get() is None and slot.seq == 0
+    assert not slot.wait(timeout=0.0)
+    for value in range(5):
+        slot.put({"value": value})
+    value, seq, stamp = slot.get_with_info()
+    # consumers only see the newest value
+    assert value == {"value": 4} and seq == 5 and stamp is not None
+    assert slot.wait(timeout=0.0)
+
+
+def test_latest_value_across_threads():
+    slot = LatestValue()
+    done = threading.Event()
+
+    def produce():
+        seq = 0
+        while not done.is_set():
+            seq += 1
+            slot.put((seq, seq * 2))
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    try:
+        assert slot.wait(timeout=1.0)
+        seen = []
+        end = time.monotonic() + 0.05
+        while time.monotonic() < end:
+            value, seq, _ = slot.get_with_info()
+            # every value read is complete and matches its sequence number
+            assert value == (seq, seq * 2)
+            seen.append(seq)
+    finally:
+        done.set()
+        producer.join()
+    assert seen == sorted(seen)
+
+
+def test_periodic_thread_stop_and_join():
+    calls = []
+    thread = PeriodicThread("test_periodic", lambda: calls.append(time.monotonic()), freq=200.0)
+    thread.start()
+    time.sleep(0.1)
+    thread.stop()
+    assert not thread.is_alive
+    num_calls = len(calls)
+    assert 5 < num_calls <= 25
+    time.sleep(0.05)
+    # nothing runs after stop returned
+    assert len(calls) == num_calls
+    assert thread.stats.num_ticks >= num_calls - 1
+    thread.check()
+
+
+def test_periodic_thread_error():
+    def fail():
+        raise ValueError("bus error")
+
+    thread = PeriodicThread("test_failing", fail, freq=200.0)
+    thread.start()
+    deadline = time.monotonic() + 1.0
+    while thread.is_alive and time.monotonic() < deadline:
+        time.sleep(0.005)
+    assert not thread.is_alive
+    with pytest.raises(RuntimeError) as info:
+        thread.check()
+    assert isinstance(info.value.__cause__, ValueError)
+    thread.stop()
+
+
+@pytest.fixture
+def follower_bus():
+    # dependencies of motors_bus and of the follower cameras
+    pytest.importorskip("serial")
+    pytest.importorskip("deepdiff")
+    pytest.importorskip("draccus")
+    from ngine.utils.lerobot_common.motors.feetech.simulated import SimulatedFeetechMotorsBus
+    from ngine.utils.lerobot_common.motors.motors_bus import Motor, MotorNormMode
+
+    motors = {f"joint_{i}": Motor(i + 1, "sts3215", MotorNormMode.RANGE_M100_100) for i in range(6)}
+    bus = SimulatedFeetechMotorsBus("sim", motors)
+    bus.connect()
+    bus.write_calibration(bus.read_calibration())
+    yield bus
+    bus.disconnect(disable_torque=False)
+
+
+class CountingBus:
+    """Counts the sync reads and writes of a bus, the simulated chain also fails on concurrent port access."""
+
+    def __init__(self, bus):
+        self.bus = bus
+        self.reads = 0
+        self.writes = []
+
+    def sync_read(self, data_name, *args, **kwargs):
+        self.reads += 1
+        return self.bus.sync_read(data_name, *args, **kwargs)
+
+    def sync_write(self, data_name, values, *args, **kwargs):
+        self.writes.append(dict(values))
+        return self.bus.sync_write(data_name, values, *args, **kwargs)
+
+
+def wait_ticks(io, num_ticks=2, timeout=1.0):
+    seq = io.positions.seq
+    deadline = time.monotonic() + timeout
+    while io.positions.seq < seq + num_ticks:
+        assert time.monotonic() < deadline, "the bus thread stopped ticking"
+        time.sleep(0.001)
+
+
+def test_follower_io_coalesces_bus_access(follower_bus):
+    from ngine.sim2real.lerobot_follower.threaded_io import FollowerIO
+
+    bus = CountingBus(follower_bus)
+    io = FollowerIO(bus, bus_freq=200.0)
+    io.start()
+    try:
+        # the control loop reads far faster than the bus rate, from the latest positions
+        num_calls = 0
+        end = time.monotonic() + 0.1
+        while time.monotonic() < end:
+            positions = io.read_positions()
+            num_calls += 1
+        assert set(positions) == set(follower_bus.motors)
+        assert bus.reads <= io.stats()["follower_bus"]["ticks"] + 1 < num_calls
+        assert bus.writes == []
+
+        # goals published between two ticks are written once, the newest one
+        goals = [{name: float(step * 10) for name in follower_bus.motors} for step in range(1, 6)]
+        for goal in goals:
+            io.send_goal(goal)
+        wait_ticks(io)
+        assert 1 <= len(bus.writes) < len(goals)
+        assert bus.writes[-1] == goals[-1]
+        for name, value in io.read_positions().items():
+            assert value == pytest.approx(goals[-1][name], abs=0.1), name
+
+        # an unchanged goal is not written again
+        num_writes = len(bus.writes)
+        wait_ticks(io)
+        assert len(bus.writes) == num_writes
+    finally:
+        io.stop()
+    assert not io.is_running
+    io.check()
@@ -0,0 +1,204 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from ngine.utils.snapshot_ring import EnvStateProvider, SceneSnapshotRing, _leaf_equal, _leaves_equal, flatten_state
+
+NUM_STEPS = 200
+INTERVAL = 5
+CAPACITY = 16
+
+
+class MockStateProvider:
+    """
+    Scene state provider over plain arrays, a small articulation / rigid object / action term layout where only
+    the robot and one object move.
+    """
+
+    def __init__(self, num_objects=8, num_joints=20, seed=0):
+        self.rng = np.random.default_rng(seed)
+        self.state = {
+            "scene": {
+                "articulation": {
+                    "robot": {
+                        "root_pose": np.zeros((1, 7), dtype=np.float32),
+                        "root_velocity": np.zeros((1, 6), dtype=np.float32),
+                        "joint_position": np.zeros((1, num_joints), dtype=np.float32),
+                        "joint_velocity": np.zeros((1, num_joints), dtype=np.float32),
+                    }
+                },
+                "rigid_object": {
+                    f"object_{i}": {
+                        "root_pose": self.rng.standard_normal((1, 7)).astype(np.float32),
+                        "root_velocity": np.zeros((1, 6), dtype=np.float32),
+                    }
+                    for i in range(num_objects)
+                },
+            },
+            "action_terms": {"arm_action": np.zeros(num_joints)},
+        }
+
+    def step(self):
+        robot = self.state["scene"]["articulation"]["robot"]
+        robot["joint_velocity"][:] = self.rng.standard_normal(robot["joint_velocity"].shape)
+        robot["joint_position"] += 0.01 * robot["joint_velocity"]
+        self.state["scene"]["rigid_object"]["object_0"]["root_pose"][:, :3] += 0.001
+        self.state["action_terms"]["arm_action"] += 0.01
+
+    def capture(self):
+        # live buffers, as the simulation views are: the ring has to copy what it keeps
+        return self.state
+
+    def restore(self, state):
+        for path, value in flatten_state(state).items():
+            node = self.state
+            for key in path[:-1]:
+                node = node[key]
+            node[path[-1]][...] = value
+
+
+def states_equal(a, b):
+    flat_a, flat_b = flatten_state(a), flatten_state(b)
+    return flat_a.keys() == flat_b.keys() and all(_leaf_equal(flat_a[k], flat_b[k]) for k in flat_a)
+
+
+def record(ring, provider, frames, reference):
+    for frame in frames:
+        if ring.maybe_take(frame) is not None:
+            reference[frame] = copy.deepcopy(provider.state)
+        provider.step()
+
+
+@pytest.fixture
+def recorded():
+    """A ring filled by NUM_STEPS frames, with the deep copies of the state at every snapshot frame."""
+    provider = MockStateProvider()
+    ring = SceneSnapshotRing(provider, interval=INTERVAL, capacity=CAPACITY)
+    reference = {}
+    record(ring, provider, range(NUM_STEPS), reference)
+    return ring, provider, reference
+
+
+def test_ring_keeps_the_newest_snapshots(recorded):
+    ring, _, _ = recorded
+    assert len(ring) == CAPACITY
+    assert ring.frames[-1] == (NUM_STEPS - 1) // INTERVAL * INTERVAL
+
+
+def test_static_leaves_are_shared(recorded):
+    ring, _, _ = recorded
+    # the object leaves that never move are stored once for the whole ring
+    stats = ring.memory_stats()
+    assert stats["stored_bytes"] < stats["full_copy_bytes"] / 2
+
+
+def test_rewind_restores_bit_exact(recorded):
+    ring, provider, reference = recorded
+    target = ring.frames[-1] - 7
+    restored = ring.rewind(target)
+    # the newest snapshot at or before the target, the later ones are dropped
+    assert restored == target // INTERVAL * INTERVAL
+    assert states_equal(provider.state, reference[restored])
+    assert ring.frames[-1] == restored
+
+    # mutating the live state after a rewind must not leak into the snapshots
+    provider.step()
+    assert ring.rewind(restored) == restored
+    assert states_equal(provider.state, reference[restored])
+
+
+def test_stepping_on_replaces_the_dropped_future(recorded):
+    ring, provider, reference = recorded
+    restored = ring.rewind(ring.frames[-1] - 7)
+    record(ring, provider, range(restored, restored + 3 * INTERVAL), reference)
+    for frame in reversed(ring.frames):
+        assert ring.rewind(frame) == frame
+        assert states_equal(provider.state, reference[frame])
+
+
+def test_rewind_before_the_oldest_snapshot(recorded):
+    ring, _, _ = recorded
+    assert ring.rewind(-1) is None
+
+
+def test_invalid_ring_size():
+    with pytest.raises(ValueError):
+        SceneSnapshotRing(MockStateProvider(), interval=0)
+
+
+def test_leaves_equal_matches_leaf_equal():
+    torch = pytest.importorskip("torch")
+    a = torch.arange(6.0).reshape(2, 3)
+    pairs = [
+        (a, a.clone()),
+        (a, a + 1),
+        (a, a.reshape(3, 2)),
+        (a, a.double()),
+        (a, a.numpy()),
+        (torch.tensor([float("nan")]), torch.tensor([float("nan")])),
+        (torch.zeros(0), torch.zeros(0)),
+        (np.ones(3), np.ones(3)),
+        (1, 1),
+    ]
+    assert _leaves_equal(pairs) == [_leaf_equal(x, y) for x, y in pairs]
+
+
+class FakeSceneEnv:
+    """The env attributes read by EnvStateProvider, a reset fails the test."""
+
+    def __init__(self, torch):
+        self.scene_state = {"articulation": {"robot": {"joint_position": torch.zeros(1, 4)}}}
+        self.action_manager = SimpleNamespace(_action=torch.zeros(1, 4), _prev_action=torch.zeros(1, 4), _terms={})
+        self.forwarded = 0
+        self.scene = SimpleNamespace(get_state=lambda is_relative: self.scene_state, reset_to=self.reset_to)
+        self.sim = SimpleNamespace(forward=self.forward)
+        self.observation_manager = SimpleNamespace(compute=lambda update_history: {})
+
+    def reset_to(self, state, env_ids, is_relative):
+        assert env_ids is None and is_relative
+        for path, value in flatten_state(state).items():
+            node = self.scene_state
+            for key in path[:-1]:
+                node = node[key]
+            node[path[-1]].copy_(value)
+
+    def forward(self):
+        self.forwarded += 1
+
+    def _reset_idx(self, env_ids):
+        pytest.fail("a rewind must not reset the environment")
+
+    def step(self):
+        self.scene_state["articulation"]["robot"]["joint_position"] += 1.0
+        self.action_manager._prev_action.copy_(self.action_manager._action)
+        self.action_manager._action += 0.5
+
+
+def test_env_rewind_without_reset():
+    torch = pytest.importorskip("torch")
+    env = FakeSceneEnv(torch)
+    ring = SceneSnapshotRing(EnvStateProvider(env), interval=1)
+    for frame in range(4):
+        env.step()
+        ring.take(frame)
+    assert ring.rewind(1) == 1
+    assert env.forwarded == 1
+    assert torch.equal(env.scene_state["articulation"]["robot"]["joint_position"], torch.full((1, 4), 2.0))
+    assert torch.equal(env.action_manager._action, torch.full((1, 4), 1.0))
+    assert torch.equal(env.action_manager._prev_action, torch.full((1, 4), 0.5))
@@ -0,0 +1,82 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""The bounding volume hierarchy of the robot base placement checks against brute force overlap tests."""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("torch")
+
+from ngine.utils.place_utils.spatial_index import AABBTree, SceneSpatialIndex  # noqa: E402
+
+
+def overlaps(qmins, qmaxs, mins, maxs):
+    """(M, N) strict overlap on every axis, like env_utils.check_overlap."""
+    return np.all((qmins[:, None] < maxs[None]) & (qmaxs[:, None] > mins[None]), axis=-1)
+
+
+def first_overlaps_brute_force(qmins, qmaxs, mins, maxs):
+    if len(mins) == 0:
+        return np.full(len(qmins), -1, dtype=np.int64)
+    hits = overlaps(qmins, qmaxs, mins, maxs)
+    return np.where(hits.any(axis=1), hits.argmax(axis=1), -1)
+
+
+def random_boxes(rng, num, size=0.5):
+    mins = rng.uniform(-5.0, 5.0, (num, 3))
+    return mins, mins + rng.uniform(0.05, size, (num, 3))
+
+
+@pytest.mark.parametrize("num_boxes", [0, 1, 7, 300])
+@pytest.mark.parametrize("leaf_size", [1, 4])
+def test_first_overlaps_matches_brute_force(num_boxes, leaf_size):
+    rng = np.random.default_rng(num_boxes)
+    mins, maxs = random_boxes(rng, num_boxes)
+    qmins, qmaxs = random_boxes(rng, 500, size=1.5)
+    tree = AABBTree(mins, maxs, leaf_size=leaf_size)
+    assert len(tree) == num_boxes
+    expected = first_overlaps_brute_force(qmins, qmaxs, mins.reshape(-1, 3), maxs.reshape(-1, 3))
+    np.testing.assert_array_equal(tree.first_overlaps(qmins, qmaxs), expected)
+
+
+def test_query_matches_brute_force():
+    rng = np.random.default_rng(0)
+    mins, maxs = random_boxes(rng, 200)
+    qmins, qmaxs = random_boxes(rng, 50, size=2.0)
+    tree = AABBTree(mins, maxs)
+    hits = overlaps(qmins, qmaxs, mins, maxs)
+    for qmin, qmax, row in zip(qmins, qmaxs, hits):
+        assert tree.query(qmin, qmax) == np.flatnonzero(row).tolist()
+
+
+def test_touching_boxes_do_not_overlap():
+    tree = AABBTree([[0.0, 0.0, 0.0]], [[1.0, 1.0, 1.0]])
+    qmins = [[1.0, 0.0, 0.0], [0.5, 0.5, 0.5]]
+    np.testing.assert_array_equal(tree.first_overlaps(qmins, [[2.0, 1.0, 1.0]] * 2), [-1, 0])
+
+
+def test_duplicate_boxes_report_the_lowest_index():
+    mins = np.zeros((10, 3))
+    tree = AABBTree(mins, mins + 1.0, leaf_size=1)
+    np.testing.assert_array_equal(tree.first_overlaps([[0.2] * 3], [[0.8] * 3]), [0])
+
+
+def test_out_of_scene():
+    no_boxes = np.zeros((0, 3))
+    index = SceneSpatialIndex(np.array([0.0, 0.0, 0.0]), np.array([4.0, 4.0, 3.0]), no_boxes, no_boxes, names=[])
+    qmins = np.array([[1.0, 1.0, -1.0], [-0.5, 1.0, 0.0], [3.0, 3.0, 0.0]])
+    # only x and y are checked against the scene bounds
+    np.testing.assert_array_equal(index.out_of_scene(qmins, qmins + 0.5), [False, True, False])
+    np.testing.assert_array_equal(index.out_of_scene(qmins, qmins + 1.5), [False, True, True])
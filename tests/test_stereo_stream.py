@@ -0,0 +1,157 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""The stereo streaming pipeline end to end, with synthetic frames and a local decoding consumer."""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from ngine.utils.stereo_stream import StereoFrameBuffer, StereoStreamEncoder
+
+SHAPE = (240, 640, 3)
+
+
+def synthetic_stereo_frame(shape, index):
+    """A moving gradient, stamped with its index in the first row, to check frame ordering after decoding."""
+    height, width, _ = shape
+    x = (np.arange(width, dtype=np.int32)[None, :] + 4 * index) % 256
+    y = np.arange(height, dtype=np.int32)[:, None] % 256
+    image = np.empty(shape, dtype=np.uint8)
+    image[..., 0] = x
+    image[..., 1] = y
+    image[..., 2] = (x + y) // 2
+    return image
+
+
+def loopback(codec, shape=SHAPE, num_frames=150, publish_fps=90.0, consumer_delay=0.0, **encoder_kwargs):
+    """
+    Publishes ``num_frames`` frames at ``publish_fps`` while a consumer decodes every frame it gets, sleeping
+    ``consumer_delay`` seconds per frame to emulate a slow viewer.
+
+    Returns:
+        tuple: the encoder stats and the sequence numbers of the received frames
+    """
+    cv2 = pytest.importorskip("cv2")
+    av = pytest.importorskip("av") if codec == "h264" else None
+
+    frames = StereoFrameBuffer.create(shape)
+    reader = StereoFrameBuffer(frames.name)
+    encoder = StereoStreamEncoder(reader, codec=codec, **encoder_kwargs).start()
+    decoders = [av.CodecContext.create("h264", "r") for _ in range(encoder.num_tiles)] if av else None
+    tile_shape = (shape[0], shape[1] // encoder.num_tiles, 3)
+    received = []
+    errors = []
+    done = threading.Event()
+
+    def consume():
+        last_index = -1
+        while not done.is_set() or encoder.mailbox.item is not None:
+            frame = encoder.latest(timeout=0.05)
+            if frame is None:
+                continue
+            assert not received or frame.seq > received[-1], f"frame {frame.seq} received after {received[-1]}"
+            if decoders is None:
+                for tile in frame.tiles:
+                    image = cv2.imdecode(np.frombuffer(tile, dtype=np.uint8), cv2.IMREAD_COLOR)
+                    assert image.shape == tile_shape, image.shape
+            else:
+                # a dropped frame breaks the reference chain, the frame which replaced it is a keyframe
+                assert frame.index == last_index + 1 or frame.keyframe, f"frame {frame.index} after a gap"
+                for decoder, tile in zip(decoders, frame.tiles):
+                    for packet in decoder.parse(tile):
+                        for image in decoder.decode(packet):
+                            assert image.height == shape[0], image.height
+            encoder.ack(frame)
+            received.append(frame.seq)
+            last_index = frame.index
+            if consumer_delay > 0:
+                time.sleep(consumer_delay)
+
+    def consume_safe():
+        try:
+            consume()
+        except Exception as e:
+            errors.append(e)
+
+    consumer = threading.Thread(target=consume_safe, daemon=True)
+    consumer.start()
+    try:
+        interval = 1.0 / publish_fps
+        next_time = time.perf_counter()
+        for index in range(num_frames):
+            frames.publish(synthetic_stereo_frame(shape, index))
+            next_time += interval
+            time.sleep(max(0.0, next_time - time.perf_counter()))
+        time.sleep(0.1)
+    finally:
+        done.set()
+        consumer.join()
+        encoder.stop()
+        stats = encoder.stats()
+        reader.close()
+        frames.close()
+    if errors:
+        raise errors[0]
+    if encoder.error is not None:
+        raise encoder.error
+    return stats, received
+
+
+@pytest.mark.parametrize("codec", ["jpeg", "h264"])
+@pytest.mark.parametrize("consumer_delay", [0.0, 0.05])
+def test_loopback(codec, consumer_delay):
+    num_frames = 150
+    _, received = loopback(codec, num_frames=num_frames, consumer_delay=consumer_delay)
+    assert received
+    # a slow viewer skips frames but always ends on the newest one
+    assert received[-1] == num_frames
+    if consumer_delay > 0:
+        assert len(received) < num_frames
+
+
+def test_h264_keyframes_are_flagged():
+    pytest.importorskip("av")
+    frames = StereoFrameBuffer.create(SHAPE)
+    reader = StereoFrameBuffer(frames.name)
+    try:
+        encoder = StereoStreamEncoder(reader, codec="h264", gop=5)
+        flags = []
+        for index in range(13):
+            frames.publish(synthetic_stereo_frame(SHAPE, index))
+            flags.append(encoder.encode_frame(keyframe=index == 7).keyframe)
+        # the first frame, the gop keyframes and the forced one, which restarts the gop
+        assert [index for index, keyframe in enumerate(flags) if keyframe] == [0, 5, 7, 12]
+    finally:
+        reader.close()
+        frames.close()
+
+
+def test_frame_buffer_returns_the_latest_frame():
+    frames = StereoFrameBuffer.create(SHAPE)
+    reader = StereoFrameBuffer(frames.name)
+    try:
+        out = np.empty(SHAPE, dtype=np.uint8)
+        assert reader.read_latest(out) is None
+        for index in range(3):
+            frames.publish(synthetic_stereo_frame(SHAPE, index), capture_ns=index)
+        assert reader.read_latest(out) == (3, 2)
+        np.testing.assert_array_equal(out, synthetic_stereo_frame(SHAPE, 2))
+        # nothing newer than the frame read
+        assert reader.read_latest(out, after_seq=3) is None
+    finally:
+        reader.close()
+        frames.close()
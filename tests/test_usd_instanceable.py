@@ -0,0 +1,136 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""The pure pxr instanceable conversion against the prim by prim version, and the manifest skips of convert_tree."""
+
+import os
+
+import pytest
+
+pytest.importorskip("pxr")
+
+from pxr import Sdf, Usd, UsdGeom  # noqa: E402
+
+from ngine.utils.usd_instanceable import GEOMETRY_TYPES, convert_asset, convert_tree  # noqa: E402
+
+
+def reference_convert(asset_usd_path, create_xforms=True, geometry_types=GEOMETRY_TYPES):
+    """Prim by prim conversion of OpenUsd.convert_asset_instanceable, with Usd in place of omni.usd."""
+    stage = Usd.Stage.Open(asset_usd_path)
+    if create_xforms:
+        prims = [stage.GetPseudoRoot()]
+        edits = Sdf.BatchNamespaceEdit()
+        while len(prims) > 0:
+            prim = prims.pop(0)
+            if prim.GetTypeName() in geometry_types:
+                new_xform = UsdGeom.Xform.Define(stage, str(prim.GetPath()) + "_xform")
+                edits.Add(Sdf.NamespaceEdit.Reparent(prim.GetPath(), new_xform.GetPath(), 0))
+                continue
+            prims += prim.GetChildren()
+        stage.GetRootLayer().Apply(edits)
+    prims = [stage.GetPseudoRoot()]
+    while len(prims) > 0:
+        prim = prims.pop(0)
+        if prim:
+            if prim.GetTypeName() in geometry_types:
+                parent_prim = prim.GetParent()
+                if parent_prim and not parent_prim.IsInstance():
+                    parent_prim.SetInstanceable(True)
+                    continue
+            prims += prim.GetChildren()
+    text = stage.GetRootLayer().ExportToString()
+    stage.GetRootLayer().Reload(force=True)
+    return text
+
+
+def write_synthetic_assets(root, num_assets=4):
+    """Asset tree with nested geometry, shared parents, an existing instance and a referenced part."""
+    os.makedirs(os.path.join(root, "parts"), exist_ok=True)
+    part = Usd.Stage.CreateNew(os.path.join(root, "parts", "handle.usda"))
+    part.SetDefaultPrim(part.DefinePrim("/handle", "Xform"))
+    part.DefinePrim("/handle/mesh", "Mesh")
+    part.GetRootLayer().Save()
+    for i in range(num_assets):
+        stage = Usd.Stage.CreateNew(os.path.join(root, f"fixture_{i}.usda"))
+        stage.SetDefaultPrim(stage.DefinePrim("/fixture", "Xform"))
+        for j in range(3):
+            stage.DefinePrim(f"/fixture/body_{j}", "Xform")
+            stage.DefinePrim(f"/fixture/body_{j}/visual", "Mesh")
+            stage.DefinePrim(f"/fixture/body_{j}/collision", "Box")
+            stage.DefinePrim(f"/fixture/body_{j}/link/inner", "Sphere")
+        stage.DefinePrim("/fixture/shared", "Xform")
+        stage.DefinePrim("/fixture/shared/nested/deep", "Capsule")
+        stage.DefinePrim("/fixture/shared/top", "Mesh")
+        stage.DefinePrim("/fixture/instanced", "Xform").SetInstanceable(True)
+        stage.DefinePrim("/fixture/instanced/mesh", "Mesh")
+        if i > 0:
+            # the sequential version cannot reparent geometry brought in by a reference, it drops all its reparents
+            handle = stage.DefinePrim("/fixture/handle", "Xform")
+            handle.GetReferences().AddReference("./parts/handle.usda")
+        stage.GetRootLayer().Save()
+
+
+def quiet(*_):
+    pass
+
+
+@pytest.fixture
+def source_dir(tmp_path):
+    source_dir = str(tmp_path / "assets")
+    write_synthetic_assets(source_dir)
+    return source_dir
+
+
+def mtimes(manifest, output_dir):
+    return {p: os.path.getmtime(os.path.join(output_dir, p)) for p in manifest["assets"]}
+
+
+@pytest.mark.parametrize("create_xforms", [True, False])
+def test_convert_asset_matches_prim_by_prim(source_dir, tmp_path, create_xforms):
+    source = os.path.join(source_dir, "fixture_0.usda")
+    expected = reference_convert(source, create_xforms)
+    out_path = str(tmp_path / "single.usda")
+    convert_asset(source, out_path, create_xforms)
+    assert Sdf.Layer.OpenAsAnonymous(out_path).ExportToString() == expected
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_convert_tree_skips_unchanged_assets(source_dir, tmp_path, workers):
+    output_dir = str(tmp_path / "converted")
+    first = convert_tree(source_dir, output_dir, workers=workers, log=quiet)
+    assert {entry["status"] for entry in first["assets"].values()} == {"converted"}
+
+    before = mtimes(first, output_dir)
+    convert_tree(source_dir, output_dir, workers=workers, log=quiet)
+    assert mtimes(first, output_dir) == before
+
+    # touching one source only converts that asset again
+    stage = Usd.Stage.Open(os.path.join(source_dir, "fixture_1.usda"))
+    stage.DefinePrim("/fixture/extra", "Mesh")
+    stage.GetRootLayer().Save()
+    convert_tree(source_dir, output_dir, workers=workers, log=quiet)
+    after = mtimes(first, output_dir)
+    assert [p for p, mtime in before.items() if after[p] != mtime] == ["fixture_1.usda"]
+
+
+def test_in_place_conversion_is_idempotent(source_dir, tmp_path):
+    manifest_path = str(tmp_path / "in_place.json")
+    convert_tree(source_dir, workers=0, log=quiet, manifest_path=manifest_path)
+    path = os.path.join(source_dir, "fixture_2.usda")
+    with open(path) as f:
+        before = f.read()
+    # no nested Xforms on a second run
+    convert_tree(source_dir, workers=0, log=quiet, manifest_path=manifest_path)
+    with open(path) as f:
+        assert f.read() == before
@@ -0,0 +1,120 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""The layer-level simplification against the per-prim stage edits of OpenUsd.usd_simplify."""
+
+import pytest
+
+pytest.importorskip("pxr")
+
+from pxr import Sdf, Usd, UsdPhysics  # noqa: E402
+
+from ngine.utils.usd_simplify import (  # noqa: E402
+    CONTACT_REPORT_API,
+    CONTACT_REPORT_ATTRS,
+    SIMPLIFY_API_SCHEMAS,
+    simplify_layer,
+    simplify_to_file,
+)
+
+
+def reference_simplify(stage, ref_fixture_names, prim=None):
+    """Per-prim stage edits of OpenUsd.usd_simplify, with PhysX schemas removed by name."""
+    if prim is None:
+        prim = stage.GetPseudoRoot()
+    for child in prim.GetAllChildren():
+        if child.GetName() in ref_fixture_names or not child.IsValid():
+            continue
+        for api, schemas in SIMPLIFY_API_SCHEMAS:
+            if child.HasAPI(api):
+                for schema in schemas:
+                    child.RemoveAppliedSchema(schema)
+        for attr in CONTACT_REPORT_ATTRS:
+            if child.HasAttribute(attr):
+                child.RemoveProperty(attr)
+        if CONTACT_REPORT_API in child.GetAppliedSchemas():
+            child.RemoveAppliedSchema(CONTACT_REPORT_API)
+        name = child.GetName().lower()
+        if "joint" in name or "collisions" in name or child.IsA(UsdPhysics.Joint):
+            stage.RemovePrim(child.GetPath())
+            continue
+        reference_simplify(stage, ref_fixture_names, child)
+    return stage
+
+
+def build_synthetic_scene():
+    """In-memory scene with every case handled by the simplification, including prims from a reference."""
+    asset = Sdf.Layer.CreateAnonymous(".usda")
+    asset_stage = Usd.Stage.Open(asset)
+    body = asset_stage.DefinePrim("/Asset", "Xform")
+    asset_stage.SetDefaultPrim(body)
+    UsdPhysics.RigidBodyAPI.Apply(body)
+    for i in range(3):
+        link = asset_stage.DefinePrim(f"/Asset/link_{i}", "Cube")
+        UsdPhysics.CollisionAPI.Apply(link)
+        link.AddAppliedSchema("PhysxCollisionAPI")
+    UsdPhysics.RevoluteJoint.Define(asset_stage, "/Asset/hinge")
+
+    stage = Usd.Stage.CreateInMemory()
+    stage.DefinePrim("/World", "Xform")
+    for fixture in ("counter", "cabinet", "microwave"):
+        root = stage.DefinePrim(f"/World/{fixture}", "Xform")
+        UsdPhysics.ArticulationRootAPI.Apply(root)
+        root.AddAppliedSchema("PhysxArticulationAPI")
+        UsdPhysics.RigidBodyAPI.Apply(root)
+        root.AddAppliedSchema(CONTACT_REPORT_API)
+        root.CreateAttribute("physxContactReportThreshold", Sdf.ValueTypeNames.Float).Set(0.1)
+        for i in range(4):
+            part = stage.DefinePrim(f"/World/{fixture}/part_{i}", "Cube")
+            UsdPhysics.CollisionAPI.Apply(part)
+            stage.DefinePrim(f"/World/{fixture}/part_{i}/collisions", "Xform")
+        stage.DefinePrim(f"/World/{fixture}/door_joint", "Xform")
+        UsdPhysics.PrismaticJoint.Define(stage, f"/World/{fixture}/slide")
+        referenced = stage.DefinePrim(f"/World/{fixture}/handle")
+        referenced.GetReferences().AddReference(asset.identifier)
+    explicit = stage.DefinePrim("/World/shelf", "Cube")
+    explicit.SetMetadata("apiSchemas", Sdf.TokenListOp.CreateExplicit(["PhysicsCollisionAPI", "PhysxCollisionAPI"]))
+    return stage
+
+
+def source_stage(reference_stage):
+    """A stage on a copy of the root layer of reference_stage, sharing the referenced asset."""
+    source = Sdf.Layer.CreateAnonymous(".usda")
+    source.TransferContent(reference_stage.GetRootLayer())
+    return source, Usd.Stage.Open(source)
+
+
+@pytest.mark.parametrize("ref_fixture_names", [(), ("microwave",), ("counter", "cabinet")])
+def test_matches_per_prim_simplification(ref_fixture_names):
+    reference_stage = build_synthetic_scene()
+    source, stage = source_stage(reference_stage)
+    before = source.ExportToString()
+
+    expected = reference_simplify(reference_stage, list(ref_fixture_names)).GetRootLayer().ExportToString()
+    assert simplify_layer(stage, ref_fixture_names).ExportToString() == expected
+    # the stage is left unchanged
+    assert source.ExportToString() == before
+
+
+def test_cached_file_matches_uncached(tmp_path, monkeypatch):
+    monkeypatch.setenv("NGINE_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.delenv("NGINE_DISABLE_CACHE", raising=False)
+    _, stage = source_stage(build_synthetic_scene())
+
+    uncached = simplify_to_file(stage, ["microwave"], str(tmp_path / "uncached.usd"), use_cache=False)
+    cold = simplify_to_file(stage, ["microwave"], str(tmp_path / "cold.usd"))
+    warm = simplify_to_file(stage, ["microwave"], str(tmp_path / "warm.usd"))
+    expected = Sdf.Layer.OpenAsAnonymous(uncached).ExportToString()
+    assert Sdf.Layer.OpenAsAnonymous(cold).ExportToString() == expected
+    assert Sdf.Layer.OpenAsAnonymous(warm).ExportToString() == expected
@@ -0,0 +1,108 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+pytest.importorskip("torch")
+
+from ngine.scripts.policy.vector_eval import SlotPolicyAdapter, VectorEvalHarness, as_batched_policy  # noqa: E402
+
+
+class FakeEnv:
+    """Auto-resetting vectorized env, slot ``i`` ends its episodes after ``i + 2`` steps and succeeds when the
+    sum of the actions of the episode is positive."""
+
+    def __init__(self, num_envs):
+        self.num_envs = num_envs
+        self.unwrapped = self
+        self.steps = np.zeros(num_envs, dtype=np.int64)
+        self.action_sums = np.zeros(num_envs)
+
+    def _obs(self):
+        return {"policy": {"state": np.stack([np.arange(self.num_envs), self.steps], axis=1).astype(np.float32)}}
+
+    def reset(self):
+        self.steps[:] = 0
+        self.action_sums[:] = 0.0
+        return self._obs(), {}
+
+    def step(self, actions):
+        self.steps += 1
+        self.action_sums += np.asarray(actions)[:, 0]
+        terminated = self.steps >= np.arange(self.num_envs) + 2
+        success = terminated & (self.action_sums > 0)
+        self.steps[terminated] = 0
+        self.action_sums[terminated] = 0.0
+        return self._obs(), np.zeros(self.num_envs), terminated, np.zeros(self.num_envs, dtype=bool), {"is_success": success}
+
+
+class DummyPolicy:
+    """Per-env policy: positive actions on even slots, negative ones on odd slots."""
+
+    def __init__(self):
+        self.resets = 0
+        self.predictions = 0
+
+    def reset_model(self):
+        self.resets += 1
+
+    def predict(self, obs):
+        assert obs["state"].shape == (1, 2)
+        self.predictions += 1
+        return np.full((1, 3), 1.0 if obs["state"][0, 0] % 2 == 0 else -1.0, dtype=np.float32)
+
+
+def test_per_env_policy_is_adapted_per_slot():
+    created = []
+
+    def make_policy():
+        created.append(DummyPolicy())
+        return created[-1]
+
+    policy = as_batched_policy(make_policy(), make_policy=make_policy)
+    assert isinstance(policy, SlotPolicyAdapter)
+    report = VectorEvalHarness([("task", FakeEnv(4))], policy, episodes_per_task=8).run()
+
+    assert report["test_count"] == 8
+    # even slots succeed, odd slots fail
+    assert all(e["success"] == (e["slot"][1] % 2 == 0) for e in report["episodes"])
+    assert all(e["length"] == e["slot"][1] + 2 for e in report["episodes"])
+    # one policy per slot, reset once per episode it started
+    assert len(created) == 4
+    assert sum(p.resets for p in created) == 8
+    assert sum(p.predictions for p in created) == sum(e["length"] for e in report["episodes"])
+
+
+def test_harness_adapts_shared_policy():
+    policy = DummyPolicy()
+    report = VectorEvalHarness([("a", FakeEnv(2)), ("b", FakeEnv(3))], policy, episodes_per_task=5).run()
+    assert report["tasks"]["a"]["episode_count"] == 5 and report["tasks"]["b"]["episode_count"] == 5
+    assert policy.resets == 10
+
+
+def test_batched_policy_is_used_as_is():
+    class BatchedPolicy:
+        def predict_batch(self, obs, slots):
+            return np.ones((len(slots), 3), dtype=np.float32)
+
+    policy = BatchedPolicy()
+    assert as_batched_policy(policy) is policy
+    report = VectorEvalHarness([("task", FakeEnv(3))], policy, episodes_per_task=6).run()
+    assert report["success_rate"] == 1.0
+
+
+def test_policy_without_inference_is_rejected():
+    with pytest.raises(TypeError):
+        as_batched_policy(object())
@@ -0,0 +1,88 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Round trips of synthetic VR frames through the packed layout and the streamed HDF5 file."""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("h5py")
+
+from ngine.utils.vr_frames import (  # noqa: E402
+    VR_CONTROLLER_BOOL_KEYS,
+    VR_CONTROLLER_KEYS,
+    VR_CONTROLLER_STATE_KEYS,
+    VR_FRAME_SIZE,
+    VR_INTERNAL_STATE_KEYS,
+    VR_MATRIX_KEYS,
+    VRFrameWriter,
+    pack_vr_frame,
+    read_vr_frames,
+    unpack_vr_frame,
+)
+
+
+def synthetic_vr_frame_args(rng):
+    """Random raw input of one step, in the argument order of pack_vr_frame."""
+    matrices = [rng.standard_normal((4, 4)).astype(np.float32) for _ in VR_MATRIX_KEYS]
+    controllers = [
+        {key: bool(rng.integers(2)) if key in VR_CONTROLLER_BOOL_KEYS else float(np.float32(rng.uniform(-1, 1)))
+         for key in VR_CONTROLLER_STATE_KEYS}
+        for _ in VR_CONTROLLER_KEYS
+    ]
+    internal_state = {key: float(rng.integers(-1, 3)) for key in VR_INTERNAL_STATE_KEYS}
+    return (*matrices, *controllers, internal_state)
+
+
+def assert_unpacks_to(frame, args):
+    raw_input = unpack_vr_frame(frame)
+    for key, matrix in zip(VR_MATRIX_KEYS, args[:len(VR_MATRIX_KEYS)]):
+        np.testing.assert_array_equal(raw_input[key], matrix)
+    for key, state in zip(VR_CONTROLLER_KEYS, args[len(VR_MATRIX_KEYS):-1]):
+        assert raw_input[key] == state, key
+    assert raw_input["internal_state"] == args[-1]
+
+
+def test_pack_roundtrip():
+    rng = np.random.default_rng(0)
+    frame = np.empty(VR_FRAME_SIZE, dtype=np.float32)
+    for _ in range(10):
+        args = synthetic_vr_frame_args(rng)
+        pack_vr_frame(frame, *args)
+        assert_unpacks_to(frame, args)
+
+
+@pytest.mark.parametrize("num_frames, writer_kwargs", [(1000, {}), (5000, {"capacity": 256, "chunk_frames": 64})])
+def test_writer_roundtrip(tmp_path, num_frames, writer_kwargs, episodes=3):
+    rng = np.random.default_rng(0)
+    path = tmp_path / "vr_frames.hdf5"
+    expected = []
+    with VRFrameWriter(path, **writer_kwargs) as writer:
+        for step in range(num_frames):
+            if step > 0 and step % (num_frames // episodes) == 0:
+                writer.new_episode()
+            args = synthetic_vr_frame_args(rng)
+            writer.write(step, *args)
+            expected.append((step, writer.episode, args))
+
+    data = read_vr_frames(path)
+    assert len(data["frames"]) == num_frames
+    for (step, episode, args), frame, read_step, read_episode in zip(
+        expected, data["frames"], data["step"], data["episode"]
+    ):
+        assert (read_step, read_episode) == (step, episode)
+        assert_unpacks_to(frame, args)
+
+    last_episode = read_vr_frames(path, episode=expected[-1][1])
+    assert list(last_episode["step"]) == [step for step, episode, _ in expected if episode == expected[-1][1]]
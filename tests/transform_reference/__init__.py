@@ -0,0 +1 @@
+"""Per-pose transform functions the batched transforms are tested against."""
@@ -0,0 +1,576 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+The per-pose numpy_impl functions before they were routed through ``batched``, the reference of the batched tests.
+
+NOTE: Quaternion convention is (x, y, z, w)
+"""
+
+import math
+import numpy as np
+
+from ngine.utils.math_utils.transform_utils.consts import _NEXT_AXIS, _AXES2TUPLE
+from ngine.utils.math_utils.transform_utils.numpy_impl import EPS, unit_vector, vec
+
+
+def convert_quat(q, to="xyzw"):
+    """
+    Convert quaternion from one convention to another.
+    The 'to' parameter specifies the target convention.
+    If to == 'xyzw', input is in 'wxyz' format, and vice versa.
+
+    Args:
+        q (np.array): 4D quaternion array
+        to (str): 'xyzw' or 'wxyz', target convention
+
+    Returns:
+        np.array: Converted quaternion
+    """
+    if to == "xyzw":
+        return q[[1, 2, 3, 0]]
+    if to == "wxyz":
+        return q[[3, 0, 1, 2]]
+    raise Exception("convert_quat: choose a valid `to` argument (xyzw or wxyz)")
+
+
+def quat_multiply(quaternion1, quaternion0):
+    """
+    Return the product of two quaternions (q1 * q0).
+
+    Args:
+        quaternion1 (np.array): (x, y, z, w) quaternion
+        quaternion0 (np.array): (x, y, z, w) quaternion
+
+    Returns:
+        np.array: (x, y, z, w) multiplied quaternion
+    """
+    x0, y0, z0, w0 = quaternion0
+    x1, y1, z1, w1 = quaternion1
+    return np.array(
+        (
+            x1 * w0 + y1 * z0 - z1 * y0 + w1 * x0,
+            -x1 * z0 + y1 * w0 + z1 * x0 + w1 * y0,
+            x1 * y0 - y1 * x0 + z1 * w0 + w1 * z0,
+            -x1 * x0 - y1 * y0 - z1 * z0 + w1 * w0,
+        ),
+        dtype=np.float32,
+    )
+
+
+def quat_conjugate(quaternion):
+    """
+    Return the conjugate of a quaternion.
+
+    Args:
+        quaternion (np.array): (x, y, z, w) quaternion
+
+    Returns:
+        np.array: (x, y, z, w) conjugate quaternion
+    """
+    return np.array(
+        (-quaternion[0], -quaternion[1], -quaternion[2], quaternion[3]),
+        dtype=np.float32,
+    )
+
+
+def quat_inverse(quaternion):
+    """
+    Return the inverse of a quaternion.
+
+    Args:
+        quaternion (np.array): (x, y, z, w) quaternion
+
+    Returns:
+        np.array: (x, y, z, w) inverse quaternion
+    """
+    return quat_conjugate(quaternion) / np.dot(quaternion, quaternion)
+
+
+def quat_distance(quaternion1, quaternion0):
+    """
+    Return the distance between two quaternions, such that distance * quaternion0 = quaternion1.
+
+    Args:
+        quaternion1 (np.array): (x, y, z, w) quaternion
+        quaternion0 (np.array): (x, y, z, w) quaternion
+
+    Returns:
+        np.array: (x, y, z, w) quaternion distance
+    """
+    return quat_multiply(quaternion1, quat_inverse(quaternion0))
+
+
+def quat_slerp(quat0, quat1, fraction, shortestpath=True):
+    """
+    Return spherical linear interpolation between two quaternions.
+
+    Args:
+        quat0 (np.array): (x, y, z, w) start quaternion
+        quat1 (np.array): (x, y, z, w) end quaternion
+        fraction (float): interpolation fraction
+        shortestpath (bool): whether to use shortest path
+
+    Returns:
+        np.array: (x, y, z, w) interpolated quaternion
+    """
+    q0 = unit_vector(quat0[:4])
+    q1 = unit_vector(quat1[:4])
+    if fraction == 0.0:
+        return q0
+    elif fraction == 1.0:
+        return q1
+    d = np.dot(q0, q1)
+    if abs(abs(d) - 1.0) < EPS:
+        return q0
+    if shortestpath and d < 0.0:
+        d = -d
+        q1 *= -1.0
+    angle = math.acos(np.clip(d, -1, 1))
+    if abs(angle) < EPS:
+        return q0
+    isin = 1.0 / math.sin(angle)
+    q0 *= math.sin((1.0 - fraction) * angle) * isin
+    q1 *= math.sin(fraction * angle) * isin
+    q0 += q1
+    return q0
+
+
+def mat2pose(hmat):
+    """
+    Convert a 4x4 homogeneous matrix to pose.
+
+    Args:
+        hmat (np.array): 4x4 homogeneous matrix
+
+    Returns:
+        tuple: (position, quaternion)
+    """
+    pos = hmat[:3, 3]
+    orn = mat2quat(hmat[:3, :3])
+    return pos, orn
+
+
+def mat2quat(rmat):
+    """
+    Convert rotation matrix to quaternion.
+
+    Args:
+        rmat (np.array): 3x3 rotation matrix
+
+    Returns:
+        np.array: (x, y, z, w) quaternion
+    """
+    M = np.asarray(rmat).astype(np.float32)[:3, :3]
+
+    m00 = M[0, 0]
+    m01 = M[0, 1]
+    m02 = M[0, 2]
+    m10 = M[1, 0]
+    m11 = M[1, 1]
+    m12 = M[1, 2]
+    m20 = M[2, 0]
+    m21 = M[2, 1]
+    m22 = M[2, 2]
+    K = np.array(
+        [
+            [m00 - m11 - m22, np.float32(0.0), np.float32(0.0), np.float32(0.0)],
+            [m01 + m10, m11 - m00 - m22, np.float32(0.0), np.float32(0.0)],
+            [m02 + m20, m12 + m21, m22 - m00 - m11, np.float32(0.0)],
+            [m21 - m12, m02 - m20, m10 - m01, m00 + m11 + m22],
+        ]
+    )
+    K /= 3.0
+    w, V = np.linalg.eigh(K)
+    inds = np.array([3, 0, 1, 2])
+    q1 = V[inds, np.argmax(w)]
+    if q1[0] < 0.0:
+        np.negative(q1, q1)
+    inds = np.array([1, 2, 3, 0])
+    return q1[inds]
+
+
+def euler2mat(euler):
+    """
+    Convert euler angles to rotation matrix.
+
+    Args:
+        euler (np.array): (r, p, y) euler angles
+
+    Returns:
+        np.array: 3x3 rotation matrix
+    """
+    euler = np.asarray(euler, dtype=np.float64)
+    assert euler.shape[-1] == 3, "Invalid shaped euler {}".format(euler)
+
+    ai, aj, ak = -euler[..., 2], -euler[..., 1], -euler[..., 0]
+    si, sj, sk = np.sin(ai), np.sin(aj), np.sin(ak)
+    ci, cj, ck = np.cos(ai), np.cos(aj), np.cos(ak)
+    cc, cs = ci * ck, ci * sk
+    sc, ss = si * ck, si * sk
+
+    mat = np.empty(euler.shape[:-1] + (3, 3), dtype=np.float64)
+    mat[..., 2, 2] = cj * ck
+    mat[..., 2, 1] = sj * sc - cs
+    mat[..., 2, 0] = sj * cc + ss
+    mat[..., 1, 2] = cj * sk
+    mat[..., 1, 1] = sj * ss + cc
+    mat[..., 1, 0] = sj * cs - sc
+    mat[..., 0, 2] = -sj
+    mat[..., 0, 1] = cj * si
+    mat[..., 0, 0] = cj * ci
+    return mat
+
+
+def mat2euler(rmat, axes="sxyz"):
+    """
+    Convert rotation matrix to euler angles (radians).
+
+    Args:
+        rmat (np.array): 3x3 rotation matrix
+        axes (str): axis sequence
+
+    Returns:
+        np.array: (r, p, y) euler angles
+    """
+    try:
+        firstaxis, parity, repetition, frame = _AXES2TUPLE[axes.lower()]
+    except (AttributeError, KeyError):
+        firstaxis, parity, repetition, frame = axes
+
+    i = firstaxis
+    j = _NEXT_AXIS[i + parity]
+    k = _NEXT_AXIS[i - parity + 1]
+
+    M = np.asarray(rmat, dtype=np.float32)[:3, :3]
+    if repetition:
+        sy = math.sqrt(M[i, j] * M[i, j] + M[i, k] * M[i, k])
+        if sy > EPS:
+            ax = math.atan2(M[i, j], M[i, k])
+            ay = math.atan2(sy, M[i, i])
+            az = math.atan2(M[j, i], -M[k, i])
+        else:
+            ax = math.atan2(-M[j, k], M[j, j])
+            ay = math.atan2(sy, M[i, i])
+            az = 0.0
+    else:
+        cy = math.sqrt(M[i, i] * M[i, i] + M[j, i] * M[j, i])
+        if cy > EPS:
+            ax = math.atan2(M[k, j], M[k, k])
+            ay = math.atan2(-M[k, i], cy)
+            az = math.atan2(M[j, i], M[i, i])
+        else:
+            ax = math.atan2(-M[j, k], M[j, j])
+            ay = math.atan2(-M[k, i], cy)
+            az = 0.0
+
+    if parity:
+        ax, ay, az = -ax, -ay, -az
+    if frame:
+        ax, az = az, ax
+    return vec((ax, ay, az))
+
+
+def pose2mat(pose):
+    """
+    Convert pose to homogeneous matrix.
+
+    Args:
+        pose (2-tuple): (position, quaternion)
+
+    Returns:
+        np.array: 4x4 homogeneous matrix
+    """
+    homo_pose_mat = np.zeros((4, 4), dtype=np.float32)
+    homo_pose_mat[:3, :3] = quat2mat(pose[1])
+    homo_pose_mat[:3, 3] = np.array(pose[0], dtype=np.float32)
+    homo_pose_mat[3, 3] = 1.0
+    return homo_pose_mat
+
+
+def quat2mat(quaternion):
+    """
+    Convert quaternion to rotation matrix.
+
+    Args:
+        quaternion (np.array): (x, y, z, w) quaternion
+
+    Returns:
+        np.array: 3x3 rotation matrix
+    """
+    inds = np.array([3, 0, 1, 2])
+    q = np.asarray(quaternion).copy().astype(np.float32)[inds]
+
+    n = np.dot(q, q)
+    if n < EPS:
+        return np.identity(3)
+    q *= math.sqrt(2.0 / n)
+    q2 = np.outer(q, q)
+    return np.array(
+        [
+            [1.0 - q2[2, 2] - q2[3, 3], q2[1, 2] - q2[3, 0], q2[1, 3] + q2[2, 0]],
+            [q2[1, 2] + q2[3, 0], 1.0 - q2[1, 1] - q2[3, 3], q2[2, 3] - q2[1, 0]],
+            [q2[1, 3] - q2[2, 0], q2[2, 3] + q2[1, 0], 1.0 - q2[1, 1] - q2[2, 2]],
+        ]
+    )
+
+
+def quat2axisangle(quat):
+    """
+    Convert quaternion to axis-angle format, returns a unit vector scaled by the rotation angle.
+
+    Args:
+        quat (np.array): (x, y, z, w) quaternion
+
+    Returns:
+        np.array: (ax, ay, az) axis-angle
+    """
+    if quat[3] > 1.0:
+        quat[3] = 1.0
+    elif quat[3] < -1.0:
+        quat[3] = -1.0
+
+    den = np.sqrt(1.0 - quat[3] * quat[3])
+    if math.isclose(den, 0.0):
+        return np.zeros(3)
+
+    return (quat[:3] * 2.0 * math.acos(quat[3])) / den
+
+
+def axisangle2quat(vec):
+    """
+    Convert axis-angle format to quaternion.
+
+    Args:
+        vec (np.array): (ax, ay, az) axis-angle
+
+    Returns:
+        np.array: (x, y, z, w) quaternion
+    """
+    angle = np.linalg.norm(vec)
+    if math.isclose(angle, 0.0):
+        return np.array([0.0, 0.0, 0.0, 1.0])
+    axis = vec / angle
+    q = np.zeros(4)
+    q[3] = np.cos(angle / 2.0)
+    q[:3] = axis * np.sin(angle / 2.0)
+    return q
+
+
+def pose_in_A_to_pose_in_B(pose_A, pose_A_in_B):
+    """
+    Transform the pose of C in frame A to frame B.
+
+    Args:
+        pose_A (np.array): 4x4 pose of C in A
+        pose_A_in_B (np.array): 4x4 pose of A in B
+
+    Returns:
+        np.array: 4x4 pose of C in B
+    """
+    return pose_A_in_B.dot(pose_A)
+
+
+def pose_inv(pose):
+    """
+    Compute the inverse of a homogeneous pose matrix.
+
+    Args:
+        pose (np.array): 4x4 pose matrix
+
+    Returns:
+        np.array: 4x4 inverse pose matrix
+    """
+    pose_inv = np.zeros((4, 4))
+    pose_inv[:3, :3] = pose[:3, :3].T
+    pose_inv[:3, 3] = -pose_inv[:3, :3].dot(pose[:3, 3])
+    pose_inv[3, 3] = 1.0
+    return pose_inv
+
+
+def make_pose(translation, rotation):
+    """
+    Create a homogeneous pose matrix from translation and rotation.
+
+    Args:
+        translation (np.array): (x, y, z) translation
+        rotation (np.array): 3x3 rotation matrix
+
+    Returns:
+        np.array: 4x4 homogeneous matrix
+    """
+    pose = np.zeros((4, 4))
+    pose[:3, :3] = rotation
+    pose[:3, 3] = translation
+    pose[3, 3] = 1.0
+    return pose
+
+
+def rotate_2d_point(input, rot):
+    """
+    rotate a 2d vector counterclockwise
+
+    Args:
+        input (np.array): 1d-array representing 2d vector
+        rot (float): rotation value
+
+    Returns:
+        np.array: rotated 1d-array
+    """
+    input_x, input_y = input
+    x = input_x * np.cos(rot) - input_y * np.sin(rot)
+    y = input_x * np.sin(rot) + input_y * np.cos(rot)
+    return np.array([x, y])
+
+
+def compute_delta_pose(cur, tgt):
+    """Compute relative pose: delta = tgt ∘ (cur)^(-1).
+
+    Args:
+        cur: Current pose array of shape (T, 7) [p_cur, q_cur].
+        tgt: Target pose array of shape (T, 7) [p_tgt, q_tgt].
+
+    Returns:
+        Relative pose array of shape (T, 7) [dp, dq].
+    """
+    p_cur = cur[:, :3]
+    q_cur = cur[:, 3:]
+    p_tgt = tgt[:, :3]
+    q_tgt = tgt[:, 3:]
+    p_cur_inv, q_cur_inv = se3_inverse(p_cur, q_cur)
+    dp, dq = se3_compose(p_cur_inv, q_cur_inv, p_tgt, q_tgt)
+    return np.concatenate([dp, dq], axis=-1)
+
+
+def pose_left_multiply(a, b):
+    """Left multiply pose: T_curr = (ΔT)^(-1) ∘ T_target.
+
+    Args:
+        a: Target pose array of shape (T, 7) [p, q].
+        b: Relative pose array of shape (T, 7) [dp, dq].
+
+    Returns:
+        Current pose array of shape (T, 7) [p_curr, q_curr].
+    """
+    dp_rel = b[:, :3]
+    dq_rel = b[:, 3:]
+    p_tgt = a[:, :3]
+    q_tgt = a[:, 3:]
+    dp_rel_inv, dq_rel_inv = se3_inverse(dp_rel, dq_rel)
+    p_curr, q_curr = se3_compose(p_tgt, q_tgt, dp_rel_inv, dq_rel_inv)
+    return np.concatenate([p_curr, q_curr], axis=-1)
+
+
+def se3_compose(p1, q1, p2, q2):
+    """Compose two SE(3) transformations: (p1, q1) ∘ (p2, q2).
+
+    Args:
+        p1: First translation vector of shape (..., 3).
+        q1: First quaternion of shape (..., 4) in wxyz format.
+        p2: Second translation vector of shape (..., 3).
+        q2: Second quaternion of shape (..., 4) in wxyz format.
+
+    Returns:
+        Tuple of (composed_translation, composed_quaternion).
+    """
+    R1 = quat_to_R(q1)
+    p = p1 + np.einsum('...ij,...j->...i', R1, p2)
+    q = quat_mul(q1, q2)
+    return p, quat_normalize(q)
+
+
+def se3_inverse(p, q):
+    """Compute inverse of SE(3) transformation: (p, q)^(-1).
+
+    Args:
+        p: Translation vector of shape (..., 3).
+        q: Quaternion of shape (..., 4) in wxyz format.
+
+    Returns:
+        Tuple of (inverse_translation, inverse_quaternion).
+    """
+    R = quat_to_R(q)
+    Rt = np.swapaxes(R, -1, -2)
+    p_inv = -np.einsum('...ij,...j->...i', Rt, p)
+    q_inv = quat_conj(quat_normalize(q))
+    return p_inv, q_inv
+
+
+def quat_to_R(q):
+    """Convert quaternion to rotation matrix.
+
+    Args:
+        q: Quaternion array of shape (..., 4) in wxyz format.
+
+    Returns:
+        Rotation matrix array of shape (..., 3, 3).
+    """
+    q = quat_normalize(q)
+    w, x, y, z = np.moveaxis(q, -1, 0)
+    R = np.empty(q.shape[:-1] + (3, 3), dtype=np.float64)
+    R[..., 0, 0] = 1 - 2 * (y * y + z * z)
+    R[..., 0, 1] = 2 * (x * y - z * w)
+    R[..., 0, 2] = 2 * (x * z + y * w)
+    R[..., 1, 0] = 2 * (x * y + z * w)
+    R[..., 1, 1] = 1 - 2 * (x * x + z * z)
+    R[..., 1, 2] = 2 * (y * z - x * w)
+    R[..., 2, 0] = 2 * (x * z - y * w)
+    R[..., 2, 1] = 2 * (y * z + x * w)
+    R[..., 2, 2] = 1 - 2 * (x * x + y * y)
+    return R
+
+
+def quat_mul(q1, q2):
+    """Multiply two quaternions.
+
+    Args:
+        q1: First quaternion array of shape (..., 4) in wxyz format.
+        q2: Second quaternion array of shape (..., 4) in wxyz format.
+
+    Returns:
+        Product quaternion q1 * q2 of shape (..., 4).
+    """
+    w1, x1, y1, z1 = np.moveaxis(q1, -1, 0)
+    w2, x2, y2, z2 = np.moveaxis(q2, -1, 0)
+    w = w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2
+    x = w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2
+    y = w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2
+    z = w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2
+    return np.stack([w, x, y, z], axis=-1)
+
+
+def quat_normalize(q):
+    """Normalize quaternion to unit length.
+
+    Args:
+        q: Quaternion array of shape (..., 4) in wxyz format.
+
+    Returns:
+        Normalized quaternion of same shape.
+    """
+    q = np.asarray(q, dtype=np.float64)
+    return q / np.linalg.norm(q, axis=-1, keepdims=True)
+
+
+def quat_conj(q):
+    """Compute quaternion conjugate.
+
+    Args:
+        q: Quaternion array of shape (..., 4) in wxyz format.
+
+    Returns:
+        Conjugate quaternion [w, -x, -y, -z] of same shape.
+    """
+    w, x, y, z = np.moveaxis(q, -1, 0)
+    return np.stack([w, -x, -y, -z], axis=-1)
@@ -0,0 +1,570 @@
+# Copyright 2025 ngine Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+The per-pose torch_impl functions before they were routed through ``batched``, the reference of the batched tests.
+
+NOTE: Quaternion convention is (x, y, z, w)
+"""
+
+import torch
+
+from ngine.utils.math_utils.transform_utils.consts import _NEXT_AXIS, _AXES2TUPLE
+from ngine.utils.math_utils.transform_utils.torch_impl import EPS
+
+
+def convert_quat(q, to="xyzw"):
+    """
+    Convert quaternion from one convention to another (torch version).
+    If to == 'xyzw', input is 'wxyz', and vice versa.
+
+    Args:
+        q (torch.Tensor): 4D quaternion tensor
+        to (str): 'xyzw' or 'wxyz'
+
+    Returns:
+        torch.Tensor: Converted quaternion
+    """
+    if to == "xyzw":
+        return q[[1, 2, 3, 0]]
+    if to == "wxyz":
+        return q[[3, 0, 1, 2]]
+    raise Exception("convert_quat_torch: choose a valid `to` argument (xyzw or wxyz)")
+
+
+def quat_multiply(quaternion1, quaternion0):
+    """
+    Return multiplication of two quaternions (q1 * q0) (torch version).
+
+    Args:
+        quaternion1 (torch.Tensor): (x, y, z, w) quaternion
+        quaternion0 (torch.Tensor): (x, y, z, w) quaternion
+
+    Returns:
+        torch.Tensor: (x, y, z, w) multiplied quaternion
+    """
+    x0, y0, z0, w0 = quaternion0
+    x1, y1, z1, w1 = quaternion1
+    return torch.stack((
+        x1 * w0 + y1 * z0 - z1 * y0 + w1 * x0,
+        -x1 * z0 + y1 * w0 + z1 * x0 + w1 * y0,
+        x1 * y0 - y1 * x0 + z1 * w0 + w1 * z0,
+        -x1 * x0 - y1 * y0 - z1 * z0 + w1 * w0,
+    ))
+
+
+def quat_conjugate(quaternion):
+    """
+    Return conjugate of quaternion (torch version).
+
+    Args:
+        quaternion (torch.Tensor): (x, y, z, w) quaternion
+
+    Returns:
+        torch.Tensor: (x, y, z, w) conjugate quaternion
+    """
+    return torch.stack((
+        -quaternion[0], -quaternion[1], -quaternion[2], quaternion[3]
+    ))
+
+
+def quat_inverse(quaternion):
+    """
+    Return inverse of quaternion (torch version).
+
+    Args:
+        quaternion (torch.Tensor): (x, y, z, w) quaternion
+
+    Returns:
+        torch.Tensor: (x, y, z, w) inverse quaternion
+    """
+    return quat_conjugate(quaternion) / torch.dot(quaternion, quaternion)
+
+
+def quat_distance(quaternion1, quaternion0):
+    """
+    Return distance between two quaternions, such that distance * quaternion0 = quaternion1 (torch version).
+
+    Args:
+        quaternion1 (torch.Tensor): (x, y, z, w) quaternion
+        quaternion0 (torch.Tensor): (x, y, z, w) quaternion
+
+    Returns:
+        torch.Tensor: (x, y, z, w) quaternion distance
+    """
+    return quat_multiply(quaternion1, quat_inverse(quaternion0))
+
+
+def quat_slerp(quat0, quat1, fraction, shortestpath=True):
+    """
+    Return spherical linear interpolation between two quaternions (torch version).
+
+    Args:
+        quat0 (torch.Tensor): (x, y, z, w) start quaternion
+        quat1 (torch.Tensor): (x, y, z, w) end quaternion
+        fraction (float): interpolation fraction
+        shortestpath (bool): whether to use shortest path
+
+    Returns:
+        torch.Tensor: (x, y, z, w) interpolated quaternion
+    """
+    def unit_vector(data):
+        norm = torch.norm(data)
+        if norm == 0:
+            return data
+        return data / norm
+
+    q0 = unit_vector(quat0[:4])
+    q1 = unit_vector(quat1[:4])
+    if fraction == 0.0:
+        return q0
+    elif fraction == 1.0:
+        return q1
+    d = torch.dot(q0, q1)
+    if torch.abs(torch.abs(d) - 1.0) < EPS:
+        return q0
+    if shortestpath and d < 0.0:
+        d = -d
+        q1 = -q1
+    angle = torch.acos(torch.clamp(d, -1, 1))
+    if torch.abs(angle) < EPS:
+        return q0
+    isin = 1.0 / torch.sin(angle)
+    q0 = q0 * (torch.sin((1.0 - fraction) * angle) * isin)
+    q1 = q1 * (torch.sin(fraction * angle) * isin)
+    q0 = q0 + q1
+    return q0
+
+
+def mat2pose(hmat):
+    """
+    Convert homogeneous 4x4 matrix to pose (torch version).
+
+    Args:
+        hmat (torch.Tensor): 4x4 homogeneous matrix
+
+    Returns:
+        tuple: (position, quaternion)
+    """
+    pos = hmat[:3, 3]
+    orn = mat2quat(hmat[:3, :3])
+    return pos, orn
+
+
+def mat2quat(rmat):
+    """
+    Convert rotation matrix to quaternion (torch version).
+
+    Args:
+        rmat (torch.Tensor): 3x3 rotation matrix
+
+    Returns:
+        torch.Tensor: (x, y, z, w) quaternion
+    """
+    M = rmat[:3, :3].float()
+    m00 = M[0, 0]
+    m01 = M[0, 1]
+    m02 = M[0, 2]
+    m10 = M[1, 0]
+    m11 = M[1, 1]
+    m12 = M[1, 2]
+    m20 = M[2, 0]
+    m21 = M[2, 1]
+    m22 = M[2, 2]
+    K = torch.tensor([
+        [m00 - m11 - m22, 0.0, 0.0, 0.0],
+        [m01 + m10, m11 - m00 - m22, 0.0, 0.0],
+        [m02 + m20, m12 + m21, m22 - m00 - m11, 0.0],
+        [m21 - m12, m02 - m20, m10 - m01, m00 + m11 + m22],
+    ], dtype=torch.float32)
+    K /= 3.0
+    w, V = torch.linalg.eigh(K)
+    inds = torch.tensor([3, 0, 1, 2])
+    q1 = V[:, torch.argmax(w)][inds]
+    if q1[0] < 0.0:
+        q1 = -q1
+    inds2 = torch.tensor([1, 2, 3, 0])
+    return q1[inds2]
+
+
+def euler2mat(euler):
+    """
+    Convert euler angles to rotation matrix (torch version).
+
+    Args:
+        euler (torch.Tensor): (r, p, y) euler angles
+
+    Returns:
+        torch.Tensor: 3x3 rotation matrix
+    """
+    euler = euler.float()
+    assert euler.shape[-1] == 3, "Invalid shaped euler {}".format(euler)
+    ai, aj, ak = -euler[..., 2], -euler[..., 1], -euler[..., 0]
+    si, sj, sk = torch.sin(ai), torch.sin(aj), torch.sin(ak)
+    ci, cj, ck = torch.cos(ai), torch.cos(aj), torch.cos(ak)
+    cc, cs = ci * ck, ci * sk
+    sc, ss = si * ck, si * sk
+
+    mat = torch.empty(euler.shape[:-1] + (3, 3), dtype=torch.float32, device=euler.device)
+    mat[..., 2, 2] = cj * ck
+    mat[..., 2, 1] = sj * sc - cs
+    mat[..., 2, 0] = sj * cc + ss
+    mat[..., 1, 2] = cj * sk
+    mat[..., 1, 1] = sj * ss + cc
+    mat[..., 1, 0] = sj * cs - sc
+    mat[..., 0, 2] = -sj
+    mat[..., 0, 1] = cj * si
+    mat[..., 0, 0] = cj * ci
+    return mat
+
+
+def mat2euler(rmat, axes="sxyz"):
+    """
+    Convert rotation matrix to euler angles in radians (torch version).
+
+    Args:
+        rmat (torch.Tensor): 3x3 rotation matrix
+        axes (str): axis sequence
+
+    Returns:
+        torch.Tensor: (r, p, y) euler angles
+    """
+    try:
+        firstaxis, parity, repetition, frame = _AXES2TUPLE[axes.lower()]
+    except (AttributeError, KeyError):
+        firstaxis, parity, repetition, frame = axes
+
+    i = firstaxis
+    j = _NEXT_AXIS[i + parity]
+    k = _NEXT_AXIS[i - parity + 1]
+
+    M = rmat[:3, :3].float()
+    if repetition:
+        sy = torch.sqrt(M[i, j] * M[i, j] + M[i, k] * M[i, k])
+        if sy > EPS:
+            ax = torch.atan2(M[i, j], M[i, k])
+            ay = torch.atan2(sy, M[i, i])
+            az = torch.atan2(M[j, i], -M[k, i])
+        else:
+            ax = torch.atan2(-M[j, k], M[j, j])
+            ay = torch.atan2(sy, M[i, i])
+            az = torch.tensor(0.0, device=M.device)
+    else:
+        cy = torch.sqrt(M[i, i] * M[i, i] + M[j, i] * M[j, i])
+        if cy > EPS:
+            ax = torch.atan2(M[k, j], M[k, k])
+            ay = torch.atan2(-M[k, i], cy)
+            az = torch.atan2(M[j, i], M[i, i])
+        else:
+            ax = torch.atan2(-M[j, k], M[j, j])
+            ay = torch.atan2(-M[k, i], cy)
+            az = torch.tensor(0.0, device=M.device)
+
+    if parity:
+        ax, ay, az = -ax, -ay, -az
+    if frame:
+        ax, az = az, ax
+    return torch.stack((ax, ay, az)).to(dtype=torch.float32)
+
+
+def pose2mat(pose):
+    """
+    Convert pose to homogeneous matrix (torch version).
+
+    Args:
+        pose (tuple): (position, quaternion)
+
+    Returns:
+        torch.Tensor: 4x4 homogeneous matrix
+    """
+    homo_pose_mat = torch.zeros((4, 4), dtype=torch.float32, device=pose[0].device)
+    homo_pose_mat[:3, :3] = quat2mat(pose[1])
+    homo_pose_mat[:3, 3] = pose[0].float()
+    homo_pose_mat[3, 3] = 1.0
+    return homo_pose_mat
+
+
+def quat2mat(quaternion):
+    """
+    Convert quaternion to rotation matrix (torch version).
+
+    Args:
+        quaternion (torch.Tensor): (x, y, z, w) quaternion
+
+    Returns:
+        torch.Tensor: 3x3 rotation matrix
+    """
+    inds = torch.tensor([3, 0, 1, 2], dtype=torch.long, device=quaternion.device)
+    q = quaternion.clone().float()[inds]
+
+    n = torch.dot(q, q)
+    if n < EPS:
+        return torch.eye(3, dtype=torch.float32, device=quaternion.device)
+    q = q * torch.sqrt(torch.tensor(2.0, device=q.device) / n)
+    q2 = torch.ger(q, q)
+    return torch.stack([
+        torch.stack([1.0 - q2[2, 2] - q2[3, 3], q2[1, 2] - q2[3, 0], q2[1, 3] + q2[2, 0]]),
+        torch.stack([q2[1, 2] + q2[3, 0], 1.0 - q2[1, 1] - q2[3, 3], q2[2, 3] - q2[1, 0]]),
+        torch.stack([q2[1, 3] - q2[2, 0], q2[2, 3] + q2[1, 0], 1.0 - q2[1, 1] - q2[2, 2]])
+    ])
+
+
+def quat2axisangle(quat):
+    """
+    Convert quaternion to axis-angle format (torch version).
+    Returns a unit vector direction scaled by its angle in radians.
+
+    Args:
+        quat (torch.Tensor): (x, y, z, w) quaternion
+
+    Returns:
+        torch.Tensor: (ax, ay, az) axis-angle exponential coordinates
+    """
+    if not torch.is_tensor(quat):
+        quat = torch.tensor(quat, dtype=torch.float32)
+    w = quat[3].clamp(-1.0, 1.0)
+    xyz = quat[:3]
+    den = torch.sqrt(1.0 - w * w)
+    if torch.isclose(den, torch.tensor(0.0, dtype=quat.dtype)):
+        return torch.zeros(3, dtype=quat.dtype, device=quat.device)
+    angle = 2.0 * torch.acos(w)
+    return xyz * angle / den
+
+
+def axisangle2quat(vec):
+    """
+    Convert axis-angle to quaternion (torch version).
+
+    Args:
+        vec (torch.Tensor): (ax, ay, az) axis-angle
+
+    Returns:
+        torch.Tensor: (x, y, z, w) quaternion
+    """
+    angle = torch.norm(vec)
+    if torch.isclose(angle, torch.tensor(0.0, dtype=vec.dtype, device=vec.device)):
+        return torch.tensor([0.0, 0.0, 0.0, 1.0], dtype=vec.dtype, device=vec.device)
+    axis = vec / angle
+    q = torch.zeros(4, dtype=vec.dtype, device=vec.device)
+    q[3] = torch.cos(angle / 2.0)
+    q[:3] = axis * torch.sin(angle / 2.0)
+    return q
+
+
+def pose_in_A_to_pose_in_B(pose_A, pose_A_in_B):
+    """
+    Transform pose of C in frame A to frame B (torch version).
+
+    Args:
+        pose_A (torch.Tensor): 4x4 pose of C in A
+        pose_A_in_B (torch.Tensor): 4x4 pose of A in B
+
+    Returns:
+        torch.Tensor: 4x4 pose of C in B
+    """
+    return torch.matmul(pose_A_in_B, pose_A)
+
+
+def pose_inv(pose):
+    """
+    Compute inverse of homogeneous pose matrix (torch version).
+
+    Args:
+        pose (torch.Tensor): 4x4 pose matrix
+
+    Returns:
+        torch.Tensor: 4x4 inverse pose matrix
+    """
+    pose_inv = torch.zeros((4, 4), dtype=pose.dtype, device=pose.device)
+    pose_inv[:3, :3] = pose[:3, :3].T
+    pose_inv[:3, 3] = -torch.matmul(pose_inv[:3, :3], pose[:3, 3])
+    pose_inv[3, 3] = 1.0
+    return pose_inv
+
+
+def make_pose(translation, rotation):
+    """
+    Make homogeneous pose matrix from translation and rotation (torch version).
+
+    Args:
+        translation (torch.Tensor): (x, y, z) translation
+        rotation (torch.Tensor): 3x3 rotation matrix
+
+    Returns:
+        torch.Tensor: 4x4 pose matrix
+    """
+    pose = torch.zeros((4, 4), dtype=rotation.dtype, device=rotation.device)
+    pose[:3, :3] = rotation
+    pose[:3, 3] = translation
+    pose[3, 3] = 1.0
+    return pose
+
+
+def rotate_2d_point(input, rot):
+    """
+    rotate a 2d vector counterclockwise (torch version)
+
+    Args:
+        input (torch.Tensor): 1d-array representing 2d vector
+        rot (float): rotation value
+
+    Returns:
+        torch.Tensor: rotated 1d-array
+    """
+    input_x, input_y = input
+    x = input_x * torch.cos(rot) - input_y * torch.sin(rot)
+    y = input_x * torch.sin(rot) + input_y * torch.cos(rot)
+    return torch.stack([x, y])
+
+
+def compute_delta_pose(cur: torch.Tensor, tgt: torch.Tensor) -> torch.Tensor:
+    """Compute relative pose: delta = tgt ∘ (cur)^(-1).
+
+    Args:
+        cur: Current pose tensor of shape (T, 7) [p_cur, q_cur].
+        tgt: Target pose tensor of shape (T, 7) [p_tgt, q_tgt].
+
+    Returns:
+        Relative pose tensor of shape (T, 7) [dp, dq].
+    """
+    p_cur = cur[:, :3]
+    q_cur = cur[:, 3:]
+    p_tgt = tgt[:, :3]
+    q_tgt = tgt[:, 3:]
+    p_cur_inv, q_cur_inv = se3_inverse(p_cur, q_cur)
+    dp, dq = se3_compose(p_cur_inv, q_cur_inv, p_tgt, q_tgt)
+    return torch.cat([dp, dq], dim=-1)
+
+
+def pose_left_multiply(a: torch.Tensor, b: torch.Tensor) -> torch.Tensor:
+    """Left multiply pose: T_curr = (ΔT)^(-1) ∘ T_target.
+
+    Args:
+        a: Target pose tensor of shape (T, 7) [p, q].
+        b: Relative pose tensor of shape (T, 7) [dp, dq].
+
+    Returns:
+        Current pose tensor of shape (T, 7) [p_curr, q_curr].
+    """
+    dp_rel = b[:, :3]
+    dq_rel = b[:, 3:]
+    p_tgt = a[:, :3]
+    q_tgt = a[:, 3:]
+    dp_rel_inv, dq_rel_inv = se3_inverse(dp_rel, dq_rel)
+    p_curr, q_curr = se3_compose(p_tgt, q_tgt, dp_rel_inv, dq_rel_inv)
+    return torch.cat([p_curr, q_curr], dim=-1)
+
+
+def se3_compose(p1: torch.Tensor, q1: torch.Tensor, p2: torch.Tensor, q2: torch.Tensor):
+    """Compose two SE(3) transformations: (p1, q1) ∘ (p2, q2).
+
+    Args:
+        p1: First translation tensor of shape (..., 3).
+        q1: First quaternion tensor of shape (..., 4) in wxyz format.
+        p2: Second translation tensor of shape (..., 3).
+        q2: Second quaternion tensor of shape (..., 4) in wxyz format.
+
+    Returns:
+        Tuple of (composed_translation, composed_quaternion).
+    """
+    R1 = quat_to_R(q1)
+    p = p1 + torch.einsum('...ij,...j->...i', R1, p2)
+    q = quat_mul(q1, q2)
+    return p, quat_normalize(q)
+
+
+def se3_inverse(p: torch.Tensor, q: torch.Tensor):
+    """Compute inverse of SE(3) transformation: (p, q)^(-1).
+
+    Args:
+        p: Translation tensor of shape (..., 3).
+        q: Quaternion tensor of shape (..., 4) in wxyz format.
+
+    Returns:
+        Tuple of (inverse_translation, inverse_quaternion).
+    """
+    R = quat_to_R(q)
+    Rt = torch.swapaxes(R, -1, -2)
+    p_inv = -torch.einsum('...ij,...j->...i', Rt, p)
+    q_inv = quat_conj(quat_normalize(q))
+    return p_inv, q_inv
+
+
+def quat_to_R(q: torch.Tensor) -> torch.Tensor:
+    """Convert quaternion to rotation matrix.
+
+    Args:
+        q: Quaternion tensor of shape (..., 4) in wxyz format.
+
+    Returns:
+        Rotation matrix tensor of shape (..., 3, 3).
+    """
+    q = quat_normalize(q)
+    w, x, y, z = torch.moveaxis(q, -1, 0)
+    R = torch.empty(q.shape[:-1] + (3, 3), dtype=q.dtype, device=q.device)
+    R[..., 0, 0] = 1 - 2 * (y * y + z * z)
+    R[..., 0, 1] = 2 * (x * y - z * w)
+    R[..., 0, 2] = 2 * (x * z + y * w)
+    R[..., 1, 0] = 2 * (x * y + z * w)
+    R[..., 1, 1] = 1 - 2 * (x * x + z * z)
+    R[..., 1, 2] = 2 * (y * z - x * w)
+    R[..., 2, 0] = 2 * (x * z - y * w)
+    R[..., 2, 1] = 2 * (y * z + x * w)
+    R[..., 2, 2] = 1 - 2 * (x * x + y * y)
+    return R
+
+
+def quat_mul(q1: torch.Tensor, q2: torch.Tensor) -> torch.Tensor:
+    """Multiply two quaternions.
+
+    Args:
+        q1: First quaternion tensor of shape (..., 4) in wxyz format.
+        q2: Second quaternion tensor of shape (..., 4) in wxyz format.
+
+    Returns:
+        Product quaternion q1 * q2 of shape (..., 4).
+    """
+    w1, x1, y1, z1 = torch.moveaxis(q1, -1, 0)
+    w2, x2, y2, z2 = torch.moveaxis(q2, -1, 0)
+    w = w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2
+    x = w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2
+    y = w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2
+    z = w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2
+    return torch.stack([w, x, y, z], dim=-1)
+
+
+def quat_normalize(q: torch.Tensor) -> torch.Tensor:
+    """Normalize quaternion to unit length.
+
+    Args:
+        q: Quaternion tensor of shape (..., 4) in wxyz format.
+
+    Returns:
+        Normalized quaternion tensor of same shape.
+    """
+    q = q.to(dtype=torch.float64)
+    return q / torch.linalg.norm(q, dim=-1, keepdim=True)
+
+
+def quat_conj(q: torch.Tensor) -> torch.Tensor:
+    """Compute quaternion conjugate.
+
+    Args:
+        q: Quaternion tensor of shape (..., 4) in wxyz format.
+
+    Returns:
+        Conjugate quaternion [w, -x, -y, -z] of same shape.
+    """
+    w, x, y, z = torch.moveaxis(q, -1, 0)
+    return torch.stack([w, -x, -y, -z], dim=-1)